@@ -1,3 +1,4 @@
 from deeplite_torch_zoo.wrappers import (  # pylint: disable=unused-import
     create_model, get_data_splits_by_name, get_eval_function,
-    get_model_by_name, get_models_by_dataset, list_models, profile)
+    get_model_by_name, get_models_by_dataset, get_profile_by_name, list_models,
+    predict_latency_by_name, prefetch_checkpoints, profile)
@@ -4,7 +4,7 @@ from torchvision import transforms
 
 from deeplite_torch_zoo.src.classification.augmentations.augs import \
     get_vanilla_transforms
-from deeplite_torch_zoo.src.classification.augmentations.distortions import \
+from deeplite_torch_zoo.src.classification.augmentations.distortions.distortions import \
     DISTORTION_REGISTRY
 
 
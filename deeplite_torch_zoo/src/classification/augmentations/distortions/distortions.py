@@ -1,6 +1,7 @@
 # Code modified from: https://github.com/hendrycks/robustness
 
 import ctypes
+import functools
 import pathlib
 from io import BytesIO
 
@@ -162,6 +163,44 @@ def gaussian_blur(x, severity=1):
     return np.clip(x, 0, 1) * 255
 
 
+def shuffle_pixels(x, max_delta):
+    """
+    Local pixel shuffling of glass_blur on a (H, W, C) image, in place. The reference loop visits the
+    pixels max_delta < h <= H - max_delta, max_delta < w <= W - max_delta in reverse raster order and
+    swaps the pixel views x[h, w] and x[h + dy, w + dx], which assigns x[h, w] = x[h + dy, w + dx]:
+    a pixel takes the current value of its neighbour, already replaced if the neighbour was visited
+    before. The same displacements are drawn here and the chains of visited neighbours are resolved
+    by pointer jumping, which gives the output of the loop in O(log(H * W)) array operations.
+    """
+    h_image, w_image = x.shape[0], x.shape[1]
+    rows = np.arange(h_image - max_delta, max_delta, -1)
+    cols = np.arange(w_image - max_delta, max_delta, -1)
+    deltas = np.random.randint(-max_delta, max_delta, size=(len(rows), len(cols), 2))
+    if not deltas.size:
+        return x
+
+    h, w = np.meshgrid(rows, cols, indexing='ij')
+    h_prime, w_prime = h + deltas[..., 1], w + deltas[..., 0]
+    target = (h * w_image + w).ravel()
+    source = (h_prime * w_image + w_prime).ravel()
+    # neighbours after (h, w) in raster order and inside the shuffled region are visited before it
+    visited = (h_prime > max_delta) & (h_prime <= h_image - max_delta) & \
+        (w_prime > max_delta) & (w_prime <= w_image - max_delta)
+    follow = visited.ravel() & (source > target)
+
+    # x[p] = x_orig[pointer[p]] for resolved pixels and x[p] = x[pointer[p]] for the others
+    pointer = np.arange(h_image * w_image)
+    pointer[target] = source
+    resolved = np.ones(h_image * w_image, dtype=bool)
+    resolved[target] = ~follow
+    while not resolved.all():
+        pointer, resolved = np.where(resolved, pointer, pointer[pointer]), resolved | resolved[pointer]
+
+    pixels = x.reshape(h_image * w_image, -1)
+    pixels[:] = pixels[pointer]
+    return x
+
+
 @DISTORTION_REGISTRY.register('glass_blur')
 def glass_blur(x, severity=1):
     # sigma, max_delta, iterations
@@ -169,16 +208,9 @@ def glass_blur(x, severity=1):
 
     x = np.uint8(gaussian(np.array(x) / 255.0, sigma=c[0], channel_axis=-1) * 255)
 
-    h_image, w_image = x.shape[0], x.shape[1]
-
     # locally shuffle pixels
-    for i in range(c[2]):
-        for h in range(h_image - c[1], c[1], -1):
-            for w in range(w_image - c[1], c[1], -1):
-                dx, dy = np.random.randint(-c[1], c[1], size=(2,))
-                h_prime, w_prime = h + dy, w + dx
-                # swap
-                x[h, w], x[h_prime, w_prime] = x[h_prime, w_prime], x[h, w]
+    for _ in range(c[2]):
+        shuffle_pixels(x, c[1])
 
     return np.clip(gaussian(x / 255.0, sigma=c[0], channel_axis=-1), 0, 1) * 255
 
@@ -250,12 +282,10 @@ def fog(x, severity=1):
     return np.clip(x * max_val / (max_val + c[0]), 0, 1) * 255
 
 
-@DISTORTION_REGISTRY.register('frost')
-def frost(x, severity=1):
+@functools.lru_cache(maxsize=None)
+def load_frost_image(idx):
+    """frost images are decoded once per process"""
     HERE = pathlib.Path(__file__).parent
-    c = [(1, 0.4), (0.8, 0.6), (0.7, 0.7), (0.65, 0.7), (0.6, 0.75)][severity - 1]
-    w, h = x.shape[0], x.shape[1]
-    idx = np.random.randint(5)
     filename = [
         HERE / './frost_imgs/frost1.png',
         HERE / './frost_imgs/frost2.png',
@@ -264,7 +294,15 @@ def frost(x, severity=1):
         HERE / './frost_imgs/frost5.jpg',
         HERE / './frost_imgs/frost6.jpg',
     ][idx]
-    frost = cv2.imread(str(filename))
+    return cv2.imread(str(filename))
+
+
+@DISTORTION_REGISTRY.register('frost')
+def frost(x, severity=1):
+    c = [(1, 0.4), (0.8, 0.6), (0.7, 0.7), (0.65, 0.7), (0.6, 0.75)][severity - 1]
+    w, h = x.shape[0], x.shape[1]
+    idx = np.random.randint(5)
+    frost = load_frost_image(idx)
 
     # randomly crop and convert to rgb
     frost = cv2.resize(frost, (h, w))
@@ -9,11 +9,24 @@
 # --------------------------------------------------------'
 
 import torch.nn as nn
+import torch.nn.functional as F
 
 from deeplite_torch_zoo.src.dnn_blocks.common import ConvBnAct
 from deeplite_torch_zoo.src.dnn_blocks.timm import DropPath
 
 
+def fuse_bn(conv, bn):
+    kernel = conv.weight
+    running_mean = bn.running_mean
+    running_var = bn.running_var
+    gamma = bn.weight
+    beta = bn.bias
+    eps = bn.eps
+    std = (running_var + eps).sqrt()
+    t = (gamma / std).reshape(-1, 1, 1, 1)
+    return kernel * t, beta - running_mean * gamma / std
+
+
 class LargeKernelReparam(nn.Module):
     def __init__(self, channels, kernel, small_kernel=5):
         super(LargeKernelReparam, self).__init__()
@@ -24,10 +37,28 @@ class LargeKernelReparam(nn.Module):
             p=small_kernel//2, g=channels, act=None)
 
     def forward(self, inp):
+        if hasattr(self, 'lkb_reparam'):
+            return self.lkb_reparam(inp)
         outp = self.dw_large(inp)
         outp += self.dw_small(inp)
         return outp
 
+    def reparameterize(self):
+        # merges the small kernel into the center of the large kernel
+        if hasattr(self, 'lkb_reparam'):
+            return
+        eq_k, eq_b = fuse_bn(self.dw_large.conv, self.dw_large.bn)
+        small_k, small_b = fuse_bn(self.dw_small.conv, self.dw_small.bn)
+        eq_b = eq_b + small_b
+        eq_k = eq_k + F.pad(small_k, [(eq_k.shape[-1] - self.small_kernel) // 2] * 4)
+        conv = self.dw_large.conv
+        self.lkb_reparam = nn.Conv2d(conv.in_channels, conv.out_channels, conv.kernel_size, stride=conv.stride,
+            padding=conv.padding, dilation=conv.dilation, groups=conv.groups, bias=True)
+        self.lkb_reparam.weight.data = eq_k.detach()
+        self.lkb_reparam.bias.data = eq_b.detach()
+        self.__delattr__('dw_large')
+        self.__delattr__('dw_small')
+
 
 class MLP(nn.Module):
     def __init__(self, in_channels, hidden_channels=None, out_channels=None, act_layer=nn.GELU, drop=0.,):
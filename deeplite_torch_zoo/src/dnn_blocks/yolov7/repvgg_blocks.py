@@ -1,5 +1,6 @@
 # Taken from https://github.com/WongKinYiu/yolov7/blob/HEAD/models/common.py
 
+import numpy as np
 import torch
 import torch.nn as nn
 
@@ -127,6 +128,22 @@ class RepConv(nn.Module):
         conv.bias = torch.nn.Parameter(bias)
         return conv
 
+    def reparameterize(self):
+        # merges the branches with get_equivalent_kernel_bias, which unlike fuse_repvgg_block
+        # also supports grouped convolutions in the identity branch
+        if hasattr(self, "rbr_reparam"):
+            return
+        kernel, bias = self.get_equivalent_kernel_bias()
+        conv = self.rbr_dense[0]
+        self.rbr_reparam = nn.Conv2d(conv.in_channels, conv.out_channels, conv.kernel_size, conv.stride,
+                                     conv.padding, dilation=conv.dilation, groups=conv.groups, bias=True)
+        self.rbr_reparam.weight.data = kernel.detach()
+        self.rbr_reparam.bias.data = bias.detach()
+        for name in ("rbr_dense", "rbr_1x1", "rbr_identity", "id_tensor"):
+            if hasattr(self, name):
+                self.__delattr__(name)
+        self.deploy = True
+
     def fuse_repvgg_block(self):
         if self.deploy:
             return
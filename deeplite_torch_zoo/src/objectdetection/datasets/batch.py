@@ -0,0 +1,87 @@
+import torch
+
+
+class DetectionBatch(object):
+    """
+    Collated batch of a detection dataset. The labels of all images are stored once as a flat
+    (sum_n, 1 + C) tensor `targets` whose rows are [batch index, x1, y1, x2, y2, class, ...],
+    in image order, so the labels of image i are the rows offsets[i]:offsets[i + 1].
+
+    For the consumers of the former collate output a batch unpacks as
+    (images, padded labels, lengths, shapes), the (B, max_n, C) zero-padded labels are built
+    on first access with a single scatter.
+
+    :param images: Tensor (B, 3, H, W)
+    :param targets: Tensor (sum_n, 1 + C)
+    :param lengths: Tensor (B,), number of labels of every image, kept on the host
+    :param shapes: Tensor (B, 2), original (height, width) of every image, or None
+    """
+
+    def __init__(self, images, targets, lengths, shapes=None):
+        self.images = images
+        self.targets = targets
+        self.lengths = lengths.cpu()
+        self.shapes = shapes
+        self.offsets = torch.zeros(len(self.lengths) + 1, dtype=torch.long)
+        torch.cumsum(self.lengths, 0, out=self.offsets[1:])
+        self._padded = None
+
+    @classmethod
+    def collate(cls, images, labels, shapes=None):
+        """builds a batch from the per-image (n_i, C) label tensors"""
+        lengths = torch.tensor([len(label) for label in labels], dtype=torch.long)
+        labels = torch.cat(labels)
+        batch_index = torch.repeat_interleave(torch.arange(len(lengths)), lengths).to(labels)
+        return cls(torch.stack(images), torch.cat((batch_index[:, None], labels), dim=1), lengths,
+            torch.tensor(shapes) if shapes is not None else None)
+
+    @classmethod
+    def from_padded(cls, images, labels, lengths, shapes=None):
+        """builds a batch from (B, max_n, C) zero-padded labels"""
+        valid = torch.arange(labels.shape[1], device=labels.device) < lengths.to(labels.device)[:, None]
+        batch_index = valid.nonzero()[:, :1].to(labels)
+        return cls(images, torch.cat((batch_index, labels[valid]), dim=1), lengths, shapes)
+
+    def __len__(self):
+        return len(self.lengths)
+
+    def __iter__(self):
+        return iter((self.images, self.padded, self.lengths, self.shapes))
+
+    @property
+    def batch_index(self):
+        return self.targets[:, 0]
+
+    @property
+    def labels(self):
+        """flat (sum_n, C) labels without the batch index, a view of `targets`"""
+        return self.targets[:, 1:]
+
+    def image_labels(self, i):
+        """(n_i, C) labels of image i, a view of `targets`"""
+        return self.targets[self.offsets[i]:self.offsets[i + 1], 1:]
+
+    @property
+    def padded(self):
+        if self._padded is None:
+            max_num_obj = int(self.lengths.max()) if len(self.lengths) else 0
+            padded = self.targets.new_zeros((len(self), max_num_obj, self.targets.shape[1] - 1))
+            batch_index = torch.repeat_interleave(torch.arange(len(self)), self.lengths)
+            position = torch.arange(len(batch_index)) - self.offsets[batch_index]
+            padded[batch_index.to(padded.device), position.to(padded.device)] = self.labels
+            self._padded = padded
+        return self._padded
+
+    def _apply(self, fn):
+        return DetectionBatch(fn(self.images), fn(self.targets), self.lengths, self.shapes)
+
+    def to(self, device, non_blocking=False):
+        """moves the images and the targets, lengths and shapes stay on the host"""
+        return self._apply(lambda x: x.to(device, non_blocking=non_blocking))
+
+    def pin_memory(self):
+        # called by the DataLoader with pin_memory=True
+        return self._apply(lambda x: x.pin_memory())
+
+    def half(self):
+        return self._apply(lambda x: x.half() if x.is_floating_point() else x)
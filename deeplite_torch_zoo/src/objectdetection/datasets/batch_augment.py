@@ -0,0 +1,255 @@
+"""
+Detection augmentations applied to collated batches instead of single images in the DataLoader
+workers. Batches are those of `collate_img_label_fn`: RGB images (B, 3, H, W), float in [0, 1]
+or uint8, padded labels (B, N, C) with xyxy pixel boxes in the first four columns and the number
+of boxes of each image. The transforms run on the device of the images, e.g. on the GPU after
+the batch has been moved there, and follow the per-image ones of data_augment.py.
+"""
+
+import math
+import random
+
+import torch
+import torch.nn.functional as F
+
+BORDER_VALUE = 114
+
+
+def _uniform(n, low, high, device):
+    return torch.empty(n, device=device).uniform_(low, high)
+
+
+def _to_float(images):
+    return images.float() / 255 if images.dtype == torch.uint8 else images
+
+
+def _from_float(images, dtype):
+    return (images * 255).round_().clamp_(0, 255).to(dtype) if dtype == torch.uint8 else images
+
+
+def _valid_mask(labels, lengths):
+    return torch.arange(labels.shape[1], device=labels.device) < lengths.to(labels.device)[:, None]
+
+
+def _compact(labels, keep):
+    """moves the kept boxes of every image to the front and zeroes the padding"""
+    order = torch.sort((~keep).to(torch.uint8), dim=1, stable=True).indices
+    labels = labels.gather(1, order[..., None].expand_as(labels))
+    lengths = keep.sum(1)
+    labels[~_valid_mask(labels, lengths)] = 0
+    return labels, lengths
+
+
+def _pad_labels(labels, num_columns, device):
+    lengths = torch.tensor([len(label) for label in labels], dtype=torch.long)
+    padded = torch.zeros((len(labels), int(lengths.max()) if len(labels) else 0, num_columns),
+        device=device)
+    for i, label in enumerate(labels):
+        padded[i, :len(label)] = label
+    return padded, lengths
+
+
+def box_candidates(box1, box2, wh_thr=2, ar_thr=20, area_thr=0.1, eps=1e-16):
+    """torch version of data_augment.box_candidates for boxes of shape (..., 4)"""
+    w1, h1 = box1[..., 2] - box1[..., 0], box1[..., 3] - box1[..., 1]
+    w2, h2 = box2[..., 2] - box2[..., 0], box2[..., 3] - box2[..., 1]
+    ar = torch.maximum(w2 / (h2 + eps), h2 / (w2 + eps))  # aspect ratio
+    return (w2 > wh_thr) & (h2 > wh_thr) & (w2 * h2 / (w1 * h1 + eps) > area_thr) & (ar < ar_thr)
+
+
+def batch_mosaic(images, labels, lengths, p=1.0):
+    """
+    Replaces each image with probability p by a 4-mosaic of it and 3 random images of the batch,
+    as `DLZooDataset._load_mosaic` does: the tiles are placed around a random center of a
+    (2H, 2W) canvas which is then resized back to (H, W).
+    """
+    batch_size, channels, h, w = images.shape
+    selected = [i for i in range(batch_size) if random.random() < p]
+    if not selected:
+        return images, labels, lengths
+
+    lengths = lengths.cpu()
+    fill = BORDER_VALUE if images.dtype == torch.uint8 else BORDER_VALUE / 255
+    canvases = images.new_full((len(selected), channels, 2 * h, 2 * w), fill)
+    mosaic_labels = []
+    for canvas, item in zip(canvases, selected):
+        yc, xc = int(random.uniform(h // 2, 2 * h - h // 2)), int(random.uniform(w // 2, 2 * w - w // 2))
+        indices = [item] + random.choices(range(batch_size), k=3)
+        random.shuffle(indices)
+        tile_labels = []
+        for i, index in enumerate(indices):
+            if i == 0:  # top left
+                x1a, y1a, x2a, y2a = max(xc - w, 0), max(yc - h, 0), xc, yc
+                x1b, y1b, x2b, y2b = w - (x2a - x1a), h - (y2a - y1a), w, h
+            elif i == 1:  # top right
+                x1a, y1a, x2a, y2a = xc, max(yc - h, 0), min(xc + w, w * 2), yc
+                x1b, y1b, x2b, y2b = 0, h - (y2a - y1a), min(w, x2a - x1a), h
+            elif i == 2:  # bottom left
+                x1a, y1a, x2a, y2a = max(xc - w, 0), yc, xc, min(h * 2, yc + h)
+                x1b, y1b, x2b, y2b = w - (x2a - x1a), 0, w, min(y2a - y1a, h)
+            else:  # bottom right
+                x1a, y1a, x2a, y2a = xc, yc, min(xc + w, w * 2), min(h * 2, yc + h)
+                x1b, y1b, x2b, y2b = 0, 0, min(w, x2a - x1a), min(y2a - y1a, h)
+            canvas[:, y1a:y2a, x1a:x2a] = images[index, :, y1b:y2b, x1b:x2b]
+
+            tile = labels[index, :lengths[index]].clone()
+            tile[:, [0, 2]] = (tile[:, [0, 2]] + (x1a - x1b)).clamp(0, 2 * w)
+            tile[:, [1, 3]] = (tile[:, [1, 3]] + (y1a - y1b)).clamp(0, 2 * h)
+            tile_labels.append(tile)
+        tile_labels = torch.cat(tile_labels)
+        # boxes clipped away by the tile borders
+        tile_labels = tile_labels[(tile_labels[:, 2] > tile_labels[:, 0]) & (tile_labels[:, 3] > tile_labels[:, 1])]
+        tile_labels[:, :4] /= 2
+        mosaic_labels.append(tile_labels)
+
+    canvases = F.interpolate(_to_float(canvases), size=(h, w), mode='bilinear', align_corners=False)
+    images = images.clone()
+    images[selected] = _from_float(canvases, images.dtype)
+
+    new_labels = [mosaic_labels[selected.index(i)] if i in selected else labels[i, :lengths[i]]
+        for i in range(batch_size)]
+    labels, lengths = _pad_labels(new_labels, labels.shape[2], labels.device)
+    return images, labels, lengths
+
+
+def batch_random_perspective(images, labels, lengths, degrees=10, translate=.1, scale=.1, shear=10,
+    perspective=0.0):
+    """
+    `data_augment.random_perspective` for a batch: a random transform per image, applied with
+    `grid_sample`, and the boxes filtered by `box_candidates`
+    """
+    batch_size, _, h, w = images.shape
+    device = images.device
+
+    def eye():
+        return torch.eye(3, device=device).repeat(batch_size, 1, 1)
+
+    # Center
+    C = eye()
+    C[:, 0, 2] = -w / 2
+    C[:, 1, 2] = -h / 2
+
+    # Perspective
+    P = eye()
+    P[:, 2, 0] = _uniform(batch_size, -perspective, perspective, device)
+    P[:, 2, 1] = _uniform(batch_size, -perspective, perspective, device)
+
+    # Rotation and Scale, as cv2.getRotationMatrix2D
+    R = eye()
+    a = _uniform(batch_size, -degrees, degrees, device) * math.pi / 180
+    s = _uniform(batch_size, 1 - scale, 1 + scale, device)
+    R[:, 0, 0] = R[:, 1, 1] = s * torch.cos(a)
+    R[:, 0, 1] = s * torch.sin(a)
+    R[:, 1, 0] = -s * torch.sin(a)
+
+    # Shear
+    S = eye()
+    S[:, 0, 1] = torch.tan(_uniform(batch_size, -shear, shear, device) * math.pi / 180)
+    S[:, 1, 0] = torch.tan(_uniform(batch_size, -shear, shear, device) * math.pi / 180)
+
+    # Translation
+    T = eye()
+    T[:, 0, 2] = _uniform(batch_size, 0.5 - translate, 0.5 + translate, device) * w
+    T[:, 1, 2] = _uniform(batch_size, 0.5 - translate, 0.5 + translate, device) * h
+
+    M = T @ S @ R @ P @ C  # order of operations (right to left) is IMPORTANT
+
+    # source pixel of every output pixel, normalized to [-1, 1] for grid_sample
+    m = torch.linalg.inv(M)[..., None, None]
+    xs = torch.arange(w, device=device, dtype=torch.float32)[None, None, :]
+    ys = torch.arange(h, device=device, dtype=torch.float32)[None, :, None]
+    z = m[:, 2, 0] * xs + m[:, 2, 1] * ys + m[:, 2, 2]
+    grid = torch.stack((
+        (m[:, 0, 0] * xs + m[:, 0, 1] * ys + m[:, 0, 2]) / z * (2 / max(w - 1, 1)) - 1,
+        (m[:, 1, 0] * xs + m[:, 1, 1] * ys + m[:, 1, 2]) / z * (2 / max(h - 1, 1)) - 1,
+    ), dim=-1)
+    fill = BORDER_VALUE / 255
+    warped = F.grid_sample(_to_float(images) - fill, grid, mode='bilinear', padding_mode='zeros',
+        align_corners=True) + fill
+    images = _from_float(warped, images.dtype)
+
+    # Transform label coordinates
+    labels = labels.to(device)
+    if labels.shape[1]:
+        boxes = labels[..., :4]
+        xy = boxes[..., [0, 1, 2, 3, 0, 3, 2, 1]].reshape(batch_size, -1, 4, 2)  # x1y1, x2y2, x1y2, x2y1
+        xy = torch.cat((xy, torch.ones_like(xy[..., :1])), dim=-1) @ M[:, None].transpose(-1, -2)
+        xy = xy[..., :2] / xy[..., 2:3] if perspective else xy[..., :2]
+        new = torch.cat((xy.min(dim=2).values, xy.max(dim=2).values), dim=-1)
+        new[..., [0, 2]] = new[..., [0, 2]].clamp(0, w)
+        new[..., [1, 3]] = new[..., [1, 3]].clamp(0, h)
+
+        keep = box_candidates(boxes * s[:, None, None], new, area_thr=0.10) & _valid_mask(labels, lengths)
+        labels = torch.cat((new, labels[..., 4:]), dim=-1)
+        labels, new_lengths = _compact(labels, keep)
+        lengths = new_lengths.to(lengths.device)
+    return images, labels, lengths
+
+
+def batch_flip(images, labels, lengths, p=0.5, vertical=False):
+    """flips each image and its boxes with probability p, horizontally or vertically"""
+    flip = torch.rand(images.shape[0], device=images.device) < p
+    if not flip.any():
+        return images, labels, lengths
+    dim, columns = (2, [1, 3]) if vertical else (3, [0, 2])
+    images = images.clone()
+    images[flip] = images[flip].flip(dim)
+    labels = labels.to(images.device).clone()
+    flip_boxes = flip[:, None] & _valid_mask(labels, lengths)
+    labels[..., columns] = torch.where(flip_boxes[..., None], images.shape[dim] - labels[..., columns[::-1]],
+        labels[..., columns])
+    return images, labels, lengths
+
+
+def batch_augment_hsv(images, hgain=0.5, sgain=0.5, vgain=0.5, eps=1e-8):
+    """`data_augment.AugmentHSV` for a batch of RGB images, with random gains per image"""
+    if not (hgain or sgain or vgain):
+        return images
+    batch_size, device = images.shape[0], images.device
+    gains = (_uniform((batch_size, 3), -1, 1, device) * torch.tensor([hgain, sgain, vgain], device=device) + 1)
+    gains = gains[:, :, None, None]
+    rgb = _to_float(images)
+
+    # RGB -> HSV, hue in [0, 6), saturation and value in [0, 1]
+    val = rgb.amax(dim=1, keepdim=True)
+    delta = val - rgb.amin(dim=1, keepdim=True)
+    # index of the max channel and hue from its next and previous channels, e.g. (g - b) for r
+    argmax = (rgb[:, 0:1] != val).long() * (1 + (rgb[:, 1:2] != val).long())
+    diff = rgb.gather(1, (argmax + 1) % 3) - rgb.gather(1, (argmax + 2) % 3)
+    hue = (diff.div_(delta + eps) + 2 * argmax) % 6
+    sat = delta.div_(val + eps)
+
+    hue = (hue * gains[:, 0:1]) % 6
+    sat = (sat * gains[:, 1:2]).clamp_(0, 1)
+    val = (val * gains[:, 2:3]).clamp_(0, 1)
+
+    # HSV -> RGB
+    k = (torch.tensor([5., 3., 1.], device=device)[None, :, None, None] + hue) % 6
+    rgb = val - val * sat * torch.minimum(k, 4 - k).clamp_(0, 1)
+    return _from_float(rgb, images.dtype)
+
+
+class BatchAugmentation(object):
+    """
+    Mosaic, random perspective, flips and HSV augmentation of collated batches with the
+    hyperparameters of a dataset config (cfg.TRAIN). Returns the augmented images, the labels
+    on the device of the images and the number of boxes of each image.
+    """
+
+    def __init__(self, hyp_cfg):
+        self.hyp_cfg = hyp_cfg
+
+    def __call__(self, images, labels, lengths):
+        hyp = self.hyp_cfg
+        if hyp.get('mosaic', 0):
+            images, labels, lengths = batch_mosaic(images, labels, lengths, p=hyp['mosaic'])
+        images, labels, lengths = batch_random_perspective(images, labels, lengths,
+            degrees=hyp['degrees'],
+            translate=hyp['translate'],
+            scale=hyp['scale'],
+            shear=hyp['shear'],
+            perspective=hyp['perspective'])
+        images, labels, lengths = batch_flip(images, labels, lengths, p=hyp['fliplr'])
+        images, labels, lengths = batch_flip(images, labels, lengths, p=hyp['flipud'], vertical=True)
+        images = batch_augment_hsv(images, hgain=hyp['hsv_h'], sgain=hyp['hsv_s'], vgain=hyp['hsv_v'])
+        return images, labels, lengths
@@ -27,20 +27,30 @@
 # Code from https://github.com/westerndigitalcorporation/YOLOv3-in-PyTorch
 
 import json
+import os
 import time
 from collections import defaultdict
 
 import numpy as np
 import torch
-from PIL import ImageFile
+from PIL import Image, ImageFile
 from pycocotools.coco import COCO
-from torchvision.datasets import CocoDetection
+from torch.utils.data import Dataset
 
+from deeplite_torch_zoo.src.objectdetection.datasets.batch import \
+    DetectionBatch
+from deeplite_torch_zoo.src.objectdetection.datasets.coco.coco_index import \
+    get_coco_index
 from deeplite_torch_zoo.src.objectdetection.eval.zoo_eval.coco.utils import \
     xywh_to_xyxy
 
 
-class CocoDetectionBoundingBox(CocoDetection):
+class CocoDetectionBoundingBox(Dataset):
+    """
+    COCO detection dataset for the YOLO models. Annotations are read from a `CocoIndex` cached on
+    the first use of the annotation file, so the dataset is created without parsing the json file
+    and the labels of an image are a slice of the memory-mapped index.
+    """
     def __init__(
         self,
         img_root,
@@ -53,9 +63,13 @@ class CocoDetectionBoundingBox(CocoDetection):
         missing_ids=[],
         include_background_class=False,
     ):
-        super(CocoDetectionBoundingBox, self).__init__(img_root, ann_file_name)
+        super(CocoDetectionBoundingBox, self).__init__()
+        self.root = img_root
+        self.ann_file_name = ann_file_name
         self._tf = transform
         self._img_size = img_size
+        self._index = get_coco_index(ann_file_name)
+        self._coco = None
 
         self.classes = ["BACKGROUND"] + classes if include_background_class else classes
         self.num_classes = len(self.classes)
@@ -66,35 +80,36 @@ class CocoDetectionBoundingBox(CocoDetection):
         elif isinstance(category, list):
             self.all_categories = False
             self.category_ids = category
-            self.coco = SubsampledCOCO(ann_file_name, classes)
-            self.ids = list(sorted(self.coco.imgs.keys()))
+            self._index = self._index.subset(category)
+        self.ids = self._index.image_ids.tolist()
+        # category id -> class id lookup table
+        category_ids = np.unique(self._index.category_ids)
+        self._class_ids = np.full(category_ids.max(initial=0) + 1, -1, dtype=np.float32)
+        for category_id in category_ids:
+            self._class_ids[category_id] = self._delete_coco_empty_category(category_id)
 
         ImageFile.LOAD_TRUNCATED_IMAGES = True
 
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def coco(self):
+        """pycocotools COCO object of the annotations, only created when accessed"""
+        if self._coco is None:
+            self._coco = COCO(self.ann_file_name) if self.all_categories else \
+                SubsampledCOCO(self.ann_file_name, self.classes)
+        return self._coco
+
     def __getitem__(self, index):
         """
         return:
             label_tensor of shape nx6, where n is number of labels in the image and x1,y1,x2,y2, class_id and confidence.
         """
-        img, targets = super(CocoDetectionBoundingBox, self).__getitem__(index)
-        labels = []
-        for target in targets:
-            bbox = torch.tensor(target["bbox"], dtype=torch.float32)  # in xywh format
-            category_id = target["category_id"]
-            if (not self.all_categories) and (category_id not in self.category_ids):
-                continue
-            conf = torch.tensor([1.0])
-            category_id = self._delete_coco_empty_category(category_id)
-            category_id = torch.tensor([float(category_id)])
-            label = torch.cat((bbox, category_id))
-            labels.append(label)
-        if labels:
-            label_tensor = torch.stack(labels)
-        else:
-            label_tensor = torch.zeros((0, 5))
-        del labels
-
-        shape = (np.array(img).shape[0], np.array(img).shape[1])
+        img = Image.open(os.path.join(self.root, self._index.file_name(index))).convert("RGB")
+        boxes, category_ids = self._index.annotations(index)  # boxes in xywh format
+        label_tensor = torch.from_numpy(np.concatenate((boxes, self._class_ids[category_ids, None]), axis=1))
+        shape = tuple(self._index.image_sizes[index].tolist())
 
         if self._tf == None:
             return np.array(img), None, None, self.ids[index]
@@ -112,33 +127,8 @@ class CocoDetectionBoundingBox(CocoDetection):
         )
 
     def collate_img_label_fn(self, sample):
-        images = []
-        labels = []
-        lengths = []
-        labels_with_tail = []
-        shapes = []
-
-        max_num_obj = 0
-        for image, label, length, _, shape in sample:
-            images.append(image)
-            labels.append(label)
-            lengths.append(length)
-            max_num_obj = max(max_num_obj, length)
-            shapes.append(shape)
-        for label in labels:
-            num_obj = label.size(0)
-            zero_tail = torch.zeros(
-                (max_num_obj - num_obj, label.size(1)),
-                dtype=label.dtype,
-                device=label.device,
-            )
-            label_with_tail = torch.cat((label, zero_tail), dim=0)
-            labels_with_tail.append(label_with_tail)
-        image_tensor = torch.stack(images)
-        label_tensor = torch.stack(labels_with_tail)
-        length_tensor = torch.tensor(lengths)
-        shape_tensor = torch.tensor(shapes)
-        return image_tensor, label_tensor, length_tensor, shape_tensor
+        images, labels, _, _, shapes = zip(*sample)
+        return DetectionBatch.collate(images, labels, shapes)
 
     def _delete_coco_empty_category(self, old_id):
         """The COCO dataset has 91 categories but 11 of them are empty.
@@ -0,0 +1,108 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+from deeplite_torch_zoo.utils.checkpoints import get_cache_root
+
+INDEX_ARRAYS = ('image_ids', 'file_names', 'image_sizes', 'offsets', 'boxes', 'category_ids')
+
+
+class CocoIndex:
+    """
+    Compact index of the bounding box annotations of a COCO annotation file. Images are sorted by id,
+    as in torchvision's CocoDetection, and the annotations of image i are
+    boxes[offsets[i]:offsets[i + 1]] (xywh, float32) and category_ids[offsets[i]:offsets[i + 1]].
+    Image sizes are stored as (height, width).
+    """
+
+    def __init__(self, image_ids, file_names, image_sizes, offsets, boxes, category_ids):
+        self.image_ids = image_ids
+        self.file_names = file_names
+        self.image_sizes = image_sizes
+        self.offsets = offsets
+        self.boxes = boxes
+        self.category_ids = category_ids
+
+    def __len__(self):
+        return len(self.image_ids)
+
+    @classmethod
+    def from_annotation_file(cls, ann_file):
+        with open(ann_file, 'r') as f:
+            dataset = json.load(f)
+        images = sorted(dataset['images'], key=lambda img: img['id'])
+        image_ids = np.array([img['id'] for img in images], dtype=np.int64)
+        annotations = dataset.get('annotations', [])
+        positions = np.searchsorted(image_ids, np.array([ann['image_id'] for ann in annotations], dtype=np.int64))
+        # stable sort keeps the annotations of an image in the file order, as pycocotools does
+        order = np.argsort(positions, kind='stable')
+        offsets = np.zeros(len(images) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(np.bincount(positions, minlength=len(images)))
+        return cls(
+            image_ids=image_ids,
+            file_names=np.array([img['file_name'].encode() for img in images], dtype=np.bytes_),
+            image_sizes=np.array([(img['height'], img['width']) for img in images], dtype=np.int32).reshape(-1, 2),
+            offsets=offsets,
+            boxes=np.array([annotations[i]['bbox'] for i in order], dtype=np.float32).reshape(-1, 4),
+            category_ids=np.array([annotations[i]['category_id'] for i in order], dtype=np.int32),
+        )
+
+    @classmethod
+    def load(cls, index_dir):
+        return cls(**{name: np.load(os.path.join(index_dir, f'{name}.npy'), mmap_mode='r') for name in INDEX_ARRAYS})
+
+    def save(self, index_dir):
+        Path(index_dir).mkdir(parents=True, exist_ok=True)
+        # category_ids.npy is written last and marks a complete index
+        for name in INDEX_ARRAYS:
+            tmp_path = os.path.join(index_dir, f'{name}.{os.getpid()}.tmp.npy')
+            np.save(tmp_path, getattr(self, name))
+            os.replace(tmp_path, os.path.join(index_dir, f'{name}.npy'))
+
+    def subset(self, category_ids):
+        """returns the index of the annotations of the given categories and of the images that have them"""
+        keep = np.isin(self.category_ids, category_ids)
+        image_index = np.repeat(np.arange(len(self)), np.diff(self.offsets))[keep]
+        counts = np.bincount(image_index, minlength=len(self))
+        images = np.flatnonzero(counts)
+        offsets = np.zeros(len(images) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(counts[images])
+        return CocoIndex(
+            image_ids=self.image_ids[images],
+            file_names=self.file_names[images],
+            image_sizes=self.image_sizes[images],
+            offsets=offsets,
+            boxes=self.boxes[keep],
+            category_ids=self.category_ids[keep],
+        )
+
+    def position(self, image_id):
+        return int(np.searchsorted(self.image_ids, image_id))
+
+    def file_name(self, i):
+        return self.file_names[i].decode()
+
+    def annotations(self, i):
+        """returns the xywh boxes and the category ids of image i"""
+        start, end = self.offsets[i], self.offsets[i + 1]
+        return self.boxes[start:end], self.category_ids[start:end]
+
+
+def get_coco_index(ann_file, cache_dir=None):
+    """
+    Returns the `CocoIndex` of a COCO annotation file. The index is built once and cached as .npy files
+    under `cache_dir` (`<cache root>/coco_index` by default), keyed by the path, size and mtime of the
+    annotation file, and is then loaded memory-mapped.
+    """
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.expanduser(get_cache_root()), 'coco_index')
+    ann_file = os.path.abspath(ann_file)
+    stat = os.stat(ann_file)
+    key = hashlib.sha1(f'{ann_file}:{stat.st_size}:{stat.st_mtime_ns}'.encode()).hexdigest()
+    index_dir = os.path.join(cache_dir, f'{Path(ann_file).stem}-{key[:16]}')
+    if not os.path.exists(os.path.join(index_dir, f'{INDEX_ARRAYS[-1]}.npy')):
+        CocoIndex.from_annotation_file(ann_file).save(index_dir)
+    return CocoIndex.load(index_dir)
@@ -41,17 +41,17 @@ from torchvision.transforms import functional as TF
 #                           tv_tf.ToTensor()])
 
 
-def default_transform_fn(img_size):
+def default_transform_fn(img_size, uint8=False):
     return ComposeWithLabel(
         [
             PadToSquareWithLabel(fill=(127, 127, 127)),
             ResizeWithLabel(img_size),
-            tv_tf.ToTensor(),
+            tv_tf.PILToTensor() if uint8 else tv_tf.ToTensor(),
         ]
     )
 
 
-def random_transform_fn(img_size):
+def random_transform_fn(img_size, uint8=False):
     return ComposeWithLabel(
         [
             RandomHorizontalFlipWithLabel(),
@@ -59,7 +59,7 @@ def random_transform_fn(img_size):
             # RandomAffineWithLabel(degrees=5, shear=10),
             RandomAdjustImage(),
             ClampLabel(),
-            tv_tf.ToTensor(),
+            tv_tf.PILToTensor() if uint8 else tv_tf.ToTensor(),
         ]
     )
 
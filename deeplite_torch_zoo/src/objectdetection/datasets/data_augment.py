@@ -144,23 +144,32 @@ class Resize(object):
     """
     Resize the image to target size and transforms it into a color channel(BGR->RGB),
     as well as pixel value normalization([0,1])
+
+    With uint8=True the image stays uint8 and is not normalized, scaling to [0,1]
+    is left to the consumer of the batch (see `images_to_float`)
     """
 
-    def __init__(self, target_shape, correct_box=True, normalize_image=True):
+    def __init__(self, target_shape, correct_box=True, normalize_image=True, uint8=False):
         self.h_target, self.w_target = target_shape
         self.correct_box = correct_box
-        self.normalize_image = normalize_image
+        self.normalize_image = normalize_image and not uint8
+        self.uint8 = uint8
 
     def __call__(self, img, bboxes):
         h_org, w_org, _ = img.shape
-        img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB).astype(np.float32)
+        img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+        if not self.uint8:
+            img = img.astype(np.float32)
 
         resize_ratio = min(1.0 * self.w_target / w_org, 1.0 * self.h_target / h_org)
         resize_w = int(resize_ratio * w_org)
         resize_h = int(resize_ratio * h_org)
         image_resized = cv2.resize(img, (resize_w, resize_h))
 
-        image_paded = np.full((self.h_target, self.w_target, 3), 128.0)
+        if self.uint8:
+            image_paded = np.full((self.h_target, self.w_target, 3), 128, dtype=np.uint8)
+        else:
+            image_paded = np.full((self.h_target, self.w_target, 3), 128.0)
         dw = int((self.w_target - resize_w) / 2)
         dh = int((self.h_target - resize_h) / 2)
         image_paded[dh : resize_h + dh, dw : resize_w + dw, :] = image_resized
@@ -183,7 +192,10 @@ class Mixup(object):
     def __call__(self, img_org, bboxes_org, img_mix, bboxes_mix):
         if random.random() < self.p:
             lam = np.random.beta(1.5, 1.5)
-            img = lam * img_org + (1 - lam) * img_mix
+            if img_org.dtype == np.uint8:
+                img = np.rint(np.float32(lam) * img_org + np.float32(1 - lam) * img_mix).astype(np.uint8)
+            else:
+                img = lam * img_org + (1 - lam) * img_mix
             bboxes_org = np.concatenate(
                 [bboxes_org, np.full((len(bboxes_org), 1), lam)], axis=1
             )
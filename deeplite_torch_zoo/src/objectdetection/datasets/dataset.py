@@ -2,20 +2,83 @@
 
 import random
 
+import cv2
 import numpy as np
+import torch
 from torch.utils.data import Dataset
 
+from deeplite_torch_zoo.src.objectdetection.datasets.batch_augment import \
+    BatchAugmentation
 from deeplite_torch_zoo.src.objectdetection.datasets.data_augment import (
     AugmentHSV, Mixup, RandomHorizontalFlip, RandomVerticalFlip, Resize,
     random_perspective)
+from deeplite_torch_zoo.src.objectdetection.datasets.image_cache import \
+    ImageCache
+
+
+def images_to_float(images, device=None, half=False):
+    """
+    Moves a batch of images to the device and converts it to fp32 (or fp16), uint8 batches
+    of datasets created with uint8=True are scaled to [0, 1] on the device.
+    """
+    is_uint8 = images.dtype == torch.uint8
+    images = images.to(device, non_blocking=True) if device is not None else images
+    images = images.half() if half else images.float()
+    if is_uint8:
+        images /= 255
+    return images
 
 
 class DLZooDataset(Dataset):
-    def __init__(self, hyp_cfg, img_size, augment=False, *args, **kwargs):
+    """
+    Base class of the detection datasets. With uint8=True images stay uint8 through
+    resizing, mosaic, mixup and HSV augmentation and are collated into uint8 batches,
+    which are 4x smaller to send from the DataLoader workers than fp32 ones. Batches
+    then have to be scaled to [0, 1] by the consumer, e.g. with `images_to_float`.
+
+    With cache_size (bytes) or cache_dir set, decoded images are kept in an `ImageCache`
+    shared by the DataLoader workers, so mosaic and mixup reuse them instead of decoding
+    each image several times per epoch. Cached images are already resized to img_size
+    and the augmentations are applied to them, as in YOLOv5.
+
+    With augment=True and batch_augment=True the workers only decode and resize the images,
+    mosaic, random perspective, flips and HSV augmentation are left to `batch_augmentation`,
+    which the training loop applies to the collated batches (e.g. on the GPU).
+    """
+    def __init__(self, hyp_cfg, img_size, augment=False, uint8=False, cache_size=0, cache_dir=None,
+        batch_augment=False, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._hyp_cfg = hyp_cfg
         self._img_size = img_size
-        self._do_augment = augment
+        self._do_augment = augment and not batch_augment
+        self.batch_augmentation = BatchAugmentation(hyp_cfg) if augment and batch_augment else None
+        self._uint8 = uint8
+        self._cache_size = cache_size
+        self._cache_dir = cache_dir
+        self.image_cache = None
+
+    def _init_image_cache(self, num_images):
+        # called by the subclasses once the number of images is known
+        if self._cache_size or self._cache_dir is not None:
+            self.image_cache = ImageCache(num_images, self._img_size, self._cache_size, self._cache_dir)
+
+    def _load_image(self, index, img_path):
+        """returns the BGR image, the ratio to scale its boxes by and the original (h, w) shape"""
+        if self.image_cache is not None:
+            return self.image_cache.load(index, img_path)
+        img = cv2.imread(img_path)  # H*W*C and C=BGR
+        assert img is not None, "File Not Found " + img_path
+        return img, 1.0, (img.shape[0], img.shape[1])
+
+    def _resize(self, img, bboxes, normalize_image=True):
+        return Resize((self._img_size, self._img_size), True, normalize_image, uint8=self._uint8)(
+            np.copy(img), np.copy(bboxes)
+        )
+
+    def _to_tensor(self, img):
+        if self._uint8:
+            return torch.from_numpy(np.ascontiguousarray(img))
+        return torch.from_numpy(img).float()
 
     def _augment(self, img, bboxes):
         img, bboxes = random_perspective(img, bboxes,
@@ -62,7 +125,7 @@ class DLZooDataset(Dataset):
 
             # place img in img4
             if i == 0:  # top left
-                img4 = np.full((s * 2, s * 2, img.shape[2]), 114.0, dtype=np.float32) #114, dtype=np.uint8)  # base image with 4 tiles
+                img4 = np.full((s * 2, s * 2, img.shape[2]), 114, dtype=np.uint8 if self._uint8 else np.float32)  # base image with 4 tiles
                 x1a, y1a, x2a, y2a = max(xc - w, 0), max(yc - h, 0), xc, yc  # xmin, ymin, xmax, ymax (large image)
                 x1b, y1b, x2b, y2b = w - (x2a - x1a), h - (y2a - y1a), w, h  # xmin, ymin, xmax, ymax (small image)
             elif i == 1:  # top right
@@ -93,9 +156,7 @@ class DLZooDataset(Dataset):
         bboxes4 = np.clip(bboxes4, 0, img4.shape[0])
 
         if resize_to_original_size:
-            img4, bboxes4 = Resize((s, s), True, False)(
-                np.copy(img4), np.copy(bboxes4)
-            )
+            img4, bboxes4 = self._resize(img4, bboxes4, normalize_image=False)
 
         img4 = img4.transpose(2, 0, 1)  # HWC->CHW
         return img4, bboxes4, img_id
@@ -0,0 +1,125 @@
+import hashlib
+import multiprocessing
+import os
+
+import cv2
+import numpy as np
+import torch
+
+_TICK, _HITS, _MISSES, _DISK_HITS, _EVICTIONS = range(5)
+
+
+class ImageCache:
+    """
+    Cache of decoded detection images, resized to fit into `img_size` x `img_size` the same way
+    as the letterbox `Resize` does, so the dataset only has to pad them.
+
+    Images are kept in a size-bounded LRU cache in shared memory, which is allocated when the
+    cache is created and is used by all the DataLoader workers. With `cache_dir`, images are also
+    stored on disk as .npy files keyed by the image path, its mtime and `img_size`, and are read
+    memory-mapped on a RAM cache miss instead of decoding the image again.
+
+    :param num_images: Number of images in the dataset, images are keyed by their index
+    :param img_size: Input size of the model
+    :param max_bytes: Size of the RAM cache in bytes, 0 to only use the disk cache
+    :param cache_dir: Directory of the disk cache, disabled if None
+    """
+
+    def __init__(self, num_images, img_size, max_bytes=0, cache_dir=None):
+        self.img_size = img_size
+        self.cache_dir = cache_dir
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+        slot_bytes = img_size * img_size * 3
+        self.num_slots = int(min(num_images, max_bytes // slot_bytes))
+        self._data = torch.empty((self.num_slots, slot_bytes), dtype=torch.uint8).share_memory_()
+        # image index, h, w, original h, original w of the image in each slot
+        self._slot_info = torch.full((self.num_slots, 5), -1, dtype=torch.int64).share_memory_()
+        self._slot_tick = torch.zeros(self.num_slots, dtype=torch.int64).share_memory_()
+        self._image_slot = torch.full((num_images,), -1, dtype=torch.int64).share_memory_()
+        self._counters = torch.zeros(5, dtype=torch.int64).share_memory_()
+        self._lock = multiprocessing.Lock()
+
+    def load(self, index, img_path):
+        """
+        returns the BGR image resized to fit into img_size x img_size, the ratio to scale
+        its boxes by and the original (h, w) shape of the image
+        """
+        with self._lock:
+            counters = self._counters.numpy()
+            slot = int(self._image_slot[index])
+            if slot >= 0:
+                counters[_TICK] += 1
+                counters[_HITS] += 1
+                self._slot_tick[slot] = int(counters[_TICK])
+                _, h, w, h0, w0 = self._slot_info[slot].tolist()
+                img = self._data[slot, :h * w * 3].numpy().reshape(h, w, 3).copy()
+                return img, self._ratio(h0, w0), (h0, w0)
+            counters[_MISSES] += 1
+
+        img, original_shape = self._read(img_path)
+        if self.num_slots:
+            self._store(index, img, original_shape)
+        return img, self._ratio(*original_shape), original_shape
+
+    def stats(self):
+        counters = self._counters.tolist()
+        return {
+            'hits': counters[_HITS],
+            'misses': counters[_MISSES],
+            'disk_hits': counters[_DISK_HITS],
+            'evictions': counters[_EVICTIONS],
+            'cached': int((self._slot_info[:, 0] >= 0).sum()),
+            'capacity': self.num_slots,
+        }
+
+    def _ratio(self, h0, w0):
+        return min(1.0 * self.img_size / w0, 1.0 * self.img_size / h0)
+
+    def _store(self, index, img, original_shape):
+        h, w, _ = img.shape
+        with self._lock:
+            if self._image_slot[index] >= 0:  # cached by another worker in the meantime
+                return
+            counters = self._counters.numpy()
+            # empty slots have a zero tick and are used first
+            slot = int(self._slot_tick.argmin())
+            evicted = int(self._slot_info[slot, 0])
+            if evicted >= 0:
+                self._image_slot[evicted] = -1
+                counters[_EVICTIONS] += 1
+            counters[_TICK] += 1
+            self._data[slot, :h * w * 3] = torch.from_numpy(img.reshape(-1))
+            self._slot_info[slot] = torch.tensor([index, h, w, *original_shape])
+            self._slot_tick[slot] = int(counters[_TICK])
+            self._image_slot[index] = slot
+
+    def _read(self, img_path):
+        cache_path = self._cache_path(img_path) if self.cache_dir is not None else None
+        if cache_path is not None and os.path.exists(cache_path):
+            record = np.load(cache_path, mmap_mode='r')
+            with self._lock:
+                self._counters[_DISK_HITS] += 1
+            return np.array(record['image']), tuple(int(x) for x in record['shape'])
+
+        img = cv2.imread(img_path)  # H*W*C and C=BGR
+        assert img is not None, "File Not Found " + img_path
+        h0, w0 = img.shape[:2]
+        ratio = self._ratio(h0, w0)
+        img = cv2.resize(img, (int(ratio * w0), int(ratio * h0)))
+
+        if cache_path is not None:
+            record = np.zeros((), dtype=[('shape', np.int64, 2), ('image', np.uint8, img.shape)])
+            record['shape'] = (h0, w0)
+            record['image'] = img
+            tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'wb') as f:
+                np.save(f, record)
+            os.replace(tmp_path, cache_path)
+        return img, (h0, w0)
+
+    def _cache_path(self, img_path):
+        img_path = os.path.abspath(img_path)
+        key = f'{img_path}:{os.stat(img_path).st_mtime_ns}:{self.img_size}'
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode()).hexdigest() + '.npy')
@@ -4,11 +4,12 @@ import csv
 import random
 from pathlib import Path
 
-import cv2
 import numpy as np
 import torch
 
 import deeplite_torch_zoo.src.objectdetection.yolov5.configs.hyps.hyp_config_lisa as lisa_cfg
+from deeplite_torch_zoo.src.objectdetection.datasets.batch import \
+    DetectionBatch
 from deeplite_torch_zoo.src.objectdetection.datasets.dataset import \
     DLZooDataset
 
@@ -19,9 +20,10 @@ class LISA(DLZooDataset):
     """
 
     def __init__(
-        self, data_folder="data/lisa", _set="train", split=0.7, seed=123, img_size=416
+        self, data_folder="data/lisa", _set="train", split=0.7, seed=123, img_size=416, uint8=False,
+        cache_size=0, cache_dir=None
     ):
-        super().__init__(lisa_cfg.TRAIN, img_size)
+        super().__init__(lisa_cfg.TRAIN, img_size, uint8=uint8, cache_size=cache_size, cache_dir=cache_dir)
         """
         :param data_folder: folder where data files are stored
         :param split: split data randomly with split % for training and 1 - split % for validation
@@ -85,6 +87,7 @@ class LISA(DLZooDataset):
             self.objects = self._subsample(self.objects, valid_indices)
 
         assert len(self.images) == len(self.objects)
+        self._init_image_cache(len(self.images))
 
     @property
     def available_sets(self):
@@ -99,12 +102,13 @@ class LISA(DLZooDataset):
 
     def _get_image(self, idx):
         file_path = str(self.data_folder / self.images[idx])
-        img = cv2.imread(file_path)
+        img, ratio, _ = self._load_image(idx, file_path)
         objects = self.objects[idx]
         labels = [self.label_map[label] for label in objects["labels"]]
         boxes = objects["boxes"]
         bboxes = np.zeros((len(boxes), 5))
         bboxes[:, :4] = boxes
+        bboxes[:, :4] *= ratio
         img, bboxes = self._augment(img, bboxes)
         bboxes[:, 4] = labels
         return img, bboxes
@@ -117,7 +121,7 @@ class LISA(DLZooDataset):
 
         img, bboxes = self._load_mixup(i, self._get_image,
             len(self.images), p= lisa_cfg.TRAIN['mixup'])
-        img = torch.from_numpy(img).float()
+        img = self._to_tensor(img)
         bboxes = torch.from_numpy(bboxes).float()
 
         return img, bboxes, bboxes.shape[0], 0
@@ -129,30 +133,5 @@ class LISA(DLZooDataset):
         return len(self.images)
 
     def collate_img_label_fn(self, sample):
-        images = []
-        labels = []
-        lengths = []
-        labels_with_tail = []
-        img_ids = []
-        max_num_obj = 0
-        for image, label, length, img_id in sample:
-            images.append(image)
-            labels.append(label)
-            lengths.append(length)
-            img_ids.append(torch.tensor([img_id]))
-            max_num_obj = max(max_num_obj, length)
-        for label in labels:
-            num_obj = label.size(0)
-            zero_tail = torch.zeros(
-                (max_num_obj - num_obj, label.size(1)),
-                dtype=label.dtype,
-                device=label.device,
-            )
-            label_with_tail = torch.cat((label, zero_tail), dim=0)
-            labels_with_tail.append(label_with_tail)
-        image_tensor = torch.stack(images)
-        label_tensor = torch.stack(labels_with_tail)
-        length_tensor = torch.tensor(lengths)
-        img_ids_tensor = torch.stack(img_ids)
-        return image_tensor, label_tensor, length_tensor, img_ids_tensor
-
+        images, labels, _, _ = zip(*sample)
+        return DetectionBatch.collate(images, labels)
@@ -4,19 +4,23 @@ import os
 import random
 from pathlib import Path
 
-import cv2
 import numpy as np
 import torch
+from numpy.lib import recfunctions
 
 import deeplite_torch_zoo.src.objectdetection.yolov5.configs.hyps.hyp_config_voc as cfg
-from deeplite_torch_zoo.src.objectdetection.datasets.data_augment import Resize
+from deeplite_torch_zoo.src.objectdetection.datasets.batch import \
+    DetectionBatch
 from deeplite_torch_zoo.src.objectdetection.datasets.dataset import \
     DLZooDataset
+from deeplite_torch_zoo.src.objectdetection.datasets.voc_utils import \
+    get_annotation_index
 
 
 class VocDataset(DLZooDataset):
-    def __init__(self, annotation_path, anno_file_type, augment=False, img_size=416, class_names=None):
-        super().__init__(cfg.TRAIN, img_size, augment)
+    def __init__(self, annotation_path, anno_file_type, augment=False, img_size=416, class_names=None, uint8=False,
+        cache_size=0, cache_dir=None, batch_augment=False):
+        super().__init__(cfg.TRAIN, img_size, augment, uint8, cache_size, cache_dir, batch_augment)
 
         self.annotation_path = annotation_path
         with open(os.path.join(annotation_path, 'class_names.txt'), 'r') as f:
@@ -28,16 +32,15 @@ class VocDataset(DLZooDataset):
                 raise RuntimeError(f'Classes in the val datatset and class_names.txt are not the same: '
                     '{class_names} vs. {self.classes}')
 
-        self.__annotations = self.__load_annotations(anno_file_type)
+        self.__img_paths, self.__offsets, self.__boxes = self.__load_annotations(anno_file_type)
+        self.__indices = np.arange(len(self.__img_paths))
         if anno_file_type == "train":
-            self.__annotations = [
-                annotation
-                for annotation in self.__annotations
-                if self.__not_empty(annotation)
-            ]
+            # skip the images without boxes
+            self.__indices = np.flatnonzero(np.diff(self.__offsets) > 0)
+        self._init_image_cache(len(self.__indices))
 
     def __len__(self):
-        return len(self.__annotations)
+        return len(self.__indices)
 
     def __getitem__(self, item):
         """
@@ -45,97 +48,56 @@ class VocDataset(DLZooDataset):
             bboxes of shape nx6, where n is number of labels in the image and x1,y1,x2,y2, class_id and confidence.
         """
 
-        get_img_fn = lambda img_index: self.__parse_annotation(self.__annotations[img_index])
+        get_img_fn = lambda img_index: self.__parse_annotation(img_index)
         if self._do_augment and random.random() < cfg.TRAIN['mosaic']:
             shape = None
             img, bboxes, img_id = self._load_mosaic(item, get_img_fn,
-                len(self.__annotations))
+                len(self.__indices))
         elif self._do_augment and cfg.TRAIN['mixup'] > 0:
             img, bboxes, img_id, shape = self._load_mixup(item, get_img_fn,
-                len(self.__annotations), p=cfg.TRAIN['mixup'])
+                len(self.__indices), p=cfg.TRAIN['mixup'])
         else:
             img, bboxes, img_id, shape = get_img_fn(item)
             img = img.transpose(2, 0, 1)
 
-        img = torch.from_numpy(img).float()
+        img = self._to_tensor(img)
         bboxes = torch.from_numpy(bboxes).float()
         return img, bboxes, bboxes.shape[0], img_id, shape
 
     def collate_img_label_fn(self, sample):
-        images = []
-        labels = []
-        lengths = []
-        shapes = []
-        labels_with_tail = []
-        max_num_obj = 0
-        for image, label, length, _, shape in sample:
-            images.append(image)
-            labels.append(label)
-            lengths.append(length)
-            shapes.append(shape)
-            max_num_obj = max(max_num_obj, length)
-        for label in labels:
-            num_obj = label.size(0)
-            zero_tail = torch.zeros(
-                (max_num_obj - num_obj, label.size(1)),
-                dtype=label.dtype,
-                device=label.device,
-            )
-            label_with_tail = torch.cat((label, zero_tail), dim=0)
-            labels_with_tail.append(label_with_tail)
-        image_tensor = torch.stack(images)
-        label_tensor = torch.stack(labels_with_tail)
-        length_tensor = torch.tensor(lengths)
-        shape_tensor = torch.tensor(shapes)
-        return image_tensor, label_tensor, length_tensor, shape_tensor
+        images, labels, _, _, shapes = zip(*sample)
+        return DetectionBatch.collate(images, labels, shapes)
 
     def __load_annotations(self, anno_type):
-
+        """
+        returns the memory-mapped image paths, box offsets and boxes of the text annotations created by
+        `prepare_yolo_voc_data`, from the annotation index cached by `get_annotation_index`
+        """
         assert anno_type in [
             "train",
             "test",
         ], "You must choice one of the 'train' or 'test' for anno_type parameter"
         anno_path = os.path.join(self.annotation_path, anno_type + "_annotation.txt")
-        with open(anno_path, "r") as f:
-            annotations = list(filter(lambda x: len(x) > 0, f.readlines()))
-        assert len(annotations) > 0, "No images found in {}".format(anno_path)
-
-        return annotations
-
-    def __not_empty(self, annotation):
-        anno = annotation.strip().split(" ")
-        bboxes = np.array([list(map(str, box.split(","))) for box in anno[1:]])
-        return len(bboxes)
+        img_paths, offsets, boxes = get_annotation_index(anno_path, self.classes)
+        assert len(img_paths) > 0, "No images found in {}".format(self.annotation_path)
+        return img_paths, offsets, boxes
 
-    def __parse_annotation(self, annotation):
+    def __parse_annotation(self, index):
         """
-        Data augument.
-        :param annotation: Image' path and bboxes' coordinates, categories.
-        ex. [image_path xmin,ymin,xmax,ymax,class_ind xmin,ymin,xmax,ymax,class_ind ...]
+        Loads the image and its boxes and applies the augmentations.
+        :param index: Index of the image in the dataset.
         :return: Return the enhanced image and bboxes. bbox'shape is [xmin, ymin, xmax, ymax, class_ind]
         """
-        anno = annotation.strip().split(" ")
-
-        img_path = anno[0]
-
-        img = cv2.imread(img_path)  # H*W*C and C=BGR
-        assert img is not None, "File Not Found " + img_path
-
-        original_shape = (img.shape[0], img.shape[1])
-
-        def map_box_data(box_data):
-            class_id = self.classes.index(box_data[4])
-            return [float(value) for value in box_data[:4]] + [class_id]
-
-        bboxes = np.array([map_box_data(box.split(',')) for box in anno[1:]])
+        i = self.__indices[index]
+        img_path = self.__img_paths[i].decode()
+        img, ratio, original_shape = self._load_image(index, img_path)
 
-        if len(bboxes) == 0:
-            bboxes = np.array(np.zeros((0, 5)))
+        boxes = self.__boxes[self.__offsets[i]:self.__offsets[i + 1]]
+        bboxes = recfunctions.structured_to_unstructured(boxes, dtype=np.float64)
+        bboxes[:, :4] *= ratio
 
         if self._do_augment:
             img, bboxes = self._augment(img, bboxes)
 
-        img, bboxes = Resize((self._img_size, self._img_size), True)(
-            np.copy(img), np.copy(bboxes)
-        )
+        img, bboxes = self._resize(img, bboxes)
         return img, bboxes, str(Path(img_path).stem), original_shape
@@ -1,111 +1,208 @@
 # Code modified from https://github.com/Peterisfar/YOLOV3/
 
 import argparse
+import hashlib
 import os
 import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import numpy as np
+from numpy.lib import recfunctions
 from tqdm import tqdm
 
+from deeplite_torch_zoo.utils.checkpoints import get_cache_root
+
+# boxes of all the images of a split, the boxes of image i are boxes[offsets[i]:offsets[i + 1]]
+BOX_DTYPE = np.dtype([('xmin', np.float32), ('ymin', np.float32), ('xmax', np.float32),
+    ('ymax', np.float32), ('class_id', np.int32)])
+INDEX_FILES = ('paths.npy', 'offsets.npy', 'boxes.npy')
+
+
+def get_annotation_index_dir(anno_path, classes, cache_dir=None):
+    """
+    Directory of the annotation index of a text annotation file under `cache_dir` (`<cache root>/voc_index`
+    by default), keyed by the path, size and mtime of the file and by the class names, so that the index is
+    rebuilt when the annotations or class_names.txt change
+    """
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.expanduser(get_cache_root()), 'voc_index')
+    anno_path = os.path.abspath(anno_path)
+    stat = os.stat(anno_path)
+    key = hashlib.sha1(f'{anno_path}:{stat.st_size}:{stat.st_mtime_ns}:{" ".join(classes)}'.encode()).hexdigest()
+    return os.path.join(cache_dir, f'{Path(anno_path).stem}-{key[:16]}')
+
+
+def build_annotation_index(image_paths, image_boxes):
+    """
+    Packs the annotations of a split into a path table, per-image offsets and a structured array
+    of boxes (`BOX_DTYPE`).
+
+    :param image_paths: List of image paths
+    :param image_boxes: List of (n, 5) arrays of xmin, ymin, xmax, ymax, class_id, one per image
+    """
+    offsets = np.zeros(len(image_boxes) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(boxes) for boxes in image_boxes])
+    boxes = np.concatenate([np.asarray(boxes, dtype=np.float64).reshape(-1, 5) for boxes in image_boxes]) \
+        if image_boxes else np.zeros((0, 5))
+    return (
+        np.array([str(path).encode() for path in image_paths], dtype=np.bytes_),
+        offsets,
+        recfunctions.unstructured_to_structured(boxes, dtype=BOX_DTYPE),
+    )
+
 
-def parse_voc_annotation(data_path, file_type, anno_path, use_difficult_bbox=False):
-    class_names = []
+def save_annotation_index(index_dir, image_paths, image_boxes):
+    """Saves the annotation index of a split, which `load_annotation_index` maps into memory"""
+    Path(index_dir).mkdir(parents=True, exist_ok=True)
+    # boxes.npy is written last and marks a complete index
+    for filename, array in zip(INDEX_FILES, build_annotation_index(image_paths, image_boxes)):
+        tmp_path = os.path.join(index_dir, f'{Path(filename).stem}.{os.getpid()}.tmp.npy')
+        np.save(tmp_path, array)
+        os.replace(tmp_path, os.path.join(index_dir, filename))
+
+
+def load_annotation_index(index_dir):
+    """returns the memory-mapped path table, offsets and boxes saved by `save_annotation_index`"""
+    return tuple(np.load(os.path.join(index_dir, filename), mmap_mode='r') for filename in INDEX_FILES)
+
+
+def get_annotation_index(anno_path, classes, cache_dir=None):
+    """
+    Returns the memory-mapped path table, offsets and boxes of a text annotation file. The index is built
+    once from the text file and cached in `get_annotation_index_dir`.
+    """
+    index_dir = get_annotation_index_dir(anno_path, classes, cache_dir)
+    if not os.path.exists(os.path.join(index_dir, INDEX_FILES[-1])):
+        save_annotation_index(index_dir, *parse_text_annotations(anno_path, classes))
+    return load_annotation_index(index_dir)
+
+
+def parse_text_annotations(anno_path, classes):
+    """
+    Parses the text annotations, one
+    "image_path xmin,ymin,xmax,ymax,class_name xmin,ymin,xmax,ymax,class_name ..." line per image,
+    into the image paths and (n, 5) arrays of boxes with class ids taken from `classes`
+    """
+    image_paths, image_boxes = [], []
+    with open(anno_path, "r") as f:
+        for line in f:
+            anno = line.strip().split(" ")
+            if not anno[0]:
+                continue
+            image_paths.append(anno[0])
+            boxes = [box.split(",") for box in anno[1:]]
+            image_boxes.append([[float(value) for value in box[:4]] + [classes.index(box[4])] for box in boxes])
+    return image_paths, image_boxes
+
+
+def _index_images(images_dir):
+    image_index = {}
+    for entry in os.scandir(images_dir):
+        image_index.setdefault(os.path.splitext(entry.name)[0], []).append(entry.path)
+    return image_index
+
+
+def _find_image(image_index, image_id):
+    image_paths = image_index.get(image_id)
+    if image_paths is None:
+        # image names that contain the image id, as matched by glob(f'*{image_id}*')
+        image_paths = [path for stem, paths in image_index.items() if image_id in stem for path in paths]
+    if len(image_paths) > 1:
+        raise RuntimeError(f'More than one file matched with image id {image_id}')
+    if not image_paths:
+        raise FileNotFoundError(f'No image found for image id {image_id}')
+    return image_paths[0]
+
+
+def _parse_voc_xml(label_path, use_difficult_bbox=False):
+    objects = []
+    root = ET.parse(label_path).getroot()
+    for obj in root.findall("object"):
+        if obj.find("difficult"):
+            difficult = obj.find("difficult").text.strip()
+            if (not use_difficult_bbox) and (
+                int(difficult) == 1
+            ):  # difficult
+                continue
+        bbox = obj.find("bndbox")
+        name = obj.find("name").text.lower().strip()
+        objects.append((*[float(bbox.find(key).text.strip()) for key in ("xmin", "ymin", "xmax", "ymax")], name))
+    return objects
+
+
+def parse_voc_annotation(data_path, file_type, use_difficult_bbox=False, num_workers=None):
+    """
+    Parses the VOC annotations of the images listed in ImageSets/Main/<file_type>.txt,
+    the XML files are parsed in a pool of `num_workers` processes.
+
+    :return: Image paths, lists of (xmin, ymin, xmax, ymax, class_name) objects per image and
+        the class names in the order of their first appearance
+    """
     img_inds_file = os.path.join(data_path, "ImageSets", "Main", file_type + ".txt")
     with open(img_inds_file, "r") as f:
         lines = f.readlines()
         image_ids = [line.strip() for line in lines]
 
-    with open(anno_path, "a") as f:
-        for image_id in tqdm(image_ids):
-            image_paths = [file for file in Path(os.path.join(data_path, "JPEGImages")).glob(f'*{image_id}*')]
-            if len(image_paths) > 1:
-                raise RuntimeError(f'More than one file matched with image id {image_id}')
-            annotation = str(image_paths[0])
-            label_path = os.path.join(data_path, "Annotations", image_id + ".xml")
-            root = ET.parse(label_path).getroot()
-            objects = root.findall("object")
-            for obj in objects:
-                if obj.find("difficult"):
-                    difficult = obj.find("difficult").text.strip()
-                    if (not use_difficult_bbox) and (
-                        int(difficult) == 1
-                    ):  # difficult
-                        continue
-                bbox = obj.find("bndbox")
-                name = obj.find("name").text.lower().strip()
-                if name not in class_names:
-                    class_names.append(name)
-                xmin = bbox.find("xmin").text.strip()
-                ymin = bbox.find("ymin").text.strip()
-                xmax = bbox.find("xmax").text.strip()
-                ymax = bbox.find("ymax").text.strip()
-                annotation += " " + ",".join([xmin, ymin, xmax, ymax, str(name)])
-            annotation += "\n"
-            f.write(annotation)
-    return len(image_ids), class_names
-
-
-def prepare_voc_data(train_data_paths, test_data_paths, data_root_annotation, train_test_split):
-    print("Preparing VOC dataset for YOLO. Onetime process...")
-    train_annotation_path = os.path.join(
-        str(data_root_annotation), "train_annotation.txt"
-    )
-    if os.path.exists(train_annotation_path):
-        os.remove(train_annotation_path)
+    image_index = _index_images(os.path.join(data_path, "JPEGImages"))
+    image_paths = [_find_image(image_index, image_id) for image_id in image_ids]
+    label_paths = [os.path.join(data_path, "Annotations", image_id + ".xml") for image_id in image_ids]
+    use_difficult_bbox = [use_difficult_bbox] * len(label_paths)
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        image_objects = list(tqdm(executor.map(_parse_voc_xml, label_paths, use_difficult_bbox, chunksize=64),
+            total=len(label_paths)))
 
-    test_annotation_path = os.path.join(
-        str(data_root_annotation), "test_annotation.txt"
-    )
-    if os.path.exists(test_annotation_path):
-        os.remove(test_annotation_path)
+    class_names = list(dict.fromkeys(obj[4] for objects in image_objects for obj in objects))
+    return image_paths, image_objects, class_names
 
-    class_names_file_path = os.path.join(
-        str(data_root_annotation), "class_names.txt"
-    )
-    if os.path.exists(class_names_file_path):
-        os.remove(class_names_file_path)
 
-    train_file_tag, test_file_tag = train_test_split
+def _annotation_line(image_path, objects, classes):
+    line = str(image_path)
+    for *box, name in objects:
+        if name not in classes:
+            raise ValueError(f'Class {name} of {image_path} is not one of the training classes {classes}')
+        line += ' ' + ','.join([*(f'{value:g}' for value in box), name])
+    return line + '\n'
 
-    len_train_total = 0
-    class_names_train = []
-    for train_data_path in train_data_paths:
-        len_train, class_names = parse_voc_annotation(
-            train_data_path,
-            train_file_tag,
-            train_annotation_path,
-            use_difficult_bbox=False,
-        )
-        len_train_total += len_train
-        class_names_train += class_names
-    class_names_train = set(class_names_train)
-
-    len_test_total = 0
-    class_names_test = []
-    for test_data_path in test_data_paths:
-        len_test, class_names = parse_voc_annotation(
-            test_data_path,
-            test_file_tag,
-            test_annotation_path,
-            use_difficult_bbox=False,
-        )
-        len_test_total += len_test
-        class_names_test += class_names
-    class_names_test = set(class_names_test)
-
-    with open(class_names_file_path, 'w') as f:
-        f.write(' '.join(sorted(list(class_names_train))))
 
+def prepare_voc_data(train_data_paths, test_data_paths, data_root_annotation, train_test_split, num_workers=None):
+    print("Preparing VOC dataset for YOLO. Onetime process...")
+    train_file_tag, test_file_tag = train_test_split
+    splits = {}
+    for anno_type, data_paths, file_tag in (('train', train_data_paths, train_file_tag),
+        ('test', test_data_paths, test_file_tag)):
+        splits[anno_type] = ([], [])
+        for data_path in data_paths:
+            image_paths, image_objects, _ = parse_voc_annotation(
+                data_path,
+                file_tag,
+                use_difficult_bbox=False,
+                num_workers=num_workers,
+            )
+            splits[anno_type][0].extend(image_paths)
+            splits[anno_type][1].extend(image_objects)
+
+    class_names_train = sorted({obj[4] for objects in splits['train'][1] for obj in objects})
+    with open(os.path.join(str(data_root_annotation), "class_names.txt"), 'w') as f:
+        f.write(' '.join(class_names_train))
+
+    for anno_type, (image_paths, image_objects) in splits.items():
+        anno_path = os.path.join(str(data_root_annotation), anno_type + "_annotation.txt")
+        with open(anno_path, 'w') as f:
+            for image_path, objects in zip(image_paths, image_objects):
+                f.write(_annotation_line(image_path, objects, class_names_train))
+
+    len_train, len_test = len(splits['train'][0]), len(splits['test'][0])
     print(f"The number of images for train and test are: \
-            train : {len_train} | test : {len_test}. The number of classes is {len(class_names_train)}".format(len_train, len_test))
+            train : {len_train} | test : {len_test}. The number of classes is {len(class_names_train)}")
 
 
 def prepare_yolo_voc_data(vockit_data_root, annotation_path, standard_voc_format=True, is_07_subset=False):
 
     Path(annotation_path).mkdir(parents=True, exist_ok=True)
 
-    train_anno_path = os.path.join(str(annotation_path), "train_annotation.txt")
-    test_anno_path = os.path.join(str(annotation_path), "test_annotation.txt")
+    text_anno_paths = [os.path.join(str(annotation_path), f"{anno_type}_annotation.txt")
+        for anno_type in ('train', 'test')]
 
     if standard_voc_format:
         train_data_paths = [os.path.join(vockit_data_root, "VOC2007"),
@@ -117,7 +214,7 @@ def prepare_yolo_voc_data(vockit_data_root, annotation_path, standard_voc_format
 
     train_test_split = ('trainval', 'test') if not is_07_subset else ('train', 'val')
 
-    if not (os.path.exists(train_anno_path) and os.path.exists(test_anno_path)):
+    if not all(os.path.exists(anno_path) for anno_path in text_anno_paths):
         prepare_voc_data(train_data_paths, test_data_paths, annotation_path, train_test_split)
 
 
@@ -134,4 +231,4 @@ if __name__ == "__main__":
     )
     args = parser.parse_args()
 
-    prepare_voc_data(args.vockid_path, args.annotation_path)
+    prepare_yolo_voc_data(args.vockid_path, args.annotation_path)
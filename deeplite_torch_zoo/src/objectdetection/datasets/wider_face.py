@@ -5,12 +5,12 @@ from os.path import abspath, expanduser
 from pathlib import Path
 from typing import Dict, List, Union
 
-import cv2
 import numpy as np
 import torch
 
 import deeplite_torch_zoo.src.objectdetection.yolov5.configs.hyps.hyp_config_default as cfg
-from deeplite_torch_zoo.src.objectdetection.datasets.data_augment import Resize
+from deeplite_torch_zoo.src.objectdetection.datasets.batch import \
+    DetectionBatch
 from deeplite_torch_zoo.src.objectdetection.datasets.dataset import \
     DLZooDataset
 
@@ -21,8 +21,8 @@ WF_CLASS_NAMES = {
 
 
 class WiderFace(DLZooDataset):
-    def __init__(self, root, split="train", num_classes=None, img_size=416):
-        super().__init__(cfg.TRAIN, img_size)
+    def __init__(self, root, split="train", num_classes=None, img_size=416, uint8=False, cache_size=0, cache_dir=None):
+        super().__init__(cfg.TRAIN, img_size, uint8=uint8, cache_size=cache_size, cache_dir=cache_dir)
         """`WIDERFace <http://shuoyang1213.me/WIDERFACE/>`_ Dataset.
         Args:
             root (string): Root directory where images and annotations are downloaded to.
@@ -53,6 +53,7 @@ class WiderFace(DLZooDataset):
         if num_classes is not None:
             self.num_classes = num_classes
         self.inv_map = {k: v for k, v in enumerate(sorted(list(self.classes)))}
+        self._init_image_cache(len(self.img_info))
 
     def __getitem__(self, item):
         """
@@ -60,16 +61,16 @@ class WiderFace(DLZooDataset):
             bboxes of shape nx6, where n is number of labels in the image and x1,y1,x2,y2, class_id and confidence.
         """
 
-        get_img_fn = lambda img_index: self.__parse_annotation(self.img_info[img_index])
-        img, bboxes, img_id = self._load_mixup(item, get_img_fn,
+        get_img_fn = lambda img_index: self.__parse_annotation(self.img_info[img_index], img_index)
+        img, bboxes, img_id, _ = self._load_mixup(item, get_img_fn,
             len(self.img_info), p=cfg.TRAIN['mixup'])
 
-        img = torch.from_numpy(img).float()
+        img = self._to_tensor(img)
         bboxes = torch.from_numpy(bboxes).float()
 
         return img, bboxes, bboxes.shape[0], img_id
 
-    def __parse_annotation(self, _info):
+    def __parse_annotation(self, _info, index):
         """
         Data augument.
         :param annotation: Image' path and bboxes' coordinates, categories.
@@ -78,10 +79,9 @@ class WiderFace(DLZooDataset):
         """
 
         img_path = _info["img_path"]
-        img = cv2.imread(img_path)  # H*W*C and C=BGR
-        assert img is not None, "File Not Found " + img_path
+        img, ratio, original_shape = self._load_image(index, img_path)
 
-        bboxes = _info["annotations"]["bbox"]
+        bboxes = _info["annotations"]["bbox"] * ratio
         labels = np.ones((len(bboxes), 1))
         bboxes = np.concatenate((bboxes, labels), axis=1)
 
@@ -89,35 +89,12 @@ class WiderFace(DLZooDataset):
             bboxes = np.array(np.zeros((0, 5)))
         else:
             img, bboxes = self._augment(img, bboxes)
-        img, bboxes = Resize((self._img_size, self._img_size), True)(
-            np.copy(img), np.copy(bboxes)
-        )
-        return img, bboxes, str(Path(img_path).stem)
+        img, bboxes = self._resize(img, bboxes)
+        return img, bboxes, str(Path(img_path).stem), original_shape
 
     def collate_img_label_fn(self, sample):
-        images = []
-        labels = []
-        lengths = []
-        labels_with_tail = []
-        max_num_obj = 0
-        for image, label, length, img_id in sample:
-            images.append(image)
-            labels.append(label)
-            lengths.append(length)
-            max_num_obj = max(max_num_obj, length)
-        for label in labels:
-            num_obj = label.size(0)
-            zero_tail = torch.zeros(
-                (max_num_obj - num_obj, label.size(1)),
-                dtype=label.dtype,
-                device=label.device,
-            )
-            label_with_tail = torch.cat((label, zero_tail), dim=0)
-            labels_with_tail.append(label_with_tail)
-        image_tensor = torch.stack(images)
-        label_tensor = torch.stack(labels_with_tail)
-        length_tensor = torch.tensor(lengths)
-        return image_tensor, label_tensor, length_tensor, None
+        images, labels, _, _ = zip(*sample)
+        return DetectionBatch.collate(images, labels)
 
     def __len__(self) -> int:
         return len(self.img_info)
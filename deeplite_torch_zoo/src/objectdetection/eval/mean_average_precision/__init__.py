@@ -23,4 +23,5 @@ SOFTWARE.
 """
 from .metric_builder import MetricBuilder
 from .mean_average_precision_2d import MeanAveragePrecision2d
-from .multiprocessing import MetricMultiprocessing
+from .mean_average_precision_2d_numpy import MeanAveragePrecision2dNumpy
+from .multiprocessing import MetricMultiprocessing, MetricThreading
@@ -0,0 +1,256 @@
+"""
+MIT License
+
+Copyright (c) 2020 Sergei Belousov
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import numpy as np
+
+from .mean_average_precision_2d import MeanAveragePrecision2d
+from .utils import (compute_average_precision,
+                    compute_average_precision_with_recall_thresholds,
+                    compute_iou, compute_precision_recall)
+
+
+class GrowableArray:
+    """ Append-only 1d array with amortized O(1) growth.
+
+    Arguments:
+        dtype (np.dtype): type of stored elements.
+        capacity (int): initial number of preallocated elements.
+    """
+    def __init__(self, dtype, capacity=1024):
+        self._buffer = np.empty(capacity, dtype=dtype)
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def data(self):
+        """ View of the filled part of the buffer."""
+        return self._buffer[:self._size]
+
+    def extend(self, values):
+        """ Append values to the end of the array."""
+        values = np.asarray(values, dtype=self._buffer.dtype).ravel()
+        size = self._size + values.shape[0]
+        if size > self._buffer.shape[0]:
+            buffer = np.empty(max(size, 2 * self._buffer.shape[0]), dtype=self._buffer.dtype)
+            buffer[:self._size] = self._buffer[:self._size]
+            self._buffer = buffer
+        self._buffer[self._size:size] = values
+        self._size = size
+
+
+def ragged_arange(starts, lengths):
+    """ Concatenate ranges [start, start + length) into one flat index array."""
+    offsets = np.cumsum(lengths) - lengths
+    return np.repeat(starts - offsets, lengths) + np.arange(lengths.sum())
+
+
+class MeanAveragePrecision2dNumpy(MeanAveragePrecision2d):
+    """ Mean Average Precision for object detection with columnar NumPy storage.
+
+    Produces the same output as MeanAveragePrecision2d, but keeps all the matches
+    in flat growable arrays instead of per-class DataFrames: one record per
+    predicted box plus a flat buffer of its IoU's with the gt boxes of the same
+    class and image. TP/FP assignment is vectorized over all the images of a class.
+
+    Arguments:
+        num_classes (int): number of classes.
+    """
+    def add(self, preds, gt):
+        """ Add sample to evaluation.
+
+        Arguments:
+            preds (np.array): predicted boxes.
+            gt (np.array): ground truth boxes.
+
+        Input format:
+            preds: [xmin, ymin, xmax, ymax, class_id, confidence]
+            gt: [xmin, ymin, xmax, ymax, class_id, difficult, crowd]
+        """
+        assert preds.ndim == 2 and preds.shape[1] == 6
+        assert gt.ndim == 2 and gt.shape[1] == 7
+        preds = preds[self._valid_class_mask(preds[:, 4])]
+        gt = gt[self._valid_class_mask(gt[:, 4])]
+        gt = gt[np.argsort(gt[:, 4], kind='stable')]
+        pred_cls = preds[:, 4].astype(np.int64)
+        gt_cls = gt[:, 4].astype(np.int64)
+
+        self.class_counter += np.bincount(gt_cls, minlength=self.num_classes).astype(np.int32)
+        gt_offset = len(self._gt_difficult)
+        self._gt_difficult.extend(gt[:, 5] != 0)
+        self._gt_crowd.extend(gt[:, 6] != 0)
+
+        if preds.shape[0] > 0:
+            same_class = pred_cls[:, None] == gt_cls[None, :]
+            num_gt = same_class.sum(axis=1)
+            iou_offset = len(self._iou)
+            if gt.shape[0] > 0:
+                self._iou.extend(compute_iou(preds, gt)[same_class])
+            self._det_class.extend(pred_cls)
+            self._det_confidence.extend(preds[:, 5])
+            self._det_num_gt.extend(num_gt)
+            self._det_iou_offset.extend(iou_offset + np.cumsum(num_gt) - num_gt)
+            self._det_gt_offset.extend(gt_offset + np.searchsorted(gt_cls, pred_cls, side='left'))
+        self.imgs_counter = self.imgs_counter + 1
+        self._class_tables = None
+
+    def _evaluate_class(self, class_id, iou_threshold, recall_thresholds, mpolicy="greedy"):
+        """ Evaluate class.
+
+        Arguments:
+            class_id (int): index of evaluated class.
+            iou_threshold (float): iou threshold.
+            recall_thresholds (np.array or None): specific recall thresholds to the
+                                                  computation of average precision.
+            mpolicy (str): box matching policy.
+                           greedy - greedy matching like VOC PASCAL.
+                           soft - soft matching like COCO.
+
+        Returns:
+            average_precision (np.array)
+            precision (np.array)
+            recall (np.array)
+        """
+        assert mpolicy in ["greedy", "soft"]
+        if self._class_tables is None:
+            self._build_class_tables()
+        nd, pair_det, pair_gt, pair_iou, det_group = self._class_tables[class_id]
+
+        tp = np.zeros(nd, dtype=np.float64)
+        fp = np.zeros(nd, dtype=np.float64)
+        mask = pair_iou > iou_threshold
+        pair_det, pair_gt = pair_det[mask], pair_gt[mask]
+
+        # boxes without any gt above the threshold are false positives
+        has_candidates = np.zeros(nd, dtype=bool)
+        has_candidates[pair_det] = True
+        fp[~has_candidates] = 1
+
+        if mpolicy == "greedy":
+            self._match_greedy(pair_det, pair_gt, tp, fp)
+        else:
+            self._match_soft(pair_det, pair_gt, det_group, tp, fp)
+
+        precision, recall = compute_precision_recall(tp, fp, self.class_counter[class_id])
+        if recall_thresholds is None:
+            average_precision = compute_average_precision(precision, recall)
+        else:
+            average_precision = compute_average_precision_with_recall_thresholds(
+                precision, recall, recall_thresholds
+            )
+        return average_precision, precision, recall
+
+    def _match_greedy(self, pair_det, pair_gt, tp, fp):
+        """ Match every box against its best gt only (VOC PASCAL)."""
+        difficult = self._gt_difficult.data
+        crowd = self._gt_crowd.data
+        first = np.unique(pair_det, return_index=True)[1]
+        det, gt = pair_det[first], pair_gt[first]
+        # boxes matched to a difficult gt are ignored
+        valid = ~difficult[gt]
+        det, gt = det[valid], gt[valid]
+        # the most confident box wins the gt, the rest are false positives unless gt is a crowd
+        winners = np.zeros(det.shape[0], dtype=bool)
+        winners[np.unique(gt, return_index=True)[1]] = True
+        tp[det[winners]] = 1
+        fp[det[~winners & ~crowd[gt]]] = 1
+
+    def _match_soft(self, pair_det, pair_gt, det_group, tp, fp):
+        """ Match every box against the best not yet matched gt (COCO).
+
+        Boxes of the same image have to be matched in the order of confidence,
+        so matching is done in rounds: round k processes the k-th box of every
+        image at once, boxes of one round never compete for the same gt.
+        """
+        difficult = self._gt_difficult.data
+        crowd = self._gt_crowd.data
+        if pair_det.shape[0] == 0:
+            return
+        active = np.unique(pair_det)
+        group = det_group[active]
+        order = np.argsort(group, kind='stable')
+        group_start = np.r_[True, group[order][1:] != group[order][:-1]]
+        position = np.arange(order.shape[0])
+        det_round = np.empty(tp.shape[0], dtype=np.int64)
+        det_round[active[order]] = position - np.maximum.accumulate(np.where(group_start, position, 0))
+
+        pair_round = det_round[pair_det]
+        order = np.argsort(pair_round, kind='stable')
+        pair_det, pair_gt, pair_round = pair_det[order], pair_gt[order], pair_round[order]
+        bounds = np.searchsorted(pair_round, np.arange(pair_round[-1] + 2), side='left')
+
+        matched = np.zeros(difficult.shape[0], dtype=bool)
+        decided = np.zeros(tp.shape[0], dtype=bool)
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            det, gt = pair_det[start:end], pair_gt[start:end]
+            # already matched non-crowd gts are skipped, the first remaining one decides
+            decisive = ~(matched[gt] & ~crowd[gt])
+            det, gt = det[decisive], gt[decisive]
+            det, first = np.unique(det, return_index=True)
+            gt = gt[first]
+            is_tp = ~difficult[gt] & ~matched[gt]
+            tp[det[is_tp]] = 1
+            matched[gt[is_tp]] = True
+            decided[det] = True
+        fp[active[~decided[active]]] = 1
+
+    def _build_class_tables(self):
+        """ Expand ragged IoU rows into per-class (box, gt, iou) pairs sorted by confidence."""
+        det_class = self._det_class.data
+        order = np.lexsort((-self._det_confidence.data, det_class))
+        class_bounds = np.searchsorted(det_class[order], np.arange(self.num_classes + 1), side='left')
+        self._class_tables = []
+        for class_id in range(self.num_classes):
+            det = order[class_bounds[class_id]:class_bounds[class_id + 1]]
+            num_gt = self._det_num_gt.data[det]
+            pair_det = np.repeat(np.arange(det.shape[0]), num_gt)
+            pair_gt = ragged_arange(self._det_gt_offset.data[det], num_gt)
+            pair_iou = self._iou.data[ragged_arange(self._det_iou_offset.data[det], num_gt)]
+            pair_order = np.lexsort((-pair_iou, pair_det))
+            self._class_tables.append((
+                det.shape[0],
+                pair_det[pair_order],
+                pair_gt[pair_order],
+                pair_iou[pair_order],
+                self._det_gt_offset.data[det],
+            ))
+
+    def _valid_class_mask(self, class_ids):
+        """ Mask of boxes with integer class id in [0, num_classes)."""
+        return (class_ids >= 0) & (class_ids < self.num_classes) & (class_ids == np.floor(class_ids))
+
+    def _init(self):
+        """ Initialize internal state."""
+        self.imgs_counter = 0
+        self.class_counter = np.zeros(self.num_classes, dtype=np.int32)
+        self._det_class = GrowableArray(np.int64)
+        self._det_confidence = GrowableArray(np.float64)
+        self._det_num_gt = GrowableArray(np.int64)
+        self._det_iou_offset = GrowableArray(np.int64)
+        self._det_gt_offset = GrowableArray(np.int64)
+        self._iou = GrowableArray(np.float64)
+        self._gt_difficult = GrowableArray(bool)
+        self._gt_crowd = GrowableArray(bool)
+        self._class_tables = None
@@ -24,10 +24,12 @@ SOFTWARE.
 
 from .adapter import AdapterDefault
 from .mean_average_precision_2d import MeanAveragePrecision2d
-from .multiprocessing import MetricMultiprocessing
+from .mean_average_precision_2d_numpy import MeanAveragePrecision2dNumpy
+from .multiprocessing import MetricMultiprocessing, MetricThreading
 
 metrics_dict = {
-    'map_2d': MeanAveragePrecision2d
+    'map_2d': MeanAveragePrecision2dNumpy,
+    'map_2d_pandas': MeanAveragePrecision2d,
 }
 
 class MetricBuilder:
@@ -42,7 +44,9 @@ class MetricBuilder:
 
         Arguments:
             metric_type (str): type of evaluation metric.
-            async_mode (bool): use multiprocessing metric.
+            async_mode (bool or str): accumulate the metric asynchronously,
+                                      'thread' - in a worker thread,
+                                      'process' or True - in a child process.
             adapter_type (AdapterBase): type of adapter class.
 
         Returns:
@@ -51,6 +55,8 @@ class MetricBuilder:
         assert metric_type in metrics_dict, "Unknown metric_type"
         if not async_mode:
             metric_fn = metrics_dict[metric_type](*args, **kwargs)
+        elif async_mode == 'thread':
+            metric_fn = MetricThreading(metrics_dict[metric_type], *args, **kwargs)
         else:
             metric_fn = MetricMultiprocessing(metrics_dict[metric_type], *args, **kwargs)
         return adapter_type(metric_fn)
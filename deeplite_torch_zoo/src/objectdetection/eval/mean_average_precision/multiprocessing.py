@@ -22,25 +22,79 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-from .metric_base import MetricBase
+import queue
+import threading
+import traceback
 from multiprocessing import Process, Queue
-from multiprocessing.managers import BaseManager
 
-def create_metric_fn(metric_type, *args, **kwargs):
-    """ Create multiprocessing version of metric function.
+import numpy as np
 
-    Arguments:
-        metric_type (dtype): type of metric function.
-        *args, **kwargs: metric specific arguments.
+from .metric_base import MetricBase
+
+try:
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError:  # python < 3.8, arrays are pickled through the queue
+    SharedMemory = None
+
+
+class SharedArrayPool:
+    """ Fixed pool of shared memory slots to pass (preds, gt) pairs between processes.
+
+    The number of slots bounds the number of samples in flight, so a producer
+    waiting for a free slot gets backpressure from a slow consumer. Arrays that do
+    not fit into a slot (or all arrays if shared memory is not available) are
+    sent through the queue as is.
 
-    Returns:
-        metric_fn: instance of metric.
+    Arguments:
+        num_slots (int): number of slots.
+        slot_size (int): size of a slot in float64 elements.
     """
-    if not hasattr(BaseManager, str(metric_type)):
-        BaseManager.register(str(metric_type), metric_type)
-    manager = BaseManager()
-    manager.start()
-    return getattr(manager, str(metric_type))(*args, **kwargs)
+    def __init__(self, num_slots, slot_size):
+        self.num_slots = num_slots
+        self.slot_size = slot_size
+        self.free_slots = Queue(maxsize=num_slots)
+        for slot in range(num_slots):
+            self.free_slots.put(slot)
+        self.shm = None
+        if SharedMemory is not None:
+            self.shm = SharedMemory(create=True, size=num_slots * slot_size * 8)
+
+    def pack(self, slot, preds, gt):
+        """ Copy arrays into the slot, returns picklable message."""
+        preds = np.ascontiguousarray(preds, dtype=np.float64)
+        gt = np.ascontiguousarray(gt, dtype=np.float64)
+        if self.shm is None or preds.size + gt.size > self.slot_size:
+            return slot, preds, gt
+        buffer = self._slot_buffer(self.shm, slot, self.slot_size)
+        buffer[:preds.size] = preds.ravel()
+        buffer[preds.size:preds.size + gt.size] = gt.ravel()
+        return slot, preds.shape, gt.shape
+
+    @staticmethod
+    def unpack(shm, slot_size, message):
+        """ Copy arrays out of the slot."""
+        slot, preds, gt = message
+        if isinstance(preds, np.ndarray):
+            return slot, preds, gt
+        buffer = SharedArrayPool._slot_buffer(shm, slot, slot_size)
+        preds_size = int(np.prod(preds))
+        gt_size = int(np.prod(gt))
+        return (
+            slot,
+            buffer[:preds_size].reshape(preds).copy(),
+            buffer[preds_size:preds_size + gt_size].reshape(gt).copy()
+        )
+
+    @staticmethod
+    def _slot_buffer(shm, slot, slot_size):
+        return np.ndarray((slot_size,), dtype=np.float64, buffer=shm.buf, offset=slot * slot_size * 8)
+
+    def close(self):
+        """ Release shared memory."""
+        if self.shm is not None:
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
 
 
 class MetricMultiprocessing(MetricBase):
@@ -51,15 +105,28 @@ class MetricMultiprocessing(MetricBase):
     to async computation 'per frame' part of the metric in parallel
     with next frame inference.
 
+    The metric lives in a child process which drains a bounded queue of
+    samples, arrays are passed through a pool of shared memory slots.
+    'add' blocks when all the slots are in flight and raises if the child
+    process has failed.
+
     Arguments:
         metric_type (dtype): type of metric function.
         *args, **kwargs: metric specific arguments.
+        num_slots (int): max number of samples in flight.
+        slot_size (int): size of shared memory slot in float64 elements.
     """
-    def __init__(self, metric_type, *args, **kwargs):
+    def __init__(self, metric_type, *args, num_slots=64, slot_size=4096, **kwargs):
         super().__init__()
-        self.metric_fn = create_metric_fn(metric_type, *args, **kwargs)
+        self.metric_type = metric_type
+        self.metric_args = args
+        self.metric_kwargs = kwargs
+        self.num_slots = num_slots
+        self.slot_size = slot_size
         self.proc = None
         self.queue = None
+        self.result_queue = None
+        self.pool = None
         self.is_start = False
 
     def add(self, preds, gt):
@@ -76,7 +143,9 @@ class MetricMultiprocessing(MetricBase):
         """
         if not self.is_start:
             self.start()
-        self.queue.put((preds, gt))
+        self._check_errors()
+        slot = self._get(self.pool.free_slots)
+        self.queue.put(('add', self.pool.pack(slot, preds, gt)))
 
     def value(self, *args, **kwargs):
         """ Evaluate Metric.
@@ -88,16 +157,20 @@ class MetricMultiprocessing(MetricBase):
         Returns:
             metric (dict): evaluated metrics.
         """
-        if self.is_start:
-            self.stop()
-        return self.metric_fn.value(*args, **kwargs)
+        if not self.is_start:
+            self.start()
+        self.queue.put(('value', (args, kwargs)))
+        status, result = self._get(self.result_queue)
+        if status == 'error':
+            self._reset_proc()
+            raise RuntimeError(f'Metric process failed:\n{result}')
+        return result
 
     def reset(self):
         """ Reset stored data.
         Asynchronous wrapper for 'reset' method.
         """
         self._reset_proc()
-        self.metric_fn.reset()
 
     def start(self):
         """ Start child process."""
@@ -107,23 +180,73 @@ class MetricMultiprocessing(MetricBase):
         """ Stop child process."""
         self._reset_proc()
 
+    def __del__(self):
+        self._reset_proc()
+
     @staticmethod
-    def _proc_loop(metric_fn, queue):
+    def _proc_loop(metric_type, args, kwargs, task_queue, result_queue, free_slots, shm_name, slot_size):
         """ Body of multiprocessing add."""
+        shm = SharedMemory(name=shm_name) if shm_name is not None else None
+        metric_fn = metric_type(*args, **kwargs)
+        error = None
         while True:
-            preds, gt = queue.get()
-            if preds is None and gt is None:
+            cmd, payload = task_queue.get()
+            if cmd == 'stop':
                 break
-            metric_fn.add(preds, gt)
+            try:
+                if cmd == 'add':
+                    slot, preds, gt = SharedArrayPool.unpack(shm, slot_size, payload)
+                    free_slots.put(slot)
+                    if error is None:
+                        metric_fn.add(preds, gt)
+                elif cmd == 'value':
+                    if error is not None:
+                        result_queue.put(('error', error))
+                    else:
+                        result_queue.put(('ok', metric_fn.value(*payload[0], **payload[1])))
+            except Exception:  # pylint: disable=broad-except
+                error = traceback.format_exc()
+                result_queue.put(('error', error))
+        if shm is not None:
+            shm.close()
+
+    def _get(self, source):
+        """ Blocking get from the queue which fails if child process is dead."""
+        while True:
+            try:
+                return source.get(timeout=1.0)
+            except queue.Empty:
+                if self.proc is None or not self.proc.is_alive():
+                    raise RuntimeError('Metric process is not running')
+
+    def _check_errors(self):
+        """ Raise the error reported by child process."""
+        try:
+            status, result = self.result_queue.get_nowait()
+        except queue.Empty:
+            return
+        if status == 'error':
+            self._reset_proc()
+            raise RuntimeError(f'Metric process failed:\n{result}')
 
     def _init_proc(self):
         """ Initialize child process."""
-        if self.queue is None:
-            self.queue = Queue()
         if self.proc is None:
+            self.pool = SharedArrayPool(self.num_slots, self.slot_size)
+            self.queue = Queue()
+            self.result_queue = Queue()
             self.proc = Process(
                 target=self._proc_loop,
-                args=[self.metric_fn, self.queue],
+                args=[
+                    self.metric_type,
+                    self.metric_args,
+                    self.metric_kwargs,
+                    self.queue,
+                    self.result_queue,
+                    self.pool.free_slots,
+                    self.pool.shm.name if self.pool.shm is not None else None,
+                    self.slot_size,
+                ],
                 daemon=True
             )
             self.proc.start()
@@ -132,9 +255,91 @@ class MetricMultiprocessing(MetricBase):
     def _reset_proc(self):
         """ Reset child process."""
         if self.proc is not None:
-            self.add(None, None)
+            if self.proc.is_alive():
+                self.queue.put(('stop', None))
             self.proc.join()
             self.proc = None
-        if self.queue is not None:
-            self.queue = None
+        if self.pool is not None:
+            self.pool.close()
+            self.pool = None
+        self.queue = None
+        self.result_queue = None
         self.is_start = False
+
+
+class MetricThreading(MetricBase):
+    """ Implements parallelism at the metric level with a worker thread.
+
+    Same interface as MetricMultiprocessing, the samples are passed to the
+    worker thread through a bounded queue without copying. Suits metrics whose
+    'add' is dominated by NumPy calls that release the GIL.
+
+    Arguments:
+        metric_type (dtype): type of metric function.
+        *args, **kwargs: metric specific arguments.
+        max_queue_size (int): max number of samples in flight.
+    """
+    def __init__(self, metric_type, *args, max_queue_size=64, **kwargs):
+        super().__init__()
+        self.metric_fn = metric_type(*args, **kwargs)
+        self.queue = queue.Queue(maxsize=max_queue_size)
+        self.thread = None
+        self.error = None
+
+    def add(self, preds, gt):
+        """ Add sample to evaluation.
+        Asynchronous wrapper for 'add' method.
+
+        Arguments:
+            preds (np.array): predicted boxes.
+            gt (np.array): ground truth boxes.
+        """
+        if self.thread is None:
+            self.start()
+        self._check_errors()
+        self.queue.put((preds, gt))
+
+    def value(self, *args, **kwargs):
+        """ Evaluate Metric.
+        Asynchronous wrapper for 'value' method.
+        """
+        self.stop()
+        self._check_errors()
+        return self.metric_fn.value(*args, **kwargs)
+
+    def reset(self):
+        """ Reset stored data.
+        Asynchronous wrapper for 'reset' method.
+        """
+        self.stop()
+        self.error = None
+        self.metric_fn.reset()
+
+    def start(self):
+        """ Start worker thread."""
+        self.thread = threading.Thread(target=self._thread_loop, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """ Drain the queue and stop worker thread."""
+        if self.thread is not None:
+            self.queue.put((None, None))
+            self.thread.join()
+            self.thread = None
+
+    def _thread_loop(self):
+        """ Body of threading add."""
+        while True:
+            preds, gt = self.queue.get()
+            if preds is None and gt is None:
+                break
+            if self.error is None:
+                try:
+                    self.metric_fn.add(preds, gt)
+                except Exception:  # pylint: disable=broad-except
+                    self.error = traceback.format_exc()
+
+    def _check_errors(self):
+        """ Raise the error reported by worker thread."""
+        if self.error is not None:
+            raise RuntimeError(f'Metric thread failed:\n{self.error}')
@@ -60,8 +60,7 @@ def compute_average_precision(precision, recall):
     """
     precision = np.concatenate(([0.], precision, [0.]))
     recall = np.concatenate(([0.], recall, [1.]))
-    for i in range(precision.size - 1, 0, -1):
-        precision[i - 1] = np.maximum(precision[i - 1], precision[i])
+    precision = np.maximum.accumulate(precision[::-1])[::-1]
     ids = np.where(recall[1:] != recall[:-1])[0]
     average_precision = np.sum((recall[ids + 1] - recall[ids]) * precision[ids + 1])
     return average_precision
@@ -77,10 +76,10 @@ def compute_average_precision_with_recall_thresholds(precision, recall, recall_t
     Returns:
         average_precision (np.array)
     """
-    average_precision = 0.
-    for t in recall_thresholds:
-        p = np.max(precision[recall >= t]) if np.sum(recall >= t) != 0 else 0
-        average_precision = average_precision + p / recall_thresholds.size
+    # recall is non-decreasing, so max precision at recall >= t is a suffix maximum
+    precision = np.concatenate((np.maximum.accumulate(precision[::-1])[::-1], [0.]))
+    ids = np.searchsorted(recall, recall_thresholds, side='left')
+    average_precision = np.sum(precision[ids] / recall_thresholds.size)
     return average_precision
 
 def compute_iou(pred, gt):
@@ -134,7 +133,7 @@ def compute_match_table(preds, gt, img_id):
         match_table: [img_id, confidence, iou, difficult, crowd]
     """
     def _tile(arr, nreps, axis=0):
-        return np.repeat(arr, nreps, axis=axis).reshape(nreps, -1).tolist()
+        return np.tile(arr, (nreps, 1)).tolist()
 
     def _empty_array_2d(size):
         return [[] for i in range(size)]
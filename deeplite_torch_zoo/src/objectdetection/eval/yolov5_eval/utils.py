@@ -55,6 +55,21 @@ def box_area(box):
     return (box[2] - box[0]) * (box[3] - box[1])
 
 
+def box_iou_batch(box1, box2, eps=1e-7):
+    """
+    Return intersection-over-union (Jaccard index) of boxes for a batch of images.
+    Both sets of boxes are expected to be in (x1, y1, x2, y2) format.
+    Arguments:
+        box1 (Tensor[B, N, 4])
+        box2 (Tensor[B, M, 4])
+    Returns:
+        iou (Tensor[B, N, M]): the pairwise IoU values for every image in the batch
+    """
+    (a1, a2), (b1, b2) = box1[:, :, None].chunk(2, 3), box2[:, None].chunk(2, 3)
+    inter = (torch.min(a2, b2) - torch.max(a1, b1)).clamp(0).prod(3)
+    return inter / ((a2 - a1).prod(3) + (b2 - b1).prod(3) - inter + eps)
+
+
 def non_max_suppression(
         prediction,
         conf_thres=0.25,
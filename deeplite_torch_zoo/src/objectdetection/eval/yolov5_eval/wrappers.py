@@ -18,6 +18,8 @@ def yolo_eval_voc(
     progressbar=False,
     subclasses=None,
     num_classes=None,
+    batched_matching=False,
+    async_metric=False,
     **kwargs
 ):
     model.to(device)
@@ -29,6 +31,8 @@ def yolo_eval_voc(
         eval_style=eval_style,
         map_iou_thresh=iou_thresh,
         num_classes=num_classes,
+        batched_matching=batched_matching,
+        async_metric=async_metric,
     )
     return ap_dict
 
@@ -44,6 +48,8 @@ def yolo_eval_coco(
     progressbar=False,
     subclasses=None,
     num_classes=None,
+    batched_matching=False,
+    async_metric=False,
     **kwargs
 ):
     model.to(device)
@@ -55,5 +61,7 @@ def yolo_eval_coco(
         eval_style=eval_style,
         map_iou_thresh=np.arange(0.5, 1.0, 0.05),
         num_classes=num_classes,
+        batched_matching=batched_matching,
+        async_metric=async_metric,
     )
     return ap_dict
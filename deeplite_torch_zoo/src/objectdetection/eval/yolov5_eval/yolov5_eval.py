@@ -6,10 +6,17 @@ import numpy as np
 import torch
 from tqdm import tqdm
 
+from deeplite_torch_zoo.src.objectdetection.datasets.batch import \
+    DetectionBatch
+from deeplite_torch_zoo.src.objectdetection.datasets.dataset import \
+    images_to_float
 from deeplite_torch_zoo.src.objectdetection.eval.mean_average_precision import \
     MetricBuilder
+from deeplite_torch_zoo.src.objectdetection.eval.mean_average_precision.utils import (
+    compute_average_precision,
+    compute_average_precision_with_recall_thresholds, compute_precision_recall)
 from deeplite_torch_zoo.src.objectdetection.eval.yolov5_eval.utils import (
-    box_iou, check_version, non_max_suppression)
+    box_iou, box_iou_batch, check_version, non_max_suppression)
 
 
 def smart_inference_mode(torch_1_9=check_version(torch.__version__, '1.9.0')):
@@ -45,6 +52,149 @@ def process_batch(detections, labels, iouv):
     return torch.tensor(correct, dtype=torch.bool, device=iouv.device)
 
 
+def process_batch_dense(detections, detections_valid, labels, labels_valid, iouv):
+    """
+    Return correct prediction matrix for a padded batch of images, computed on the tensors' device
+    Uses the same matching as process_batch: every detection is assigned to its best IoU label,
+    every label is taken by the first (most confident) detection assigned to it.
+    Arguments:
+        detections (Tensor[B, N, 6]), x1, y1, x2, y2, conf, class
+        detections_valid (Tensor[B, N]), mask of non-padded detections
+        labels (Tensor[B, M, 5]), x1, y1, x2, y2, class
+        labels_valid (Tensor[B, M]), mask of non-padded labels
+        iouv (Tensor[T]), IoU thresholds
+    Returns:
+        correct (Tensor[B, N, T]), for T IoU levels
+    """
+    num_dets, num_labels = detections.shape[1], labels.shape[1]
+    iou = box_iou_batch(labels[..., :4], detections[..., :4])  # [B, M, N]
+    valid = (labels[..., 4:5] == detections[..., None, :, 5]) & labels_valid[..., None] & detections_valid[:, None]
+    candidates = (iou[:, None] >= iouv[:, None, None]) & valid[:, None]  # [B, T, M, N]
+
+    matched = candidates.any(2)  # [B, T, N]
+    best_label = torch.where(candidates, iou[:, None], iou.new_tensor(-1.)).argmax(2)
+    claims = (best_label[:, :, None] == torch.arange(num_labels, device=iou.device)[:, None]) & matched[:, :, None]
+    det_index = torch.arange(num_dets, device=iou.device)
+    first_det = torch.where(claims, det_index, num_dets).min(3).values  # [B, T, M]
+    correct = matched & (first_det.gather(2, best_label) == det_index)
+    return correct.permute(0, 2, 1)
+
+
+def rescale_boxes_batch(boxes, test_input_size, org_img_shapes):
+    """
+    Map boxes of a batch from the letterboxed network input back to the original images
+    Arguments:
+        boxes (Tensor[B, N, 4]), x1, y1, x2, y2
+        org_img_shapes (Tensor[B, 2]), original (height, width) of every image
+    """
+    org_img_shapes = org_img_shapes.to(boxes)
+    org_h, org_w = org_img_shapes[:, 0, None, None], org_img_shapes[:, 1, None, None]
+    resize_ratio = torch.min(test_input_size / org_w, test_input_size / org_h)
+    dw = (test_input_size - resize_ratio * org_w) / 2
+    dh = (test_input_size - resize_ratio * org_h) / 2
+
+    boxes = boxes.clone()
+    boxes[..., 0::2] = (boxes[..., 0::2] - dw) / resize_ratio
+    boxes[..., 1::2] = (boxes[..., 1::2] - dh) / resize_ratio
+    return boxes
+
+
+def scale_predictions_batch(pred_bbox, test_input_size, org_img_shapes, conf_thresh):
+    """
+    Batched version of scale_predictions, instead of removing the filtered boxes returns their mask
+    Arguments:
+        pred_bbox (Tensor[B, N, 6]), x1, y1, x2, y2, conf, class
+        org_img_shapes (Tensor[B, 2]), original (height, width) of every image
+    Returns:
+        pred_coor (Tensor[B, N, 4]), boxes in the original image coordinates
+        mask (Tensor[B, N]), mask of the valid boxes
+    """
+    pred_coor = rescale_boxes_batch(pred_bbox[..., :4], test_input_size, org_img_shapes)
+    org_img_shapes = org_img_shapes.to(pred_coor)
+    org_h, org_w = org_img_shapes[:, 0, None], org_img_shapes[:, 1, None]
+    pred_coor = torch.stack([
+        pred_coor[..., 0].clamp(min=0),
+        pred_coor[..., 1].clamp(min=0),
+        torch.min(pred_coor[..., 2], org_w - 1),
+        torch.min(pred_coor[..., 3], org_h - 1),
+    ], -1)
+    invalid_mask = (pred_coor[..., 0] > pred_coor[..., 2]) | (pred_coor[..., 1] > pred_coor[..., 3])
+    pred_coor = pred_coor.masked_fill(invalid_mask[..., None], 0)
+
+    bboxes_scale = (pred_coor[..., 2:4] - pred_coor[..., 0:2]).prod(-1).sqrt()
+    mask = (bboxes_scale > 0) & torch.isfinite(bboxes_scale) & (pred_bbox[..., 4] > conf_thresh)
+    return pred_coor, mask
+
+
+def match_predictions_batch(preds, targets, shapes, test_input_size, iouv, conf_thresh):
+    """
+    Rescale and match the NMS output of a batch on the model device, sync to host once
+    Arguments:
+        preds (list of Tensor[n, 6]), NMS output for every image, x1, y1, x2, y2, conf, class
+        targets (Tensor[B, M, 5]), zero-padded labels, x1, y1, x2, y2, class
+        shapes (Tensor[B, 2]), original (height, width) of every image
+        iouv (Tensor[T]), IoU thresholds
+    Returns:
+        correct (array[n, T]), conf (array[n]), pred_cls (array[n]) of valid predictions
+        and target_cls (array[m]) of valid labels
+    """
+    preds = torch.nn.utils.rnn.pad_sequence(preds, batch_first=True).float()
+    targets = targets.to(preds)
+    # keep at least one (invalid) padded row to avoid reductions over empty dims
+    if not preds.shape[1]:
+        preds = preds.new_zeros((len(targets), 1, 6))
+    if not targets.shape[1]:
+        targets = targets.new_zeros((len(targets), 1, 5))
+    shapes = shapes.to(preds.device)
+    boxes, preds_valid = scale_predictions_batch(preds, test_input_size, shapes, conf_thresh)
+    detections = torch.cat((boxes, preds[..., 4:6]), -1)
+    labels = torch.cat((rescale_boxes_batch(targets[..., :4], test_input_size, shapes), targets[..., 4:5]), -1)
+    labels_valid = targets.ne(0).any(-1)
+    correct = process_batch_dense(detections, preds_valid, labels, labels_valid, iouv)
+
+    columns = (correct, preds_valid, preds[..., 4], preds[..., 5], labels_valid, targets[..., 4])
+    stats = torch.cat([x.flatten().float() for x in columns]).cpu().numpy()
+    correct, preds_valid, conf, pred_cls, labels_valid, target_cls = \
+        np.split(stats, np.cumsum([x.numel() for x in columns])[:-1])
+    preds_valid, labels_valid = preds_valid.astype(bool), labels_valid.astype(bool)
+    return (
+        correct.reshape(-1, iouv.shape[0])[preds_valid].astype(bool),
+        conf[preds_valid],
+        pred_cls[preds_valid].astype(np.int64),
+        target_cls[labels_valid].astype(np.int64),
+    )
+
+
+def compute_ap_from_matches(correct, conf, pred_cls, target_cls, num_classes, recall_thresholds=None):
+    """
+    Compute AP per class and IoU threshold from precomputed correct prediction matrices
+    Arguments:
+        correct (array[N, T]), conf (array[N]), pred_cls (array[N]), target_cls (array[M])
+        recall_thresholds (np.array or None): specific recall thresholds to the
+                                              computation of average precision
+    Returns:
+        ap (array[T, num_classes])
+    """
+    order = np.lexsort((-conf, pred_cls))
+    correct, pred_cls = correct[order].astype(np.float64), pred_cls[order]
+    class_bounds = np.searchsorted(pred_cls, np.arange(num_classes + 1), side='left')
+    target_cls = target_cls[(target_cls >= 0) & (target_cls < num_classes)]
+    num_targets = np.bincount(target_cls, minlength=num_classes)
+
+    ap = np.zeros((correct.shape[1], num_classes))
+    for c in range(num_classes):
+        tp_c = correct[class_bounds[c]:class_bounds[c + 1]]
+        for t in range(tp_c.shape[1]):
+            precision, recall = compute_precision_recall(tp_c[:, t], 1 - tp_c[:, t], num_targets[c])
+            if recall_thresholds is None:
+                ap[t, c] = compute_average_precision(precision, recall)
+            else:
+                ap[t, c] = compute_average_precision_with_recall_thresholds(
+                    precision, recall, recall_thresholds
+                )
+    return ap
+
+
 @smart_inference_mode()
 def evaluate(
         model,
@@ -59,6 +209,8 @@ def evaluate(
         half=False,  # use FP16 half-precision inference
         eval_style='coco',
         map_iou_thresh=0.5,
+        batched_matching=False,  # match whole batches on the model device instead of per-image on host
+        async_metric=False,  # accumulate the metric in a worker, False, 'thread' or 'process'
 ):
     if num_classes is None:
         num_classes = dataloader.dataset.num_classes
@@ -80,17 +232,21 @@ def evaluate(
 
     metric_fn = MetricBuilder.build_evaluation_metric(
         "map_2d",
-        async_mode=False,
+        async_mode=async_metric,
         num_classes=num_classes
     )
+    iouv = torch.as_tensor(np.atleast_1d(map_iou_thresh), dtype=torch.float32, device=device)
+    stats = []
 
     print('Inference on test set')
-    for im, targets, _, shapes in pbar:
+    for batch in pbar:
+        if not isinstance(batch, DetectionBatch):
+            batch = DetectionBatch.from_padded(*batch[:3], shapes=batch[3])
         if cuda:
-            im = im.to(device, non_blocking=True)
-            targets = targets.to(device)
-        im = im.half() if half else im.float()  # uint8 to fp16/32
-        # im /= 255  # 0 - 255 to 0.0 - 1.0
+            batch = batch.to(device)
+        im, shapes = batch.images, batch.shapes
+        # uint8 batches are scaled to 0.0 - 1.0 on the device
+        im = images_to_float(im, device if cuda else None, half=half)
         nb, _, height, width = im.shape  # batch size, channels, height, width
 
         # Inference
@@ -105,6 +261,10 @@ def evaluate(
                                     agnostic=single_cls,
                                     max_det=max_det)
 
+        if batched_matching:
+            stats.append(match_predictions_batch(preds, batch.padded, shapes, height, iouv, conf_thres))
+            continue
+
         for i, pred in enumerate(preds):
             orig_shape = tuple(shapes[i].numpy())
             pred = pred.cpu().numpy()
@@ -117,12 +277,9 @@ def evaluate(
             p[:, :4] = pred[:, :4]
             p[:, 4] = pred[:, 5]
             p[:, 5] = pred[:, 4]
-            jj = 0
-            for j in range(targets[i, ...].shape[0]):
-                if any(targets[i, j, :]):
-                    jj += 1
-            gt = np.zeros((jj, 7))
-            gt[:, :5] = targets[i, :jj, :].cpu().numpy()
+            labels = batch.image_labels(i)[:, :5]
+            gt = np.zeros((len(labels), 7))
+            gt[:, :5] = labels.cpu().numpy()
 
             gt_coor = gt[:, :4]
             org_h, org_w = orig_shape
@@ -137,7 +294,9 @@ def evaluate(
 
     print('Computing mAP value')
     t1 = time.perf_counter()
-    if eval_style == 'coco':
+    if batched_matching:
+        metrics = compute_metrics_from_matches(stats, num_classes, map_iou_thresh, eval_style)
+    elif eval_style == 'coco':
         metrics = metric_fn.value(
             iou_thresholds=map_iou_thresh,
             recall_thresholds=np.arange(0., 1.01, 0.01),
@@ -158,6 +317,19 @@ def evaluate(
     return APs
 
 
+def compute_metrics_from_matches(stats, num_classes, map_iou_thresh, eval_style='coco'):
+    """
+    Build the MeanAveragePrecision2d output dict from the match_predictions_batch outputs
+    """
+    correct, conf, pred_cls, target_cls = (np.concatenate(x, 0) for x in zip(*stats))
+    recall_thresholds = np.arange(0., 1.01, 0.01) if eval_style == 'coco' else None
+    ap = compute_ap_from_matches(correct, conf, pred_cls, target_cls, num_classes, recall_thresholds)
+    metrics = {'mAP': ap.mean(axis=1).mean(axis=0)}
+    for t, ap_t in zip(np.atleast_1d(map_iou_thresh), ap):
+        metrics[t] = {cls_id: {'ap': ap_t[cls_id]} for cls_id in range(num_classes)}
+    return metrics
+
+
 def scale_predictions(
     pred_bbox, test_input_size, org_img_shape, valid_scale, conf_thresh
 ):
@@ -17,9 +17,10 @@ class COCOEvaluator(Evaluator):
         img_size=448,
         gt=None,
         progressbar=False,
+        batch_size=8,
     ):
         super(COCOEvaluator, self).__init__(
-            model=model, img_size=img_size
+            model=model, img_size=img_size, batch_size=batch_size
         )
         self.dataset = dataset
         self.progressbar = progressbar
@@ -32,8 +33,15 @@ class COCOEvaluator(Evaluator):
 
     def evaluate(self, multi_test=False, flip_test=False):
         results = []
+        imgs, img_inds = [], []
         for img, _, _, img_ind in tqdm(self.dataset, disable=not self.progressbar):
-            results += self.process_image(img, int(img_ind))
+            imgs.append(img)
+            img_inds.append(int(img_ind))
+            if len(imgs) == self.batch_size:
+                results += self.process_images(imgs, img_inds, multi_test=multi_test, flip_test=flip_test)
+                imgs, img_inds = [], []
+        if imgs:
+            results += self.process_images(imgs, img_inds, multi_test=multi_test, flip_test=flip_test)
 
         results = np.array(results).astype(np.float32)
         if len(results) == 0:
@@ -46,6 +54,12 @@ class COCOEvaluator(Evaluator):
         print("Current AP: {:.5f}".format(E.stats[0]))
         return {"mAP": E.stats[0]}
 
+    def process_images(self, imgs, img_inds, **kwargs):
+        results = []
+        for img, img_ind in zip(imgs, img_inds):
+            results += self.process_image(img, img_ind)
+        return results
+
     def process_image(self, img, **kwargs):
         pass
 
@@ -63,10 +77,16 @@ class YoloCOCOEvaluator(COCOEvaluator):
             progressbar=progressbar,
         )
 
-    def process_image(self, img, img_ind, multi_test=False, flip_test=False, **kwargs):
+    def process_images(self, imgs, img_inds, multi_test=False, flip_test=False, **kwargs):
+        results = []
+        for img_ind, bboxes_prd in zip(img_inds, self.get_bboxes(imgs, multi_test, flip_test)):
+            results += self._to_coco_results(bboxes_prd, img_ind)
+        return results
 
-        bboxes_prd = self.get_bbox(img, multi_test, flip_test)
+    def process_image(self, img, img_ind, multi_test=False, flip_test=False, **kwargs):
+        return self.process_images([img], [img_ind], multi_test=multi_test, flip_test=flip_test)
 
+    def _to_coco_results(self, bboxes_prd, img_ind):
         results = []
         for bbox in bboxes_prd:
             coor = np.array(bbox[:4], dtype=np.int32)
@@ -100,8 +120,17 @@ class SSDCOCOEvaluator(COCOEvaluator):
         )
         self.predictor = predictor
 
+    def process_images(self, imgs, img_inds, **kwargs):
+        results = []
+        for img_id, (boxes, labels, probs) in zip(img_inds, self.predictor.predict_batch(imgs)):
+            results += self._to_coco_results(boxes, labels, probs, img_id)
+        return results
+
     def process_image(self, img, img_id):
         boxes, labels, probs = self.predictor.predict(img)
+        return self._to_coco_results(boxes, labels, probs, img_id)
+
+    def _to_coco_results(self, boxes, labels, probs, img_id):
         results = []
         for bbox, label, prob in zip(boxes, labels, probs):
             xmin, ymin, xmax, ymax = bbox
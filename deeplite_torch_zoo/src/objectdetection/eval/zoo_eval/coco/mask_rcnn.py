@@ -15,10 +15,17 @@ class RCNNCOCOEvaluator(COCOEvaluator):
     def _tensorize(self, img):
         return torch.tensor(img.transpose(2, 0, 1) / 255.0, dtype=torch.float, device=self.device)
 
-    def process_image(self, img, img_id):
-        img = self._tensorize(img)
+    def process_images(self, imgs, img_inds, **kwargs):
         self.model.eval()
-        res = self.model([img])[0]
+        results = []
+        for img_id, res in zip(img_inds, self.model([self._tensorize(img) for img in imgs])):
+            results += self._to_coco_results(res, img_id)
+        return results
+
+    def process_image(self, img, img_id):
+        return self.process_images([img], [img_id])
+
+    def _to_coco_results(self, res, img_id):
         boxes = res['boxes']
         labels = res['labels']
         probs = res['scores']
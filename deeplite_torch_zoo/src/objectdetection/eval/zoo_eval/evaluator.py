@@ -9,54 +9,65 @@ from deeplite_torch_zoo.src.objectdetection.yolov5.utils.general import (
 
 
 class Evaluator(object):
-    def __init__(self, model, img_size=448, conf_thresh=0.001, nms_thresh=0.5):
+    def __init__(self, model, img_size=448, conf_thresh=0.001, nms_thresh=0.5, batch_size=8):
         self.conf_thresh = conf_thresh
         self.nms_thresh = nms_thresh
         self.val_shape = img_size
+        self.batch_size = batch_size
         self.model = model
         self.device = next(model.parameters()).device
 
     def get_bbox(self, img, multi_test=False, flip_test=False):
+        return self.get_bboxes([img], multi_test, flip_test)[0]
+
+    def get_bboxes(self, imgs, multi_test=False, flip_test=False):
+        """
+        Predict the boxes of a list of images, every test scale (and its flipped
+        copies) is processed with batched forward passes
+        """
         if multi_test:
             test_input_sizes = range(320, 640, 96)
-            bboxes_list = []
-            for test_input_size in test_input_sizes:
-                valid_scale = (0, np.inf)
-                bboxes_list.append(self.__predict(img, test_input_size, valid_scale))
-                if flip_test:
-                    bboxes_flip = self.__predict(
-                        img[:, ::-1], test_input_size, valid_scale
-                    )
-                    bboxes_flip[:, [0, 2]] = img.shape[1] - bboxes_flip[:, [2, 0]]
-                    bboxes_list.append(bboxes_flip)
-            bboxes = np.row_stack(bboxes_list)
         else:
-            bboxes = self.__predict(img, self.val_shape, (0, np.inf))
-
-        bboxes = nms(bboxes, self.conf_thresh, self.nms_thresh)
-
-        return bboxes
+            test_input_sizes = [self.val_shape]
+        flip_test = multi_test and flip_test
+        valid_scale = (0, np.inf)
+
+        bboxes_list = [[] for _ in imgs]
+        for test_input_size in test_input_sizes:
+            batch = list(imgs)
+            if flip_test:
+                batch += [img[:, ::-1] for img in imgs]
+            predictions = self.__predict(batch, test_input_size, valid_scale)
+            for i, bboxes in enumerate(predictions[:len(imgs)]):
+                bboxes_list[i].append(bboxes)
+            for i, bboxes_flip in enumerate(predictions[len(imgs):]):
+                bboxes_flip[:, [0, 2]] = imgs[i].shape[1] - bboxes_flip[:, [2, 0]]
+                bboxes_list[i].append(bboxes_flip)
+
+        return [
+            nms(np.row_stack(bboxes), self.conf_thresh, self.nms_thresh)
+            for bboxes in bboxes_list
+        ]
 
     def apply_model(self, imgs):
         with torch.no_grad():
             pred_bbox, _ = self.model(imgs)
 
         pred_bbox = post_process(pred_bbox)
-        return pred_bbox.squeeze()
-
-    def __predict(self, img, test_shape, valid_scale):
-        org_img = np.copy(img)
-        org_h, org_w, _ = org_img.shape
+        return pred_bbox
 
-        img = self.__get_img_tensor(img, test_shape).to(self.device)
+    def __predict(self, imgs, test_shape, valid_scale):
         self.model.eval()
-        pred_bbox = self.apply_model(img)
-        if len(pred_bbox) == 0:
-            return np.zeros((0, 6))
-
-        bboxes = self._scale_predictions(
-            pred_bbox, test_shape, (org_h, org_w), valid_scale
-        )
+        bboxes = []
+        for start in range(0, len(imgs), self.batch_size):
+            batch = imgs[start:start + self.batch_size]
+            img_tensor = torch.cat([self.__get_img_tensor(img, test_shape) for img in batch])
+            pred_bbox = self.apply_model(img_tensor.to(self.device))
+            for img, img_pred_bbox in zip(batch, pred_bbox):
+                org_h, org_w, _ = img.shape
+                bboxes.append(self._scale_predictions(
+                    img_pred_bbox, test_shape, (org_h, org_w), valid_scale
+                ))
         return bboxes
 
     def __get_img_tensor(self, img, test_shape):
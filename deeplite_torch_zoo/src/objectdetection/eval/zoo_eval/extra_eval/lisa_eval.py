@@ -72,9 +72,9 @@ class Demo(Evaluator):
 class LISAEval(Evaluator):
     """docstring for LISAEval"""
 
-    def __init__(self, model, data_root, visiual=False, net="yolov3", img_size=448):
+    def __init__(self, model, data_root, visiual=False, net="yolov3", img_size=448, batch_size=8):
         super(LISAEval, self).__init__(
-            model=model, img_size=img_size, net=net
+            model=model, img_size=img_size, batch_size=batch_size
         )
 
         self.dataset = val_dataset = LISA(data_root, _set="valid")
@@ -88,25 +88,23 @@ class LISAEval(Evaluator):
         results = []
         start = time.time()
         avg_loss = 0
-        for img_idx, (img_path) in enumerate(self.dataset.images):
-
-            image = cv2.imread("{}/{}".format(self.data_root, img_path))
-            label = self.dataset.objects[img_idx]
-            print("Parsing batch: {}/{}".format(img_idx, len(self.dataset)), end="\r")
-            bboxes_prd = self.get_bbox(image)
-            if len(bboxes_prd) == 0:
-                bboxes_prd = np.zeros((0, 6))
-
-            # Handle the batch of predictions produced
-            # This is slow, but consistent with old implementation.
-            detections = {"bboxes": [], "labels": []}
-            detections["bboxes"] = bboxes_prd[:, :5]
-            detections["labels"] = bboxes_prd[:, 5]
-
-            gt_bboxes = np.array(label["boxes"], dtype=np.float64)
-            gt_labels = [self.dataset.label_map[_l] for _l in label["labels"]]
-            gt = {"bboxes": gt_bboxes, "labels": gt_labels}
-            results.append({"detections": detections, "gt": gt})
+        for batch_start in range(0, len(self.dataset.images), self.batch_size):
+            img_inds = range(batch_start, min(batch_start + self.batch_size, len(self.dataset.images)))
+            images = [
+                cv2.imread("{}/{}".format(self.data_root, self.dataset.images[img_idx]))
+                for img_idx in img_inds
+            ]
+            print("Parsing batch: {}/{}".format(batch_start, len(self.dataset)), end="\r")
+            for img_idx, bboxes_prd in zip(img_inds, self.get_bboxes(images)):
+                label = self.dataset.objects[img_idx]
+                detections = {"bboxes": [], "labels": []}
+                detections["bboxes"] = bboxes_prd[:, :5]
+                detections["labels"] = bboxes_prd[:, 5]
+
+                gt_bboxes = np.array(label["boxes"], dtype=np.float64)
+                gt_labels = [self.dataset.label_map[_l] for _l in label["labels"]]
+                gt = {"bboxes": gt_bboxes, "labels": gt_labels}
+                results.append({"detections": detections, "gt": gt})
         print("validation loss = {}".format(avg_loss))
         # put your model in training mode back on
 
@@ -128,13 +126,13 @@ class LISAEval(Evaluator):
 
 
 @EVAL_WRAPPER_REGISTRY.register(task_type='object_detection', model_type='yolo', dataset_type='lisa')
-def yolo_eval_lisa(model, data_root, device="cuda", net="yolov3", img_size=448, **kwargs):
+def yolo_eval_lisa(model, data_root, device="cuda", net="yolov3", img_size=448, batch_size=8, **kwargs):
 
     mAP = 0
     result = {}
     model.to(device)
     with torch.no_grad():
-        mAP = LISAEval(model, data_root, net=net, img_size=img_size).evaluate()
+        mAP = LISAEval(model, data_root, net=net, img_size=img_size, batch_size=batch_size).evaluate()
         result["mAP"] = mAP
 
     return result
@@ -29,9 +29,9 @@ from deeplite_torch_zoo.wrappers.registries import EVAL_WRAPPER_REGISTRY
 class WiderFaceEval(Evaluator):
     """docstring for WiderFaceEval"""
 
-    def __init__(self, model, data_root, net="yolov3", img_size=448):
+    def __init__(self, model, data_root, net="yolov3", img_size=448, batch_size=8):
         super(WiderFaceEval, self).__init__(
-            model=model, img_size=img_size)
+            model=model, img_size=img_size, batch_size=batch_size)
 
         self.dataset = WiderFace(data_root, split="val")
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
@@ -42,26 +42,21 @@ class WiderFaceEval(Evaluator):
         self.model.cuda()
         results = []
         start = time.time()
-        for img_idx, _ in enumerate(self.dataset.img_info):
-            _info = self.dataset.img_info[img_idx]
-            img_path = _info["img_path"]
-            image = cv2.imread(img_path)
-
-            print("Parsing batch: {}/{}".format(img_idx, len(self.dataset)), end="\r")
-            bboxes_prd = self.get_bbox(image)
-            if len(bboxes_prd) == 0:
-                bboxes_prd = np.zeros((0, 6))
-
-            # Handle the batch of predictions produced
-            # This is slow, but consistent with old implementation.
-            detections = {"bboxes": [], "labels": []}
-            detections["bboxes"] = bboxes_prd[:, :5]
-            detections["labels"] = bboxes_prd[:, 5]
-
-            gt_bboxes = _info["annotations"]["bbox"]
-            gt_labels = np.ones(len(gt_bboxes))
-            gt = {"bboxes": gt_bboxes, "labels": gt_labels}
-            results.append({"detections": detections, "gt": gt})
+        num_images = len(self.dataset.img_info)
+        for batch_start in range(0, num_images, self.batch_size):
+            infos = self.dataset.img_info[batch_start:batch_start + self.batch_size]
+            images = [cv2.imread(_info["img_path"]) for _info in infos]
+
+            print("Parsing batch: {}/{}".format(batch_start, len(self.dataset)), end="\r")
+            for _info, bboxes_prd in zip(infos, self.get_bboxes(images)):
+                detections = {"bboxes": [], "labels": []}
+                detections["bboxes"] = bboxes_prd[:, :5]
+                detections["labels"] = bboxes_prd[:, 5]
+
+                gt_bboxes = _info["annotations"]["bbox"]
+                gt_labels = np.ones(len(gt_bboxes))
+                gt = {"bboxes": gt_bboxes, "labels": gt_labels}
+                results.append({"detections": detections, "gt": gt})
         # put your model in training mode back on
 
         mAP = MAP(results, self.dataset.num_classes)
@@ -75,13 +70,13 @@ class WiderFaceEval(Evaluator):
 
 
 @EVAL_WRAPPER_REGISTRY.register(task_type='object_detection', model_type='yolo', dataset_type='wider_face')
-def yolo_eval_wider_face(model, data_root, device="cuda", net="yolov3", img_size=448, **kwargs):
+def yolo_eval_wider_face(model, data_root, device="cuda", net="yolov3", img_size=448, batch_size=8, **kwargs):
 
     mAP = 0
     result = {}
     model.to(device)
     with torch.no_grad():
-        mAP = WiderFaceEval(model, data_root, net=net, img_size=img_size).evaluate()
+        mAP = WiderFaceEval(model, data_root, net=net, img_size=img_size, batch_size=batch_size).evaluate()
         result["mAP"] = mAP
 
     return result
@@ -142,6 +142,9 @@ class RepVGGBlock(nn.Module):
             self.__delattr__('id_tensor')
         self.pretrained = True
 
+    def reparameterize(self):
+        self.switch_to_pretrained()
+
 
 
 class RepVGG(nn.Module):
@@ -29,13 +29,16 @@ import os
 import cv2
 import numpy as np
 from PIL import ImageFile
-from torchvision.datasets import CocoDetection
+from pycocotools.coco import COCO
+from torch.utils.data import Dataset
 
+from deeplite_torch_zoo.src.objectdetection.datasets.coco.coco_index import \
+    get_coco_index
 from deeplite_torch_zoo.src.objectdetection.eval.zoo_eval.coco.utils import \
     xywh_to_xyxy
 
 
-class CocoDetectionBoundingBox(CocoDetection):
+class CocoDetectionBoundingBox(Dataset):
     def __init__(
         self,
         img_root,
@@ -46,7 +49,13 @@ class CocoDetectionBoundingBox(CocoDetection):
         missing_ids=[],
         classes=[],
     ):
-        super(CocoDetectionBoundingBox, self).__init__(img_root, ann_file_name)
+        super(CocoDetectionBoundingBox, self).__init__()
+        self.root = img_root
+        self.ann_file_name = ann_file_name
+        # annotations are read from the cached index, see CocoIndex
+        self._index = get_coco_index(ann_file_name)
+        self._coco = None
+        self.ids = self._index.image_ids.tolist()
         self.missing_ids = missing_ids
         self.transform = transform
         self.target_transform = target_transform
@@ -62,6 +71,16 @@ class CocoDetectionBoundingBox(CocoDetection):
             self.category_id = category
         ImageFile.LOAD_TRUNCATED_IMAGES = True
 
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def coco(self):
+        """pycocotools COCO object of the annotations, only created when accessed"""
+        if self._coco is None:
+            self._coco = COCO(self.ann_file_name)
+        return self._coco
+
     def __getitem__(self, index):
         """
         return:
@@ -87,7 +106,7 @@ class CocoDetectionBoundingBox(CocoDetection):
         return image
 
     def _read_image(self, img_id):
-        path = self.coco.loadImgs(img_id)[0]['file_name']
+        path = self._index.file_name(self._index.position(img_id))
         image_file = os.path.join(self.root, path)
         image = cv2.imread(str(image_file))
         image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
@@ -98,22 +117,13 @@ class CocoDetectionBoundingBox(CocoDetection):
         return str(image_id), self._get_annotation(image_id)
 
     def _get_annotation(self, img_id):
-        ann_ids = self.coco.getAnnIds(imgIds=img_id)
-        targets = self.coco.loadAnns(ann_ids)
-        boxes = []
-        labels = []
-        is_difficult = []
-        for target in targets:
-            bbox = target["bbox"]  # in xywh format
-            category_id = target["category_id"]
-            if (not self.all_categories) and (category_id != self.category_id):
-                continue
-            category_id = self._delete_coco_empty_category(category_id)
-            labels.append(category_id + 1)
-            boxes.append(bbox)
-            is_difficult.append(0)
-        labels = np.array(labels, dtype=np.int64)
-        is_difficult = np.array(is_difficult, dtype=np.int64)
+        boxes, category_ids = self._index.annotations(self._index.position(img_id))  # boxes in xywh format
+        if not self.all_categories:
+            keep = category_ids == self.category_id
+            boxes, category_ids = boxes[keep], category_ids[keep]
+        labels = np.array([self._delete_coco_empty_category(category_id) + 1 for category_id in category_ids],
+            dtype=np.int64)
+        is_difficult = np.zeros(len(labels), dtype=np.int64)
         boxes = np.array(boxes, dtype=np.float32)
         if len(boxes) > 0:
             boxes = xywh_to_xyxy(boxes)
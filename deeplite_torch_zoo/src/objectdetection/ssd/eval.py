@@ -1,95 +1,157 @@
-import os
-
 import numpy as np
 import torch
+from torch.utils.data import DataLoader, Dataset
 
 from vision.utils import box_utils, measurements
 
 
-def group_annotation_by_class(dataloader):
-    true_case_stat = {}
-    all_gt_boxes = {}
-    all_difficult_cases = {}
-    for i, _ in enumerate(dataloader.dataset):
-        image_id, annotation = dataloader.dataset.get_annotation(i)
-        gt_boxes, classes, is_difficult = annotation
-        gt_boxes = torch.from_numpy(gt_boxes)
-        for i, difficult in enumerate(is_difficult):
-            class_index = int(classes[i])
-            gt_box = gt_boxes[i]
-            if not difficult:
-                true_case_stat[class_index] = true_case_stat.get(class_index, 0) + 1
-
-            if class_index not in all_gt_boxes:
-                all_gt_boxes[class_index] = {}
-            if image_id not in all_gt_boxes[class_index]:
-                all_gt_boxes[class_index][image_id] = []
-            all_gt_boxes[class_index][image_id].append(gt_box)
-            if class_index not in all_difficult_cases:
-                all_difficult_cases[class_index] = {}
-            if image_id not in all_difficult_cases[class_index]:
-                all_difficult_cases[class_index][image_id] = []
-            all_difficult_cases[class_index][image_id].append(difficult)
-
-    for class_index in all_gt_boxes:
-        for image_id in all_gt_boxes[class_index]:
-            all_gt_boxes[class_index][image_id] = torch.stack(
-                all_gt_boxes[class_index][image_id]
-            )
-    for class_index in all_difficult_cases:
-        for image_id in all_difficult_cases[class_index]:
-            all_difficult_cases[class_index][image_id] = torch.tensor(
-                all_difficult_cases[class_index][image_id]
-            )
-    return true_case_stat, all_gt_boxes, all_difficult_cases
+class PredictionDataset(Dataset):
+    """Dataset of transformed images ready for Predictor.predict_tensor.
+
+    Images are decoded and transformed inside the DataLoader workers, every
+    sample also carries its index and the (height, width) of the original image.
+    """
+    def __init__(self, dataset, transform):
+        self.dataset = dataset
+        self.transform = transform
+
+    def __getitem__(self, index):
+        image = self.dataset.get_image(index)
+        return index, self.transform(image), image.shape[:2]
+
+    def __len__(self):
+        return len(self.dataset)
+
+
+def collate_predictions(batch):
+    indexes, images, image_sizes = zip(*batch)
+    return list(indexes), torch.stack(images), list(image_sizes)
+
+
+def group_annotation_by_class(dataset):
+    """Collect the ground truth of the whole dataset into flat arrays.
+
+    Only the annotations are read, images are not decoded.
+
+    Returns:
+        image_indexes (N): index of the image of every gt box.
+        labels (N): class of every gt box.
+        boxes (N, 4): gt boxes in corner-form.
+        is_difficult (N): difficult flag of every gt box.
+    """
+    image_indexes, labels, boxes, is_difficult = [], [], [], []
+    for i in range(len(dataset)):
+        _, (gt_boxes, classes, difficult) = dataset.get_annotation(i)
+        image_indexes.append(np.full(len(classes), i, dtype=np.int64))
+        labels.append(np.asarray(classes, dtype=np.int64))
+        boxes.append(np.asarray(gt_boxes, dtype=np.float32).reshape(-1, 4))
+        is_difficult.append(np.asarray(difficult, dtype=bool))
+    return (
+        np.concatenate(image_indexes),
+        np.concatenate(labels),
+        np.concatenate(boxes),
+        np.concatenate(is_difficult),
+    )
+
+
+def predict_dataset(predictor, dataloader):
+    """Run the predictor over the dataset of the dataloader.
+
+    Batch size and number of workers are taken from the dataloader.
+
+    Returns:
+        image_indexes (M): index of the image of every detection.
+        labels (M): class of every detection.
+        probs (M): confidence of every detection.
+        boxes (M, 4): detected boxes in corner-form.
+    """
+    loader = DataLoader(
+        PredictionDataset(dataloader.dataset, predictor.transform),
+        batch_size=dataloader.batch_size or 1,
+        num_workers=dataloader.num_workers,
+        collate_fn=collate_predictions,
+    )
+    image_indexes, labels, probs, boxes = [], [], [], []
+    for indexes, images, image_sizes in loader:
+        results = predictor.predict_tensor(images, image_sizes)
+        for index, (image_boxes, image_labels, image_probs) in zip(indexes, results):
+            image_indexes.append(np.full(image_labels.size(0), index, dtype=np.int64))
+            labels.append(image_labels.numpy().astype(np.int64))
+            probs.append(image_probs.numpy().astype(np.float32))
+            boxes.append(image_boxes.numpy().astype(np.float32).reshape(-1, 4))
+    return (
+        np.concatenate(image_indexes),
+        np.concatenate(labels),
+        np.concatenate(probs),
+        np.concatenate(boxes),
+    )
+
+
+def match_detections(det_images, det_boxes, gt_images, gt_boxes, gt_difficult, iou_threshold):
+    """Greedy VOC matching of the detections of one class sorted by decreasing confidence.
+
+    Every detection is matched with the gt box of the same image it overlaps the most.
+    Detections matched with a difficult gt box are ignored, every other gt box can be
+    matched by one detection only.
+
+    Returns:
+        true_positive (M), false_positive (M)
+    """
+    num_dets = det_images.shape[0]
+    true_positive = np.zeros(num_dets)
+    false_positive = np.zeros(num_dets)
+
+    # gt boxes of the image of every detection
+    gt_order = np.argsort(gt_images, kind="stable")
+    gt_start = np.searchsorted(gt_images[gt_order], det_images, side="left")
+    num_gt = np.searchsorted(gt_images[gt_order], det_images, side="right") - gt_start
+    pair_det = np.repeat(np.arange(num_dets), num_gt)
+    offsets = np.cumsum(num_gt) - num_gt
+    pair_gt = gt_order[np.repeat(gt_start - offsets, num_gt) + np.arange(num_gt.sum())]
+    ious = box_utils.iou_of(
+        torch.from_numpy(det_boxes[pair_det]), torch.from_numpy(gt_boxes[pair_gt])
+    ).numpy()
+
+    # best gt box of every detection
+    pair_order = np.lexsort((-ious, pair_det))
+    first = np.unique(pair_det[pair_order], return_index=True)[1]
+    best = pair_order[first]
+    det, gt = pair_det[best], pair_gt[best]
+    above = ious[best] > iou_threshold
+    false_positive[:] = 1
+    false_positive[det[above]] = 0
+
+    det, gt = det[above], gt[above]
+    valid = ~gt_difficult[gt]
+    det, gt = det[valid], gt[valid]
+    # the most confident detection takes the gt box, the rest are false positives
+    winners = np.zeros(det.shape[0], dtype=bool)
+    winners[np.unique(gt, return_index=True)[1]] = True
+    true_positive[det[winners]] = 1
+    false_positive[det[~winners]] = 1
+    return true_positive, false_positive
 
 
 def compute_average_precision_per_class(
     num_true_cases,
+    det_images,
+    det_probs,
+    det_boxes,
+    gt_images,
     gt_boxes,
-    difficult_cases,
-    prediction_file,
+    gt_difficult,
     iou_threshold,
     use_2007_metric,
 ):
-    with open(str(prediction_file)) as f:
-        image_ids = []
-        boxes = []
-        scores = []
-        for line in f:
-            t = line.rstrip().split(" ")
-            image_ids.append(t[0])
-            scores.append(float(t[1]))
-            box = torch.tensor([float(v) for v in t[2:]]).unsqueeze(0)
-            box -= 1.0  # convert to python format where indexes start from 0
-            boxes.append(box)
-        scores = np.array(scores)
-        sorted_indexes = np.argsort(-scores)
-        boxes = [boxes[i] for i in sorted_indexes]
-        image_ids = [image_ids[i] for i in sorted_indexes]
-        true_positive = np.zeros(len(image_ids))
-        false_positive = np.zeros(len(image_ids))
-        matched = set()
-        for i, image_id in enumerate(image_ids):
-            box = boxes[i]
-            if image_id not in gt_boxes:
-                false_positive[i] = 1
-                continue
-
-            gt_box = gt_boxes[image_id]
-            ious = box_utils.iou_of(box, gt_box)
-            max_iou = torch.max(ious).item()
-            max_arg = torch.argmax(ious).item()
-            if max_iou > iou_threshold:
-                if difficult_cases[image_id][max_arg] == 0:
-                    if (image_id, max_arg) not in matched:
-                        true_positive[i] = 1
-                        matched.add((image_id, max_arg))
-                    else:
-                        false_positive[i] = 1
-            else:
-                false_positive[i] = 1
-
+    sorted_indexes = np.argsort(-det_probs, kind="stable")
+    true_positive, false_positive = match_detections(
+        det_images[sorted_indexes],
+        det_boxes[sorted_indexes],
+        gt_images,
+        gt_boxes,
+        gt_difficult,
+        iou_threshold,
+    )
     true_positive = true_positive.cumsum()
     false_positive = false_positive.cumsum()
     precision = true_positive / (true_positive + false_positive)
@@ -103,65 +165,33 @@ def compute_average_precision_per_class(
 def ssd_eval(
     predictor,
     dataloader,
-    data_path,
     class_names,
     iou_threshold=0.5,
     use_2007_metric=True,
 ):
-    true_case_stat, all_gb_boxes, all_difficult_cases = group_annotation_by_class(
-        dataloader
-    )
-    results = []
-    for i, _ in enumerate(dataloader.dataset):
-        image = dataloader.dataset.get_image(i)
-        boxes, labels, probs = predictor.predict(image)
-        # print("Prediction: {:4f} seconds.".format(timer.end("Predict")))
-        indexes = torch.ones(labels.size(0), 1, dtype=torch.float32) * i
-        results.append(
-            torch.cat(
-                [
-                    indexes.reshape(-1, 1),
-                    labels.reshape(-1, 1).float(),
-                    probs.reshape(-1, 1),
-                    boxes + 1.0,  # matlab's indexes start from 1
-                ],
-                dim=1,
-            )
-        )
-    results = torch.cat(results)
-    for class_index, class_name in enumerate(class_names):
-        if class_index == 0:
-            continue  # ignore background
-        prediction_path = os.path.join(
-            str(data_path), "det_test_{}.txt".format(class_name)
-        )
-        with open(str(prediction_path), "w") as f:
-            sub = results[results[:, 1] == class_index, :]
-            for i in range(sub.size(0)):
-                prob_box = sub[i, 2:].numpy()
-                image_id = dataloader.dataset.ids[int(sub[i, 0])]
-                print(str(image_id) + " " + " ".join([str(v) for v in prob_box]), file=f)
+    gt_images, gt_labels, gt_boxes, gt_difficult = group_annotation_by_class(dataloader.dataset)
+    det_images, det_labels, det_probs, det_boxes = predict_dataset(predictor, dataloader)
+
     aps = []
     results = {}
-    # print("\n\nAverage Precision Per-class:")
     for class_index, class_name in enumerate(class_names):
         if class_index == 0:
-            continue
-        prediction_path = os.path.join(
-            str(data_path), "det_test_{}.txt".format(class_name)
-        )
+            continue  # ignore background
+        gt_mask = gt_labels == class_index
+        det_mask = det_labels == class_index
         ap = compute_average_precision_per_class(
-            true_case_stat[class_index],
-            all_gb_boxes[class_index],
-            all_difficult_cases[class_index],
-            prediction_path,
+            np.count_nonzero(gt_mask & ~gt_difficult),
+            det_images[det_mask],
+            det_probs[det_mask],
+            det_boxes[det_mask],
+            gt_images[gt_mask],
+            gt_boxes[gt_mask],
+            gt_difficult[gt_mask],
             iou_threshold,
             use_2007_metric,
         )
         aps.append(ap)
-        # print("{}: {}".format(class_name, ap))
         results[class_name] = ap
 
     results["mAP"] = sum(aps) / len(aps)
-    # print("\nAverage Precision Across All Classes:{}".format(sum(aps) / len(aps)))
-    return results
\ No newline at end of file
+    return results
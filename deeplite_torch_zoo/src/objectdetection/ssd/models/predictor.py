@@ -2,10 +2,11 @@ import torch
 
 from ..repo.vision.utils import box_utils
 from ..repo.vision.ssd.data_preprocessing import PredictionTransform
+from ..repo.vision.ssd.predictor import BatchPredictorMixin
 from ..repo.vision.utils.misc import Timer
 
 
-class Predictor:
+class Predictor(BatchPredictorMixin):
     def __init__(self, net, size, mean=0.0, std=1.0, nms_method=None,
                  iou_threshold=0.45, filter_threshold=0.01, candidate_size=200, sigma=0.5, device=None):
         self.net = net
@@ -67,4 +68,4 @@ class Predictor:
         picked_box_probs[:, 1] *= height
         picked_box_probs[:, 2] *= width
         picked_box_probs[:, 3] *= height
-        return picked_box_probs[:, :4], torch.tensor(picked_labels), picked_box_probs[:, 4]
\ No newline at end of file
+        return picked_box_probs[:, :4], torch.tensor(picked_labels), picked_box_probs[:, 4]
@@ -5,7 +5,67 @@ from .data_preprocessing import PredictionTransform
 from ..utils.misc import Timer
 
 
-class Predictor:
+class BatchPredictorMixin:
+    """predict_batch and predict_tensor of the Predictor classes, which provide net, transform, device,
+    timer and the NMS settings."""
+
+    def predict_batch(self, images, top_k=-1, prob_threshold=None):
+        """Run detection on a list of images with a single forward pass.
+
+        NMS is done for all the images and classes at once on the model device.
+
+        Returns:
+            a list with a (boxes, labels, probs) tuple per image, same as predict.
+        """
+        batch = torch.stack([self.transform(image) for image in images])
+        image_sizes = [image.shape[:2] for image in images]
+        return self.predict_tensor(batch, image_sizes, top_k=top_k, prob_threshold=prob_threshold)
+
+    def predict_tensor(self, batch, image_sizes, top_k=-1, prob_threshold=None):
+        """Same as predict_batch for a batch of already transformed images.
+
+        Args:
+            batch (N, C, H, W): images after self.transform.
+            image_sizes: (height, width) of every original image, used to scale the boxes.
+        """
+        sizes = torch.tensor([[width, height] * 2 for height, width in image_sizes], dtype=torch.float32)
+        batch = batch.to(self.device)
+        with torch.no_grad():
+            self.timer.start()
+            scores, boxes = self.net.forward(batch)
+        if not prob_threshold:
+            prob_threshold = self.filter_threshold
+        num_classes = scores.size(2)
+        image_index, prior_index, class_index = (scores[..., 1:] > prob_threshold).nonzero(as_tuple=True)
+        class_index = class_index + 1
+        probs = scores[image_index, prior_index, class_index]
+        boxes = boxes[image_index, prior_index]
+        groups = image_index * num_classes + class_index
+        if self.nms_method == "soft":
+            keep, probs = box_utils.batched_soft_nms(boxes, probs, groups,
+                                                     score_threshold=prob_threshold,
+                                                     sigma=self.sigma,
+                                                     top_k=top_k)
+        else:
+            keep = box_utils.batched_hard_nms(boxes, probs, groups,
+                                              iou_threshold=self.iou_threshold,
+                                              top_k=top_k,
+                                              candidate_size=self.candidate_size)
+            probs = probs[keep]
+        image_index = image_index[keep].cpu()
+        picked_boxes = boxes[keep].cpu() * sizes[image_index]
+        picked_labels = class_index[keep].cpu()
+        picked_probs = probs.cpu()
+        counts = torch.bincount(image_index, minlength=len(image_sizes)).tolist()
+        results = []
+        for result in zip(picked_boxes.split(counts), picked_labels.split(counts), picked_probs.split(counts)):
+            if result[0].size(0) == 0:
+                result = torch.tensor([]), torch.tensor([]), torch.tensor([])
+            results.append(tuple(result))
+        return results
+
+
+class Predictor(BatchPredictorMixin):
     def __init__(self, net, size, mean=0.0, std=1.0, nms_method=None,
                  iou_threshold=0.45, filter_threshold=0.01, candidate_size=200, sigma=0.5, device=None):
         self.net = net
@@ -1,5 +1,6 @@
 import collections
 import torch
+import torchvision
 import itertools
 from typing import List
 import math
@@ -97,13 +98,12 @@ def convert_locations_to_boxes(locations, priors, center_variance,
         boxes:  priors: [[center_x, center_y, h, w]]. All the values
             are relative to the image size.
     """
-    # priors can have one dimension less.
-    if priors.dim() + 1 == locations.dim():
-        priors = priors.unsqueeze(0)
+    # priors can have one dimension less, they are broadcast over the batch.
+    # No shape-dependent branch, so that the SSD models can be traced with torch.fx
     return torch.cat([
         locations[..., :2] * center_variance * priors[..., 2:] + priors[..., :2],
         torch.exp(locations[..., 2:] * size_variance) * priors[..., 2:]
-    ], dim=locations.dim() - 1)
+    ], dim=-1)
 
 
 def convert_boxes_to_locations(center_form_boxes, center_form_priors, center_variance, size_variance):
@@ -206,7 +206,7 @@ def hard_negative_mining(loss, labels, neg_pos_ratio):
 
 def center_form_to_corner_form(locations):
     return torch.cat([locations[..., :2] - locations[..., 2:]/2,
-                     locations[..., :2] + locations[..., 2:]/2], locations.dim() - 1) 
+                     locations[..., :2] + locations[..., 2:]/2], -1)
 
 
 def corner_form_to_center_form(boxes):
@@ -257,6 +257,100 @@ def nms(box_scores, nms_method=None, score_threshold=None, iou_threshold=None,
         return hard_nms(box_scores, iou_threshold, top_k, candidate_size=candidate_size)
 
 
+def _group_order(idxs):
+    """Stable ordering of the elements by group index."""
+    position = torch.arange(idxs.numel(), device=idxs.device)
+    # torch.sort is not stable, so the position breaks ties within a group
+    return (idxs * idxs.numel() + position).argsort()
+
+
+def _group_ranks(idxs):
+    """Rank of every element among the preceding elements of the same group."""
+    ranks = torch.zeros_like(idxs)
+    if idxs.numel() == 0:
+        return ranks
+    order = _group_order(idxs)
+    sorted_idxs = idxs[order]
+    position = torch.arange(idxs.numel(), device=idxs.device)
+    group_start = torch.ones_like(sorted_idxs, dtype=torch.bool)
+    group_start[1:] = sorted_idxs[1:] != sorted_idxs[:-1]
+    start, _ = torch.cummax(torch.where(group_start, position, torch.zeros_like(position)), 0)
+    ranks[order] = position - start
+    return ranks
+
+
+def batched_hard_nms(boxes, scores, idxs, iou_threshold, top_k=-1, candidate_size=200):
+    """Hard NMS over many independent groups (e.g. image and class pairs) at once.
+
+    Gives the same result as calling hard_nms for every group separately.
+
+    Args:
+        boxes (N, 4): boxes in corner-form.
+        scores (N): probabilities.
+        idxs (N): group index of every box, boxes of different groups never suppress each other.
+        iou_threshold: intersection over union threshold.
+        top_k: keep top_k results per group. If k <= 0, keep all the results.
+        candidate_size: only consider the candidates with the highest scores in every group.
+    Returns:
+         keep: indexes of the kept boxes sorted by group and by decreasing score within a group.
+    """
+    order = scores.argsort(descending=True)
+    order = order[_group_ranks(idxs[order]) < candidate_size]
+    keep = order[torchvision.ops.batched_nms(boxes[order], scores[order], idxs[order], iou_threshold)]
+    if top_k > 0:
+        keep = keep[_group_ranks(idxs[keep]) < top_k]
+    return keep[_group_order(idxs[keep])]
+
+
+def batched_soft_nms(boxes, scores, idxs, score_threshold, sigma=0.5, top_k=-1):
+    """Soft NMS over many independent groups (e.g. image and class pairs) at once.
+
+    Gives the same result as calling soft_nms for every group separately. The groups
+    are padded to the same size and processed in parallel, one pick per iteration.
+
+    Args:
+        boxes (N, 4): boxes in corner-form.
+        scores (N): probabilities.
+        idxs (N): group index of every box, boxes of different groups never affect each other.
+        score_threshold: boxes with scores less than value are not considered.
+        sigma: the parameter in score re-computation.
+        top_k: keep top_k results per group. If k <= 0, keep all the results.
+    Returns:
+         keep: indexes of the picked boxes sorted by group and by order of picking.
+         picked_scores: re-computed scores of the picked boxes.
+    """
+    if idxs.numel() == 0:
+        return idxs.new_zeros(0), scores.new_zeros(0)
+    _, group_ids = torch.unique(idxs, return_inverse=True)
+    ranks = _group_ranks(group_ids)
+    num_groups, group_size = int(group_ids.max()) + 1, int(ranks.max()) + 1
+    index = idxs.new_full((num_groups, group_size), -1)
+    index[group_ids, ranks] = torch.arange(idxs.numel(), device=idxs.device)
+    padded_boxes = boxes.new_zeros((num_groups, group_size, 4))
+    padded_boxes[group_ids, ranks] = boxes
+    padded_scores = scores.new_zeros((num_groups, group_size))
+    padded_scores[group_ids, ranks] = scores
+    alive = index >= 0
+
+    rows = torch.arange(num_groups, device=idxs.device)
+    num_picks = group_size if top_k <= 0 else min(top_k, group_size)
+    picked, picked_scores = [], []
+    for _ in range(num_picks):
+        if not alive.any():
+            break
+        best = padded_scores.masked_fill(~alive, -math.inf).argmax(dim=1)
+        picked.append(torch.where(alive[rows, best], index[rows, best], torch.full_like(best, -1)))
+        picked_scores.append(padded_scores[rows, best])
+        alive[rows, best] = False
+        ious = iou_of(padded_boxes[rows, best].unsqueeze(1), padded_boxes)
+        padded_scores = padded_scores * torch.exp(-(ious * ious) / sigma)
+        alive &= padded_scores > score_threshold
+    picked = torch.stack(picked, dim=1)
+    picked_scores = torch.stack(picked_scores, dim=1)
+    mask = picked >= 0
+    return picked[mask], picked_scores[mask]
+
+
 def soft_nms(box_scores, score_threshold, sigma=0.5, top_k=-1):
     """Soft NMS implementation.
 
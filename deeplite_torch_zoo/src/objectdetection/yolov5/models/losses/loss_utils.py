@@ -2,10 +2,11 @@
 
 import math
 
-import numpy as np
 import torch
 import torch.nn as nn
 
+from deeplite_torch_zoo.src.objectdetection.datasets.batch import \
+    DetectionBatch
 from deeplite_torch_zoo.src.objectdetection.yolov5.utils.general import \
     xyxy2cxcywh
 
@@ -21,22 +22,23 @@ def de_parallel(model):
 
 
 def get_yolov5_targets(raw_targets, labels_length, img_size, device):
-    targets = torch.zeros(
-            (int(sum(labels_length)), 6), device=device, dtype=torch.float32
-        )
-    cum_index = np.cumsum(labels_length)
-    prv_index = 0
-    for i, target in enumerate(raw_targets):
-        current_index = int(cum_index[i])
-        current_length = int(labels_length[i])
-        targets[prv_index:current_index, 0] = i
-        targets[prv_index:current_index, 1] = target[:current_length, 4]
-        targets[prv_index:current_index, 2:] = xyxy2cxcywh(
-            target[:current_length, :4]
-        )  # convert from x1, y1, x2, y2 to cx, cy, w, h
-        prv_index = cum_index[i]
-
-    targets[:, 2:6] /= img_size  # Normalize to 0 - 1
+    """
+    Returns the (image, class, cx, cy, w, h) targets of a batch with boxes normalized to 0 - 1.
+    raw_targets is a `DetectionBatch` (labels_length is then unused) or zero-padded
+    (B, max_n, C) x1, y1, x2, y2, class labels with labels_length labels per image.
+    """
+    if isinstance(raw_targets, DetectionBatch):
+        batch_index, labels = raw_targets.batch_index, raw_targets.labels
+    else:
+        labels_length = torch.as_tensor(labels_length, device=raw_targets.device)
+        valid = torch.arange(raw_targets.shape[1], device=raw_targets.device) < labels_length[:, None]
+        batch_index, labels = valid.nonzero()[:, 0], raw_targets[valid]
+
+    labels = labels.to(device=device, dtype=torch.float32)
+    targets = torch.empty((len(labels), 6), device=device, dtype=torch.float32)
+    targets[:, 0] = batch_index.to(device)
+    targets[:, 1] = labels[:, 4]
+    targets[:, 2:] = xyxy2cxcywh(labels[:, :4]) / img_size  # x1, y1, x2, y2 to cx, cy, w, h, normalized to 0 - 1
     return targets
 
 
@@ -18,6 +18,7 @@ import matplotlib
 import matplotlib.pyplot as plt
 import numpy as np
 import torch
+import torchvision
 import yaml
 from tqdm import tqdm
 
@@ -1207,34 +1208,73 @@ def post_process_sample(pred_bbox):
 
 
 def nms(bboxes, score_threshold, iou_threshold, sigma=0.3, method="nms", max_dets=300):
-    classes_in_img = list(set(bboxes[:, 5].astype(np.int32)))
-    best_bboxes = []
-
-    for cls in classes_in_img:
-        cls_mask = bboxes[:, 5].astype(np.int32) == cls
-        cls_bboxes = bboxes[cls_mask]
-        while len(cls_bboxes) > 0:
-            max_ind = np.argmax(cls_bboxes[:, 4])
-            best_bbox = cls_bboxes[max_ind]
-            best_bboxes.append(best_bbox)
-            cls_bboxes = np.concatenate(
-                [cls_bboxes[:max_ind], cls_bboxes[max_ind + 1 :]]
-            )
-            iou = iou_xyxy_numpy(best_bbox[np.newaxis, :4], cls_bboxes[:, :4])
-            assert method in ["nms", "soft-nms"]
-            weight = np.ones((len(iou),), dtype=np.float32)
-            if method == "nms":
-                iou_mask = iou > iou_threshold
-                weight[iou_mask] = 0.0
-            if method == "soft-nms":
-                weight = np.exp(-(1.0 * iou ** 2 / sigma))
-            cls_bboxes[:, 4] = cls_bboxes[:, 4] * weight
-            score_mask = cls_bboxes[:, 4] > score_threshold
-            cls_bboxes = cls_bboxes[score_mask]
-
-    best_bboxes = np.array(best_bboxes)
-    if len(best_bboxes) > max_dets:
-        best_bboxes = best_bboxes[:max_dets, :]
+    """Per-class NMS of an array of boxes, all the classes are processed at once.
+
+    Arguments:
+        bboxes (np.array): [N, 6] boxes in (xmin, ymin, xmax, ymax, score, class) format.
+        method (str): "nms" for hard NMS, "soft-nms" for gaussian soft-NMS.
+
+    Returns:
+        picked boxes sorted by class and by order of picking within a class,
+        at most max_dets of them.
+    """
+    assert method in ["nms", "soft-nms"]
+    bboxes = bboxes[bboxes[:, 4] > score_threshold]
+    classes = bboxes[:, 5].astype(np.int32)
+    if method == "nms":
+        keep = torchvision.ops.batched_nms(
+            torch.from_numpy(bboxes[:, :4]),
+            torch.from_numpy(bboxes[:, 4]),
+            torch.from_numpy(classes),
+            iou_threshold,
+        ).numpy()
+        best_bboxes = bboxes[keep[np.argsort(classes[keep], kind="stable")]]
+    else:
+        best_bboxes = soft_nms(bboxes, classes, score_threshold, sigma)
+    return best_bboxes[:max_dets]
+
+
+def soft_nms(bboxes, classes, score_threshold, sigma=0.3):
+    """Gaussian soft-NMS of every class in parallel.
+
+    The boxes of every class are padded to the same count and one box
+    per class is picked at every iteration.
+    """
+    order = np.argsort(classes, kind="stable")
+    bboxes, classes = bboxes[order], classes[order]
+    num_boxes = len(classes)
+    if num_boxes == 0:
+        return bboxes
+    class_start = np.r_[True, classes[1:] != classes[:-1]]
+    group = np.cumsum(class_start) - 1
+    position = np.arange(num_boxes)
+    rank = position - np.maximum.accumulate(np.where(class_start, position, 0))
+
+    num_groups, group_size = group[-1] + 1, rank.max() + 1
+    index = np.full((num_groups, group_size), -1)
+    index[group, rank] = position
+    boxes = np.zeros((num_groups, group_size, 4))
+    boxes[group, rank] = bboxes[:, :4]
+    scores = np.zeros((num_groups, group_size))
+    scores[group, rank] = bboxes[:, 4]
+    alive = index >= 0
+
+    rows = np.arange(num_groups)
+    picked, picked_scores = [], []
+    while alive.any():
+        best = np.where(alive, scores, -np.inf).argmax(axis=1)
+        picked.append(np.where(alive[rows, best], index[rows, best], -1))
+        picked_scores.append(scores[rows, best])
+        alive[rows, best] = False
+        with np.errstate(divide="ignore", invalid="ignore"):
+            iou = iou_xyxy_numpy(boxes[rows, best][:, np.newaxis], boxes)
+        scores = scores * np.exp(-(1.0 * iou ** 2 / sigma))
+        alive &= scores > score_threshold
+    picked = np.stack(picked, axis=1)
+    picked_scores = np.stack(picked_scores, axis=1)
+    mask = picked >= 0
+    best_bboxes = bboxes[picked[mask]]
+    best_bboxes[:, 4] = picked_scores[mask]
     return best_bboxes
 
 
@@ -1 +1,8 @@
 from deeplite_torch_zoo.utils.utils import *
+from deeplite_torch_zoo.utils.checkpoints import *
+from deeplite_torch_zoo.utils.profiler import *
+from deeplite_torch_zoo.utils.optimize import *
+from deeplite_torch_zoo.utils.quantize import *
+from deeplite_torch_zoo.utils.prune import *
+from deeplite_torch_zoo.utils.kd import *
+from deeplite_torch_zoo.utils.latency import *
@@ -0,0 +1,191 @@
+import hashlib
+import json
+import os
+import re
+import threading
+from urllib.parse import urlparse
+
+from torch.hub import download_url_to_file
+
+__all__ = [
+    "CheckpointCache",
+    "get_cache_root",
+    "get_checkpoint_cache",
+    "set_checkpoint_cache",
+]
+
+# same convention as torch.hub: "<name>-<sha256 prefix>.<ext>"
+HASH_REGEX = re.compile(r'-([a-f0-9]{8,})\.')
+HASH_BLOCK_SIZE = 1 << 20
+
+CACHE_DIR_ENV = 'DEEPLITE_ZOO_CACHE_DIR'
+MIRROR_DIR_ENV = 'DEEPLITE_ZOO_MIRROR_DIR'
+OFFLINE_ENV = 'DEEPLITE_ZOO_OFFLINE'
+
+
+def get_cache_root():
+    cache_home = os.getenv('XDG_CACHE_HOME', os.path.join('~', '.cache'))
+    return os.path.join(cache_home, 'deeplite_torch_zoo')
+
+
+def _file_sha256(path):
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            sha256.update(block)
+    return sha256.hexdigest()
+
+
+def _file_stat(path):
+    stat = os.stat(path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+class CheckpointCache:
+    """Content-addressed local store of the zoo checkpoints.
+
+    A checkpoint `<name>-<hash>.<ext>` is stored as `<cache_dir>/<hash>/<name>-<hash>.<ext>`,
+    checkpoints without a hash in the file name go to `<cache_dir>/unversioned`.
+    The manifest `<cache_dir>/manifest.json` records every file whose content has been
+    verified together with its size and mtime, so a file is hashed once and not on
+    every load. Files of the mirror directory (looked up by file name) are used in place.
+
+    :param cache_dir: Root of the store, `$DEEPLITE_ZOO_CACHE_DIR` or `~/.cache/deeplite_torch_zoo/checkpoints` by default
+    :param mirror_dir: Local directory with checkpoint files to resolve before downloading, `$DEEPLITE_ZOO_MIRROR_DIR` by default
+    :param offline: Never download, fail if a checkpoint is neither cached nor mirrored, `$DEEPLITE_ZOO_OFFLINE` by default
+    """
+
+    def __init__(self, cache_dir=None, mirror_dir=None, offline=None):
+        if cache_dir is None:
+            cache_dir = os.getenv(CACHE_DIR_ENV, os.path.join(get_cache_root(), 'checkpoints'))
+        if mirror_dir is None:
+            mirror_dir = os.getenv(MIRROR_DIR_ENV)
+        if offline is None:
+            offline = os.getenv(OFFLINE_ENV, '0').lower() not in ('', '0', 'false', 'no')
+        self.cache_dir = os.path.abspath(os.path.expanduser(cache_dir))
+        self.mirror_dir = os.path.abspath(os.path.expanduser(mirror_dir)) if mirror_dir else None
+        self.offline = offline
+        self.manifest_path = os.path.join(self.cache_dir, 'manifest.json')
+        self._manifest = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def parse_url(url):
+        """Returns the file name and the sha256 prefix embedded in it (None if absent)."""
+        filename = os.path.basename(urlparse(url).path)
+        match = HASH_REGEX.search(filename)
+        return filename, match.group(1) if match else None
+
+    def cache_path(self, url):
+        filename, hash_prefix = self.parse_url(url)
+        return os.path.join(self.cache_dir, hash_prefix or 'unversioned', filename)
+
+    def is_cached(self, url):
+        return self._find_verified(url) is not None
+
+    def fetch(self, url, progress=False):
+        """Returns the local path of the checkpoint, downloading it if needed."""
+        path = self._find_verified(url)
+        if path is None:
+            # another process may have verified it since the manifest was read
+            self._manifest = None
+            path = self._find_verified(url)
+        if path is not None:
+            return path
+
+        filename, hash_prefix = self.parse_url(url)
+        for path in self._candidates(url):
+            if os.path.isfile(path) and self._verify(path, hash_prefix):
+                return path
+
+        if self.offline:
+            raise FileNotFoundError(
+                f'Checkpoint {filename} is not in the cache {self.cache_dir} '
+                f'or the mirror {self.mirror_dir} and downloads are disabled (offline mode)'
+            )
+        path = self.cache_path(url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # the hash is checked while downloading, the file does not have to be read again
+        download_url_to_file(url, path, hash_prefix=hash_prefix, progress=progress)
+        self._record(path, hash_prefix)
+        return path
+
+    def prefetch(self, urls, progress=False):
+        """Fetches every url, returns a dict of url -> local path or raised exception."""
+        results = {}
+        for url in urls:
+            try:
+                results[url] = self.fetch(url, progress=progress)
+            except Exception as e:  # pylint: disable=broad-except
+                results[url] = e
+        return results
+
+    def _candidates(self, url):
+        candidates = [self.cache_path(url)]
+        if self.mirror_dir is not None:
+            candidates.append(os.path.join(self.mirror_dir, self.parse_url(url)[0]))
+        return candidates
+
+    def _find_verified(self, url):
+        _, hash_prefix = self.parse_url(url)
+        manifest = self._load_manifest()
+        for path in self._candidates(url):
+            entry = manifest.get(path)
+            if entry is None or not os.path.isfile(path):
+                continue
+            # unchanged since it was verified, no need to hash it again
+            if entry['stat'] == _file_stat(path) and entry['hash'].startswith(hash_prefix or ''):
+                return path
+        return None
+
+    def _verify(self, path, hash_prefix):
+        digest = _file_sha256(path)
+        if hash_prefix is not None and not digest.startswith(hash_prefix):
+            print(f'Warning: {path} does not match the expected hash {hash_prefix}, ignoring it')
+            return False
+        self._record(path, digest)
+        return True
+
+    def _record(self, path, digest):
+        # digest is the verified sha256 (or its prefix), empty for unversioned files
+        with self._lock:
+            manifest = self._read_manifest()
+            manifest[path] = {'hash': digest or '', 'stat': _file_stat(path)}
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f'{self.manifest_path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(manifest, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.manifest_path)
+            self._manifest = manifest
+
+    def _load_manifest(self):
+        if self._manifest is None:
+            self._manifest = self._read_manifest()
+        return self._manifest
+
+    def _read_manifest(self):
+        try:
+            with open(self.manifest_path) as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+
+_CHECKPOINT_CACHE = None
+
+
+def get_checkpoint_cache():
+    """Returns the checkpoint cache used by `load_pretrained_weights`."""
+    global _CHECKPOINT_CACHE  # pylint: disable=global-statement
+    if _CHECKPOINT_CACHE is None:
+        _CHECKPOINT_CACHE = CheckpointCache()
+    return _CHECKPOINT_CACHE
+
+
+def set_checkpoint_cache(cache):
+    """Replaces the checkpoint cache used by `load_pretrained_weights`, e.g.
+    `set_checkpoint_cache(CheckpointCache(mirror_dir='/mnt/zoo', offline=True))`.
+    Passing None makes it rebuilt from the environment variables on the next load.
+    """
+    global _CHECKPOINT_CACHE  # pylint: disable=global-statement
+    _CHECKPOINT_CACHE = cache
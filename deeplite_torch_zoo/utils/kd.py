@@ -0,0 +1,270 @@
+"""
+Offline teacher outputs for knowledge distillation. Instead of running the teacher on every training step,
+the top-k logits of the teacher are stored per sample and augmentation seed in a memory-mapped cache:
+
+    <root>/teacher_cache.json     number of samples, classes and seeds, top-k
+    <root>/values.npy             (num_seeds, num_samples, top_k) float16 teacher logits
+    <root>/indices.npy            (num_seeds, num_samples, top_k) int16 class indices
+    <root>/filled.npy             (num_seeds, num_samples) bool, whether the entry was computed
+
+The augmentations of a sample only depend on its index and on the augmentation seed of the epoch, which
+cycles through `num_seeds` seeds (see `with_augmentation_seeds`), so that the cached outputs match the
+images the student sees. The KD loss is computed on the sparse targets with `sparse_kd_loss`.
+"""
+
+import contextlib
+import json
+import os
+import random
+
+import numpy as np
+import torch
+import torch.nn.functional as F
+from torch.utils.data import Dataset, Sampler
+from torch.utils.data.dataloader import default_collate
+
+__all__ = [
+    "CachedTeacher",
+    "TeacherLogitCache",
+    "sparse_kd_loss",
+    "with_augmentation_seeds",
+]
+
+
+@contextlib.contextmanager
+def _seeded(seed):
+    # seeds the random generators used by the augmentations and restores them afterwards
+    random_state, numpy_state = random.getstate(), np.random.get_state()
+    with torch.random.fork_rng(devices=[]):
+        random.seed(seed)
+        np.random.seed(seed)
+        torch.manual_seed(seed)
+        try:
+            yield
+        finally:
+            random.setstate(random_state)
+            np.random.set_state(numpy_state)
+
+
+class SeededSampler(Sampler):
+    """
+    Yields (sample index, augmentation seed) pairs, the seed is the epoch modulo `num_seeds`. The epoch is
+    counted by the sampler or set with `set_epoch`, which is forwarded to the wrapped sampler.
+    """
+
+    def __init__(self, sampler, num_seeds=1):
+        self.sampler = sampler
+        self.num_seeds = num_seeds
+        self.epoch = 0
+
+    def set_epoch(self, epoch):
+        self.epoch = epoch
+        if hasattr(self.sampler, 'set_epoch'):
+            self.sampler.set_epoch(epoch)
+
+    def __iter__(self):
+        seed = self.epoch % self.num_seeds
+        self.epoch += 1
+        return ((index, seed) for index in self.sampler)
+
+    def __len__(self):
+        return len(self.sampler)
+
+
+class SeededDataset(Dataset):
+    """Map-style dataset wrapper which loads a sample with random generators seeded by its index and seed"""
+
+    def __init__(self, dataset, base_seed=0):
+        self.dataset = dataset
+        self.base_seed = base_seed
+
+    def __len__(self):
+        return len(self.dataset)
+
+    def __getattr__(self, name):
+        # attributes such as the classes of the wrapped dataset
+        if name == 'dataset':
+            raise AttributeError(name)
+        return getattr(self.dataset, name)
+
+    def __getitem__(self, key):
+        index, seed = key
+        sample_seed = np.random.SeedSequence([self.base_seed, seed, index]).generate_state(1)[0]
+        with _seeded(int(sample_seed)):
+            sample = self.dataset[index]
+        return (*sample, index, seed)
+
+
+class SeededCollate:
+    """Collates the samples of a SeededDataset with the collate function of the wrapped loader"""
+
+    def __init__(self, collate_fn=default_collate):
+        self.collate_fn = collate_fn
+
+    def __call__(self, samples):
+        batch = self.collate_fn([sample[:-2] for sample in samples])
+        indices = torch.tensor([sample[-2] for sample in samples], dtype=torch.int64)
+        seeds = torch.tensor([sample[-1] for sample in samples], dtype=torch.int64)
+        return (*batch, indices, seeds)
+
+
+def with_augmentation_seeds(dataloader, num_seeds=1, base_seed=0):
+    """
+    Returns a copy of a map-style DataLoader whose batches end with the sample indices and augmentation seeds,
+    e.g. (images, labels, indices, seeds), and whose augmentations are the same for the same index and seed.
+    Epoch e uses the seed e % num_seeds, so the random augmentations repeat every `num_seeds` epochs.
+    """
+    kwargs = {}
+    if dataloader.num_workers > 0:
+        kwargs['worker_init_fn'] = dataloader.worker_init_fn
+        # not available in older torch versions
+        for name in ('prefetch_factor', 'persistent_workers', 'generator'):
+            if hasattr(dataloader, name):
+                kwargs[name] = getattr(dataloader, name)
+    return torch.utils.data.DataLoader(
+        SeededDataset(dataloader.dataset, base_seed),
+        batch_size=dataloader.batch_size,
+        sampler=SeededSampler(dataloader.sampler, num_seeds),
+        num_workers=dataloader.num_workers,
+        collate_fn=SeededCollate(dataloader.collate_fn),
+        pin_memory=dataloader.pin_memory,
+        drop_last=dataloader.drop_last,
+        timeout=dataloader.timeout,
+        **kwargs,
+    )
+
+
+class TeacherLogitCache:
+    """
+    Memory-mapped store of the top-k teacher logits per (augmentation seed, sample index), see the module
+    docstring for the layout. An existing cache in `root` is opened if it was created with the same settings,
+    otherwise a new empty cache is created.
+    """
+
+    def __init__(self, root, num_samples, num_classes, num_seeds=1, top_k=10):
+        if num_classes > np.iinfo(np.int16).max + 1:
+            raise ValueError(f'The class indices are stored as int16, {num_classes} classes are too many')
+        self.root = root
+        self.metadata = {
+            'num_samples': num_samples,
+            'num_classes': num_classes,
+            'num_seeds': num_seeds,
+            'top_k': min(top_k, num_classes),
+        }
+        metadata_path = os.path.join(root, 'teacher_cache.json')
+        existing = None
+        if os.path.exists(metadata_path):
+            with open(metadata_path) as f:
+                existing = json.load(f)
+        mode = 'r+' if existing == self.metadata else 'w+'
+
+        os.makedirs(root, exist_ok=True)
+        shape = (num_seeds, num_samples, self.metadata['top_k'])
+        self.values = np.lib.format.open_memmap(os.path.join(root, 'values.npy'), mode=mode, dtype=np.float16,
+            shape=shape)
+        self.indices = np.lib.format.open_memmap(os.path.join(root, 'indices.npy'), mode=mode, dtype=np.int16,
+            shape=shape)
+        self.filled = np.lib.format.open_memmap(os.path.join(root, 'filled.npy'), mode=mode, dtype=np.bool_,
+            shape=shape[:2])
+        if mode == 'w+':
+            self.filled[:] = False
+            self.flush()
+            with open(metadata_path, 'w') as f:
+                json.dump(self.metadata, f, indent=1)
+
+    @property
+    def top_k(self):
+        return self.metadata['top_k']
+
+    def is_filled(self, indices, seeds):
+        return torch.from_numpy(self.filled[_to_numpy(seeds), _to_numpy(indices)])
+
+    def get(self, indices, seeds):
+        """Returns the cached (logits, class indices) of the samples, as float16 and int64 tensors"""
+        seeds, indices = _to_numpy(seeds), _to_numpy(indices)
+        return torch.from_numpy(self.values[seeds, indices]), torch.from_numpy(self.indices[seeds, indices]).long()
+
+    def update(self, indices, seeds, logits):
+        """Stores the top-k of the (N, num_classes) teacher logits of the samples"""
+        values, classes = logits.detach().float().topk(self.top_k, dim=-1)
+        seeds, indices = _to_numpy(seeds), _to_numpy(indices)
+        self.values[seeds, indices] = values.cpu().numpy().astype(np.float16)
+        self.indices[seeds, indices] = classes.cpu().numpy().astype(np.int16)
+        self.filled[seeds, indices] = True
+
+    def flush(self):
+        for array in (self.values, self.indices, self.filled):
+            array.flush()
+
+
+def _to_numpy(tensor):
+    return tensor.cpu().numpy() if isinstance(tensor, torch.Tensor) else np.asarray(tensor)
+
+
+class CachedTeacher:
+    """
+    Teacher targets of the KD loss read from a TeacherLogitCache. The entries missing from the cache are
+    computed with the teacher and stored. A `refresh` fraction of the samples, drawn again every epoch,
+    are also recomputed with the teacher, e.g. for teachers which are fine-tuned during training, 0 keeps
+    the cached entries.
+
+    :param teacher: Function which returns the teacher logits of a batch of student inputs
+    :param cache: TeacherLogitCache
+    :param refresh: Fraction of the cached entries recomputed per epoch
+    :param seed: Seed of the refreshed samples
+    """
+
+    def __init__(self, teacher, cache, refresh=0., seed=0):
+        self.teacher = teacher
+        self.cache = cache
+        self.refresh = refresh
+        self.seed = seed
+        self._refreshed = None
+        self.set_epoch(0)
+
+    def set_epoch(self, epoch):
+        self._refreshed = None
+        if self.refresh > 0:
+            generator = np.random.default_rng([self.seed, epoch])
+            self._refreshed = torch.from_numpy(generator.random(self.cache.metadata['num_samples']) < self.refresh)
+
+    def _compute(self, inputs, indices, seeds, compute):
+        with torch.no_grad():
+            logits = self.teacher(inputs[compute.to(inputs.device)])
+        self.cache.update(indices.cpu()[compute], seeds.cpu()[compute], logits)
+
+    def __call__(self, inputs, indices, seeds):
+        """Returns the sparse teacher targets (top-k logits, class indices) of a batch, on the inputs device"""
+        compute = ~self.cache.is_filled(indices, seeds)
+        if self._refreshed is not None:
+            compute |= self._refreshed[indices.cpu()]
+        if compute.any():
+            self._compute(inputs, indices, seeds, compute)
+        values, classes = self.cache.get(indices, seeds)
+        return values.to(inputs.device, non_blocking=True), classes.to(inputs.device, non_blocking=True)
+
+    def fill(self, dataloader, device=None):
+        """
+        Offline pass which computes the missing entries of every augmentation seed, with a loader returned by
+        `with_augmentation_seeds` whose inputs are moved to `device`
+        """
+        for epoch in range(self.cache.metadata['num_seeds']):
+            dataloader.sampler.set_epoch(epoch)
+            for batch in dataloader:
+                inputs, indices, seeds = batch[0], batch[-2], batch[-1]
+                compute = ~self.cache.is_filled(indices, seeds)
+                if compute.any():
+                    self._compute(inputs.to(device) if device is not None else inputs, indices, seeds, compute)
+        dataloader.sampler.set_epoch(0)
+        self.cache.flush()
+
+
+def sparse_kd_loss(student_logits, teacher_values, teacher_indices):
+    """
+    KL divergence between the teacher distribution restricted to its top-k classes and the student
+    distribution, averaged over the batch. With all the classes it equals
+    F.kl_div(F.log_softmax(student_logits, -1), F.softmax(teacher_logits, -1), reduction='batchmean').
+    """
+    log_prob_s = F.log_softmax(student_logits.float(), dim=-1).gather(-1, teacher_indices)
+    log_prob_t = F.log_softmax(teacher_values.float(), dim=-1)
+    return (log_prob_t.exp() * (log_prob_t - log_prob_s)).sum() / student_logits.shape[0]
@@ -0,0 +1,434 @@
+"""
+Latency lookup table (LUT) of the building blocks of the zoo models and a latency predictor based on it.
+
+The blocks of `src/dnn_blocks` and the common torch layers are micro-benchmarked on the local CPU over a grid
+of channel, stride and resolution configurations with `build_latency_table`. The measurements are stored
+per machine in a versioned json file:
+
+    {"version": 1, "tables": {"<host>/threads<n>/torch<version>": {"entries": {...}, "models": {...}}}}
+
+The latency of a model is then predicted by `predict_latency` from a single forward pass with hooks on its
+modules, without timing it: a module call is looked up in the LUT by its configuration and input shape, or
+estimated with a per-block-type regression on its MACs and memory traffic fitted on the LUT, or decomposed
+into the calls of its child modules.
+"""
+
+import hashlib
+import json
+import os
+import platform
+import threading
+
+import numpy as np
+import torch
+import torch.nn as nn
+
+from deeplite_torch_zoo.utils import profiler
+from deeplite_torch_zoo.utils.checkpoints import get_cache_root
+
+__all__ = [
+    "LatencyTable",
+    "build_latency_table",
+    "get_latency_table",
+    "predict_latency",
+    "set_latency_table",
+]
+
+LATENCY_LUT_ENV = 'DEEPLITE_ZOO_LATENCY_LUT'
+LATENCY_LUT_VERSION = 1
+
+
+def _conv(k, depthwise=False):
+    def factory(c1, c2, s):
+        if depthwise and c1 != c2:
+            return None
+        return nn.Conv2d(c1, c2, k, s, k // 2, groups=c1 if depthwise else 1, bias=False)
+    return factory
+
+
+def _layer(layer_cls, *args, **kwargs):
+    def factory(c1, c2, s):
+        return layer_cls(*args, **kwargs) if c1 == c2 and s == 1 else None
+    return factory
+
+
+def _block(module, name, kwargs_fn):
+    # the blocks are imported on use, to keep importing the zoo fast
+    def factory(c1, c2, s):
+        kwargs = kwargs_fn(c1, c2, s)
+        if kwargs is None:
+            return None
+        block_cls = getattr(__import__(f'deeplite_torch_zoo.src.dnn_blocks.{module}', fromlist=[name]), name)
+        return block_cls(**kwargs)
+    return factory
+
+
+def _same_shape(**kwargs):
+    # blocks whose residual connection requires the input and output shapes to match
+    return lambda c1, c2, s: dict(c1=c1, c2=c2, **kwargs) if c1 == c2 and s == 1 else None
+
+
+def _shuffle_unit(c1, c2, s):
+    if s == 1 and c1 == c2:
+        return dict(c1=c1, c2=c2)
+    if s == 2 and c2 == 2 * c1:
+        return dict(c1=c1, c2=c2, downsample=True)
+    return None
+
+
+# name -> function (c1, c2, stride) returning the module to benchmark, or None for unsupported configurations,
+# the names are the class names of the modules with an optional _<variant> suffix
+BENCHMARK_LAYERS = {
+    'Conv2d_k1': _conv(1),
+    'Conv2d_k3': _conv(3),
+    'Conv2d_dw3': _conv(3, depthwise=True),
+    'Conv2d_dw5': _conv(5, depthwise=True),
+    'BatchNorm2d': lambda c1, c2, s: nn.BatchNorm2d(c1) if c1 == c2 and s == 1 else None,
+    'ReLU': _layer(nn.ReLU, inplace=True),
+    'SiLU': _layer(nn.SiLU, inplace=True),
+    'Hardswish': _layer(nn.Hardswish, inplace=True),
+    'MaxPool2d': lambda c1, c2, s: nn.MaxPool2d(3, s, 1) if c1 == c2 else None,
+    'AdaptiveAvgPool2d': _layer(nn.AdaptiveAvgPool2d, 1),
+}
+
+BENCHMARK_BLOCKS = {
+    'ConvBnAct': _block('common', 'ConvBnAct', lambda c1, c2, s: dict(c1=c1, c2=c2, k=3, s=s)),
+    'DWConv': _block('common', 'DWConv', lambda c1, c2, s: dict(c1=c1, c2=c2, k=3, s=s) if c1 == c2 else None),
+    'GhostConv': _block('common', 'GhostConv', lambda c1, c2, s: dict(c1=c1, c2=c2, k=1, s=s)),
+    'MBConv': _block('mbnet.mbconv_blocks', 'MBConv', _same_shape(e=4)),
+    'FusedMBConv': _block('effnet.effnet_blocks', 'FusedMBConv', _same_shape(e=4)),
+    'MobileOneBlock': _block('mobileone.mobileone_blocks', 'MobileOneBlock',
+        lambda c1, c2, s: dict(c1=c1, c2=c2, k=3, s=s)),
+    'MobileOneBlock_dw': _block('mobileone.mobileone_blocks', 'MobileOneBlock',
+        lambda c1, c2, s: dict(c1=c1, c2=c2, k=3, s=s, g=c1) if c1 == c2 else None),
+    'RepConv': _block('yolov7.repvgg_blocks', 'RepConv', lambda c1, c2, s: dict(c1=c1, c2=c2, s=s)),
+    'YOLOC3': _block('yolov7.yolo_blocks', 'YOLOC3', lambda c1, c2, s: dict(c1=c1, c2=c2) if s == 1 else None),
+    'ShuffleUnit': _block('pytorchcv.shufflenet_blocks', 'ShuffleUnit', _shuffle_unit),
+    'FireUnit': _block('pytorchcv.squeezenet_blocks', 'FireUnit', _same_shape()),
+    'ResNetBasicBlock': _block('resnet.resnet_blocks', 'ResNetBasicBlock',
+        lambda c1, c2, s: dict(c1=c1, c2=c2, stride=s)),
+    'ResNetBottleneck': _block('resnet.resnet_blocks', 'ResNetBottleneck',
+        lambda c1, c2, s: dict(c1=c1, c2=c2, e=0.25, stride=s)),
+}
+
+# block types whose calls are predicted as a whole from their LUT entries, rather than from their child modules
+BLOCK_TYPES = frozenset(name.partition('_')[0] for name in BENCHMARK_BLOCKS)
+
+DEFAULT_GRID = {
+    'channels': (16, 32, 64, 128, 256, 512),
+    'resolutions': (7, 14, 28, 56, 112),
+    'strides': (1, 2),
+    'expansions': (1, 2),
+    # skip the configurations with more input activations than the largest ones of a ResNet stage at 224x224
+    'max_elements': 64 * 56 * 56,
+    # first layers of the models, with 3 input channels
+    'stem_channels': (16, 32, 64),
+    'stem_resolutions': (32, 64, 224),
+}
+
+
+def get_group(module):
+    """
+    Name of the block type of a module, which shares a latency regression in the LUT. Grouped convolutions
+    and blocks are memory bound and are fitted apart from the dense ones.
+    """
+    name = type(module).__name__
+    groups = getattr(module, 'groups', 1)
+    if isinstance(groups, int) and groups > 1:
+        name += '/grouped'
+    return name
+
+
+def _is_block(group):
+    return group.partition('/')[0] in BLOCK_TYPES
+
+
+def get_key(module, input_shape):
+    """LUT key of a module call, from the block type, the module configuration and the input shape"""
+    digest = hashlib.sha1(repr(module).encode()).hexdigest()[:12]
+    return f'{get_group(module)}/{digest}/{"x".join(map(str, input_shape))}'
+
+
+def _tensors(value):
+    if isinstance(value, torch.Tensor):
+        yield value
+    elif isinstance(value, (tuple, list)):
+        for item in value:
+            yield from _tensors(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _tensors(item)
+
+
+def _features(macs, elements, calls):
+    return [1., macs, elements, calls]
+
+
+def _fit(rows):
+    # non-negative least squares of the latency on the features, weighted to minimize the relative error
+    from scipy.optimize import nnls  # pylint: disable=import-outside-toplevel
+
+    features = np.array([_features(row['macs'], row['elements'], row['calls']) for row in rows])
+    latency = np.array([row['latency_ms'] for row in rows])
+    scale = np.maximum(features.max(axis=0), 1.)
+    weights = 1 / np.maximum(latency, 1e-6)
+    coefficients, _ = nnls(features / scale * weights[:, None], latency * weights)
+    return coefficients / scale
+
+
+class LatencyTable:
+    """
+    On-disk json LUT of block latencies. Latencies depend on the machine, so the entries are stored per host
+    name, number of torch threads and torch version, and a file written by another version of the LUT format
+    is ignored. The predicted latencies of registry models are also kept, until the entries are updated.
+
+    :param path: LUT file, `$DEEPLITE_ZOO_LATENCY_LUT` or `~/.cache/deeplite_torch_zoo/latency_lut.json` by default
+    """
+
+    def __init__(self, path=None):
+        if path is None:
+            path = os.getenv(LATENCY_LUT_ENV, os.path.join(get_cache_root(), 'latency_lut.json'))
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self._tables = None
+        self._fits = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def device_key():
+        return f'{platform.node()}/threads{torch.get_num_threads()}/torch{torch.__version__}'
+
+    def _table(self):
+        if self._tables is None:
+            self._tables = self._read()
+        return self._tables.get(self.device_key(), {'entries': {}, 'models': {}})
+
+    @property
+    def entries(self):
+        return self._table()['entries']
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        return self.entries.get(key)
+
+    def require_entries(self):
+        if not len(self):
+            raise RuntimeError(f'The latency LUT of {self.device_key()} in {self.path} is empty, build it with '
+                'python -m deeplite_torch_zoo.wrappers.latency --build')
+
+    def update(self, entries):
+        """
+        Adds measured entries, key -> {'latency_ms', 'macs', 'elements', 'calls', 'group'}, with the MACs,
+        the number of input and output elements and the number of leaf module calls of the block,
+        and clears the cached model predictions
+        """
+        self._write(lambda table: (table['entries'].update(entries), table['models'].clear()))
+        self._fits = {}
+
+    def get_model(self, key):
+        return self._table()['models'].get(key)
+
+    def set_model(self, key, latency_ms):
+        self._write(lambda table: table['models'].__setitem__(key, latency_ms))
+
+    def fit(self, group=None):
+        """
+        Regression coefficients of the latency on (1, MACs, elements, leaf calls) of a block type,
+        or of all the layers if `group` is None
+        """
+        if group not in self._fits:
+            rows = [entry for entry in self.entries.values()
+                if entry['group'] == group or (group is None and not _is_block(entry['group']))]
+            self._fits[group] = _fit(rows) if rows else None
+        return self._fits[group]
+
+    def _write(self, update):
+        with self._lock:
+            tables = self._read()
+            table = tables.setdefault(self.device_key(), {'entries': {}, 'models': {}})
+            update(table)
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f'{self.path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump({'version': LATENCY_LUT_VERSION, 'tables': tables}, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.path)
+            self._tables = tables
+
+    def _read(self):
+        try:
+            with open(self.path) as f:
+                contents = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+        return contents['tables'] if contents.get('version') == LATENCY_LUT_VERSION else {}
+
+
+_LATENCY_TABLE = None
+
+
+def get_latency_table():
+    global _LATENCY_TABLE  # pylint: disable=global-statement
+    if _LATENCY_TABLE is None:
+        _LATENCY_TABLE = LatencyTable()
+    return _LATENCY_TABLE
+
+
+def set_latency_table(table):
+    global _LATENCY_TABLE  # pylint: disable=global-statement
+    _LATENCY_TABLE = table
+
+
+def _iter_configs(grid):
+    for c2 in grid['stem_channels']:
+        for r in grid['stem_resolutions']:
+            for s in grid['strides']:
+                yield 3, c2, s, r
+    for c in grid['channels']:
+        for r in grid['resolutions']:
+            if c * r * r > grid['max_elements']:
+                continue
+            for e in grid['expansions']:
+                for s in grid['strides']:
+                    yield c, c * e, s, r
+
+
+def build_latency_table(table=None, blocks=None, grid=None, batch_size=1, warmup=5, repeat=20, overwrite=False,
+    progress=False):
+    """
+    Micro-benchmarks the layers and blocks on the local CPU over the configurations of the grid and stores
+    the latencies in the LUT. The configurations already in the LUT are skipped unless `overwrite` is set.
+
+    :param table: LatencyTable to fill, `get_latency_table()` by default
+    :param blocks: Names of the BENCHMARK_LAYERS and BENCHMARK_BLOCKS entries to benchmark, all by default
+    :param grid: Overrides of DEFAULT_GRID, the channels, resolutions, strides and output channel expansions
+        of the configurations, which are limited to `max_elements` input activations
+
+    returns the number of measured entries
+    """
+    table = table if table is not None else get_latency_table()
+    factories = {**BENCHMARK_LAYERS, **BENCHMARK_BLOCKS}
+    if blocks is not None:
+        unknown = set(blocks) - set(factories)
+        if unknown:
+            raise ValueError(f'Unknown blocks {sorted(unknown)}, the available blocks are {sorted(factories)}')
+        factories = {name: factories[name] for name in blocks}
+    grid = {**DEFAULT_GRID, **(grid or {})}
+
+    entries = {}
+    for name, factory in factories.items():
+        for c1, c2, s, r in _iter_configs(grid):
+            module = factory(c1, c2, s)
+            if module is None:
+                continue
+            module.eval()
+            inputs = torch.randn(batch_size, c1, r, r)
+            key = get_key(module, inputs.shape)
+            if key in entries or (not overwrite and table.get(key) is not None):
+                continue
+            call = trace_calls(module, inputs.clone())
+            latency_ms = profiler.measure_latency(module, inputs, warmup=warmup, repeat=repeat)['latency_ms_p50']
+            entries[key] = {
+                'latency_ms': latency_ms,
+                'macs': call.macs,
+                'elements': call.elements,
+                'calls': call.calls,
+                'group': get_group(module),
+            }
+            if progress:
+                print(f'{name} {c1}->{c2} stride {s} {r}x{r}: {latency_ms:.3f} ms')
+    if entries:
+        table.update(entries)
+    return len(entries)
+
+
+class _Call:
+    __slots__ = ('module', 'input_shape', 'macs', 'elements', 'children')
+
+    @property
+    def calls(self):
+        # number of leaf module calls
+        return sum(child.calls for child in self.children) if self.children else 1
+
+    def __init__(self, module, input_shape):
+        self.module = module
+        self.input_shape = input_shape
+        self.macs = 0
+        self.elements = 0
+        self.children = []
+
+
+def trace_calls(model, inputs):
+    """
+    Runs the model on `inputs` with hooks on all its modules, returns the tree of module calls
+    with their input shapes, MACs and number of input and output elements
+    """
+    root = _Call(None, ())
+    stack = [root]
+    counter = profiler._MacsCounter()  # pylint: disable=protected-access
+
+    def pre_hook(module, args):
+        tensors = list(_tensors(args))
+        call = _Call(module, tuple(tensors[0].shape) if tensors else ())
+        call.macs = counter.macs
+        call.elements = sum(t.numel() for t in tensors)
+        stack[-1].children.append(call)
+        stack.append(call)
+
+    def hook(module, args, outputs):
+        call = stack.pop()
+        call.macs = counter.macs - call.macs
+        call.elements += sum(t.numel() for t in _tensors(outputs))
+
+    handles = []
+    for module in model.modules():
+        handles.append(module.register_forward_pre_hook(pre_hook))
+        handles.append(module.register_forward_hook(hook))
+    try:
+        with torch.no_grad(), counter:
+            model(inputs)
+    finally:
+        for handle in handles:
+            handle.remove()
+    return root.children[0]
+
+
+def _predict_call(call, table):
+    entry = table.get(get_key(call.module, call.input_shape))
+    if entry is not None:
+        return entry['latency_ms']
+    group = get_group(call.module)
+    if _is_block(group) or not call.children:
+        coefficients = table.fit(group)
+        if coefficients is None and not call.children:
+            coefficients = table.fit()
+        if coefficients is not None:
+            return float(np.dot(coefficients, _features(call.macs, call.elements, call.calls)))
+    return sum(_predict_call(child, table) for child in call.children)
+
+
+def predict_latency(model, inputs=None, img_size=224, in_ch=3, batch_size=1, table=None):
+    """
+    Predicts the CPU latency of the model in milliseconds from the LUT of the local machine. The model
+    runs once to trace its module calls, which are looked up in the LUT, estimated from the LUT entries
+    of the same block type or decomposed into their child modules, and summed. Operators called outside of
+    modules, such as the residual additions of some models, are not counted.
+
+    :param inputs: Model inputs, a random (batch_size, in_ch, img_size, img_size) tensor by default
+    :param table: LatencyTable, `get_latency_table()` by default
+    """
+    if profiler.TorchDispatchMode is None:
+        raise RuntimeError('Latency prediction requires torch>=1.13')
+    table = table if table is not None else get_latency_table()
+    table.require_entries()
+    if inputs is None:
+        if not isinstance(img_size, tuple):
+            img_size = (in_ch, img_size, img_size)
+        inputs = torch.randn(batch_size, *img_size)
+    training = model.training
+    model.eval()
+    try:
+        root = trace_calls(model, inputs)
+    finally:
+        model.train(training)
+    return _predict_call(root, table)
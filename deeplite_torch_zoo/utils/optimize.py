@@ -0,0 +1,250 @@
+import copy
+
+import torch
+import torch.nn as nn
+
+try:
+    import torch.fx as fx
+except ImportError:  # torch < 1.8
+    fx = None
+
+__all__ = [
+    "fuse_conv_bn",
+    "optimize_for_inference",
+    "reparameterize",
+]
+
+_CONV_TYPES = (nn.Conv1d, nn.Conv2d, nn.Conv3d)
+# identities in eval mode, nn.Dropout1d is not available in older torch versions
+_DROPOUT_TYPES = tuple(getattr(nn, name) for name in ('Dropout', 'Dropout1d', 'Dropout2d', 'Dropout3d', 'AlphaDropout')
+    if hasattr(nn, name))
+_FUSED_FORWARDS = ('forward_fuse', 'fuseforward')
+_BATCH_NORM_FORWARDS = (nn.modules.batchnorm._BatchNorm.forward, nn.SyncBatchNorm.forward)  # pylint: disable=protected-access
+
+
+def fuse_conv_bn(conv, bn):
+    """
+    Returns a copy of the convolution `conv` with the eval-mode batch norm `bn` that follows it folded
+    into its weights and bias. Unlike `fuse_conv_and_bn` of the detection models, all the convolution
+    settings (groups, dilation, padding mode), the device and the dtype are kept.
+    """
+    fused = copy.deepcopy(conv)
+    with torch.no_grad():
+        scale = torch.rsqrt(bn.running_var + bn.eps)
+        if bn.weight is not None:
+            scale = scale * bn.weight
+        bias = -bn.running_mean * scale
+        if bn.bias is not None:
+            bias = bias + bn.bias
+        if conv.bias is not None:
+            bias = bias + conv.bias * scale
+        fused.weight.copy_(conv.weight * scale.reshape(-1, *[1] * (conv.weight.dim() - 1)))
+        fused.bias = nn.Parameter(bias.to(conv.weight.dtype), requires_grad=conv.weight.requires_grad)
+    return fused
+
+
+def _can_fuse(conv, bn):
+    return (
+        isinstance(conv, _CONV_TYPES)
+        # subclasses with another forward, e.g. batch norms followed by an activation, are not folded
+        and type(bn).forward in _BATCH_NORM_FORWARDS
+        and bn.running_mean is not None
+        and bn.num_features == conv.out_channels
+    )
+
+
+def _walk_conv_bn_pairs(module, prefix):
+    # pairs of the modules which can not be traced: consecutive layers of a Sequential and conv-bn-act
+    # blocks with a fused forward such as ConvBnAct
+    pairs = []
+    if isinstance(module, nn.Sequential):
+        children = list(module.named_children())
+        for (conv_name, conv), (bn_name, bn) in zip(children, children[1:]):
+            if _can_fuse(conv, bn):
+                pairs.append((prefix + conv_name, prefix + bn_name))
+    elif any(hasattr(module, name) for name in _FUSED_FORWARDS) and \
+            _can_fuse(getattr(module, 'conv', None), getattr(module, 'bn', None)):
+        pairs.append((prefix + 'conv', prefix + 'bn'))
+    return pairs
+
+
+def _find_conv_bn_pairs(module, prefix=''):
+    """
+    Finds the (conv, bn) module paths where the output of the conv is only used by the bn, from the torch.fx
+    graph of `module`, or from the graphs of its children when its forward can not be traced
+    """
+    try:
+        if fx is None:
+            raise NotImplementedError('torch.fx is not available')
+        graph = fx.symbolic_trace(module).graph
+    except Exception:  # pylint: disable=broad-except
+        pairs = _walk_conv_bn_pairs(module, prefix)
+        for name, child in module.named_children():
+            pairs.extend(_find_conv_bn_pairs(child, f'{prefix}{name}.'))
+        return pairs
+
+    modules = dict(module.named_modules())
+    calls = {}
+    for node in graph.nodes:
+        if node.op == 'call_module':
+            calls[node.target] = calls.get(node.target, 0) + 1
+
+    pairs = []
+    for node in graph.nodes:
+        if node.op != 'call_module' or not node.args or not isinstance(node.args[0], fx.Node):
+            continue
+        conv_node = node.args[0]
+        if conv_node.op != 'call_module' or len(conv_node.users) != 1:
+            continue
+        # shared modules are called more than once and can not be fused
+        if calls[conv_node.target] > 1 or calls[node.target] > 1:
+            continue
+        if _can_fuse(modules[conv_node.target], modules[node.target]):
+            pairs.append((prefix + conv_node.target, prefix + node.target))
+    return pairs
+
+
+def _get_submodule(model, path):
+    # nn.Module.get_submodule is not available in older torch versions
+    for name in path.split('.') if path else []:
+        model = getattr(model, name)
+    return model
+
+
+def _set_submodule(model, path, module):
+    parent_name, _, name = path.rpartition('.')
+    setattr(_get_submodule(model, parent_name), name, module)
+
+
+def _fold_conv_bn(model):
+    pairs = _find_conv_bn_pairs(model)
+    for conv_path, bn_path in pairs:
+        _set_submodule(model, conv_path, fuse_conv_bn(_get_submodule(model, conv_path),
+            _get_submodule(model, bn_path)))
+        _set_submodule(model, bn_path, nn.Identity())
+
+    # conv-bn-act blocks switch to their forward without the batch norm, as in YOLOModel.fuse
+    for conv_path, bn_path in pairs:
+        block_path, _, bn_name = bn_path.rpartition('.')
+        block = _get_submodule(model, block_path)
+        block_prefix = f'{block_path}.' if block_path else ''
+        fused_forward = next((getattr(block, name) for name in _FUSED_FORWARDS if hasattr(block, name)), None)
+        if bn_name == 'bn' and conv_path == block_prefix + 'conv' and fused_forward is not None:
+            block.forward = fused_forward
+            delattr(block, 'bn')
+    return len(pairs)
+
+
+def _drop_identities(model):
+    """
+    Replaces the dropout layers by identities and removes the identities of the nn.Sequential containers.
+    Returns the original layers of the modified containers, to restore them in models which index their layers.
+    """
+    for name, module in list(model.named_modules()):
+        if isinstance(module, _DROPOUT_TYPES) and name:
+            _set_submodule(model, name, nn.Identity())
+    containers = []
+    for module in model.modules():
+        # subclasses of nn.Sequential are not modified
+        if type(module) is nn.Sequential:  # pylint: disable=unidiomatic-typecheck
+            layers = module._modules  # pylint: disable=protected-access
+            if any(isinstance(layer, nn.Identity) for layer in layers.values()):
+                containers.append((module, layers.copy()))
+                for name in [name for name, layer in layers.items() if isinstance(layer, nn.Identity)]:
+                    del layers[name]
+    return containers
+
+
+def reparameterize(model):
+    """Merges the branches of the re-parameterizable blocks of the model in place, see `optimize_for_inference`"""
+    for module in list(model.modules()):
+        if hasattr(module, 'reparameterize'):
+            module.reparameterize()
+    return model
+
+
+def _flatten_outputs(outputs):
+    if isinstance(outputs, torch.Tensor):
+        return [outputs]
+    if isinstance(outputs, dict):
+        outputs = list(outputs.values())
+    if isinstance(outputs, (list, tuple)):
+        return [tensor for output in outputs for tensor in _flatten_outputs(output)]
+    return []
+
+
+def _validate(model, inputs, reference, rtol, atol):
+    with torch.no_grad():
+        outputs = _flatten_outputs(model(inputs))
+    if len(outputs) != len(reference):
+        raise ValueError(f'The optimized model returns {len(outputs)} tensors instead of {len(reference)}')
+    for i, (output, expected) in enumerate(zip(outputs, reference)):
+        if output.shape != expected.shape:
+            raise ValueError(f'Output {i} of the optimized model has shape {tuple(output.shape)} '
+                f'instead of {tuple(expected.shape)}')
+        if not expected.is_floating_point():
+            continue
+        max_error = (output.float() - expected.float()).abs().max().item() if output.numel() else 0.
+        tolerance = atol + rtol * expected.float().abs().max().item() if expected.numel() else atol
+        if not max_error <= tolerance:
+            raise ValueError(f'Output {i} of the optimized model differs from the original model by '
+                f'{max_error:.3g}, tolerance {tolerance:.3g}')
+
+
+def optimize_for_inference(model, img_size=224, in_ch=3, inputs=None, validate=True, rtol=1e-3, atol=1e-5,
+    inplace=False):
+    """
+    Optimizes a model for inference in eval mode:
+
+    1. the re-parameterizable blocks (RepVGG, MobileOne, RepConv, LargeKernelReparam) merge their
+       branches into a single convolution through their `reparameterize` method,
+    2. every batch norm which directly follows a convolution is folded into it. The pairs are found in
+       the torch.fx graph of the model, or of its largest traceable submodules, and conv-bn-act blocks
+       such as ConvBnAct switch to their `forward_fuse`,
+    3. dropout layers are replaced by identities and the identities of nn.Sequential containers are removed,
+       unless the outputs of the model change, as with models which slice their containers,
+    4. the outputs of the optimized model are compared to the outputs of the original model.
+
+    The modules are replaced in place so that the model keeps its class and attributes.
+
+    :param model: PyTorch nn.Module object
+    :param img_size: Input image resolution of the validation input, an integer or a tuple (3, 224, 224)
+    :param in_ch: Number of input channels in case img_size is an integer
+    :param inputs: Validation input, a random batch of one image of size `img_size` by default
+    :param validate: Whether to compare the outputs of the optimized and original model
+    :param rtol: Tolerance of the output difference relative to the largest absolute output value
+    :param atol: Absolute tolerance of the output difference
+    :param inplace: Whether to optimize `model` itself instead of a copy
+
+    returns the optimized model in eval mode, raises a ValueError if its outputs differ from the original model
+    """
+    if not inplace:
+        model = copy.deepcopy(model)
+    model.eval()
+
+    reference = None
+    if validate:
+        if inputs is None:
+            if not isinstance(img_size, tuple):
+                img_size = (in_ch, img_size, img_size)
+            parameter = next(model.parameters())
+            generator = torch.Generator().manual_seed(0)
+            inputs = torch.randn(1, *img_size, generator=generator).to(parameter.device, parameter.dtype)
+        with torch.no_grad():
+            reference = [output.clone() for output in _flatten_outputs(model(inputs))]
+
+    reparameterize(model)
+    _fold_conv_bn(model)
+    containers = _drop_identities(model)
+
+    if validate:
+        try:
+            _validate(model, inputs, reference, rtol, atol)
+        except Exception:  # pylint: disable=broad-except
+            if not containers:
+                raise
+            # the model selects the layers of a container by index, e.g. the SSD base networks
+            for module, layers in containers:
+                module._modules = layers  # pylint: disable=protected-access
+            _validate(model, inputs, reference, rtol, atol)
+    return model
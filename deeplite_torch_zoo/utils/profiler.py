@@ -0,0 +1,239 @@
+import json
+import os
+import platform
+import threading
+import time
+
+import numpy as np
+import torch
+
+from deeplite_torch_zoo.utils.checkpoints import get_cache_root
+
+try:
+    from torch.utils._python_dispatch import TorchDispatchMode
+except ImportError:  # torch < 1.13
+    TorchDispatchMode = None
+
+__all__ = [
+    "ProfileCache",
+    "count_macs",
+    "count_params",
+    "get_profile_cache",
+    "measure_latency",
+    "set_profile_cache",
+]
+
+PROFILE_CACHE_ENV = 'DEEPLITE_ZOO_PROFILE_CACHE'
+
+
+def _prod(values):
+    result = 1
+    for value in values:
+        result *= value
+    return result
+
+
+def _numel(tensor):
+    return _prod(tensor.shape)
+
+
+def _matmul_macs(args, out):
+    # (n, m) x (m, p), with an optional leading batch dimension for bmm
+    *batch, n, m = args[0].shape
+    return _prod(batch) * n * m * args[1].shape[-1]
+
+
+def _mv_macs(args, out):
+    return _numel(args[0])
+
+
+def _convolution_macs(args, out):
+    weight = args[1]
+    if out.shape[1] == weight.shape[0]:
+        in_channels, kernel_size = weight.shape[1], weight.shape[2:]
+    else:  # transposed convolution
+        in_channels, kernel_size = weight.shape[0], weight.shape[2:]
+    return _numel(out) * in_channels * _prod(kernel_size)
+
+
+def _affine_norm_macs(weight_index):
+    def norm_macs(args, out):
+        return _numel(out) if args[weight_index] is not None else 0
+    return norm_macs
+
+
+def _elementwise_macs(args, out):
+    return _numel(out)
+
+
+def _bilinear_macs(args, out):
+    return 4 * _numel(out)
+
+
+def _grid_sampler_macs(args, out):
+    # bilinear: 4 MACs, nearest: 0, bicubic: 16 MACs per output element
+    return {0: 4, 1: 0, 2: 16}.get(args[2], 4) * _numel(out)
+
+
+def _attention_macs(args, out):
+    q, k, v = args[0].shape, args[1].shape, args[2].shape
+    # Q @ K^T + attn @ V
+    return _prod(q[:-2]) * q[-2] * k[-2] * (q[-1] + v[-1])
+
+
+# aten operator -> MACs, the same counting rules as torchprofile applied to the
+# operators seen by the dispatcher (composite operators arrive decomposed)
+MACS_HANDLERS = {
+    'convolution': _convolution_macs,
+    '_convolution': _convolution_macs,
+    'addmm': lambda args, out: _matmul_macs(args[1:], out),
+    'mm': _matmul_macs,
+    'bmm': _matmul_macs,
+    'baddbmm': lambda args, out: _matmul_macs(args[1:], out),
+    'addmv': lambda args, out: _mv_macs(args[1:], out),
+    'mv': _mv_macs,
+    'dot': _mv_macs,
+    'mul': _elementwise_macs,
+    'mul_': _elementwise_macs,
+    'native_batch_norm': _affine_norm_macs(1),
+    '_native_batch_norm_legit': _affine_norm_macs(1),
+    '_native_batch_norm_legit_no_training': _affine_norm_macs(1),
+    'cudnn_batch_norm': _affine_norm_macs(1),
+    'native_layer_norm': _affine_norm_macs(2),
+    'native_group_norm': _affine_norm_macs(1),
+    'mean': _elementwise_macs,
+    '_adaptive_avg_pool2d': _elementwise_macs,
+    '_adaptive_avg_pool3d': _elementwise_macs,
+    'avg_pool2d': _elementwise_macs,
+    'avg_pool3d': _elementwise_macs,
+    'leaky_relu': _elementwise_macs,
+    'leaky_relu_': _elementwise_macs,
+    'upsample_bilinear2d': _bilinear_macs,
+    'grid_sampler_2d': _grid_sampler_macs,
+    '_scaled_dot_product_flash_attention': _attention_macs,
+    '_scaled_dot_product_flash_attention_for_cpu': _attention_macs,
+    '_scaled_dot_product_efficient_attention': _attention_macs,
+    '_scaled_dot_product_cudnn_attention': _attention_macs,
+}
+
+
+if TorchDispatchMode is not None:
+    class _MacsCounter(TorchDispatchMode):
+        def __init__(self):
+            super().__init__()
+            self.macs = 0
+
+        def __torch_dispatch__(self, func, types, args=(), kwargs=None):
+            out = func(*args, **(kwargs or {}))
+            handler = MACS_HANDLERS.get(func.overloadpacket.__name__)
+            if handler is not None:
+                self.macs += handler(args, out[0] if isinstance(out, (tuple, list)) else out)
+            return out
+
+
+def count_params(model):
+    """Returns the number of parameters and their size in bytes, without running the model."""
+    params = list(model.parameters())
+    return sum(p.numel() for p in params), sum(p.numel() * p.element_size() for p in params)
+
+
+def count_macs(model, inputs):
+    """
+    Counts the MACs of one forward pass of the model on `inputs`. The operators are intercepted
+    in the dispatcher during a regular forward pass on the model's device, so neither a jit trace
+    nor moving the model to cpu is needed. Falls back to torchprofile on older torch versions.
+    """
+    if TorchDispatchMode is None:
+        from torchprofile import profile_macs  # pylint: disable=import-outside-toplevel
+        return profile_macs(model, inputs)
+    counter = _MacsCounter()
+    with torch.no_grad(), counter:
+        model(inputs)
+    return counter.macs
+
+
+def measure_latency(model, inputs, warmup=10, repeat=50, percentiles=(50, 90, 99)):
+    """
+    Measures the latency of the forward pass of the model on `inputs` after `warmup` runs.
+
+    returns a dictionary with the latency percentiles and the mean in milliseconds
+    and the throughput in samples per second
+    """
+    synchronize = torch.cuda.synchronize if inputs.is_cuda else (lambda: None)
+    timings = []
+    with torch.no_grad():
+        for i in range(warmup + repeat):
+            synchronize()
+            start = time.perf_counter()
+            model(inputs)
+            synchronize()
+            if i >= warmup:
+                timings.append(time.perf_counter() - start)
+    timings_ms = np.array(timings) * 1000
+    results = {f'latency_ms_p{p}': float(np.percentile(timings_ms, p)) for p in percentiles}
+    results['latency_ms'] = float(timings_ms.mean())
+    results['throughput'] = inputs.shape[0] * 1000 / results['latency_ms']
+    return results
+
+
+class ProfileCache:
+    """
+    On-disk json cache of model profiling results. Latency measurements depend on the machine,
+    so their keys also include the host name, the number of torch threads, the device type, the dtype
+    and the torch version.
+
+    :param path: Cache file, `$DEEPLITE_ZOO_PROFILE_CACHE` or `~/.cache/deeplite_torch_zoo/profile.json` by default
+    """
+
+    def __init__(self, path=None):
+        if path is None:
+            path = os.getenv(PROFILE_CACHE_ENV, os.path.join(get_cache_root(), 'profile.json'))
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self._entries = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(model_name, dataset_name, input_shape, latency=False, device='cpu', dtype=torch.float32):
+        key = f'{model_name}/{dataset_name}/{"x".join(map(str, input_shape))}'
+        if latency:
+            key += (f'/latency/{platform.node()}/threads{torch.get_num_threads()}/{torch.device(device).type}/'
+                f'{str(dtype).replace("torch.", "")}/torch{torch.__version__}')
+        return key
+
+    def get(self, key):
+        if self._entries is None:
+            self._entries = self._read()
+        return self._entries.get(key)
+
+    def set(self, key, value):
+        with self._lock:
+            entries = self._read()
+            entries[key] = value
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f'{self.path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(entries, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.path)
+            self._entries = entries
+
+    def _read(self):
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+
+_PROFILE_CACHE = None
+
+
+def get_profile_cache():
+    global _PROFILE_CACHE  # pylint: disable=global-statement
+    if _PROFILE_CACHE is None:
+        _PROFILE_CACHE = ProfileCache()
+    return _PROFILE_CACHE
+
+
+def set_profile_cache(cache):
+    global _PROFILE_CACHE  # pylint: disable=global-statement
+    _PROFILE_CACHE = cache
@@ -0,0 +1,467 @@
+import copy
+import inspect
+import math
+import operator
+from collections import Counter
+
+import torch
+import torch.nn as nn
+import torch.nn.functional as F
+
+from deeplite_torch_zoo.utils.optimize import _flatten_outputs
+
+try:
+    import torch.fx as fx
+    from torch.fx.passes.shape_prop import ShapeProp
+except ImportError:  # torch < 1.8
+    fx = None
+
+__all__ = [
+    "ChannelDependencyGraph",
+    "prune_channels",
+]
+
+PRUNING_CRITERIA = ('bn', 'l1')
+
+# modules, functions and tensor methods which act on each channel of their input separately
+_PASSTHROUGH_MODULES = tuple(getattr(nn, name) for name in (
+    'ReLU', 'ReLU6', 'LeakyReLU', 'PReLU', 'SiLU', 'Hardswish', 'Hardsigmoid', 'Sigmoid', 'Tanh', 'GELU', 'ELU',
+    'Mish', 'Identity', 'Dropout', 'Dropout2d', 'MaxPool2d', 'AvgPool2d', 'AdaptiveAvgPool2d',
+    'AdaptiveMaxPool2d', 'Upsample', 'UpsamplingNearest2d', 'UpsamplingBilinear2d', 'ZeroPad2d',
+) if hasattr(nn, name))
+_PASSTHROUGH_FUNCTIONS = {
+    F.relu, F.relu6, F.leaky_relu, F.silu, F.hardswish, F.hardsigmoid, F.gelu, F.elu, F.softplus, F.hardtanh,
+    F.dropout, F.interpolate, F.max_pool2d, F.avg_pool2d, F.adaptive_avg_pool2d, F.adaptive_max_pool2d,
+    torch.relu, torch.sigmoid, torch.tanh, torch.clamp, torch.abs, torch.exp,
+}
+_PASSTHROUGH_METHODS = {
+    'relu', 'relu_', 'sigmoid', 'sigmoid_', 'tanh', 'tanh_', 'clamp', 'clamp_', 'abs', 'exp', 'neg',
+    'contiguous', 'clone', 'detach', 'float', 'half', 'to', 'type_as',
+}
+# binary element-wise operations, which couple the channels of their inputs
+_ELEMENTWISE_FUNCTIONS = {
+    operator.add, operator.iadd, operator.sub, operator.isub, operator.mul, operator.imul, operator.truediv,
+    operator.itruediv, torch.add, torch.sub, torch.mul, torch.div, torch.maximum, torch.minimum,
+}
+_ELEMENTWISE_METHODS = {'add', 'add_', 'sub', 'sub_', 'mul', 'mul_', 'div', 'div_'}
+_CONCAT_FUNCTIONS = {torch.cat, torch.concat} if hasattr(torch, 'concat') else {torch.cat}
+_RESHAPE_FUNCTIONS = {torch.flatten, torch.reshape}
+_RESHAPE_METHODS = {'flatten', 'view', 'reshape'}
+
+
+class _Spaces:
+    # union-find of the channel spaces, the sets of channels of different tensors which are pruned together
+    def __init__(self):
+        self.parents = []
+        self.sizes = []
+        self.frozen = []
+
+    def new(self, size, frozen=False):
+        self.parents.append(len(self.parents))
+        self.sizes.append(size)
+        self.frozen.append(frozen)
+        return len(self.parents) - 1
+
+    def find(self, space):
+        while self.parents[space] != space:
+            self.parents[space] = self.parents[self.parents[space]]
+            space = self.parents[space]
+        return space
+
+    def union(self, space, other):
+        space, other = self.find(space), self.find(other)
+        if space != other:
+            self.parents[other] = space
+            self.frozen[space] = self.frozen[space] or self.frozen[other]
+
+    def freeze(self, space):
+        self.frozen[self.find(space)] = True
+
+
+class _Tracer(fx.Tracer if fx is not None else object):
+    def __init__(self, leaf_modules=()):
+        super().__init__()
+        self.leaf_names = {name for name in leaf_modules if isinstance(name, str)}
+        self.leaf_classes = tuple(cls for cls in leaf_modules if isinstance(cls, type))
+
+    def is_leaf_module(self, m, module_qualified_name):
+        return module_qualified_name in self.leaf_names or isinstance(m, self.leaf_classes) or \
+            super().is_leaf_module(m, module_qualified_name)
+
+
+class _ShapeProp(ShapeProp if fx is not None else object):
+    def call_module(self, target, args, kwargs):
+        # leaf modules such as the Detect heads modify their input lists, the fx argument lists are immutable
+        args = tuple(list(arg) if isinstance(arg, list) else arg for arg in args)
+        return super().call_module(target, args, kwargs)
+
+
+def _get_shape(node):
+    # shape of a tensor node with a channel dimension, None for other values and tuples of tensors
+    meta = node.meta.get('tensor_meta') if isinstance(node, fx.Node) else None
+    shape = getattr(meta, 'shape', None)
+    return tuple(shape) if shape is not None and len(shape) >= 2 else None
+
+
+def _has_tensor(node):
+    return isinstance(node, fx.Node) and 'tensor_meta' in node.meta
+
+
+def _is_scalar(node):
+    return math.prod(getattr(node.meta['tensor_meta'], 'shape', (0,))) == 1
+
+
+def _iter_nodes(args):
+    if isinstance(args, fx.Node):
+        yield args
+    elif isinstance(args, (list, tuple)):
+        for arg in args:
+            yield from _iter_nodes(arg)
+    elif isinstance(args, dict):
+        for arg in args.values():
+            yield from _iter_nodes(arg)
+
+
+def _layout_size(layout):
+    return sum(size for _, size in layout)
+
+
+def _slice_tensor(module, name, index, dim):
+    tensor = getattr(module, name, None)
+    if tensor is None:
+        return
+    sliced = tensor.data.index_select(dim, index.to(tensor.device))
+    if isinstance(tensor, nn.Parameter):
+        sliced = nn.Parameter(sliced, requires_grad=tensor.requires_grad)
+    setattr(module, name, sliced)
+
+
+class ChannelDependencyGraph:
+    """
+    Channel dependencies of a model for structured pruning, built from its torch.fx graph with the shapes of
+    an example forward pass.
+
+    Each tensor with a channel dimension gets a layout, a list of (channel space, size) segments. A convolution
+    or linear layer creates a new space for its output channels, per-channel layers (batch norms, depthwise
+    convolutions, activations, pooling, upsampling) keep the layout of their input, a concatenation along the
+    channels joins the layouts of its inputs and element-wise operations, e.g. residual additions or
+    squeeze-and-excitation products, merge the spaces of their inputs. The spaces used by any other operation,
+    the model inputs and outputs, the grouped convolutions and the modules called more than once are frozen.
+    Every remaining space is a group of output channels of one or more layers which can be removed together,
+    by slicing the weights of its producers, per-channel layers and consumers.
+
+    :param model: PyTorch nn.Module object, its forward must be traceable with torch.fx apart from the leaves
+    :param inputs: Example input batch, the shapes of the intermediate tensors are taken from its forward pass
+    :param leaf_modules: Module names and classes which are not traced, their inputs and outputs are frozen
+    """
+
+    def __init__(self, model, inputs, leaf_modules=()):
+        if fx is None:
+            raise RuntimeError('Structured pruning needs torch.fx, available from torch 1.8')
+        self.model = model
+        self.spaces = _Spaces()
+        self.producers = []  # (module name, space), output channels sliced
+        self.members = []  # (module name, layout), per-channel weights sliced
+        self.consumers = []  # (module name, layout), input channels sliced
+        self._modules = dict(model.named_modules())
+
+        # the optional arguments of the forward, e.g. `augment` of the YOLO models, keep their default value
+        parameters = list(inspect.signature(model.forward).parameters.values())[1:]
+        concrete_args = {parameter.name: parameter.default for parameter in parameters
+            if parameter.default is not inspect.Parameter.empty}
+        graph = _Tracer(leaf_modules).trace(model, concrete_args=concrete_args or None)
+        module = fx.GraphModule(model, graph)
+        with torch.no_grad():
+            _ShapeProp(module).propagate(inputs)
+
+        calls = Counter(node.target for node in graph.nodes if node.op == 'call_module')
+        layouts = {}
+        for node in graph.nodes:
+            layout = self._visit(node, layouts, calls)
+            shape = _get_shape(node)
+            if layout is not None and (shape is None or _layout_size(layout) != shape[1]):
+                self._freeze(layout)
+                layout = None
+            if layout is None and shape is not None:
+                layout = self._new_layout(shape[1], frozen=True)
+            layouts[node] = layout
+
+    def _new_layout(self, size, frozen=False):
+        return [(self.spaces.new(size, frozen), size)]
+
+    def _freeze(self, layout):
+        for space, _ in layout or []:
+            self.spaces.freeze(space)
+
+    def _freeze_inputs(self, node, layouts):
+        for arg in _iter_nodes((node.args, node.kwargs)):
+            self._freeze(layouts.get(arg))
+
+    def _merge(self, layout, other):
+        # the channels of both tensors are used together, e.g. added, the segments must match
+        if [size for _, size in layout] != [size for _, size in other]:
+            return False
+        for (space, _), (other_space, _) in zip(layout, other):
+            self.spaces.union(space, other_space)
+        return True
+
+    def _visit(self, node, layouts, calls):
+        # returns the layout of the output of the node, or None to freeze its inputs and output
+        if node.op in ('placeholder', 'get_attr'):
+            return None
+        if node.op == 'output':
+            self._freeze_inputs(node, layouts)
+            return None
+
+        args = [layouts.get(arg) if isinstance(arg, fx.Node) else None for arg in node.args]
+        x = args[0] if args else None
+        shape, input_shape = _get_shape(node), _get_shape(node.args[0]) if node.args else None
+        layout = None
+        if node.op == 'call_module':
+            module = self._modules[node.target]
+            # the weights of the modules called more than once are used with several layouts
+            shared = calls[node.target] > 1 and any(True for _ in module.state_dict())
+            if not shared and x is not None and shape is not None:
+                layout = self._visit_module(node.target, module, x, input_shape)
+        elif node.target in _ELEMENTWISE_FUNCTIONS | _ELEMENTWISE_METHODS:
+            layout = self._visit_elementwise(node, layouts)
+        elif node.target in _CONCAT_FUNCTIONS:
+            layout = self._visit_concat(node, layouts)
+        elif node.target in _PASSTHROUGH_FUNCTIONS | _PASSTHROUGH_METHODS:
+            layout = x
+        elif node.target in _RESHAPE_FUNCTIONS | _RESHAPE_METHODS:
+            # flattening the pooled features or the spatial dimensions keeps the channels
+            if x is not None and shape is not None and shape[:2] == input_shape[:2] and \
+                    math.prod(shape[2:]) == math.prod(input_shape[2:]):
+                layout = x
+        elif not _has_tensor(node):
+            # shape queries such as x.size() do not use the channels
+            return None
+
+        if layout is None:
+            self._freeze_inputs(node, layouts)
+        return layout
+
+    def _visit_module(self, name, module, x, input_shape):
+        if isinstance(module, nn.Conv2d):
+            if module.groups == 1:
+                self.consumers.append((name, x))
+                layout = self._new_layout(module.out_channels)
+                self.producers.append((name, layout[0][0]))
+                return layout
+            if module.groups == module.in_channels == module.out_channels:
+                self.members.append((name, x))
+                return x
+            return None
+        if isinstance(module, nn.BatchNorm2d):
+            self.members.append((name, x))
+            return x
+        if isinstance(module, nn.Linear):
+            if len(input_shape) != 2:
+                # the channels of sequences are the last dimension
+                return None
+            self.consumers.append((name, x))
+            layout = self._new_layout(module.out_features)
+            self.producers.append((name, layout[0][0]))
+            return layout
+        if isinstance(module, nn.PReLU):
+            if module.num_parameters == 1:
+                return x
+            self.members.append((name, x))
+            return x
+        if isinstance(module, _PASSTHROUGH_MODULES):
+            return x
+        return None
+
+    def _visit_elementwise(self, node, layouts):
+        operands = [*node.args[:2], *node.kwargs.values()][:2]
+        tensors = [operand for operand in operands if _has_tensor(operand) and not _is_scalar(operand)]
+        if len(tensors) < 2:
+            return layouts.get(tensors[0]) if tensors else None
+        (first, second), (first_shape, second_shape) = tensors, [_get_shape(tensor) for tensor in tensors]
+        if first_shape is None or second_shape is None:
+            # broadcasting 1d tensors can act on the channels of 2d tensors
+            return None
+        if first_shape[1] == second_shape[1]:
+            return layouts[first] if self._merge(layouts[first], layouts[second]) else None
+        # broadcasting a single channel
+        if second_shape[1] == 1:
+            return layouts[first]
+        if first_shape[1] == 1:
+            return layouts[second]
+        return None
+
+    def _visit_concat(self, node, layouts):
+        tensors = node.args[0] if node.args else node.kwargs.get('tensors')
+        dim = node.args[1] if len(node.args) > 1 else node.kwargs.get('dim', 0)
+        if not isinstance(tensors, (list, tuple)) or not isinstance(dim, int):
+            return None
+        inputs = [layouts.get(tensor) for tensor in tensors]
+        if any(layout is None for layout in inputs):
+            return None
+        if dim % len(_get_shape(tensors[0])) == 1:
+            return [segment for layout in inputs for segment in layout]
+        # concatenations along the other dimensions use the same channels for all inputs
+        if not all(self._merge(inputs[0], layout) for layout in inputs[1:]):
+            return None
+        return inputs[0]
+
+    def get_groups(self):
+        """
+        Returns the prunable channel groups, as a dictionary {'size', 'producers', 'members', 'consumers'} of
+        the number of channels and the names of the modules which are sliced along the group
+        """
+        groups = {}
+        find = self.spaces.find
+        for name, space in self.producers:
+            space = find(space)
+            if not self.spaces.frozen[space]:
+                groups.setdefault(space, {'size': self.spaces.sizes[space], 'producers': [], 'members': [],
+                    'consumers': []})['producers'].append(name)
+        for key, records in (('members', self.members), ('consumers', self.consumers)):
+            for name, layout in records:
+                for space in {find(space) for space, _ in layout}:
+                    if space in groups and name not in groups[space][key]:
+                        groups[space][key].append(name)
+        return groups
+
+    def get_importance(self, space, criterion='bn'):
+        """
+        Importance of each channel of a group: the sum of the absolute scales of the batch norms of the group
+        for the 'bn' criterion, or of the L1 norms of the output channel weights of its producers for 'l1'.
+        The 'bn' criterion falls back to 'l1' for groups without batch norms.
+        """
+        if criterion not in PRUNING_CRITERIA:
+            raise ValueError(f'Unknown pruning criterion {criterion}, use one of {PRUNING_CRITERIA}')
+        find, size = self.spaces.find, self.spaces.sizes[space]
+        importance = torch.zeros(size)
+        if criterion == 'bn':
+            for name, layout in self.members:
+                module = self._modules[name]
+                if not isinstance(module, nn.BatchNorm2d) or module.weight is None:
+                    continue
+                offset = 0
+                for segment, segment_size in layout:
+                    if find(segment) == space:
+                        importance += module.weight.detach()[offset:offset + segment_size].abs().float().cpu()
+                    offset += segment_size
+            if importance.any():
+                return importance
+        for name, producer_space in self.producers:
+            if find(producer_space) == space:
+                weight = self._modules[name].weight.detach()
+                importance += weight.abs().flatten(1).sum(dim=1).float().cpu()
+        return importance
+
+    def _get_indices(self, layout, indices):
+        parts, offset = [], 0
+        for space, size in layout:
+            index = indices.get(self.spaces.find(space))
+            parts.append((index if index is not None else torch.arange(size)) + offset)
+            offset += size
+        return torch.cat(parts)
+
+    def prune(self, ratio=0.25, criterion='bn', round_to=8):
+        """
+        Removes the `ratio` least important channels of every prunable group, rounded to keep a multiple of
+        `round_to` channels, and slices the weights of the modules of the model in place.
+
+        returns a dictionary {group index: (channels, remaining channels)} of the pruned groups
+        """
+        if not 0 <= ratio < 1:
+            raise ValueError(f'The pruning ratio must be in [0, 1), got {ratio}')
+        indices, pruned = {}, {}
+        for i, (space, group) in enumerate(self.get_groups().items()):
+            size = group['size']
+            keep = min(size, max(round_to, math.ceil(size * (1 - ratio) / round_to) * round_to))
+            if keep < size:
+                importance = self.get_importance(space, criterion)
+                indices[space] = importance.topk(keep).indices.sort().values
+                pruned[i] = (size, keep)
+
+        for name, space in self.producers:
+            index = indices.get(self.spaces.find(space))
+            if index is not None:
+                module = self._modules[name]
+                _slice_tensor(module, 'weight', index, 0)
+                _slice_tensor(module, 'bias', index, 0)
+                if isinstance(module, nn.Linear):
+                    module.out_features = len(index)
+                else:
+                    module.out_channels = len(index)
+        for name, layout in self.members:
+            index = self._get_indices(layout, indices)
+            if len(index) < _layout_size(layout):
+                module = self._modules[name]
+                for tensor_name in ('weight', 'bias', 'running_mean', 'running_var'):
+                    _slice_tensor(module, tensor_name, index, 0)
+                if isinstance(module, nn.Conv2d):
+                    module.in_channels = module.out_channels = module.groups = len(index)
+                elif isinstance(module, nn.PReLU):
+                    module.num_parameters = len(index)
+                else:
+                    module.num_features = len(index)
+        for name, layout in self.consumers:
+            index = self._get_indices(layout, indices)
+            if len(index) < _layout_size(layout):
+                module = self._modules[name]
+                _slice_tensor(module, 'weight', index, 1)
+                if isinstance(module, nn.Linear):
+                    module.in_features = len(index)
+                else:
+                    module.in_channels = len(index)
+
+        # conv-bn-act blocks such as ConvBnAct keep the number of channels of their convolution
+        for module in self.model.modules():
+            conv = getattr(module, 'conv', None)
+            if isinstance(conv, nn.Conv2d) and not isinstance(module, nn.Conv2d):
+                for attribute in ('in_channels', 'out_channels'):
+                    if isinstance(getattr(module, attribute, None), int):
+                        setattr(module, attribute, getattr(conv, attribute))
+        return pruned
+
+
+def prune_channels(model, ratio=0.25, criterion='bn', round_to=8, img_size=224, in_ch=3, inputs=None,
+    skip_modules=(), inplace=False):
+    """
+    Structured channel pruning: removes the least important output channels of the convolutions and linear
+    layers of a model and slices the weights of the layers which use them, so that the pruned model is a
+    dense smaller model of the same class, e.g. to profile with `profile`, evaluate with `get_eval_function`
+    and fine-tune with the training scripts of the zoo.
+
+    The channels which must be removed together, e.g. the outputs of the convolutions added by residual
+    connections, the inputs of the depthwise convolutions or the inputs of the concatenations of the YOLO
+    and CSP blocks, are found with a `ChannelDependencyGraph`. Channels are ranked by the absolute scale of
+    their batch norms ('bn' criterion, as in network slimming) or by the L1 norm of their weights ('l1').
+
+    :param model: PyTorch nn.Module object
+    :param ratio: Fraction of the channels of every prunable group to remove
+    :param criterion: Channel importance, 'bn' or 'l1'
+    :param round_to: The number of remaining channels is rounded up to a multiple of `round_to`
+    :param img_size: Input image resolution of the example input, an integer or a tuple (3, 224, 224)
+    :param in_ch: Number of input channels in case img_size is an integer
+    :param inputs: Example input batch, a random batch of one image of size `img_size` by default
+    :param skip_modules: Module names and classes which are not traced, e.g. detection heads with data-dependent
+        control flow, the channels of their inputs and outputs are kept
+    :param inplace: Whether to prune `model` itself instead of a copy
+
+    returns the pruned model, raises a ValueError if the shapes of its outputs differ from the original model
+    """
+    if not inplace:
+        model = copy.deepcopy(model)
+    training = model.training
+    model.eval()
+    if inputs is None:
+        if not isinstance(img_size, tuple):
+            img_size = (in_ch, img_size, img_size)
+        parameter = next(model.parameters())
+        inputs = torch.randn(1, *img_size).to(parameter.device, parameter.dtype)
+
+    with torch.no_grad():
+        reference = [output.shape for output in _flatten_outputs(model(inputs))]
+    ChannelDependencyGraph(model, inputs, skip_modules).prune(ratio, criterion, round_to)
+    with torch.no_grad():
+        shapes = [output.shape for output in _flatten_outputs(model(inputs))]
+    if shapes != reference:
+        raise ValueError(f'The pruned model returns tensors of shapes {shapes} instead of {reference}')
+    return model.train(training)
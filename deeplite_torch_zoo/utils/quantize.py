@@ -0,0 +1,112 @@
+import copy
+import io
+
+import torch
+import torch.nn as nn
+
+from deeplite_torch_zoo.utils.optimize import reparameterize
+
+try:
+    from torch.ao.quantization import (QConfig, QConfigMapping,
+                                       default_per_channel_weight_observer,
+                                       default_weight_observer,
+                                       get_default_qconfig)
+    from torch.ao.quantization.fx.custom_config import PrepareCustomConfig
+    from torch.ao.quantization.quantize_fx import convert_fx, prepare_fx
+except ImportError:  # torch < 1.13
+    prepare_fx = None
+
+__all__ = [
+    "get_serialized_size",
+    "quantize_static",
+]
+
+QUANTIZATION_BACKENDS = ('fbgemm', 'qnnpack', 'x86')
+
+
+class _TracedModel(nn.Module):
+    # FX traces the forward of the model as a submodule call, so that the optional arguments of the
+    # forward, e.g. `augment` of the YOLO models, keep their default values instead of becoming inputs.
+    # The traced forward accepts and ignores them, so that it is called like the model by the eval functions.
+    def __init__(self, model):
+        super().__init__()
+        self.model = model
+
+    def forward(self, x, *args, **kwargs):  # pylint: disable=unused-argument
+        return self.model(x)
+
+
+def get_qconfig(backend='fbgemm', per_channel=True):
+    """Default activation observer of the backend with per-channel or per-tensor int8 weights"""
+    qconfig = get_default_qconfig(backend)
+    weight_observer = default_per_channel_weight_observer if per_channel else default_weight_observer
+    return QConfig(activation=qconfig.activation, weight=weight_observer)
+
+
+def get_serialized_size(model):
+    """Size of the state dict of the model in bytes, the packed weights of quantized layers are not parameters"""
+    buffer = io.BytesIO()
+    torch.save(model.state_dict(), buffer)
+    return buffer.getbuffer().nbytes
+
+
+def quantize_static(model, calibration_data, example_inputs=None, backend='fbgemm', per_channel=True,
+    skip_modules=(), optimize=True):
+    """
+    Post-training static int8 quantization of a model with FX graph mode quantization for the CPU backends.
+
+    The re-parameterizable blocks of the model are first merged, then the model is traced with torch.fx,
+    its conv-bn-relu patterns are fused, it is calibrated on `calibration_data` and converted to int8
+    operators. The skipped modules, e.g. detection heads with data-dependent control flow or layers which
+    lose too much accuracy, are neither traced nor quantized and run in fp32 between dequantize and
+    quantize operators.
+
+    :param model: PyTorch nn.Module object
+    :param calibration_data: Iterable of input batches to collect the activation ranges on
+    :param example_inputs: Input batch to trace the model with, the first calibration batch by default
+    :param backend: Quantized engine, 'fbgemm' or 'x86' for x86 CPUs, 'qnnpack' for ARM CPUs
+    :param per_channel: Whether to quantize the weights per output channel instead of per tensor
+    :param skip_modules: Module names, as in `model.named_modules()`, and module classes to keep in fp32
+    :param optimize: Whether to merge the re-parameterizable blocks first, see `reparameterize`
+
+    returns the quantized torch.fx.GraphModule, which keeps the public attributes of the model
+    such as the class names of the detection models
+    """
+    if prepare_fx is None:
+        raise RuntimeError('FX graph mode quantization needs torch >= 1.13')
+    if backend not in QUANTIZATION_BACKENDS:
+        raise ValueError(f'Unsupported quantization backend {backend}, use one of {QUANTIZATION_BACKENDS}')
+    if backend not in torch.backends.quantized.supported_engines:
+        raise RuntimeError(f'Quantization backend {backend} is not supported on this machine')
+    torch.backends.quantized.engine = backend
+
+    calibration_data = iter(calibration_data)
+    if example_inputs is None:
+        example_inputs = next(calibration_data)
+        calibration_data = [example_inputs, *calibration_data]
+
+    model = copy.deepcopy(model).cpu().float().eval()
+    if optimize:
+        reparameterize(model)
+
+    skip_names = [f'model.{name}' for name in skip_modules if isinstance(name, str)]
+    skip_classes = [cls for cls in skip_modules if isinstance(cls, type)]
+    qconfig_mapping = QConfigMapping().set_global(get_qconfig(backend, per_channel))
+    for name in skip_names:
+        qconfig_mapping.set_module_name(name, None)
+    for cls in skip_classes:
+        qconfig_mapping.set_object_type(cls, None)
+    custom_config = PrepareCustomConfig() \
+        .set_non_traceable_module_names(skip_names) \
+        .set_non_traceable_module_classes(skip_classes)
+
+    prepared = prepare_fx(_TracedModel(model), qconfig_mapping, (example_inputs,), custom_config)
+    with torch.no_grad():
+        for inputs in calibration_data:
+            prepared(inputs)
+    quantized = convert_fx(prepared)
+
+    for name, value in vars(model).items():
+        if not name.startswith('_') and name != 'training':
+            setattr(quantized, name, value)
+    return quantized
@@ -5,7 +5,9 @@
 # https://github.com/openvinotoolkit/openvino/blob/master/tools/pot/openvino/tools/pot/utils/registry.py
 #
 
+import importlib
 import re
+import sys
 from collections import namedtuple
 
 
@@ -58,14 +60,59 @@ def extract_dataset_type(dataset_name):
     return dataset_name
 
 
+class LazyEntry(namedtuple('LazyEntry', ['module'])):
+    """
+    Placeholder for a registry entry whose defining module was not imported yet.
+    The module is imported (and replaces the placeholder by registering the entry)
+    the first time the entry is requested from the registry.
+    """
+
+
 class Registry:
     def __init__(self, name=None):
         self._registry_dict = dict()
+        self._registry_modules = dict()
         self._name = name if name is not None else ''
 
+    def _is_registered(self, obj_name):
+        return obj_name in self._registry_dict and \
+            not isinstance(self._registry_dict[obj_name], LazyEntry)
+
+    def _record_module(self, obj_name, depth=2):
+        # the module where the register decorator was applied
+        self._registry_modules[obj_name] = sys._getframe(depth).f_globals.get('__name__')
+
+    def _resolve(self, obj_name):
+        obj = self._registry_dict[obj_name]
+        if isinstance(obj, LazyEntry):
+            importlib.import_module(obj.module)
+            obj = self._registry_dict[obj_name]
+            if isinstance(obj, LazyEntry):
+                raise KeyError(
+                    f'{obj_name} is listed in the registry manifest but was not registered '
+                    f'by {obj.module}, the manifest needs to be regenerated'
+                )
+        return obj
+
+    def defining_module(self, obj_name):
+        """
+        Name of the module registering the entry, the module is not imported
+        """
+        obj = self._registry_dict.get(obj_name)
+        if isinstance(obj, LazyEntry):
+            return obj.module
+        return self._registry_modules.get(obj_name)
+
+    def register_lazy(self, name, module):
+        """
+        Register a placeholder for an entry defined in module, without importing it
+        """
+        if name not in self._registry_dict:
+            self._registry_dict[name] = LazyEntry(module)
+
     def register(self, name=None, *args):
         def _register(obj_name, obj):
-            if obj_name in self._registry_dict:
+            if self._is_registered(obj_name):
                 raise KeyError(f'{obj_name} is already registered')
             self._registry_dict[obj_name] = obj
 
@@ -76,6 +123,7 @@ class Registry:
             if args:
                 cls_name = (cls_name, *args)
             _register(cls_name, obj)
+            self._record_module(cls_name)
             return obj
 
         return wrap
@@ -83,12 +131,16 @@ class Registry:
     def get(self, name):
         if name not in self._registry_dict:
             raise KeyError(f'{name} was not found in the {self._name} registry')
-        return self._registry_dict[name]
+        return self._resolve(name)
 
     @property
     def registry_dict(self):
         return self._registry_dict
 
+    @property
+    def registry_modules(self):
+        return self._registry_modules
+
     @property
     def name(self):
         return self._name
@@ -120,9 +172,18 @@ class ModelWrapperRegistry(Registry):
     def pretrained_models(self):
         return self._registry_pretrained_models
 
+    def register_lazy(self, model_name, dataset_name, task_type, module, has_checkpoint=True):
+        key = self._registry_key(model_name=model_name, dataset_name=dataset_name)
+        if key in self._registry_dict:
+            return
+        self._registry_dict[key] = LazyEntry(module)
+        if has_checkpoint:
+            self._registry_pretrained_models[key] = self._registry_dict[key]
+        self._task_type_map[key] = task_type
+
     def register(self, model_name, dataset_name, task_type, has_checkpoint=True):
         def _register(obj_name, obj, task_type):
-            if obj_name in self._registry_dict:
+            if self._is_registered(obj_name):
                 raise KeyError(
                     f'{obj_name} is already registered in the model wrapper registry'
                 )
@@ -139,6 +200,7 @@ class ModelWrapperRegistry(Registry):
                 model_name=cls_name, dataset_name=dataset_name
             )
             _register(cls_name, obj, task_type)
+            self._record_module(cls_name)
             return obj
 
         return wrap
@@ -150,7 +212,7 @@ class ModelWrapperRegistry(Registry):
                 f'Model {model_name} on dataset {dataset_name} was not found '
                 'in the model wrapper registry'
             )
-        return self._registry_dict[key]
+        return self._resolve(key)
 
     def get_task_type(self, model_name, dataset_name):
         GENERIC_DATASET_TASK_TYPE_MAP = {
@@ -173,9 +235,13 @@ class DatasetWrapperRegistry(Registry):
         self._task_type_map = dict()
         self._registry_key = namedtuple('RegistryKey', ['dataset_name', 'model_type'])
 
+    def register_lazy(self, dataset_name, model_type, module):
+        key = self._registry_key(dataset_name=dataset_name, model_type=model_type)
+        super().register_lazy(key, module)
+
     def register(self, dataset_name, model_type=None):
         def _register(obj_name, obj):
-            if obj_name in self._registry_dict:
+            if self._is_registered(obj_name):
                 raise KeyError(
                     f'{obj_name} is already registered in the datasplit wrapper registry'
                 )
@@ -187,6 +253,7 @@ class DatasetWrapperRegistry(Registry):
                 cls_name = obj.__name__
             cls_name = self._registry_key(dataset_name=cls_name, model_type=model_type)
             _register(cls_name, obj)
+            self._record_module(cls_name)
             return obj
 
         return wrap
@@ -201,7 +268,7 @@ class DatasetWrapperRegistry(Registry):
                 f'Dataset {dataset_name} for model type {model_type} was not found '
                 'in the datasplit wrapper registry'
             )
-        return self._registry_dict[key]
+        return self._resolve(key)
 
 
 class EvaluatorWrapperRegistry(Registry):
@@ -212,9 +279,15 @@ class EvaluatorWrapperRegistry(Registry):
             'RegistryKey', ['dataset_type', 'model_type', 'task_type']
         )
 
+    def register_lazy(self, task_type, model_type, dataset_type, module):
+        key = self._registry_key(
+            task_type=task_type, model_type=model_type, dataset_type=dataset_type
+        )
+        super().register_lazy(key, module)
+
     def register(self, task_type, model_type=None, dataset_type=None):
         def _register(obj_name, obj):
-            if obj_name in self._registry_dict:
+            if self._is_registered(obj_name):
                 raise KeyError(
                     f'{obj_name} is already registered in the evaluator wrapper registry'
                 )
@@ -228,6 +301,7 @@ class EvaluatorWrapperRegistry(Registry):
                 task_type=cls_name, model_type=model_type, dataset_type=dataset_type
             )
             _register(cls_name, obj)
+            self._record_module(cls_name)
             return obj
 
         return wrap
@@ -256,7 +330,7 @@ class EvaluatorWrapperRegistry(Registry):
                 'in the evaluator wrapper registry'
             )
 
-        return self._registry_dict[key]
+        return self._resolve(key)
 
 
 class RegistryStorage:
@@ -1,11 +1,12 @@
 import hashlib
+import inspect
 import os
 from contextlib import contextmanager
 
 import torch
-from torch.hub import load_state_dict_from_url
 
 import deeplite_torch_zoo
+from deeplite_torch_zoo.utils.checkpoints import get_checkpoint_cache
 
 KB_IN_MB_COUNT = 1024
 
@@ -50,27 +51,47 @@ def get_file_hash(filename, max_has_symbols=16, min_large_file_size_mb=1000):
     return readable_hash[:max_has_symbols]
 
 
-def load_pretrained_weights(model, checkpoint_url, progress, device):
-    pretrained_dict = load_state_dict_from_url(
-        checkpoint_url,
-        progress=progress,
-        check_hash=True,
-        map_location=device,
-    )
+def load_pretrained_weights(model, checkpoint_url, progress, device):  # pylint: disable=unused-argument
+    # the checkpoint is mapped on cpu and copied tensor by tensor into the model, wherever
+    # its parameters are, instead of materializing the whole state dict on `device` first
+    checkpoint_path = get_checkpoint_cache().fetch(checkpoint_url, progress=progress)
+    pretrained_dict = load_checkpoint(checkpoint_path)
     load_state_dict_partial(model, pretrained_dict)
     return model
 
 
+def load_checkpoint(checkpoint_path, map_location='cpu'):
+    """
+    Loads a checkpoint memory-mapped when the installed torch and the checkpoint format allow it,
+    so tensors are read from the page cache when they are used instead of being copied upfront
+    """
+    if 'mmap' in inspect.signature(torch.load).parameters:
+        try:
+            return torch.load(checkpoint_path, map_location=map_location, mmap=True)
+        except RuntimeError:
+            pass  # legacy (non-zip) serialization format can't be memory-mapped
+    return torch.load(checkpoint_path, map_location=map_location)
+
+
 def load_state_dict_partial(model, pretrained_dict):
-    model_dict = model.state_dict()
-    pretrained_dict = {
-        k: v
-        for k, v in pretrained_dict.items()
-        if k in model_dict and v.size() == model_dict[k].size()
-    }  # pylint: disable=E1135, E1136
-    model_dict.update(pretrained_dict)
-    model.load_state_dict(model_dict)
-    print(f'Loaded {len(pretrained_dict)}/{len(model_dict)} modules')
+    """
+    Copies the tensors of `pretrained_dict` with matching names and shapes into the model in place,
+    one tensor at a time. Returns the names of the tensors skipped because of a shape mismatch.
+    """
+    model_dict = model.state_dict()  # references to the model tensors, not copies
+    matched_dict, mismatched_keys = {}, []
+    for k, v in pretrained_dict.items():
+        if k not in model_dict:
+            continue
+        if v.size() == model_dict[k].size():
+            matched_dict[k] = v
+        else:
+            mismatched_keys.append(k)
+    model.load_state_dict(matched_dict, strict=False)
+    print(f'Loaded {len(matched_dict)}/{len(model_dict)} modules')
+    if mismatched_keys:
+        print(f'Skipped {len(mismatched_keys)} modules with mismatched shapes: {", ".join(mismatched_keys)}')
+    return mismatched_keys
 
 
 @contextmanager
@@ -0,0 +1,161 @@
+"""
+Measures the input pipeline of a registered dataset: the throughput of its DataLoader with the
+configured workers, and the time per sample of the decode and augmentation stages and the time per
+batch of the collate function, measured in the main process, e.g.
+
+    python -m deeplite_torch_zoo.wrappers.datasets.benchmark --dataset voc --model yolo5s \
+        --data-root /data/VOCdevkit --num-workers 8
+
+Decoding is the time spent in `_load_image` for the detection datasets, the augmentation is the
+time spent in `transform` for the classification datasets and the rest of `__getitem__` in both
+cases. Datasets with neither only report the total `__getitem__` time.
+"""
+
+import argparse
+import time
+
+from torch.utils.data import IterableDataset
+
+from deeplite_torch_zoo.wrappers.wrapper import get_data_splits_by_name
+
+_MISSING = object()
+
+
+class _StageTimer:
+    """wraps a callable and accumulates the time spent in it"""
+
+    def __init__(self, fn):
+        self.fn = fn
+        self.time = 0.0
+
+    def __call__(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self.fn(*args, **kwargs)
+        finally:
+            self.time += time.perf_counter() - start
+
+
+def profile_stages(dataset, collate_fn, batch_size=32, num_samples=64):
+    """
+    Loads the first `num_samples` samples of a map-style dataset in the main process.
+
+    Returns the mean 'getitem', 'decode' and 'augment' time per sample and 'collate' time per batch
+    in seconds, 'decode' and 'augment' are None if the stages of the dataset are not known.
+    """
+    if hasattr(dataset, '_load_image'):
+        attr, stage, other_stage = '_load_image', 'decode', 'augment'
+    elif getattr(dataset, 'transform', None) is not None:
+        attr, stage, other_stage = 'transform', 'augment', 'decode'
+    else:
+        attr = None
+
+    num_samples = min(num_samples, len(dataset))
+    if attr is not None:
+        # an instance attribute shadows the method or the transform until it is restored
+        original = dataset.__dict__.get(attr, _MISSING)
+        timer = _StageTimer(getattr(dataset, attr))
+        setattr(dataset, attr, timer)
+    try:
+        start = time.perf_counter()
+        samples = [dataset[i] for i in range(num_samples)]
+        getitem_time = time.perf_counter() - start
+    finally:
+        if attr is not None:
+            if original is _MISSING:
+                delattr(dataset, attr)
+            else:
+                setattr(dataset, attr, original)
+
+    start = time.perf_counter()
+    num_batches = 0
+    for i in range(0, num_samples, batch_size):
+        collate_fn(samples[i:i + batch_size])
+        num_batches += 1
+    collate_time = time.perf_counter() - start
+
+    stats = {
+        'getitem': getitem_time / max(num_samples, 1),
+        'decode': None,
+        'augment': None,
+        'collate': collate_time / max(num_batches, 1),
+    }
+    if attr is not None:
+        stats[stage] = timer.time / max(num_samples, 1)
+        stats[other_stage] = stats['getitem'] - stats[stage]
+    return stats
+
+
+def measure_throughput(dataloader, num_batches=50):
+    """
+    Iterates over `num_batches` batches of a DataLoader. Returns the time to the first batch,
+    which includes starting the workers, and the number of samples/s of the following batches.
+    """
+    start = time.perf_counter()
+    num_samples, first_batch_time = 0, None
+    for i, batch in enumerate(dataloader):
+        if first_batch_time is None:
+            first_batch_time = time.perf_counter() - start
+            start = time.perf_counter()
+        else:
+            num_samples += len(batch) if not isinstance(batch, (list, tuple)) else len(batch[0])
+        if i + 1 >= num_batches:
+            break
+    elapsed = time.perf_counter() - start
+    return {
+        'first_batch': first_batch_time,
+        'samples_per_sec': num_samples / elapsed if num_samples else None,
+    }
+
+
+def benchmark_dataloader(dataset_name, model_name='', data_root='', split='train', batch_size=32,
+    num_workers=4, num_batches=50, num_samples=64, **kwargs):
+    """
+    Benchmarks the `split` loader returned by the data wrapper of `dataset_name` (and `model_name`
+    for the detection and segmentation wrappers), the other kwargs are passed to the wrapper.
+
+    Returns a dict with the 'first_batch' time and the 'samples_per_sec' of the loader and, for
+    map-style datasets, the 'getitem', 'decode' and 'augment' time per sample and the 'collate'
+    time per batch measured in the main process, all times in seconds.
+    """
+    dataloaders = get_data_splits_by_name(data_root=data_root, dataset_name=dataset_name,
+        model_name=model_name, batch_size=batch_size, num_workers=num_workers, **kwargs)
+    dataloader = dataloaders[split]
+    results = measure_throughput(dataloader, num_batches=num_batches)
+    if not isinstance(dataloader.dataset, IterableDataset):
+        results.update(profile_stages(dataloader.dataset, dataloader.collate_fn, batch_size=batch_size,
+            num_samples=num_samples))
+    return results
+
+
+def _format_time(value):
+    return '-' if value is None else f'{value * 1000:.2f} ms'
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Benchmark the data loader of a dataset')
+    parser.add_argument('--dataset', required=True, help='dataset name, as in get_data_splits_by_name')
+    parser.add_argument('--model', default='', help='model name, selects the detection and segmentation wrappers')
+    parser.add_argument('--data-root', default='', help='dataset directory')
+    parser.add_argument('--split', default='train', help='loader to benchmark')
+    parser.add_argument('--batch-size', type=int, default=32)
+    parser.add_argument('--num-workers', type=int, default=4)
+    parser.add_argument('--num-batches', type=int, default=50, help='number of batches to load')
+    parser.add_argument('--num-samples', type=int, default=64, help='number of samples to profile')
+    parser.add_argument('--img-size', type=int, default=None, help='image size passed to the wrapper')
+    args = parser.parse_args(args)
+
+    kwargs = {'img_size': args.img_size} if args.img_size is not None else {}
+    results = benchmark_dataloader(args.dataset, model_name=args.model, data_root=args.data_root,
+        split=args.split, batch_size=args.batch_size, num_workers=args.num_workers,
+        num_batches=args.num_batches, num_samples=args.num_samples, **kwargs)
+    samples_per_sec = results['samples_per_sec']
+    print(f'{samples_per_sec:.1f} samples/s' if samples_per_sec is not None else 'single batch loaded')
+    print(f'first batch: {_format_time(results["first_batch"])}')
+    for stage in ('getitem', 'decode', 'augment', 'collate'):
+        if stage in results:
+            print(f'{stage}: {_format_time(results[stage])}{" per batch" if stage == "collate" else " per sample"}')
+
+
+if __name__ == '__main__':
+    main()
@@ -11,3 +11,4 @@ from .food101 import *
 from .flowers102 import *
 from .imagenette import *
 from .imagewoof import *
+from .corruptions import *
@@ -0,0 +1,237 @@
+"""
+Corruption benchmark sets: every (distortion, severity) variant of a validation split is rendered
+once, in a process pool with a fixed seed per image and variant, and stored as a memory-mapped uint8
+array, so robustness evaluations read the corrupted images instead of recomputing the distortions
+of `get_distortion_transforms` on every image of every evaluation. A set is stored as
+
+    <split>.json                              classes, number of samples, image size and variants
+    <split>.labels.npy                        labels
+    <split>-<distortion>-<severity>.npy       (N, img_size, img_size, 3) uint8 images
+
+The images are resized and center cropped as in the test transforms of `get_vanilla_transforms`
+before the distortions are applied. A set is built from an ImageFolder-style directory with:
+
+    python -m deeplite_torch_zoo.wrappers.datasets.classification.corruptions \
+        --src /data/imagewoof/val --dst /data/imagewoof_c --num-workers 32
+
+and evaluated with get_data_splits_by_name(data_root='/data/imagewoof_c', dataset_name='corruptions',
+model_name=..., distortion_name='glass_blur', severity=3). Building again with more distortions
+or severities only renders the missing variants.
+"""
+
+import argparse
+import json
+import os
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import PIL.Image
+from torch.utils.data import Dataset
+from torchvision import datasets, transforms
+
+from deeplite_torch_zoo.src.classification.augmentations.augs import (
+    DEFAULT_CROP_PCT, IMAGENET_DEFAULT_MEAN, IMAGENET_DEFAULT_STD)
+from deeplite_torch_zoo.wrappers.datasets.utils import get_dataloader
+from deeplite_torch_zoo.wrappers.registries import DATA_WRAPPER_REGISTRY
+
+__all__ = ["get_corruptions"]
+
+SEVERITIES = (1, 2, 3, 4, 5)
+CHUNK_SIZE = 64
+
+_worker_state = {}
+
+
+def get_variant_path(root, split, distortion_name, severity):
+    return os.path.join(root, f'{split}-{distortion_name}-{severity}.npy')
+
+
+def _get_distortion_fns(distortions):
+    if isinstance(distortions, dict):
+        return dict(distortions)
+    # imported when building only, some distortions need ImageMagick through Wand
+    from deeplite_torch_zoo.src.classification.augmentations.distortions.distortions import \
+        DISTORTION_REGISTRY  # pylint: disable=import-outside-toplevel
+    if distortions is None:
+        distortions = list(DISTORTION_REGISTRY.registry_dict)
+    return {name: DISTORTION_REGISTRY.get(name) for name in distortions}
+
+
+def _image_seed(seed, distortion_name, severity, index):
+    # independent of the variants rendered together and of the split of the images between workers
+    return np.random.SeedSequence([seed, zlib.crc32(distortion_name.encode()), severity, index]) \
+        .generate_state(1)[0]
+
+
+def _init_worker(dataset, distortion_fns, variants, paths, base_transform, seed):
+    _worker_state.update(dataset=dataset, distortion_fns=distortion_fns, variants=variants,
+        paths=paths, base_transform=base_transform, seed=seed, arrays={})
+
+
+def _render_chunk(indices):
+    state = _worker_state
+    labels = []
+    for index in indices:
+        image, label = state['dataset'][index]
+        image = np.asarray(state['base_transform'](image.convert('RGB')), dtype=np.uint8)
+        labels.append(label)
+        for (distortion_name, severity), path in zip(state['variants'], state['paths']):
+            if path not in state['arrays']:
+                state['arrays'][path] = np.load(path, mmap_mode='r+')
+            np.random.seed(_image_seed(state['seed'], distortion_name, severity, index))
+            distorted = state['distortion_fns'][distortion_name](image.copy(), severity=severity)
+            # as in generate_distortion_fn
+            state['arrays'][path][index] = np.uint8(distorted)
+    for array in state['arrays'].values():
+        array.flush()
+    return labels
+
+
+def build_corruption_set(dataset, output_dir, split='val', distortions=None, severities=SEVERITIES,
+    img_size=224, crop_pct=DEFAULT_CROP_PCT, num_workers=None, seed=0, classes=None):
+    """
+    Renders the corrupted variants of a dataset into `output_dir`.
+
+    :param dataset: Map-style dataset of (PIL image, label) samples, e.g. an ImageFolder without transform
+    :param distortions: Names of the distortions of DISTORTION_REGISTRY, all of them by default, or a dict
+        of name: function(image, severity) for other corruptions, picklable if num_workers > 0
+    :param num_workers: Number of worker processes, os.cpu_count() by default, 0 to render in this process
+    :param classes: Optional list of class names stored in the metadata, dataset.classes by default
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    distortion_fns = _get_distortion_fns(distortions)
+    num_samples = len(dataset)
+    metadata_path = os.path.join(output_dir, f'{split}.json')
+    metadata = {
+        'classes': classes if classes is not None else getattr(dataset, 'classes', None),
+        'num_samples': num_samples,
+        'img_size': img_size,
+        'crop_pct': crop_pct,
+        'seed': seed,
+        'variants': [],
+    }
+    if os.path.exists(metadata_path):
+        with open(metadata_path) as f:
+            existing = json.load(f)
+        if all(existing.get(key) == metadata[key] for key in ('num_samples', 'img_size', 'crop_pct', 'seed')):
+            metadata['variants'] = existing['variants']
+
+    done = {tuple(variant) for variant in metadata['variants']}
+    variants = [(name, severity) for name in distortion_fns for severity in severities
+        if (name, severity) not in done]
+    if not variants:
+        return metadata
+
+    paths = [get_variant_path(output_dir, split, *variant) for variant in variants]
+    for path in paths:
+        np.lib.format.open_memmap(path, mode='w+', dtype=np.uint8, shape=(num_samples, img_size, img_size, 3))
+    base_transform = transforms.Compose([
+        transforms.Resize(int(img_size / crop_pct)),
+        transforms.CenterCrop(img_size),
+    ])
+    init_args = (dataset, {name: distortion_fns[name] for name, _ in variants}, variants, paths,
+        base_transform, seed)
+    chunks = [range(start, min(start + CHUNK_SIZE, num_samples)) for start in range(0, num_samples, CHUNK_SIZE)]
+
+    num_workers = os.cpu_count() if num_workers is None else num_workers
+    if num_workers > 0:
+        with ProcessPoolExecutor(num_workers, initializer=_init_worker, initargs=init_args) as executor:
+            labels = [label for chunk_labels in executor.map(_render_chunk, chunks) for label in chunk_labels]
+    else:
+        _init_worker(*init_args)
+        try:
+            labels = [label for chunk in chunks for label in _render_chunk(chunk)]
+        finally:
+            _worker_state.clear()
+
+    np.save(os.path.join(output_dir, f'{split}.labels.npy'), np.array(labels, dtype=np.int64))
+    metadata['variants'] = sorted(done | set(variants))
+    # the metadata is written last and lists the complete variants
+    with open(metadata_path, 'w') as f:
+        json.dump(metadata, f, indent=1)
+    return metadata
+
+
+class CorruptionDataset(Dataset):
+    """Dataset of one (distortion, severity) variant of a corruption set, images are PIL images"""
+
+    def __init__(self, root, distortion_name, severity=1, split='val', transform=None, target_transform=None):
+        with open(os.path.join(root, f'{split}.json')) as f:
+            metadata = json.load(f)
+        variants = [tuple(variant) for variant in metadata['variants']]
+        if (distortion_name, severity) not in variants:
+            raise ValueError(f'Variant {distortion_name} {severity} was not rendered in {root}. '
+                f'Available variants: {variants}')
+        self.classes = metadata['classes']
+        self.path = get_variant_path(root, split, distortion_name, severity)
+        self.labels = np.load(os.path.join(root, f'{split}.labels.npy'))
+        self.transform = transform
+        self.target_transform = target_transform
+        self._images = None
+
+    def __getstate__(self):
+        # the images are mapped again in each DataLoader worker
+        return {**self.__dict__, '_images': None}
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __getitem__(self, idx):
+        if self._images is None:
+            self._images = np.load(self.path, mmap_mode='r')
+        image = PIL.Image.fromarray(np.asarray(self._images[idx]))
+        label = int(self.labels[idx])
+        if self.transform is not None:
+            image = self.transform(image)
+        if self.target_transform is not None:
+            label = self.target_transform(label)
+        return image, label
+
+
+@DATA_WRAPPER_REGISTRY.register(dataset_name="corruptions")
+def get_corruptions(
+    data_root, distortion_name, severity=1, split='val', batch_size=128, test_batch_size=None,
+    num_workers=4, fp16=False, distributed=False, device="cuda", val_transforms=None,
+    mean=IMAGENET_DEFAULT_MEAN, std=IMAGENET_DEFAULT_STD, **kwargs
+):
+    """
+    Test loader of a variant of a corruption set built by `build_corruption_set`. The images are
+    already cropped to the size of the set, they are only normalized by default.
+    """
+    if len(kwargs):
+        import sys
+        print(f"Warning, {sys._getframe().f_code.co_name}: extra arguments {list(kwargs.keys())}!")
+
+    if val_transforms is None:
+        val_transforms = transforms.Compose([transforms.ToTensor(), transforms.Normalize(mean, std)])
+    test_dataset = CorruptionDataset(data_root, distortion_name, severity=severity, split=split,
+        transform=val_transforms)
+
+    test_batch_size = batch_size if test_batch_size is None else test_batch_size
+    test_loader = get_dataloader(test_dataset, batch_size=test_batch_size, num_workers=num_workers,
+        fp16=fp16, distributed=distributed, shuffle=False, device=device)
+    return {"test": test_loader}
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Render the corrupted variants of an ImageFolder directory')
+    parser.add_argument('--src', required=True, help='ImageFolder directory with one subdirectory per class')
+    parser.add_argument('--dst', required=True, help='output directory of the corruption set')
+    parser.add_argument('--split', default='val', help='split name of the set')
+    parser.add_argument('--distortions', nargs='+', default=None, help='distortion names, all by default')
+    parser.add_argument('--severities', nargs='+', type=int, default=list(SEVERITIES))
+    parser.add_argument('--img-size', type=int, default=224)
+    parser.add_argument('--crop-pct', type=float, default=DEFAULT_CROP_PCT)
+    parser.add_argument('--num-workers', type=int, default=None, help='worker processes, all CPUs by default')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(args)
+
+    metadata = build_corruption_set(datasets.ImageFolder(args.src), args.dst, split=args.split,
+        distortions=args.distortions, severities=args.severities, img_size=args.img_size,
+        crop_pct=args.crop_pct, num_workers=args.num_workers, seed=args.seed)
+    print(f'Rendered {len(metadata["variants"])} variants of {metadata["num_samples"]} images')
+
+
+if __name__ == '__main__':
+    main()
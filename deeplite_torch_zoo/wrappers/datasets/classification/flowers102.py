@@ -10,6 +10,8 @@ from torchvision.datasets.vision import VisionDataset
 
 from deeplite_torch_zoo.src.classification.augmentations.augs import (
     get_imagenet_transforms, get_vanilla_transforms)
+from deeplite_torch_zoo.wrappers.datasets.packed import (
+    get_packed_dataloaders, is_packed_format)
 from deeplite_torch_zoo.wrappers.datasets.utils import get_dataloader
 from deeplite_torch_zoo.wrappers.registries import DATA_WRAPPER_REGISTRY
 
@@ -20,7 +22,7 @@ __all__ = ["get_flowers102"]
 def get_flowers102(
     data_root="", batch_size=64, test_batch_size=None, img_size=224, num_workers=4,
     fp16=False, download=True, device="cuda", distributed=False, augmentation_mode='imagenet',
-    train_transforms=None, val_transforms=None, **kwargs,
+    train_transforms=None, val_transforms=None, format='folder', **kwargs,
 ):
     if data_root == "":
         data_root = os.path.join(expanduser("~"), ".deeplite-torch-zoo")
@@ -36,6 +38,12 @@ def get_flowers102(
     train_transforms = train_transforms if train_transforms is not None else default_train_transforms
     val_transforms = val_transforms if val_transforms is not None else default_val_transforms
 
+    if is_packed_format(format):
+        train_loader, test_loader = get_packed_dataloaders(data_root, train_transforms, val_transforms,
+            batch_size=batch_size, test_batch_size=test_batch_size, num_workers=num_workers, fp16=fp16,
+            distributed=distributed, device=device)
+        return {"train": train_loader, "test": test_loader}
+
     train_dataset = Flowers102(
         root=data_root,
         split='train',
@@ -1,9 +1,10 @@
 import os
 
-from torchvision import datasets
-
 from deeplite_torch_zoo.src.classification.augmentations.augs import \
     get_imagenet_transforms
+from deeplite_torch_zoo.wrappers.datasets.file_index import CachedImageFolder
+from deeplite_torch_zoo.wrappers.datasets.packed import (
+    get_packed_dataloaders, is_packed_format)
 from deeplite_torch_zoo.wrappers.datasets.utils import get_dataloader
 from deeplite_torch_zoo.wrappers.registries import DATA_WRAPPER_REGISTRY
 
@@ -15,7 +16,7 @@ __all__ = ["get_imagenet"]
 @DATA_WRAPPER_REGISTRY.register(dataset_name="imagenet")
 def get_imagenet(data_root, batch_size=128, test_batch_size=None, img_size=224, num_workers=4,
     fp16=False, distributed=False, device="cuda", train_split='imagenet_training',
-    val_split='imagenet_val', train_transforms=None, val_transforms=None, **kwargs):
+    val_split='imagenet_val', train_transforms=None, val_transforms=None, format='folder', **kwargs):
 
     if len(kwargs):
         import sys
@@ -26,12 +27,18 @@ def get_imagenet(data_root, batch_size=128, test_batch_size=None, img_size=224,
     train_transforms = train_transforms if train_transforms is not None else default_train_transforms
     val_transforms = val_transforms if val_transforms is not None else default_val_transforms
 
-    train_dataset = datasets.ImageFolder(
+    if is_packed_format(format):
+        train_loader, test_loader = get_packed_dataloaders(data_root, train_transforms, val_transforms,
+            batch_size=batch_size, test_batch_size=test_batch_size, num_workers=num_workers, fp16=fp16,
+            distributed=distributed, device=device)
+        return {"train": train_loader, "test": test_loader}
+
+    train_dataset = CachedImageFolder(
         os.path.join(data_root, train_split),
         train_transforms,
     )
 
-    test_dataset = datasets.ImageFolder(
+    test_dataset = CachedImageFolder(
         os.path.join(data_root, val_split),
         val_transforms,
     )
@@ -9,6 +9,9 @@ from torchvision.datasets.vision import VisionDataset
 
 from deeplite_torch_zoo.src.classification.augmentations.augs import (
     get_imagenet_transforms, get_vanilla_transforms)
+from deeplite_torch_zoo.wrappers.datasets.file_index import get_file_index
+from deeplite_torch_zoo.wrappers.datasets.packed import (
+    get_packed_dataloaders, is_packed_format)
 from deeplite_torch_zoo.wrappers.datasets.utils import get_dataloader
 from deeplite_torch_zoo.wrappers.registries import DATA_WRAPPER_REGISTRY
 
@@ -29,6 +32,7 @@ def get_imagenette(
     device="cuda",
     distributed=False,
     augmentation_mode='imagenet',
+    format='folder',
     **kwargs,
 ):
     if data_root == "":
@@ -46,6 +50,12 @@ def get_imagenette(
     else:
         train_transforms, val_transforms = get_vanilla_transforms(img_size)
 
+    if is_packed_format(format):
+        train_loader, val_loader = get_packed_dataloaders(data_root, train_transforms, val_transforms,
+            batch_size=batch_size, test_batch_size=val_batch_size, num_workers=num_workers, fp16=fp16,
+            distributed=distributed, device=device)
+        return {"train": train_loader, "test": val_loader}
+
     train_dataset = Imagenette(
         root=data_root,
         split='train',
@@ -98,6 +108,7 @@ def get_imagenette_320(
     device="cuda",
     distributed=False,
     augmentation_mode='imagenet',
+    format='folder',
     **kwargs,
 ):
     if data_root == "":
@@ -117,6 +128,12 @@ def get_imagenette_320(
     else:
         train_transforms, val_transforms = get_vanilla_transforms(img_size)
 
+    if is_packed_format(format):
+        train_loader, val_loader = get_packed_dataloaders(data_root, train_transforms, val_transforms,
+            batch_size=batch_size, test_batch_size=val_batch_size, num_workers=num_workers, fp16=fp16,
+            distributed=distributed, device=device)
+        return {"train": train_loader, "test": val_loader}
+
     train_dataset = Imagenette(
         root=data_root,
         split='train',
@@ -169,6 +186,7 @@ def get_imagenette_160(
     device="cuda",
     distributed=False,
     augmentation_mode='imagenet',
+    format='folder',
     **kwargs,
 ):
     if data_root == "":
@@ -188,6 +206,12 @@ def get_imagenette_160(
     else:
         train_transforms, val_transforms = get_vanilla_transforms(img_size)
 
+    if is_packed_format(format):
+        train_loader, val_loader = get_packed_dataloaders(data_root, train_transforms, val_transforms,
+            batch_size=batch_size, test_batch_size=val_batch_size, num_workers=num_workers, fp16=fp16,
+            distributed=distributed, device=device)
+        return {"train": train_loader, "test": val_loader}
+
     train_dataset = Imagenette(
         root=data_root,
         split='train',
@@ -256,9 +280,6 @@ class Imagenette(VisionDataset):
                 "Dataset not found. You can use download=True to download it"
             )
 
-        self._labels = []
-        self._image_files = []
-
         self.classes = sorted(
             entry.name
             for entry in os.scandir(self._base_folder / "train")
@@ -266,14 +287,9 @@ class Imagenette(VisionDataset):
         )
         self.class_to_idx = {cls_name: i for i, cls_name in enumerate(self.classes)}
 
-        for target_class in sorted(self.class_to_idx.keys()):
-            class_index = self.class_to_idx[target_class]
-            target_dir = os.path.join(self._base_folder / f"{split}", target_class)
-            for folder, _, fnames in sorted(os.walk(target_dir, followlinks=True)):
-                for fname in sorted(fnames):
-                    path = os.path.join(folder, fname)
-                    self._labels.append(class_index)
-                    self._image_files.append(path)
+        _, self._image_files, self._labels = get_file_index(
+            self._base_folder / f"{split}", extensions=None, classes=self.classes
+        )
 
     def __len__(self) -> int:
         return len(self._image_files)
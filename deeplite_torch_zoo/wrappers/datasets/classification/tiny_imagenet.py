@@ -1,9 +1,10 @@
 import os
 
-from torchvision import datasets
-
 from deeplite_torch_zoo.src.classification.augmentations.augs import \
     get_vanilla_transforms
+from deeplite_torch_zoo.wrappers.datasets.file_index import CachedImageFolder
+from deeplite_torch_zoo.wrappers.datasets.packed import (
+    get_packed_dataloaders, is_packed_format)
 from deeplite_torch_zoo.wrappers.datasets.utils import get_dataloader
 from deeplite_torch_zoo.wrappers.registries import DATA_WRAPPER_REGISTRY
 
@@ -13,7 +14,7 @@ __all__ = ["get_tinyimagenet"]
 @DATA_WRAPPER_REGISTRY.register(dataset_name='tinyimagenet')
 def get_tinyimagenet(data_root, batch_size=128, test_batch_size=None, num_workers=4,
     fp16=False, img_size=64, device="cuda", distributed=False,
-    train_transforms=None, val_transforms=None, **kwargs):
+    train_transforms=None, val_transforms=None, format='folder', **kwargs):
 
     if len(kwargs):
         import sys
@@ -29,8 +30,14 @@ def get_tinyimagenet(data_root, batch_size=128, test_batch_size=None, num_worker
     train_transforms = train_transforms if train_transforms is not None else default_train_transforms
     val_transforms = val_transforms if val_transforms is not None else default_val_transforms
 
+    if is_packed_format(format):
+        train_loader, test_loader = get_packed_dataloaders(data_root, train_transforms, val_transforms,
+            batch_size=batch_size, test_batch_size=test_batch_size, num_workers=num_workers, fp16=fp16,
+            distributed=distributed, device=device)
+        return {"train": train_loader, "val": test_loader, "test": test_loader}
+
     data_transforms = {'train': train_transforms, 'val': val_transforms}
-    image_datasets = {x: datasets.ImageFolder(os.path.join(data_root, x), data_transforms[x])
+    image_datasets = {x: CachedImageFolder(os.path.join(data_root, x), data_transforms[x])
                       for x in ['train', 'val']}
 
     train_loader = get_dataloader(image_datasets["train"], batch_size=batch_size, num_workers=num_workers,
@@ -0,0 +1,161 @@
+"""
+Cached file lists of ImageFolder-style directories. Walking every class directory of a large dataset
+(1.28M files for ImageNet) takes minutes on a network file system, so the sorted file list is stored
+once as a compact .npz file with the paths relative to the root and the integer labels. The cache is
+validated by the mtimes of the indexed directories, which change whenever files are added, removed
+or renamed, so a later start only stats the directories instead of listing them.
+
+An index is built ahead of time, e.g. before a multi-node run, with a parallel walk:
+
+    python -m deeplite_torch_zoo.wrappers.datasets.file_index --root /data/imagenet/imagenet_training \
+        --threads 32
+"""
+
+import argparse
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from torchvision import datasets
+from torchvision.datasets.folder import IMG_EXTENSIONS
+
+from deeplite_torch_zoo.utils.checkpoints import get_cache_root
+
+DEFAULT_NUM_THREADS = 8
+
+
+def _walk_class_dir(class_dir, extensions):
+    """lists the files of a class directory in the order of torchvision's ImageFolder"""
+    dirs, mtimes, files = [], [], []
+    for folder, _, fnames in sorted(os.walk(class_dir, followlinks=True)):
+        dirs.append(folder)
+        mtimes.append(os.stat(folder).st_mtime_ns)
+        files.extend(os.path.join(folder, fname) for fname in sorted(fnames)
+            if extensions is None or fname.lower().endswith(extensions))
+    return dirs, mtimes, files
+
+
+def scan_image_folder(root, extensions=IMG_EXTENSIONS, classes=None, num_threads=DEFAULT_NUM_THREADS):
+    """
+    Walks the class subdirectories of `root` with `num_threads` threads.
+
+    :param extensions: Lower case file extensions to keep, all files if None
+    :param classes: Class subdirectories to index, all subdirectories of `root` by default
+
+    Returns the classes, the file paths, the labels and the walked directories with their mtimes.
+    """
+    root = os.fspath(root)
+    dirs, mtimes = [root], [os.stat(root).st_mtime_ns]
+    if classes is None:
+        classes = sorted(entry.name for entry in os.scandir(root) if entry.is_dir())
+    class_dirs = [os.path.join(root, class_name) for class_name in classes]
+    if num_threads > 1:
+        with ThreadPoolExecutor(num_threads) as executor:
+            results = list(executor.map(_walk_class_dir, class_dirs, [extensions] * len(classes)))
+    else:
+        results = [_walk_class_dir(class_dir, extensions) for class_dir in class_dirs]
+
+    paths, labels = [], []
+    for label, (walked_dirs, class_mtimes, files) in enumerate(results):
+        dirs.extend(walked_dirs)
+        mtimes.extend(class_mtimes)
+        paths.extend(files)
+        labels.extend([label] * len(files))
+    return list(classes), paths, labels, dirs, mtimes
+
+
+def _encode(strings):
+    return np.array([s.encode() for s in strings], dtype=np.bytes_)
+
+
+def _decode(array):
+    return [s.decode() for s in array.tolist()]
+
+
+def _is_valid(index, root):
+    for folder, mtime in zip(_decode(index['dirs']), index['mtimes'].tolist()):
+        try:
+            if os.stat(os.path.join(root, folder)).st_mtime_ns != mtime:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def get_file_index(root, extensions=IMG_EXTENSIONS, classes=None, cache_dir=None,
+    num_threads=DEFAULT_NUM_THREADS):
+    """
+    Returns the classes, the file paths and the labels of an ImageFolder-style directory, see
+    `scan_image_folder`. The file list is cached under `cache_dir` (`<cache root>/file_index` by default)
+    and scanned again only if one of the indexed directories has changed.
+    """
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.expanduser(get_cache_root()), 'file_index')
+    root = os.path.abspath(root)
+    key = hashlib.sha1(f'{root}:{extensions}:{classes}'.encode()).hexdigest()
+    cache_path = os.path.join(cache_dir, f'{os.path.basename(root)}-{key[:16]}.npz')
+
+    if os.path.exists(cache_path):
+        with np.load(cache_path) as index:
+            if _is_valid(index, root):
+                paths = [os.path.join(root, path) for path in _decode(index['paths'])]
+                return _decode(index['classes']), paths, index['labels'].tolist()
+
+    classes, paths, labels, dirs, mtimes = scan_image_folder(root, extensions=extensions, classes=classes,
+        num_threads=num_threads)
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = f'{cache_path[:-len(".npz")]}.{os.getpid()}.tmp.npz'
+    # all the walked paths start with root
+    prefix = len(os.path.join(root, ''))
+    np.savez(tmp_path, classes=_encode(classes), paths=_encode(path[prefix:] for path in paths),
+        labels=np.array(labels, dtype=np.int32), dirs=_encode(folder[prefix:] for folder in dirs),
+        mtimes=np.array(mtimes, dtype=np.int64))
+    os.replace(tmp_path, cache_path)
+    return classes, paths, labels
+
+
+class CachedImageFolder(datasets.ImageFolder):
+    """`torchvision.datasets.ImageFolder` which reads its file list with `get_file_index`"""
+
+    def __init__(self, root, transform=None, target_transform=None, cache_dir=None,
+        num_threads=DEFAULT_NUM_THREADS):
+        self._cache_dir = cache_dir
+        self._num_threads = num_threads
+        self._file_index = None
+        super().__init__(root, transform=transform, target_transform=target_transform)
+        self._file_index = None
+
+    def _get_file_index(self, directory):
+        if self._file_index is None:
+            self._file_index = get_file_index(directory, cache_dir=self._cache_dir,
+                num_threads=self._num_threads)
+        return self._file_index
+
+    def find_classes(self, directory):
+        classes = self._get_file_index(directory)[0]
+        if not classes:
+            raise FileNotFoundError(f"Couldn't find any class folder in {directory}.")
+        return classes, {cls_name: i for i, cls_name in enumerate(classes)}
+
+    def make_dataset(self, directory, class_to_idx, extensions=None, is_valid_file=None, **kwargs):
+        _, paths, labels = self._get_file_index(directory)
+        if not paths:
+            raise FileNotFoundError(f"Found no valid file for the classes in {directory}. "
+                f"Supported extensions are: {', '.join(IMG_EXTENSIONS)}")
+        return list(zip(paths, labels))
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Build the cached file index of an ImageFolder directory')
+    parser.add_argument('--root', required=True, help='ImageFolder directory with one subdirectory per class')
+    parser.add_argument('--cache-dir', default=None, help='index directory, <cache root>/file_index by default')
+    parser.add_argument('--threads', type=int, default=DEFAULT_NUM_THREADS, help='number of walker threads')
+    args = parser.parse_args(args)
+
+    classes, paths, _ = get_file_index(args.root, cache_dir=args.cache_dir, num_threads=args.threads)
+    print(f'Indexed {len(paths)} files of {len(classes)} classes')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,7 @@
 import os
 import sys
 from collections import namedtuple
+from functools import partial
 
 from deeplite_torch_zoo.src.objectdetection.datasets.coco import \
     CocoDetectionBoundingBox
@@ -22,12 +23,22 @@ __all__ = []
 
 def make_dataset_wrapper(wrapper_name, num_classes, img_size, dataset_create_fn):
     def wrapper_func(data_root, batch_size=32, num_workers=1, num_classes=num_classes,
-        img_size=img_size, fp16=False, distributed=False, device="cuda", **kwargs):
+        img_size=img_size, fp16=False, distributed=False, device="cuda", uint8=False,
+        cache_size=0, cache_dir=None, batch_augment=False, **kwargs):
 
         if len(kwargs):
             print(f"Warning, {sys._getframe().f_code.co_name}: extra arguments {list(kwargs.keys())}!")
 
-        train_dataset, test_dataset = dataset_create_fn(data_root, num_classes, img_size)
+        dataset_kwargs = {'uint8': uint8}
+        if cache_size or cache_dir is not None:
+            # decoded image cache, not supported by the COCO datasets. cache_size is the RAM budget in bytes
+            # of the train set only, which reads each image several times per epoch with mosaic and mixup,
+            # the test set only uses the disk cache in cache_dir
+            dataset_kwargs.update(cache_size=cache_size, cache_dir=cache_dir)
+        if batch_augment:
+            # augmentation of the collated batches, only the VOC-format datasets augment their train sets
+            dataset_kwargs.update(batch_augment=batch_augment)
+        train_dataset, test_dataset = dataset_create_fn(data_root, num_classes, img_size, **dataset_kwargs)
 
         train_loader = get_dataloader(train_dataset, batch_size=batch_size, num_workers=num_workers,
             fp16=fp16, distributed=distributed, shuffle=not distributed,
@@ -42,9 +53,9 @@ def make_dataset_wrapper(wrapper_name, num_classes, img_size, dataset_create_fn)
     return wrapper_func
 
 
-def create_coco_datasets(data_root, num_classes, img_size, subsample_categories=None):
+def create_coco_datasets(data_root, num_classes, img_size, subsample_categories=None, uint8=False):
 
-    train_trans = random_transform_fn
+    train_trans = partial(random_transform_fn, uint8=uint8)
     train_annotate = os.path.join(data_root, "annotations/instances_train2017.json")
     train_coco_root = os.path.join(data_root, "train2017")
 
@@ -67,18 +78,19 @@ def create_coco_datasets(data_root, num_classes, img_size, subsample_categories=
     val_coco_root = os.path.join(data_root, "val2017")
     test_dataset = CocoDetectionBoundingBox(
         val_coco_root, val_annotate, num_classes=num_classes, img_size=img_size,
-        transform=default_transform_fn, classes=categories, category=category_indices, missing_ids=missing_ids
+        transform=partial(default_transform_fn, uint8=uint8), classes=categories, category=category_indices, missing_ids=missing_ids
     )
 
     return train_dataset, test_dataset
 
 
-def create_lisa_datasets(data_root, num_classes, img_size):
-    return LISA(data_root, _set="train", img_size=img_size), LISA(data_root, _set="valid", img_size=img_size)
+def create_lisa_datasets(data_root, num_classes, img_size, uint8=False, cache_size=0, cache_dir=None):
+    return (LISA(data_root, _set="train", img_size=img_size, uint8=uint8, cache_size=cache_size, cache_dir=cache_dir),
+        LISA(data_root, _set="valid", img_size=img_size, uint8=uint8, cache_dir=cache_dir))
 
 
 def create_voc_datasets(data_root, num_classes, img_size, is_07_subset=False, standard_voc_format=True,
-    class_names=None):
+    class_names=None, uint8=False, cache_size=0, cache_dir=None, batch_augment=False):
     annotation_path = os.path.join(data_root, "yolo_data")
     prepare_yolo_voc_data(data_root, annotation_path,
         is_07_subset=is_07_subset, standard_voc_format=standard_voc_format)
@@ -88,6 +100,10 @@ def create_voc_datasets(data_root, num_classes, img_size, is_07_subset=False, st
         img_size=img_size,
         class_names=class_names,
         augment=True,
+        uint8=uint8,
+        cache_size=cache_size,
+        cache_dir=cache_dir,
+        batch_augment=batch_augment,
     )
     test_dataset = VocDataset(
         annotation_path=annotation_path,
@@ -95,43 +111,51 @@ def create_voc_datasets(data_root, num_classes, img_size, is_07_subset=False, st
         img_size=img_size,
         class_names=class_names,
         augment=False,
+        uint8=uint8,
+        cache_dir=cache_dir,
     )
     return train_dataset, test_dataset
 
 
-def create_widerface_datasets(data_root, num_classes, img_size):
+def create_widerface_datasets(data_root, num_classes, img_size, uint8=False, cache_size=0, cache_dir=None):
     train_dataset = WiderFace(
         root=data_root,
         num_classes=num_classes,
         split="train",
         img_size=img_size,
+        uint8=uint8,
+        cache_size=cache_size,
+        cache_dir=cache_dir,
     )
     test_dataset = WiderFace(
         root=data_root,
         num_classes=num_classes,
         split="test",
         img_size=img_size,
+        uint8=uint8,
+        cache_dir=cache_dir,
     )
     return train_dataset, test_dataset
 
 
-def create_voc07_datasets(data_root, num_classes, img_size):
+def create_voc07_datasets(data_root, num_classes, img_size, **kwargs):
     """VOC2007 dataset with a 'train' set for training and 'val' set for testing"""
-    return create_voc_datasets(data_root, num_classes, img_size, is_07_subset=True)
+    return create_voc_datasets(data_root, num_classes, img_size, is_07_subset=True, **kwargs)
 
 
-def create_voc_format_datasets(data_root, num_classes, img_size):
-    return create_voc_datasets(data_root, num_classes, img_size, standard_voc_format=False)
+def create_voc_format_datasets(data_root, num_classes, img_size, **kwargs):
+    return create_voc_datasets(data_root, num_classes, img_size, standard_voc_format=False, **kwargs)
 
 
-def create_car_detection_datasets(data_root, num_classes, img_size):
+def create_car_detection_datasets(data_root, num_classes, img_size, uint8=False):
     """Part of COCO containing only the 'car' class"""
-    return create_coco_datasets(data_root, num_classes, img_size, subsample_categories=['car'])
+    return create_coco_datasets(data_root, num_classes, img_size, subsample_categories=['car'], uint8=uint8)
 
 
-def create_person_detection_datasets(data_root, num_classes, img_size):
+def create_person_detection_datasets(data_root, num_classes, img_size, **kwargs):
     """Person detection (1 class) dataset in VOC format"""
-    return create_voc_datasets(data_root, num_classes, img_size, standard_voc_format=False, class_names=['person'])
+    return create_voc_datasets(data_root, num_classes, img_size, standard_voc_format=False, class_names=['person'],
+        **kwargs)
 
 
 DatasetParameters = namedtuple('DatasetParameters', ['num_classes', 'img_size', 'dataset_create_fn'])
@@ -0,0 +1,229 @@
+"""
+Packed classification datasets: encoded images are concatenated into large shard files with a single
+sidecar index, so a dataset is opened without scanning a directory tree and samples are read with
+large sequential reads instead of one small-file open per image. A split is stored as
+
+    <split>.json              classes, number of samples and shard files
+    <split>.index.npy         shard, offset, size and label of every sample, ordered by shard and offset
+    <split>-00000.bin, ...    shards of encoded images
+
+An ImageFolder-style directory is converted with:
+
+    python -m deeplite_torch_zoo.wrappers.datasets.packed --src /data/imagenet/imagenet_training \
+        --dst /data/imagenet_packed --split train
+
+The classification wrappers read the 'train' and 'val' splits of such a directory with format='packed'.
+"""
+
+import argparse
+import io
+import json
+import mmap
+import os
+
+import numpy as np
+import PIL.Image
+import torch.distributed as dist
+from torch.utils.data import Dataset, IterableDataset, get_worker_info
+from torchvision import datasets
+
+from deeplite_torch_zoo.wrappers.datasets.utils import get_dataloader
+
+DATASET_FORMATS = ('folder', 'packed')
+INDEX_DTYPE = np.dtype([('shard', np.int32), ('offset', np.int64), ('size', np.int64), ('label', np.int64)])
+DEFAULT_SHARD_SIZE = 256 * 2 ** 20
+
+
+def is_packed_format(dataset_format):
+    """checks the `format` argument of the classification wrappers"""
+    if dataset_format not in DATASET_FORMATS:
+        raise ValueError(f'Wrong value of format arg: {dataset_format}. Choices: {DATASET_FORMATS}')
+    return dataset_format == 'packed'
+
+
+def get_samples(dataset):
+    """returns the (image path, label) pairs of an ImageFolder or of a dataset with _image_files and _labels"""
+    if hasattr(dataset, 'samples'):
+        return list(dataset.samples)
+    return list(zip(map(str, dataset._image_files), dataset._labels))  # pylint: disable=protected-access
+
+
+def write_packed_dataset(samples, output_dir, split, classes=None, shard_size=DEFAULT_SHARD_SIZE):
+    """
+    Packs the encoded image files into shards of about `shard_size` bytes, the files are copied as is.
+
+    :param samples: Iterable of (image path, label) pairs
+    :param output_dir: Directory of the packed dataset
+    :param split: Split name, e.g. 'train' or 'val'
+    :param classes: Optional list of class names stored in the split metadata
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    index, shards = [], []
+    shard_file = None
+    for path, label in samples:
+        if shard_file is None or shard_file.tell() >= shard_size:
+            if shard_file is not None:
+                shard_file.close()
+            shards.append({'file': f'{split}-{len(shards):05d}.bin', 'num_samples': 0})
+            shard_file = open(os.path.join(output_dir, shards[-1]['file']), 'wb')
+        with open(path, 'rb') as f:
+            data = f.read()
+        index.append((len(shards) - 1, shard_file.tell(), len(data), label))
+        shard_file.write(data)
+        shards[-1]['num_samples'] += 1
+    if shard_file is not None:
+        shard_file.close()
+
+    np.save(os.path.join(output_dir, f'{split}.index.npy'), np.array(index, dtype=INDEX_DTYPE))
+    metadata = {'classes': classes, 'num_samples': len(index), 'shards': shards}
+    # the metadata is written last and marks a complete split
+    with open(os.path.join(output_dir, f'{split}.json'), 'w') as f:
+        json.dump(metadata, f, indent=1)
+    return metadata
+
+
+class _PackedSplit:
+    def __init__(self, root, split):
+        self.root = root
+        self.split = split
+        with open(os.path.join(root, f'{split}.json')) as f:
+            metadata = json.load(f)
+        self.classes = metadata['classes']
+        self.shard_files = [shard['file'] for shard in metadata['shards']]
+        self.shard_starts = np.cumsum([0] + [shard['num_samples'] for shard in metadata['shards']])
+        self.index = np.load(os.path.join(root, f'{split}.index.npy'), mmap_mode='r')
+        self._shards = {}
+
+    def __getstate__(self):
+        # shards are mapped again in each DataLoader worker
+        return {**self.__dict__, '_shards': {}}
+
+    def shard(self, shard_id):
+        if shard_id not in self._shards:
+            with open(os.path.join(self.root, self.shard_files[shard_id]), 'rb') as f:
+                self._shards[shard_id] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) \
+                    if os.fstat(f.fileno()).st_size else b''
+            if hasattr(mmap, 'MADV_SEQUENTIAL') and self._shards[shard_id]:
+                self._shards[shard_id].madvise(mmap.MADV_SEQUENTIAL)
+        return self._shards[shard_id]
+
+
+def _decode(data, label, transform, target_transform):
+    image = PIL.Image.open(io.BytesIO(data)).convert('RGB')
+    if transform is not None:
+        image = transform(image)
+    if target_transform is not None:
+        label = target_transform(label)
+    return image, label
+
+
+class PackedDataset(Dataset):
+    """Map-style dataset over a packed split, shards are memory-mapped on first access"""
+
+    def __init__(self, root, split='train', transform=None, target_transform=None):
+        self._split = _PackedSplit(root, split)
+        self.classes = self._split.classes
+        self.transform = transform
+        self.target_transform = target_transform
+
+    def __len__(self):
+        return len(self._split.index)
+
+    def __getitem__(self, idx):
+        shard_id, offset, size, label = self._split.index[idx].tolist()
+        data = self._split.shard(shard_id)[offset:offset + size]
+        return _decode(data, label, self.transform, self.target_transform)
+
+
+class PackedIterableDataset(IterableDataset):
+    """
+    Iterable dataset over a packed split which reads each shard sequentially. With shuffle=True the
+    shard order is permuted with a seed shared by all DDP ranks and samples are shuffled within a shard.
+    The shard sequence is then split into equal contiguous parts for the DDP ranks (dropping the
+    remainder) and the DataLoader workers, so every sample is read once per epoch.
+    Call `set_epoch` before each epoch to change the order.
+    """
+
+    def __init__(self, root, split='train', transform=None, target_transform=None, shuffle=True, seed=0,
+        rank=None, world_size=None):
+        self._split = _PackedSplit(root, split)
+        self.classes = self._split.classes
+        self.transform = transform
+        self.target_transform = target_transform
+        self.shuffle = shuffle
+        self.seed = seed
+        self.epoch = 0
+        distributed = dist.is_available() and dist.is_initialized()
+        self.rank = rank if rank is not None else (dist.get_rank() if distributed else 0)
+        self.world_size = world_size if world_size is not None else (dist.get_world_size() if distributed else 1)
+
+    def set_epoch(self, epoch):
+        self.epoch = epoch
+
+    def __len__(self):
+        return len(self._split.index) // self.world_size
+
+    def __iter__(self):
+        rng = np.random.default_rng((self.seed, self.epoch))
+        num_shards = len(self._split.shard_files)
+        shard_order = rng.permutation(num_shards) if self.shuffle else np.arange(num_shards)
+        shard_sizes = np.diff(self._split.shard_starts)[shard_order]
+        positions = np.cumsum(np.concatenate([[0], shard_sizes]))
+
+        # contiguous range of the shuffled shard sequence of this rank and worker
+        worker_info = get_worker_info()
+        worker_id, num_workers = (worker_info.id, worker_info.num_workers) if worker_info is not None else (0, 1)
+        rank_size = len(self)
+        rank_start = self.rank * rank_size
+        start = rank_start + rank_size * worker_id // num_workers
+        end = rank_start + rank_size * (worker_id + 1) // num_workers
+
+        for i, shard_id in enumerate(shard_order):
+            first, last = max(start, positions[i]), min(end, positions[i + 1])
+            if first >= last:
+                continue
+            shard_start = self._split.shard_starts[shard_id]
+            entries = self._split.index[shard_start + first - positions[i]:shard_start + last - positions[i]]
+            shard = self._split.shard(shard_id)
+            order = np.random.default_rng((self.seed, self.epoch, shard_id)).permutation(len(entries)) \
+                if self.shuffle else range(len(entries))
+            for j in order:
+                _, offset, size, label = entries[j].tolist()
+                yield _decode(shard[offset:offset + size], label, self.transform, self.target_transform)
+
+
+def get_packed_dataloaders(data_root, train_transforms, val_transforms, batch_size=64, test_batch_size=None,
+    num_workers=4, fp16=False, distributed=False, device="cuda", target_transform=None):
+    """
+    Train and test loaders of the 'train' and 'val' splits of a packed dataset. The train set
+    is iterated shard by shard, call `set_dataloader_epoch(train_loader, epoch)` to reshuffle it.
+    """
+    train_dataset = PackedIterableDataset(data_root, 'train', transform=train_transforms,
+        target_transform=target_transform)
+    test_dataset = PackedDataset(data_root, 'val', transform=val_transforms, target_transform=target_transform)
+
+    train_loader = get_dataloader(train_dataset, batch_size=batch_size, num_workers=num_workers,
+        fp16=fp16, distributed=distributed, shuffle=False, device=device)
+
+    test_batch_size = batch_size if test_batch_size is None else test_batch_size
+    test_loader = get_dataloader(test_dataset, batch_size=test_batch_size, num_workers=num_workers,
+        fp16=fp16, distributed=distributed, shuffle=False, device=device)
+    return train_loader, test_loader
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Pack an ImageFolder directory into shards')
+    parser.add_argument('--src', required=True, help='ImageFolder directory with one subdirectory per class')
+    parser.add_argument('--dst', required=True, help='output directory of the packed dataset')
+    parser.add_argument('--split', required=True, help='split name, the wrappers read "train" and "val"')
+    parser.add_argument('--shard-size', type=int, default=DEFAULT_SHARD_SIZE >> 20, help='shard size in Mb')
+    args = parser.parse_args(args)
+
+    dataset = datasets.ImageFolder(args.src)
+    metadata = write_packed_dataset(get_samples(dataset), args.dst, args.split, classes=dataset.classes,
+        shard_size=args.shard_size << 20)
+    print(f'Packed {metadata["num_samples"]} images into {len(metadata["shards"])} shards')
+
+
+if __name__ == '__main__':
+    main()
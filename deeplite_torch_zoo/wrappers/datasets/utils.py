@@ -1,26 +1,116 @@
+import inspect
+import random
+
+import cv2
+import numpy as np
 import torch
 
+from torch.utils.data import IterableDataset
 from torch.utils.data.dataloader import default_collate
 from torch.utils.data.distributed import DistributedSampler as DS
 
+from deeplite_torch_zoo.src.objectdetection.datasets.batch import \
+    DetectionBatch
+
+# persistent_workers, prefetch_factor and generator are not available in older torch versions
+_DATALOADER_ARGS = inspect.signature(torch.utils.data.DataLoader.__init__).parameters
+
+
+class HalfCollate:
+    """collate function which converts the fp32 tensors of a collated batch to fp16"""
+
+    def __init__(self, collate_fn):
+        self.collate_fn = collate_fn
+
+    def __call__(self, samples):
+        batch = self.collate_fn(samples)
+        if isinstance(batch, DetectionBatch):
+            return batch.half()
+        return [x.half() if isinstance(x, torch.Tensor) and x.dtype == torch.float32 else x for x in batch]
+
+
+class WorkerInit:
+    """
+    DataLoader worker_init_fn which caps the OpenCV and torch threads of a worker at `num_threads`,
+    as workers running multithreaded decoding oversubscribe the CPU, and seeds `random` and `numpy`
+    from the torch seed of the worker, which the DataLoader derives from its generator and the worker id.
+    Forked workers otherwise share the numpy random state of the parent and apply the same random
+    augmentations.
+    """
+
+    def __init__(self, num_threads=1, worker_init_fn=None):
+        self.num_threads = num_threads
+        self.worker_init_fn = worker_init_fn
+
+    def __call__(self, worker_id):
+        seed = torch.initial_seed() % 2 ** 32
+        random.seed(seed)
+        np.random.seed(seed)
+        if self.num_threads is not None:
+            torch.set_num_threads(self.num_threads)
+            cv2.setNumThreads(self.num_threads)
+        if self.worker_init_fn is not None:
+            self.worker_init_fn(worker_id)
+
 
 def get_dataloader(
     dataset, batch_size=32, num_workers=4, fp16=False, distributed=False, shuffle=False,
-    collate_fn=None, device="cuda"
+    collate_fn=None, device="cuda", pin_memory=None, persistent_workers=None, prefetch_factor=None,
+    worker_threads=1, seed=None, drop_last=False, worker_init_fn=None,
 ):
+    """
+    Creates the DataLoader of a dataset.
+
+    :param pin_memory: Copy the batches to page-locked memory, by default if `device` is a CUDA device
+    :param persistent_workers: Keep the workers and their dataset copies alive between epochs. By default
+        for map-style datasets, iterable datasets are re-created in the workers each epoch so that their
+        `set_epoch` state reaches the workers
+    :param prefetch_factor: Number of batches loaded in advance by each worker, torch's default if None
+    :param worker_threads: OpenCV and torch threads of each worker, unchanged if None
+    :param seed: Seed of the shuffling order and of the worker random states, random if None
+    """
     if collate_fn is None:
         collate_fn = default_collate
-    def half_precision(x):
-        x = collate_fn(x)
-        x = [_x.half() if isinstance(_x, torch.FloatTensor) else _x for _x in x]
-        return x
+    if pin_memory is None:
+        pin_memory = torch.device(device).type == 'cuda' and torch.cuda.is_available()
+    if persistent_workers is None:
+        persistent_workers = not isinstance(dataset, IterableDataset)
+
+    sampler = None
+    # iterable datasets split the samples between the ranks themselves
+    if distributed and not isinstance(dataset, IterableDataset):
+        sampler = DS(dataset) if seed is None else DS(dataset, seed=seed)
+
+    kwargs = {}
+    if num_workers > 0:
+        kwargs['worker_init_fn'] = WorkerInit(worker_threads, worker_init_fn)
+        if 'persistent_workers' in _DATALOADER_ARGS:
+            kwargs['persistent_workers'] = persistent_workers
+        if prefetch_factor is not None and 'prefetch_factor' in _DATALOADER_ARGS:
+            kwargs['prefetch_factor'] = prefetch_factor
+    if seed is not None and 'generator' in _DATALOADER_ARGS:
+        kwargs['generator'] = torch.Generator().manual_seed(seed)
 
     dataloader = torch.utils.data.DataLoader(
         dataset,
         batch_size=batch_size,
         shuffle=shuffle,
         num_workers=num_workers,
-        collate_fn= half_precision if fp16 else collate_fn,
-        sampler=DS(dataset) if distributed else None,
+        collate_fn=HalfCollate(collate_fn) if fp16 else collate_fn,
+        sampler=sampler,
+        pin_memory=pin_memory,
+        drop_last=drop_last,
+        **kwargs,
     )
     return dataloader
+
+
+def set_dataloader_epoch(dataloader, epoch):
+    """
+    Sets the epoch of the sampler and of the dataset of a DataLoader, whichever has `set_epoch`, to change
+    the shuffling order of a DistributedSampler or of an iterable dataset such as `PackedIterableDataset`.
+    Call before iterating the DataLoader in each epoch.
+    """
+    for obj in (dataloader.sampler, dataloader.dataset):
+        if hasattr(obj, 'set_epoch'):
+            obj.set_epoch(epoch)
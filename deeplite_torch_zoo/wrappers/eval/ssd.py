@@ -35,16 +35,12 @@ __all__ = [
 def vgg16_ssd_eval_func(
     model, data_loader, iou_threshold=0.5, use_2007_metric=True, device="cuda"
 ):
-    eval_path = os.path.join(expanduser("~"), ".deeplite-torch-zoo/voc/eval_results")
-    Path(eval_path).mkdir(parents=True, exist_ok=True)
-
     model.is_test = True
     predictor = create_vgg_ssd_predictor(model, nms_method="hard", device=device)
 
     stat = ssd_eval(
         predictor=predictor,
         dataloader=data_loader,
-        data_path=eval_path,
         class_names=data_loader.dataset.classes,
         iou_threshold=iou_threshold,
         use_2007_metric=use_2007_metric,
@@ -58,9 +54,6 @@ def vgg16_ssd_eval_func(
 def mb1_ssd_eval_func(
     model, data_loader, iou_threshold=0.5, use_2007_metric=True, device="cuda"
 ):
-    eval_path = os.path.join(expanduser("~"), ".deeplite-torch-zoo/voc/eval_results")
-    Path(eval_path).mkdir(parents=True, exist_ok=True)
-
     model.is_test = True
     predictor = create_mobilenetv1_ssd_predictor(
         model, nms_method="hard", device=device
@@ -69,7 +62,6 @@ def mb1_ssd_eval_func(
     stat = ssd_eval(
         predictor=predictor,
         dataloader=data_loader,
-        data_path=eval_path,
         class_names=data_loader.dataset.classes,
         iou_threshold=iou_threshold,
         use_2007_metric=use_2007_metric,
@@ -84,9 +76,6 @@ def mb1_ssd_eval_func(
 def mb2_ssd_eval_func(
     model, data_loader, iou_threshold=0.5, use_2007_metric=True, device="cuda"
 ):
-    eval_path = os.path.join(expanduser("~"), ".deeplite-torch-zoo/voc/eval_results")
-    Path(eval_path).mkdir(parents=True, exist_ok=True)
-
     model.is_test = True
     predictor = create_mobilenetv2_ssd_predictor(
         model, nms_method="hard", device=device
@@ -95,7 +84,6 @@ def mb2_ssd_eval_func(
     stat = ssd_eval(
         predictor=predictor,
         dataloader=data_loader,
-        data_path=eval_path,
         class_names=data_loader.dataset.classes,
         iou_threshold=iou_threshold,
         use_2007_metric=use_2007_metric,
@@ -132,9 +120,6 @@ def mb2_ssd_coco_eval_func(
 def mb2_ssd_lite_eval_func(
     model, data_loader, iou_threshold=0.5, use_2007_metric=True, device="cuda"
 ):
-    eval_path = os.path.join(expanduser("~"), ".deeplite-torch-zoo/voc/eval_results")
-    Path(eval_path).mkdir(parents=True, exist_ok=True)
-
     model.is_test = True
     predictor = create_mobilenetv2_ssd_lite_predictor(
         model, nms_method="hard", device=device
@@ -142,7 +127,6 @@ def mb2_ssd_lite_eval_func(
     stat = ssd_eval(
         predictor=predictor,
         dataloader=data_loader,
-        data_path=eval_path,
         class_names=data_loader.dataset.classes,
         iou_threshold=iou_threshold,
         use_2007_metric=use_2007_metric,
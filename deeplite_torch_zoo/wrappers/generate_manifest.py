@@ -0,0 +1,74 @@
+"""
+Generates registry_manifest.py, the static list of all the registered wrappers
+and the modules defining them, which lets the registries import wrapper modules
+only when one of their entries is requested.
+
+Needs to be rerun whenever a model, dataset or eval wrapper is added or removed:
+
+    python -m deeplite_torch_zoo.wrappers.generate_manifest
+"""
+
+from pathlib import Path
+
+import deeplite_torch_zoo.wrappers.datasets  # pylint: disable=unused-import
+import deeplite_torch_zoo.wrappers.eval  # pylint: disable=unused-import
+import deeplite_torch_zoo.wrappers.models  # pylint: disable=unused-import
+from deeplite_torch_zoo.utils.registry import LazyEntry
+from deeplite_torch_zoo.wrappers.registries import (DATA_WRAPPER_REGISTRY,
+                                                    EVAL_WRAPPER_REGISTRY,
+                                                    MODEL_WRAPPER_REGISTRY)
+
+MANIFEST_PATH = Path(__file__).parent / 'registry_manifest.py'
+
+MANIFEST_HEADER = '''"""
+Registered wrappers and the modules defining them.
+Generated by deeplite_torch_zoo/wrappers/generate_manifest.py, do not edit.
+"""
+
+'''
+
+
+def _registered_keys(registry):
+    return sorted(
+        (key for key, obj in registry.registry_dict.items() if not isinstance(obj, LazyEntry)),
+        key=lambda key: tuple(str(field) for field in key),
+    )
+
+
+def get_manifest():
+    model_wrappers = [
+        (
+            key.model_name,
+            key.dataset_name,
+            MODEL_WRAPPER_REGISTRY.task_type_map[key],
+            key in MODEL_WRAPPER_REGISTRY.pretrained_models,
+            MODEL_WRAPPER_REGISTRY.registry_modules[key],
+        )
+        for key in _registered_keys(MODEL_WRAPPER_REGISTRY)
+    ]
+    data_wrappers = [
+        (key.dataset_name, key.model_type, DATA_WRAPPER_REGISTRY.registry_modules[key])
+        for key in _registered_keys(DATA_WRAPPER_REGISTRY)
+    ]
+    eval_wrappers = [
+        (key.task_type, key.model_type, key.dataset_type, EVAL_WRAPPER_REGISTRY.registry_modules[key])
+        for key in _registered_keys(EVAL_WRAPPER_REGISTRY)
+    ]
+    return {
+        'MODEL_WRAPPERS': model_wrappers,
+        'DATA_WRAPPERS': data_wrappers,
+        'EVAL_WRAPPERS': eval_wrappers,
+    }
+
+
+def write_manifest(path=MANIFEST_PATH):
+    blocks = []
+    for name, entries in get_manifest().items():
+        lines = [f'    {entry!r},' for entry in entries]
+        blocks.append('\n'.join([f'{name} = [', *lines, ']']) + '\n')
+    with open(path, 'w') as f:
+        f.write(MANIFEST_HEADER + '\n'.join(blocks))
+
+
+if __name__ == '__main__':
+    write_manifest()
@@ -0,0 +1,79 @@
+"""
+Builds the block latency LUT of the local CPU and ranks the zoo models by their predicted latency, e.g.
+
+    python -m deeplite_torch_zoo.wrappers.latency --build
+    python -m deeplite_torch_zoo.wrappers.latency --filter imagenet --max-latency-ms 20 --measure
+
+The LUT is stored in `$DEEPLITE_ZOO_LATENCY_LUT` or `~/.cache/deeplite_torch_zoo/latency_lut.json`, per host name,
+number of torch threads and torch version. Building it with the default grid takes a few minutes, after which
+the latency of a model is predicted from a single forward pass and kept in the LUT file.
+"""
+
+import argparse
+
+import texttable
+import torch
+
+from deeplite_torch_zoo.utils import (LatencyTable, build_latency_table,
+                                      set_latency_table)
+from deeplite_torch_zoo.utils.latency import DEFAULT_GRID
+from deeplite_torch_zoo.wrappers.quantize import _format_value
+from deeplite_torch_zoo.wrappers.wrapper import (get_profile_by_name,
+                                                 list_models,
+                                                 predict_latency_by_name)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Block latency LUT and latency based ranking of the zoo models')
+    parser.add_argument('--lut', default=None, help='LUT file')
+    parser.add_argument('--threads', type=int, default=None, help='number of torch threads to benchmark with')
+    parser.add_argument('--build', action='store_true', help='benchmark the blocks missing from the LUT')
+    parser.add_argument('--overwrite', action='store_true', help='benchmark the blocks already in the LUT again')
+    parser.add_argument('--blocks', nargs='+', default=None, help='names of the blocks to benchmark, all by default')
+    parser.add_argument('--channels', nargs='+', type=int, default=DEFAULT_GRID['channels'])
+    parser.add_argument('--resolutions', nargs='+', type=int, default=DEFAULT_GRID['resolutions'])
+    parser.add_argument('--filter', default=None,
+        help='model name, dataset name or "model_name_dataset_name" to select the models to rank, as in list_models')
+    parser.add_argument('--task-type', default=None, help='task type filter, as in list_models')
+    parser.add_argument('--max-latency-ms', type=float, default=None, help='only list the models faster than this')
+    parser.add_argument('--img-size', type=int, default=224, help='image size of the latency predictions')
+    parser.add_argument('--measure', action='store_true',
+        help='also measure the latency of the ranked models, to check the predictions')
+    args = parser.parse_args(args)
+
+    if args.threads is not None:
+        torch.set_num_threads(args.threads)
+    table = LatencyTable(args.lut)
+    set_latency_table(table)
+    if args.build or args.overwrite or not len(table):
+        num_entries = build_latency_table(table, blocks=args.blocks, overwrite=args.overwrite, progress=True,
+            grid={'channels': args.channels, 'resolutions': args.resolutions})
+        print(f'Measured {num_entries} entries, the LUT of {table.device_key()} has {len(table)} entries')
+
+    if args.filter is None:
+        return
+    model_keys = list_models(args.filter, print_table=False, return_list=True, task_type_filter=args.task_type,
+        sort_by='latency', max_latency_ms=args.max_latency_ms, img_size=args.img_size)
+    header = ['Model', 'Source dataset', 'Predicted latency, ms']
+    if args.measure:
+        header.append('Measured latency, ms')
+    rows = []
+    for model_key in model_keys:
+        try:
+            latency_ms = predict_latency_by_name(model_key.model_name, model_key.dataset_name, args.img_size)
+        except Exception:  # pylint: disable=broad-except
+            # the models which failed are listed last, list_models has warned about them
+            latency_ms = None
+        row = [model_key.model_name, model_key.dataset_name, _format_value(latency_ms)]
+        if args.measure:
+            row.append(_format_value(get_profile_by_name(model_key.model_name, model_key.dataset_name,
+                img_size=args.img_size, measure_latency=True)['latency_ms']))
+        rows.append(row)
+    table = texttable.Texttable(max_width=0)
+    table.set_cols_dtype(['t'] * len(header))
+    table.add_rows([header, *rows])
+    print(table.draw())
+
+
+if __name__ == '__main__':
+    main()
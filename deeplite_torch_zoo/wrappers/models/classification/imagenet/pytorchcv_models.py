@@ -29,7 +29,8 @@ def make_wrapper_func(wrapper_fn_name, register_model_name_key, model_name_key):
 for model_name_tag in IMPL_MODEL_NAMES['pytorchcv']:
     register_model_name_tag = model_name_tag
     key = MODEL_WRAPPER_REGISTRY._registry_key(model_name=model_name_tag, dataset_name='imagenet')
-    if key in MODEL_WRAPPER_REGISTRY.registry_dict:
+    if key in MODEL_WRAPPER_REGISTRY.registry_dict and \
+            MODEL_WRAPPER_REGISTRY.defining_module(key) != __name__:
         register_model_name_tag = "_".join((model_name_tag, "pytorchcv"))
     wrapper_name = "_".join((model_name_tag, "imagenet"))
     globals()[wrapper_name] = make_wrapper_func(wrapper_name,
@@ -0,0 +1,86 @@
+"""
+Measures the CPU latency of zoo models before and after `optimize_for_inference`:
+
+    python -m deeplite_torch_zoo.wrappers.optimize --models resnet18:imagenet yolo5_6n:voc:320 --threads 1
+
+Without --models, a representative set of classification, detection and segmentation models is measured.
+"""
+
+import argparse
+
+import texttable
+import torch
+
+from deeplite_torch_zoo.utils import (count_params, measure_latency,
+                                      optimize_for_inference)
+from deeplite_torch_zoo.wrappers.wrapper import get_model_by_name
+
+# (model_name, dataset_name, img_size)
+DEFAULT_MODELS = [
+    ('resnet18', 'imagenet', 224),
+    ('mobilenet_v2', 'imagenet', 224),
+    ('mobileone_s0', 'imagenet', 224),
+    ('resnet18', 'cifar100', 32),
+    ('yolo5_6n', 'voc', 320),
+    ('mb2_ssd', 'voc', 300),
+    ('unet', 'carvana', 256),
+]
+
+
+def benchmark_optimization(model_name, dataset_name, img_size=224, in_ch=3, batch_size=1, pretrained=False,
+    warmup=10, repeat=50):
+    """
+    Measures the CPU latency of a zoo model before and after `optimize_for_inference`.
+
+    returns a dictionary with the mean latencies in milliseconds, the speedup and the number of
+    modules of both models
+    """
+    model = get_model_by_name(model_name, dataset_name, pretrained=pretrained, device='cpu')
+    model.eval()
+    optimized = optimize_for_inference(model, img_size=img_size, in_ch=in_ch)
+    inputs = torch.randn(batch_size, in_ch, img_size, img_size)
+    latency = measure_latency(model, inputs, warmup=warmup, repeat=repeat)['latency_ms']
+    optimized_latency = measure_latency(optimized, inputs, warmup=warmup, repeat=repeat)['latency_ms']
+    return {
+        'latency_ms': latency,
+        'optimized_latency_ms': optimized_latency,
+        'speedup': latency / optimized_latency,
+        'modules': len(list(model.modules())),
+        'optimized_modules': len(list(optimized.modules())),
+        'Mparams': count_params(optimized)[0] / 1e6,
+    }
+
+
+def parse_model(spec):
+    model_name, dataset_name, *img_size = spec.split(':')
+    return model_name, dataset_name, int(img_size[0]) if img_size else 224
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Measure the CPU latency of zoo models before and after '
+        'optimize_for_inference')
+    parser.add_argument('--models', nargs='+', type=parse_model, default=DEFAULT_MODELS,
+        help='models as model_name:dataset_name[:img_size]')
+    parser.add_argument('--batch-size', type=int, default=1)
+    parser.add_argument('--threads', type=int, default=None, help='torch threads, unchanged by default')
+    parser.add_argument('--warmup', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=50)
+    parser.add_argument('--pretrained', action='store_true', help='load the pretrained weights')
+    args = parser.parse_args(args)
+
+    if args.threads is not None:
+        torch.set_num_threads(args.threads)
+    table = texttable.Texttable(max_width=0)
+    table.set_cols_dtype(['t', 't', 'i', 'f', 'f', 'f', 't'])
+    rows = [['Model', 'Dataset', 'Image size', 'Latency, ms', 'Optimized, ms', 'Speedup', 'Modules']]
+    for model_name, dataset_name, img_size in args.models:
+        results = benchmark_optimization(model_name, dataset_name, img_size=img_size, batch_size=args.batch_size,
+            pretrained=args.pretrained, warmup=args.warmup, repeat=args.repeat)
+        rows.append([model_name, dataset_name, img_size, results['latency_ms'], results['optimized_latency_ms'],
+            results['speedup'], f"{results['modules']} -> {results['optimized_modules']}"])
+    table.add_rows(rows)
+    print(table.draw())
+
+
+if __name__ == '__main__':
+    main()
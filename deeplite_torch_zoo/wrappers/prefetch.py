@@ -0,0 +1,36 @@
+"""
+Downloads the pretrained weights of the zoo models into the local checkpoint cache,
+e.g. before running a sweep on nodes without network access:
+
+    python -m deeplite_torch_zoo.wrappers.prefetch --filter cifar100 --cache-dir /mnt/zoo_cache
+
+The warmed cache directory can then be used with `DEEPLITE_ZOO_CACHE_DIR=/mnt/zoo_cache DEEPLITE_ZOO_OFFLINE=1`.
+"""
+
+import argparse
+import sys
+
+from deeplite_torch_zoo.utils import CheckpointCache, set_checkpoint_cache
+from deeplite_torch_zoo.wrappers.wrapper import prefetch_checkpoints
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Prefetch pretrained zoo checkpoints')
+    parser.add_argument('--filter', default='',
+        help='model name, dataset name or "model_name_dataset_name" to select the models, as in list_models')
+    parser.add_argument('--task-type', default=None, help='task type filter, as in list_models')
+    parser.add_argument('--cache-dir', default=None, help='checkpoint cache directory')
+    parser.add_argument('--mirror-dir', default=None, help='local directory with checkpoint files to use before downloading')
+    args = parser.parse_args(args)
+
+    set_checkpoint_cache(CheckpointCache(cache_dir=args.cache_dir, mirror_dir=args.mirror_dir))
+    results = prefetch_checkpoints(args.filter, task_type_filter=args.task_type)
+    failed = {name: error for name, error in results.items() if error is not None}
+    for name, error in failed.items():
+        print(f'{name}: {error!r}')
+    print(f'Prefetched {len(results) - len(failed)}/{len(results)} models')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""
+Structured channel pruning of zoo models with `prune_channels`, e.g.
+
+    python -m deeplite_torch_zoo.wrappers.prune --model yolo5_6n --dataset voc --img-size 320 \
+        --ratios 0 0.25 0.5 --data-root /data/VOCdevkit
+
+prints the GMACs, the number of parameters and, with --data-root, the evaluation metrics of the pruned models
+before fine-tuning, to choose the pruning ratio of a model. The inputs of the detection heads are not pruned.
+"""
+
+import argparse
+import os
+
+import texttable
+import torch
+
+from deeplite_torch_zoo.utils import prune_channels
+from deeplite_torch_zoo.wrappers.quantize import (_format_value,
+                                                  get_default_skip_modules)
+from deeplite_torch_zoo.wrappers.wrapper import (get_data_splits_by_name,
+                                                 get_eval_function,
+                                                 get_model_by_name, profile)
+
+
+def prune_model(model_name, dataset_name, ratio=0.25, criterion='bn', round_to=8, img_size=None, model=None,
+    pretrained=True, skip_modules=None, data_root=None, eval_split='test', batch_size=32, num_workers=4,
+    eval_kwargs=None, **kwargs):
+    """
+    Prunes the channels of a zoo model with `prune_channels` and profiles the pruned model.
+
+    :param model_name: Name of the model, selects the model, data and evaluation wrappers
+    :param dataset_name: Name of the dataset the model was trained on
+    :param ratio: Fraction of the channels of every prunable group to remove
+    :param criterion: Channel importance, 'bn' or 'l1'
+    :param round_to: The number of remaining channels is rounded up to a multiple of `round_to`
+    :param img_size: Input image resolution to trace and profile the model with, 224 by default,
+        also passed to the data wrapper if given
+    :param model: Model to prune instead of the zoo model, e.g. a fine-tuned model
+    :param skip_modules: Module names and classes which are not traced, the detection heads by default
+    :param data_root: Dataset directory, the pruned model is evaluated on the `eval_split` loader if given
+    :param eval_kwargs: Extra arguments of the evaluation function, e.g. {'break_iter': 10}
+
+    The other kwargs are passed to the data wrapper.
+
+    returns the pruned model in eval mode and a report with its GMACs, number of parameters in millions
+    and evaluation metrics
+    """
+    if model is None:
+        model = get_model_by_name(model_name, dataset_name, pretrained=pretrained, device='cpu')
+    model = model.cpu().eval()
+    if skip_modules is None:
+        skip_modules = get_default_skip_modules(model)
+
+    if img_size is not None:
+        kwargs['img_size'] = img_size
+    else:
+        img_size = 224
+
+    pruned = prune_channels(model, ratio=ratio, criterion=criterion, round_to=round_to, img_size=img_size,
+        skip_modules=skip_modules).eval()
+    results = profile(pruned, img_size=img_size)
+    report = {'GMACs': results['GMACs'], 'Mparams': results['Mparams']}
+    if data_root is not None:
+        dataloaders = get_data_splits_by_name(data_root=data_root, dataset_name=dataset_name,
+            model_name=model_name, batch_size=batch_size, num_workers=num_workers, device='cpu', **kwargs)
+        eval_fn = get_eval_function(model_name, dataset_name)
+        report.update(eval_fn(pruned, dataloaders[eval_split], device='cpu', **(eval_kwargs or {})))
+        pruned.eval()
+    return pruned, report
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Structured channel pruning of a zoo model')
+    parser.add_argument('--model', required=True, help='model name')
+    parser.add_argument('--dataset', required=True, help='dataset name')
+    parser.add_argument('--ratios', nargs='+', type=float, default=[0., 0.1, 0.25, 0.5],
+        help='fractions of the channels to remove')
+    parser.add_argument('--criterion', default='bn', help='channel importance, bn or l1')
+    parser.add_argument('--round-to', type=int, default=8, help='keep a multiple of this number of channels')
+    parser.add_argument('--img-size', type=int, default=None,
+        help='image size to profile the models with, also passed to the data wrapper, 224 by default')
+    parser.add_argument('--skip', nargs='+', default=[],
+        help='names of modules which are not pruned in addition to the detection heads, e.g. model.9')
+    parser.add_argument('--no-pretrained', action='store_true', help='prune a randomly initialized model')
+    parser.add_argument('--data-root', default=None, help='dataset directory, evaluates the pruned models if set')
+    parser.add_argument('--batch-size', type=int, default=32)
+    parser.add_argument('--num-workers', type=int, default=4)
+    parser.add_argument('--output-dir', default=None,
+        help='directory to save the pruned models to with torch.save, to fine-tune them')
+    args = parser.parse_args(args)
+
+    model = get_model_by_name(args.model, args.dataset, pretrained=not args.no_pretrained, device='cpu')
+    rows, metrics = [], []
+    for ratio in args.ratios:
+        pruned, report = prune_model(args.model, args.dataset, ratio=ratio, criterion=args.criterion,
+            round_to=args.round_to, img_size=args.img_size, model=model,
+            skip_modules=[*get_default_skip_modules(model), *args.skip], data_root=args.data_root,
+            batch_size=args.batch_size, num_workers=args.num_workers)
+        metrics.extend(metric for metric in report if metric not in metrics)
+        rows.append((ratio, report))
+        if args.output_dir is not None:
+            os.makedirs(args.output_dir, exist_ok=True)
+            torch.save(pruned, os.path.join(args.output_dir, f'{args.model}_{args.dataset}_pruned_{ratio}.pt'))
+
+    table = texttable.Texttable(max_width=0)
+    table.set_cols_dtype(['t'] * (len(metrics) + 1))
+    table.add_rows([['Ratio', *metrics], *[[str(ratio), *[_format_value(report.get(metric))
+        for metric in metrics]] for ratio, report in rows]])
+    print(table.draw())
+
+
+if __name__ == '__main__':
+    main()
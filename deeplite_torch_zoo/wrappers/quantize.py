@@ -0,0 +1,157 @@
+"""
+Post-training static int8 quantization of zoo models for CPU inference, calibrated on the data splits of
+`get_data_splits_by_name` and evaluated with `get_eval_function`, e.g.
+
+    python -m deeplite_torch_zoo.wrappers.quantize --model yolo5_6n --dataset voc \
+        --data-root /data/VOCdevkit --calib-batches 32 --backend fbgemm --threads 1
+
+prints the accuracy, latency and size of the fp32 and int8 models. The detection heads are kept in fp32
+by default, more layers can be skipped with --skip.
+"""
+
+import argparse
+import itertools
+
+import texttable
+import torch
+
+from deeplite_torch_zoo.src.objectdetection.datasets.batch import \
+    DetectionBatch
+from deeplite_torch_zoo.src.objectdetection.datasets.dataset import \
+    images_to_float
+from deeplite_torch_zoo.utils import (get_serialized_size, measure_latency,
+                                      optimize_for_inference, quantize_static)
+from deeplite_torch_zoo.wrappers.wrapper import (get_data_splits_by_name,
+                                                 get_eval_function,
+                                                 get_model_by_name)
+
+# class names of the detection heads, their box decoding has data-dependent control flow and needs fp32
+DEFAULT_SKIP_MODULES = ('Detect', 'DetectX', 'YOLOHead')
+
+
+def get_batch_images(batch):
+    """Model inputs of a batch of a zoo data loader, uint8 detection images are scaled to [0, 1]"""
+    if isinstance(batch, DetectionBatch):
+        images = batch.images
+    elif isinstance(batch, (list, tuple)):
+        images = batch[0]
+    else:
+        images = batch
+    return images_to_float(images)
+
+
+def get_default_skip_modules(model):
+    return sorted({type(module) for module in model.modules() if type(module).__name__ in DEFAULT_SKIP_MODULES},
+        key=lambda cls: cls.__name__)
+
+
+def _get_report(model, eval_fn, dataloader, inputs, eval_kwargs):
+    model.eval()
+    report = {}
+    if eval_fn is not None:
+        report.update(eval_fn(model, dataloader, device='cpu', **eval_kwargs))
+        model.eval()
+    if inputs is not None:
+        report['latency_ms'] = measure_latency(model, inputs)['latency_ms']
+    report['size_Mb'] = get_serialized_size(model) / 1e6
+    return report
+
+
+def quantize_model(model_name, dataset_name, data_root='', calib_batches=32, backend='fbgemm', per_channel=True,
+    skip_modules=None, model=None, pretrained=True, calib_split='train', eval_split='test', batch_size=32,
+    num_workers=4, evaluate=True, eval_kwargs=None, measure_latency_batch_size=1, **kwargs):
+    """
+    Quantizes a zoo model to int8 with `quantize_static` and compares it to the fp32 model.
+
+    :param model_name: Name of the model, selects the model, data and evaluation wrappers
+    :param dataset_name: Name of the dataset the model was trained on
+    :param data_root: Dataset directory passed to `get_data_splits_by_name`
+    :param calib_batches: Number of batches of the `calib_split` loader to calibrate the activation ranges on
+    :param backend: Quantized engine, 'fbgemm' or 'x86' for x86 CPUs, 'qnnpack' for ARM CPUs
+    :param per_channel: Whether to quantize the weights per output channel
+    :param skip_modules: Module names and classes kept in fp32, the detection heads by default
+    :param model: Model to quantize instead of the zoo model, e.g. a fine-tuned model
+    :param evaluate: Whether to evaluate both models on the `eval_split` loader with `get_eval_function`
+    :param eval_kwargs: Extra arguments of the evaluation function, e.g. {'break_iter': 10}
+    :param measure_latency_batch_size: Batch size of the CPU latency measurement, no measurement if None
+
+    The other kwargs are passed to the data wrapper.
+
+    returns the quantized model and a report {'fp32': {...}, 'int8': {...}} with the evaluation metrics,
+    the mean latency in milliseconds and the size of the state dict in megabytes of both models
+    """
+    if model is None:
+        model = get_model_by_name(model_name, dataset_name, pretrained=pretrained, device='cpu')
+    model = model.cpu().eval()
+    if hasattr(model, 'is_test'):
+        # the forward of the SSD models is traced in the mode their evaluation function uses
+        model.is_test = True
+    if skip_modules is None:
+        skip_modules = get_default_skip_modules(model)
+
+    dataloaders = get_data_splits_by_name(data_root=data_root, dataset_name=dataset_name, model_name=model_name,
+        batch_size=batch_size, num_workers=num_workers, device='cpu', **kwargs)
+    calibration_data = [get_batch_images(batch)
+        for batch in itertools.islice(dataloaders[calib_split], calib_batches)]
+    quantized = quantize_static(model, calibration_data, backend=backend, per_channel=per_channel,
+        skip_modules=skip_modules)
+
+    eval_fn = get_eval_function(model_name, dataset_name) if evaluate else None
+    inputs = None
+    if measure_latency_batch_size is not None:
+        inputs = calibration_data[0][:1].expand(measure_latency_batch_size, *calibration_data[0].shape[1:])
+    eval_kwargs = eval_kwargs or {}
+    report = {
+        'fp32': _get_report(optimize_for_inference(model, inputs=calibration_data[0]), eval_fn,
+            dataloaders[eval_split], inputs, eval_kwargs),
+        'int8': _get_report(quantized, eval_fn, dataloaders[eval_split], inputs, eval_kwargs),
+    }
+    return quantized, report
+
+
+def _format_value(value):
+    if value is None:
+        return '-'
+    return f'{value:.4f}' if isinstance(value, float) else str(value)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Post-training int8 quantization of a zoo model')
+    parser.add_argument('--model', required=True, help='model name')
+    parser.add_argument('--dataset', required=True, help='dataset name')
+    parser.add_argument('--data-root', default='', help='dataset directory')
+    parser.add_argument('--calib-batches', type=int, default=32, help='number of calibration batches')
+    parser.add_argument('--batch-size', type=int, default=32)
+    parser.add_argument('--num-workers', type=int, default=4)
+    parser.add_argument('--backend', default='fbgemm', help='quantized engine, fbgemm, x86 or qnnpack')
+    parser.add_argument('--per-tensor', action='store_true', help='quantize the weights per tensor')
+    parser.add_argument('--skip', nargs='+', default=[],
+        help='names of modules kept in fp32 in addition to the detection heads, e.g. model.0')
+    parser.add_argument('--no-pretrained', action='store_true', help='quantize a randomly initialized model')
+    parser.add_argument('--no-eval', action='store_true', help='only measure the latency and size')
+    parser.add_argument('--img-size', type=int, default=None, help='image size passed to the data wrapper')
+    parser.add_argument('--threads', type=int, default=None, help='torch threads, unchanged by default')
+    parser.add_argument('--output', default=None, help='file to save the quantized model to with torch.save')
+    args = parser.parse_args(args)
+
+    if args.threads is not None:
+        torch.set_num_threads(args.threads)
+    model = get_model_by_name(args.model, args.dataset, pretrained=not args.no_pretrained, device='cpu')
+    kwargs = {'img_size': args.img_size} if args.img_size is not None else {}
+    quantized, report = quantize_model(args.model, args.dataset, data_root=args.data_root,
+        calib_batches=args.calib_batches, backend=args.backend, per_channel=not args.per_tensor,
+        skip_modules=[*get_default_skip_modules(model), *args.skip], model=model,
+        batch_size=args.batch_size, num_workers=args.num_workers, evaluate=not args.no_eval, **kwargs)
+
+    metrics = sorted(set(report['fp32']) | set(report['int8']), key=lambda key: key in ('latency_ms', 'size_Mb'))
+    table = texttable.Texttable(max_width=0)
+    table.set_cols_dtype(['t', 't', 't'])
+    table.add_rows([['Metric', 'fp32', 'int8'], *[[metric, *[_format_value(report[precision].get(metric))
+        for precision in ('fp32', 'int8')]] for metric in metrics]])
+    print(table.draw())
+    if args.output is not None:
+        torch.save(quantized, args.output)
+
+
+if __name__ == '__main__':
+    main()
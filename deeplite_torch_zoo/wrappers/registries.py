@@ -1,8 +1,20 @@
 from deeplite_torch_zoo.utils.registry import DatasetWrapperRegistry
 from deeplite_torch_zoo.utils.registry import ModelWrapperRegistry
 from deeplite_torch_zoo.utils.registry import EvaluatorWrapperRegistry
+from deeplite_torch_zoo.wrappers.registry_manifest import (DATA_WRAPPERS,
+                                                           EVAL_WRAPPERS,
+                                                           MODEL_WRAPPERS)
 
 
 MODEL_WRAPPER_REGISTRY = ModelWrapperRegistry()
 DATA_WRAPPER_REGISTRY = DatasetWrapperRegistry()
 EVAL_WRAPPER_REGISTRY = EvaluatorWrapperRegistry()
+
+# wrapper modules are imported on the first lookup of one of their entries
+for model_name, dataset_name, task_type, has_checkpoint, module in MODEL_WRAPPERS:
+    MODEL_WRAPPER_REGISTRY.register_lazy(model_name, dataset_name, task_type, module,
+        has_checkpoint=has_checkpoint)
+for dataset_name, model_type, module in DATA_WRAPPERS:
+    DATA_WRAPPER_REGISTRY.register_lazy(dataset_name, model_type, module)
+for task_type, model_type, dataset_type, module in EVAL_WRAPPERS:
+    EVAL_WRAPPER_REGISTRY.register_lazy(task_type, model_type, dataset_type, module)
@@ -0,0 +1,3677 @@
+"""
+Registered wrappers and the modules defining them.
+Generated by deeplite_torch_zoo/wrappers/generate_manifest.py, do not edit.
+"""
+
+MODEL_WRAPPERS = [
+    ('adv_inception_v3', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('adv_inception_v3', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('adv_inception_v3', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('airnet101_1x64d_r2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('airnet101_1x64d_r2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('airnet50_1x64d_r16', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('airnet50_1x64d_r16', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('airnet50_1x64d_r2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('airnet50_1x64d_r2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('airnext101_32x4d_r16', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('airnext101_32x4d_r16', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('airnext101_32x4d_r2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('airnext101_32x4d_r2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('airnext50_32x4d_r2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('airnext50_32x4d_r2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('alexnet', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('alexnet', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('alexnet_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('alexnet_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('alexnetb', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('alexnetb', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('alexnetb', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('bagnet17', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('bagnet17', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('bagnet33', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('bagnet33', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('bagnet9', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('bagnet9', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('bam_resnet101', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('bam_resnet101', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('bam_resnet152', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('bam_resnet152', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('bam_resnet18', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('bam_resnet18', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('bam_resnet34', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('bam_resnet34', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('bam_resnet50', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('bam_resnet50', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('bam_resnet50', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('bat_resnext26ts', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('bat_resnext26ts', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('beit_base_patch16_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('beit_base_patch16_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('beit_base_patch16_224_in22k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('beit_base_patch16_224_in22k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('beit_base_patch16_384', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('beit_base_patch16_384', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('beit_large_patch16_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('beit_large_patch16_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('beit_large_patch16_224_in22k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('beit_large_patch16_224_in22k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('beit_large_patch16_384', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('beit_large_patch16_384', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('beit_large_patch16_512', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('beit_large_patch16_512', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('bn_vgg11', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('bn_vgg11', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('bn_vgg11', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('bn_vgg11b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('bn_vgg11b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('bn_vgg11b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('bn_vgg13', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('bn_vgg13', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('bn_vgg13b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('bn_vgg13b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('bn_vgg16', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('bn_vgg16', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('bn_vgg16b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('bn_vgg16b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('bn_vgg19', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('bn_vgg19', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('bn_vgg19b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('bn_vgg19b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('bninception', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('bninception', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('bninception', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('botnet26t_256', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('botnet26t_256', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('botnet50ts_256', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('botnet50ts_256', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('cait_m36_384', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('cait_m36_384', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('cait_m48_448', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('cait_m48_448', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('cait_s24_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('cait_s24_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('cait_s24_384', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('cait_s24_384', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('cait_s36_384', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('cait_s36_384', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('cait_xs24_384', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('cait_xs24_384', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('cait_xxs24_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('cait_xxs24_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('cait_xxs24_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('cait_xxs24_384', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('cait_xxs24_384', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('cait_xxs36_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('cait_xxs36_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('cait_xxs36_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('cait_xxs36_384', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('cait_xxs36_384', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('cbam_resnet101', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('cbam_resnet101', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('cbam_resnet152', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('cbam_resnet152', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('cbam_resnet18', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('cbam_resnet18', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('cbam_resnet34', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('cbam_resnet34', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('cbam_resnet50', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('cbam_resnet50', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('channelnet', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('channelnet', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('coat_lite_mini', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('coat_lite_mini', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('coat_lite_mini', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('coat_lite_small', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('coat_lite_small', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('coat_lite_small', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('coat_lite_tiny', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('coat_lite_tiny', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('coat_lite_tiny', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('coat_mini', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('coat_mini', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('coat_tiny', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('coat_tiny', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('condensenet74_c4_g4', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('condensenet74_c4_g4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('condensenet74_c4_g4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('condensenet74_c8_g8', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('condensenet74_c8_g8', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('condensenet74_c8_g8', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('convit_base', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convit_base', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convit_small', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convit_small', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convit_tiny', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convit_tiny', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convmixer_1024_20_ks9_p14', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convmixer_1024_20_ks9_p14', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convmixer_1536_20', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convmixer_1536_20', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convmixer_768_32', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convmixer_768_32', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convnext_base', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convnext_base', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convnext_base_384_in22ft1k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convnext_base_384_in22ft1k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convnext_base_in22ft1k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convnext_base_in22ft1k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convnext_base_in22k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convnext_base_in22k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convnext_large', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convnext_large', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convnext_large_384_in22ft1k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convnext_large_384_in22ft1k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convnext_large_in22ft1k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convnext_large_in22ft1k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convnext_large_in22k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convnext_large_in22k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convnext_small', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convnext_small', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convnext_tiny', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('convnext_tiny', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convnext_tiny', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convnext_tiny_hnf', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('convnext_tiny_hnf', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convnext_tiny_hnf', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convnext_xlarge_384_in22ft1k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convnext_xlarge_384_in22ft1k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convnext_xlarge_in22ft1k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convnext_xlarge_in22ft1k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convnext_xlarge_in22k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('convnext_xlarge_in22k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('crossvit_15_240', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('crossvit_15_240', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('crossvit_15_240', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('crossvit_15_dagger_240', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('crossvit_15_dagger_240', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('crossvit_15_dagger_240', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('crossvit_15_dagger_408', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('crossvit_15_dagger_408', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('crossvit_18_240', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('crossvit_18_240', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('crossvit_18_dagger_240', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('crossvit_18_dagger_240', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('crossvit_18_dagger_408', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('crossvit_18_dagger_408', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('crossvit_9_240', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('crossvit_9_240', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('crossvit_9_240', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('crossvit_9_dagger_240', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('crossvit_9_dagger_240', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('crossvit_9_dagger_240', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('crossvit_base_240', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('crossvit_base_240', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('crossvit_small_240', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('crossvit_small_240', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('crossvit_small_240', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('crossvit_tiny_240', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('crossvit_tiny_240', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('crossvit_tiny_240', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('cspdarknet53', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('cspdarknet53', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('cspdarknet53', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('cspdarknet53_iabn', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('cspdarknet53_iabn', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('cspresnet50', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('cspresnet50', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('cspresnet50', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('cspresnet50d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('cspresnet50d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('cspresnet50d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('cspresnet50w', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('cspresnet50w', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('cspresnet50w', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('cspresnext50', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('cspresnext50', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('cspresnext50', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('cspresnext50_iabn', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('cspresnext50_iabn', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('darknet19', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('darknet19', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('darknet53', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('darknet53', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('darknet53', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('darknet53_pytorchcv', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('darknet53_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('darknet53_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('darknet_ref', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('darknet_ref', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('darknet_ref', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('darknet_tiny', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('darknet_tiny', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('darknet_tiny', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('darts', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('darts', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('darts', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('deeplab_mobilenet', 'voc', 'semantic_segmentation', True, 'deeplite_torch_zoo.wrappers.models.segmentation.deeplab'),
+    ('deit_base_distilled_patch16_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('deit_base_distilled_patch16_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('deit_base_distilled_patch16_384', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('deit_base_distilled_patch16_384', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('deit_base_patch16_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('deit_base_patch16_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('deit_base_patch16_384', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('deit_base_patch16_384', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('deit_small_distilled_patch16_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('deit_small_distilled_patch16_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('deit_small_patch16_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('deit_small_patch16_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('deit_small_patch16_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('deit_tiny_distilled_patch16_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('deit_tiny_distilled_patch16_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('deit_tiny_patch16_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('deit_tiny_patch16_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('deit_tiny_patch16_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('densenet121', 'cifar100', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.cifar100.densenet'),
+    ('densenet121', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('densenet121', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('densenet121', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('densenet121_pytorchcv', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('densenet121_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('densenet121_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('densenet121_torchvision', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('densenet121_torchvision', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('densenet121_torchvision', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('densenet121d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('densenet121d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('densenet121d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('densenet161', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('densenet161', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('densenet161', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('densenet161_pytorchcv', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('densenet161_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('densenet161_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('densenet161_torchvision', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('densenet161_torchvision', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('densenet161_torchvision', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('densenet169', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('densenet169', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('densenet169', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('densenet169_pytorchcv', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('densenet169_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('densenet169_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('densenet169_torchvision', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('densenet169_torchvision', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('densenet169_torchvision', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('densenet201', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('densenet201', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('densenet201', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('densenet201_pytorchcv', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('densenet201_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('densenet201_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('densenet201_torchvision', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('densenet201_torchvision', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('densenet201_torchvision', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('densenet264', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('densenet264', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('densenet264d_iabn', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('densenet264d_iabn', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('densenetblur121d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('densenetblur121d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('diapreresnet10', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnet10', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnet101', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnet101', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnet101b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnet101b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnet12', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnet12', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnet14', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnet14', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnet152', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnet152', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnet152b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnet152b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnet16', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnet16', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnet18', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnet18', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnet200', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnet200', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnet200b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnet200b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnet26', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnet26', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnet269b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnet269b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnet34', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnet34', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnet50', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnet50', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnet50b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnet50b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnetbc14b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnetbc14b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnetbc26b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnetbc26b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnetbc38b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diapreresnetbc38b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnet10', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnet10', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnet101', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnet101', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnet101b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnet101b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnet12', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnet12', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnet14', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnet14', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnet152', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnet152', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnet152b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnet152b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnet16', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnet16', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnet18', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnet18', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnet200', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnet200', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnet200b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnet200b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnet26', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnet26', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnet34', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnet34', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnet50', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnet50', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnet50b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnet50b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnetbc14b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnetbc14b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnetbc26b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnetbc26b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnetbc38b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diaresnetbc38b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dicenet_w1', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('dicenet_w1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dicenet_w1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dicenet_w2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('dicenet_w2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dicenet_w2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dicenet_w3d2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('dicenet_w3d2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dicenet_w3d2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dicenet_w3d4', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('dicenet_w3d4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dicenet_w3d4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dicenet_w5d4', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('dicenet_w5d4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dicenet_w5d4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dicenet_w7d8', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('dicenet_w7d8', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dicenet_w7d8', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dicenet_wd2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('dicenet_wd2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dicenet_wd2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dicenet_wd5', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('dicenet_wd5', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dicenet_wd5', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diracnet18v2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('diracnet18v2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diracnet18v2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diracnet34v2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('diracnet34v2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('diracnet34v2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dla102', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('dla102', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dla102', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dla102_pytorchcv', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('dla102_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dla102_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dla102x', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('dla102x', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dla102x', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dla102x2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dla102x2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dla102x2_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dla102x2_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dla102x_pytorchcv', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('dla102x_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dla102x_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dla169', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dla169', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dla169_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dla169_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dla34', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('dla34', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dla34', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dla34_pytorchcv', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('dla34_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dla34_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dla46_c', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('dla46_c', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dla46_c', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dla46c', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('dla46c', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dla46c', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dla46x_c', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('dla46x_c', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dla46x_c', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dla46xc', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('dla46xc', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dla46xc', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dla60', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('dla60', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dla60', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dla60_pytorchcv', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('dla60_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dla60_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dla60_res2net', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('dla60_res2net', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dla60_res2net', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dla60_res2next', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('dla60_res2next', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dla60_res2next', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dla60x', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('dla60x', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dla60x', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dla60x_c', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('dla60x_c', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dla60x_c', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dla60x_pytorchcv', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('dla60x_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dla60x_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dla60xc', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('dla60xc', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dla60xc', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dm_nfnet_f0', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dm_nfnet_f0', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dm_nfnet_f1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dm_nfnet_f1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dm_nfnet_f2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dm_nfnet_f2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dm_nfnet_f3', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dm_nfnet_f3', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dm_nfnet_f4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dm_nfnet_f4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dm_nfnet_f5', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dm_nfnet_f5', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dm_nfnet_f6', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dm_nfnet_f6', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dpn107', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dpn107', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dpn107_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dpn107_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dpn131', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dpn131', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dpn131_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dpn131_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dpn68', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('dpn68', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dpn68', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dpn68_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dpn68_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dpn68b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('dpn68b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dpn68b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dpn68b_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dpn68b_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dpn92', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('dpn92', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dpn92', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dpn98', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dpn98', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('dpn98_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('dpn98_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('drnc26', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('drnc26', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('drnc42', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('drnc42', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('drnc58', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('drnc58', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('drnd105', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('drnd105', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('drnd22', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('drnd22', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('drnd38', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('drnd38', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('drnd54', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('drnd54', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('eca_botnext26ts_256', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('eca_botnext26ts_256', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('eca_halonext26ts', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('eca_halonext26ts', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('eca_nfnet_l0', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('eca_nfnet_l0', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('eca_nfnet_l0', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('eca_nfnet_l1', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('eca_nfnet_l1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('eca_nfnet_l1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('eca_nfnet_l2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('eca_nfnet_l2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('eca_nfnet_l3', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('eca_nfnet_l3', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('eca_resnet33ts', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('eca_resnet33ts', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('eca_resnet33ts', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('eca_resnext26ts', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('eca_resnext26ts', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('eca_resnext26ts', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('eca_vovnet39b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('eca_vovnet39b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('eca_vovnet39b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ecaresnet101d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ecaresnet101d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ecaresnet101d_pruned', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ecaresnet101d_pruned', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ecaresnet200d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ecaresnet200d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ecaresnet269d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ecaresnet269d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ecaresnet26t', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('ecaresnet26t', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ecaresnet26t', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ecaresnet50d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ecaresnet50d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ecaresnet50d_pruned', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ecaresnet50d_pruned', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ecaresnet50t', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('ecaresnet50t', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ecaresnet50t', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ecaresnetlight', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ecaresnetlight', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ecaresnext26t_32x4d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('ecaresnext26t_32x4d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ecaresnext26t_32x4d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ecaresnext50t_32x4d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('ecaresnext50t_32x4d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ecaresnext50t_32x4d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_b0', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_b0', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_b0', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_b0_pytorchcv', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_b0_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b0_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b0b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_b0b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b0b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b0c', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_b0c', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b0c', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b1', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_b1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_b1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_b1_pruned', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_b1_pruned', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_b1_pytorchcv', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_b1_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b1_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b1b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_b1b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b1b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b1c', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_b1c', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b1c', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_b2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_b2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_b2_pruned', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_b2_pruned', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_b2_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b2_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b2a', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_b2a', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_b2a', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_b2b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_b2b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b2b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b2c', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_b2c', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b2c', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b3', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_b3', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_b3', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_b3_pruned', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_b3_pruned', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_b3_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b3_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b3a', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_b3a', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_b3a', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_b3b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_b3b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b3b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b3c', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_b3c', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b3c', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b4', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_b4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_b4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_b4_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b4_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b4b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_b4b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b4b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b4c', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_b4c', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b4c', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b5', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_b5', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_b5', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_b5_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b5_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b5b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_b5b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b5b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b5c', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_b5c', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b5c', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b6', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_b6', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_b6', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_b6_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b6_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b6b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_b6b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b6b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b6c', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_b6c', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b6c', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b7', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_b7', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_b7', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_b7_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b7_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b7b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_b7b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b7b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b7c', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_b7c', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b7c', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b8', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_b8', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_b8', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_b8_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b8_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b8c', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_b8c', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_b8c', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_cc_b0_4e', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_cc_b0_4e', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_cc_b0_4e', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_cc_b0_8e', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_cc_b0_8e', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_cc_b0_8e', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_cc_b1_8e', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_cc_b1_8e', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_cc_b1_8e', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_edge_large_b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_edge_large_b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_edge_large_b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_edge_medium_b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_edge_medium_b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_edge_medium_b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_edge_small_b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_edge_small_b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_edge_small_b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('efficientnet_el', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_el', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_el', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_el_pruned', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_el_pruned', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_el_pruned', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_em', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_em', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_em', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_es', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_es', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_es', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_es_pruned', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_es_pruned', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_es_pruned', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_l2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_l2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_lite0', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_lite0', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_lite0', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_lite1', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_lite1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_lite1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_lite2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_lite2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_lite2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_lite3', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_lite3', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_lite3', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_lite4', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnet_lite4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnet_lite4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnetv2_l', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnetv2_l', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnetv2_m', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnetv2_m', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnetv2_m', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnetv2_rw_m', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnetv2_rw_m', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnetv2_rw_m', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnetv2_rw_s', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnetv2_rw_s', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnetv2_rw_s', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnetv2_rw_t', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnetv2_rw_t', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnetv2_rw_t', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnetv2_s', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('efficientnetv2_s', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnetv2_s', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnetv2_xl', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('efficientnetv2_xl', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ens_adv_inception_resnet_v2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('ens_adv_inception_resnet_v2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ens_adv_inception_resnet_v2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ese_vovnet19b_dw', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('ese_vovnet19b_dw', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ese_vovnet19b_dw', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ese_vovnet19b_slim', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('ese_vovnet19b_slim', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ese_vovnet19b_slim', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ese_vovnet19b_slim_dw', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('ese_vovnet19b_slim_dw', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ese_vovnet19b_slim_dw', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ese_vovnet39b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('ese_vovnet39b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ese_vovnet39b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ese_vovnet39b_evos', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('ese_vovnet39b_evos', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ese_vovnet39b_evos', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ese_vovnet57b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ese_vovnet57b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ese_vovnet99b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ese_vovnet99b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ese_vovnet99b_iabn', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ese_vovnet99b_iabn', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('espnetv2_w1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('espnetv2_w1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('espnetv2_w2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('espnetv2_w2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('espnetv2_w3d2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('espnetv2_w3d2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('espnetv2_w5d4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('espnetv2_w5d4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('espnetv2_wd2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('espnetv2_wd2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('fasterrcnn_resnet50_fpn', 'coco', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.mask_rcnn'),
+    ('fastseresnet101b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('fastseresnet101b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('fbnet_cb', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('fbnet_cb', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('fbnet_cb', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('fbnetc_100', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('fbnetc_100', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('fbnetc_100', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('fbnetv3_b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('fbnetv3_b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('fbnetv3_b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('fbnetv3_d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('fbnetv3_d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('fbnetv3_d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('fbnetv3_g', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('fbnetv3_g', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('fbnetv3_g', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('fcn32', 'voc', 'semantic_segmentation', True, 'deeplite_torch_zoo.wrappers.models.segmentation.fcn'),
+    ('fdmobilenet_w1', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('fdmobilenet_w1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('fdmobilenet_w1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('fdmobilenet_w3d4', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('fdmobilenet_w3d4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('fdmobilenet_w3d4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('fdmobilenet_wd2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('fdmobilenet_wd2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('fdmobilenet_wd2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('fdmobilenet_wd4', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('fdmobilenet_wd4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('fdmobilenet_wd4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('fishnet150', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('fishnet150', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('fishnet150', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('fishnet99', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('fishnet99', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('gc_efficientnetv2_rw_t', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('gc_efficientnetv2_rw_t', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gc_efficientnetv2_rw_t', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gcresnet33ts', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('gcresnet33ts', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gcresnet33ts', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gcresnet50t', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('gcresnet50t', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gcresnet50t', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gcresnext26ts', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('gcresnext26ts', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gcresnext26ts', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gcresnext50ts', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('gcresnext50ts', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gcresnext50ts', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gernet_l', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('gernet_l', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gernet_l', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gernet_m', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('gernet_m', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gernet_m', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gernet_s', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('gernet_s', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gernet_s', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ghostnet', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('ghostnet', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('ghostnet_050', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('ghostnet_050', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ghostnet_050', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ghostnet_100', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('ghostnet_100', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ghostnet_100', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ghostnet_130', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('ghostnet_130', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ghostnet_130', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_inception_v3', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('gluon_inception_v3', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_inception_v3', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_resnet101_v1b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_resnet101_v1b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_resnet101_v1c', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_resnet101_v1c', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_resnet101_v1d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_resnet101_v1d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_resnet101_v1s', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_resnet101_v1s', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_resnet152_v1b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_resnet152_v1b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_resnet152_v1c', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_resnet152_v1c', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_resnet152_v1d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_resnet152_v1d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_resnet152_v1s', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_resnet152_v1s', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_resnet18_v1b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('gluon_resnet18_v1b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_resnet18_v1b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_resnet34_v1b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('gluon_resnet34_v1b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_resnet34_v1b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_resnet50_v1b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('gluon_resnet50_v1b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_resnet50_v1b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_resnet50_v1c', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('gluon_resnet50_v1c', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_resnet50_v1c', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_resnet50_v1d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('gluon_resnet50_v1d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_resnet50_v1d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_resnet50_v1s', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('gluon_resnet50_v1s', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_resnet50_v1s', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_resnext101_32x4d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_resnext101_32x4d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_resnext101_64x4d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_resnext101_64x4d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_resnext50_32x4d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('gluon_resnext50_32x4d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_resnext50_32x4d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_senet154', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_senet154', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_seresnext101_32x4d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_seresnext101_32x4d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_seresnext101_64x4d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_seresnext101_64x4d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_seresnext50_32x4d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('gluon_seresnext50_32x4d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_seresnext50_32x4d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_xception65', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('gluon_xception65', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gluon_xception65', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gmixer_12_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('gmixer_12_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gmixer_12_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gmixer_24_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('gmixer_24_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gmixer_24_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gmlp_b16_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gmlp_b16_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gmlp_s16_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('gmlp_s16_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gmlp_s16_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gmlp_ti16_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('gmlp_ti16_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('gmlp_ti16_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('googlenet', 'cifar100', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.cifar100.googlenet'),
+    ('googlenet', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('googlenet', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('halo2botnet50ts_256', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('halo2botnet50ts_256', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('halonet26t', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('halonet26t', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('halonet50ts', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('halonet50ts', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('halonet_h1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('halonet_h1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('haloregnetz_b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('haloregnetz_b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('haloregnetz_b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('hardcorenas_a', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('hardcorenas_a', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('hardcorenas_b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('hardcorenas_b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('hardcorenas_c', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('hardcorenas_c', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('hardcorenas_d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('hardcorenas_d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('hardcorenas_e', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('hardcorenas_e', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('hardcorenas_f', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('hardcorenas_f', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('hardnet39ds', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('hardnet39ds', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('hardnet39ds', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('hardnet68', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('hardnet68', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('hardnet68', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('hardnet68ds', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('hardnet68ds', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('hardnet68ds', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('hardnet85', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('hardnet85', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('hrnet_w18', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('hrnet_w18', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('hrnet_w18', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('hrnet_w18_small', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('hrnet_w18_small', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('hrnet_w18_small', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('hrnet_w18_small_v1', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('hrnet_w18_small_v1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('hrnet_w18_small_v1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('hrnet_w18_small_v2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('hrnet_w18_small_v2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('hrnet_w18_small_v2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('hrnet_w18_small_v2_pytorchcv', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('hrnet_w18_small_v2_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('hrnet_w18_small_v2_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('hrnet_w30', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('hrnet_w30', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('hrnet_w32', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('hrnet_w32', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('hrnet_w40', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('hrnet_w40', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('hrnet_w44', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('hrnet_w44', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('hrnet_w48', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('hrnet_w48', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('hrnet_w64', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('hrnet_w64', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('hrnetv2_w18', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('hrnetv2_w18', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('hrnetv2_w18', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('hrnetv2_w30', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('hrnetv2_w30', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('hrnetv2_w32', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('hrnetv2_w32', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('hrnetv2_w40', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('hrnetv2_w40', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('hrnetv2_w44', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('hrnetv2_w44', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('hrnetv2_w48', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('hrnetv2_w48', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('hrnetv2_w64', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('hrnetv2_w64', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('ibn_densenet121', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('ibn_densenet121', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('ibn_densenet121', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('ibn_densenet161', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('ibn_densenet161', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('ibn_densenet169', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('ibn_densenet169', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('ibn_densenet169', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('ibn_densenet201', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('ibn_densenet201', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('ibn_resnet101', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('ibn_resnet101', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('ibn_resnet152', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('ibn_resnet152', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('ibn_resnet50', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('ibn_resnet50', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('ibn_resnet50', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('ibn_resnext101_32x4d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('ibn_resnext101_32x4d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('ibn_resnext101_64x4d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('ibn_resnext101_64x4d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('ibn_resnext50_32x4d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('ibn_resnext50_32x4d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('ibnb_resnet101', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('ibnb_resnet101', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('ibnb_resnet152', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('ibnb_resnet152', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('ibnb_resnet50', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('ibnb_resnet50', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('ibnb_resnet50', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('ig_resnext101_32x16d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ig_resnext101_32x16d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ig_resnext101_32x32d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ig_resnext101_32x32d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ig_resnext101_32x48d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ig_resnext101_32x48d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ig_resnext101_32x8d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ig_resnext101_32x8d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('igcv3_w1', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('igcv3_w1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('igcv3_w1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('igcv3_w3d4', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('igcv3_w3d4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('igcv3_w3d4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('igcv3_wd2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('igcv3_wd2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('igcv3_wd2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('igcv3_wd4', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('igcv3_wd4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('igcv3_wd4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('inception_resnet_v2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('inception_resnet_v2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('inception_resnet_v2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('inception_v3', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('inception_v3', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('inception_v3', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('inception_v3_torchvision', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('inception_v3_torchvision', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('inception_v4', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('inception_v4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('inception_v4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('irevnet301', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('irevnet301', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('isqrtcovresnet101', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('isqrtcovresnet101', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('isqrtcovresnet101b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('isqrtcovresnet101b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('isqrtcovresnet18', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('isqrtcovresnet18', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('isqrtcovresnet34', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('isqrtcovresnet34', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('isqrtcovresnet50', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('isqrtcovresnet50', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('isqrtcovresnet50b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('isqrtcovresnet50b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('jx_nest_base', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('jx_nest_base', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('jx_nest_small', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('jx_nest_small', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('jx_nest_tiny', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('jx_nest_tiny', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('jx_nest_tiny', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('lambda_resnet26rpt_256', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('lambda_resnet26rpt_256', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('lambda_resnet26t', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('lambda_resnet26t', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('lambda_resnet26t', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('lambda_resnet50ts', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('lambda_resnet50ts', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('lambda_resnet50ts', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('lamhalobotnet50ts_256', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('lamhalobotnet50ts_256', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('lcnet_035', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('lcnet_035', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('lcnet_035', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('lcnet_050', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('lcnet_050', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('lcnet_050', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('lcnet_075', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('lcnet_075', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('lcnet_075', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('lcnet_100', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('lcnet_100', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('lcnet_100', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('lcnet_150', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('lcnet_150', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('lcnet_150', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('legacy_senet154', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('legacy_senet154', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('legacy_seresnet101', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('legacy_seresnet101', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('legacy_seresnet101', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('legacy_seresnet152', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('legacy_seresnet152', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('legacy_seresnet18', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('legacy_seresnet18', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('legacy_seresnet18', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('legacy_seresnet34', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('legacy_seresnet34', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('legacy_seresnet34', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('legacy_seresnet50', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('legacy_seresnet50', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('legacy_seresnet50', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('legacy_seresnext101_32x4d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('legacy_seresnext101_32x4d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('legacy_seresnext26_32x4d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('legacy_seresnext26_32x4d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('legacy_seresnext26_32x4d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('legacy_seresnext50_32x4d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('legacy_seresnext50_32x4d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('lenet5', 'mnist', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.mnist.lenet'),
+    ('levit_128', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('levit_128', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('levit_128s', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('levit_128s', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('levit_192', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('levit_192', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('levit_256', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('levit_256', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('levit_384', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('levit_384', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mb1_ssd', 'voc', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.ssd'),
+    ('mb2_ssd', 'coco', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.ssd'),
+    ('mb2_ssd', 'voc', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.ssd'),
+    ('mb2_ssd_lite', 'person_detection', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.ssd'),
+    ('mb2_ssd_lite', 'voc', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.ssd'),
+    ('menet108_8x1_g3', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('menet108_8x1_g3', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('menet108_8x1_g3', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('menet128_8x1_g4', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('menet128_8x1_g4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('menet128_8x1_g4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('menet160_8x1_g8', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('menet160_8x1_g8', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('menet160_8x1_g8', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('menet228_12x1_g3', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('menet228_12x1_g3', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('menet228_12x1_g3', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('menet256_12x1_g4', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('menet256_12x1_g4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('menet256_12x1_g4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('menet348_12x1_g3', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('menet348_12x1_g3', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('menet348_12x1_g3', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('menet352_12x1_g8', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('menet352_12x1_g8', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('menet352_12x1_g8', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('menet456_24x1_g3', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('menet456_24x1_g3', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('menet456_24x1_g3', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mixer_b16_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mixer_b16_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mixer_b16_224_in21k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mixer_b16_224_in21k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mixer_b16_224_miil', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mixer_b16_224_miil', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mixer_b16_224_miil_in21k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mixer_b16_224_miil_in21k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mixer_b32_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mixer_b32_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mixer_b32_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mixer_l16_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mixer_l16_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mixer_l16_224_in21k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mixer_l16_224_in21k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mixer_l32_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mixer_l32_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mixer_s16_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mixer_s16_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mixer_s16_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mixer_s32_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mixer_s32_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mixer_s32_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mixnet_l', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mixnet_l', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mixnet_l', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mixnet_l_pytorchcv', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mixnet_l_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mixnet_l_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mixnet_m', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mixnet_m', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mixnet_m', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mixnet_m_pytorchcv', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mixnet_m_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mixnet_m_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mixnet_s', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mixnet_s', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mixnet_s', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mixnet_s_pytorchcv', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mixnet_s_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mixnet_s_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mixnet_xl', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mixnet_xl', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mixnet_xl', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mixnet_xxl', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mixnet_xxl', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mixnet_xxl', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mlp2', 'mnist', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.mnist.mlp'),
+    ('mlp4', 'mnist', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.mnist.mlp'),
+    ('mlp8', 'mnist', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.mnist.mlp'),
+    ('mnasnet0_5', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mnasnet0_5', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('mnasnet0_5', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('mnasnet0_75', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mnasnet0_75', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('mnasnet0_75', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('mnasnet1_0', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mnasnet1_0', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('mnasnet1_0', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('mnasnet1_3', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mnasnet1_3', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('mnasnet1_3', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('mnasnet_050', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mnasnet_050', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mnasnet_050', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mnasnet_075', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mnasnet_075', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mnasnet_075', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mnasnet_100', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mnasnet_100', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mnasnet_100', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mnasnet_140', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mnasnet_140', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mnasnet_140', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mnasnet_a1', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mnasnet_a1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mnasnet_a1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mnasnet_a1_pytorchcv', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mnasnet_a1_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mnasnet_a1_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mnasnet_b1', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mnasnet_b1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mnasnet_b1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mnasnet_b1_pytorchcv', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mnasnet_b1_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mnasnet_b1_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mnasnet_small', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mnasnet_small', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mnasnet_small', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mnasnet_small_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mnasnet_small_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenet_v1', 'cifar100', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.cifar100.mobilenetv1'),
+    ('mobilenet_v1', 'vww', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.vww.mobilenetv1'),
+    ('mobilenet_v1_0.25', 'vww', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.vww.mobilenetv1'),
+    ('mobilenet_v1_0.25_96px', 'vww', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.vww.mobilenetv1'),
+    ('mobilenet_v2', 'cifar100', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.cifar100.mobilenetv2'),
+    ('mobilenet_v2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenet_v2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('mobilenet_v2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('mobilenet_v2', 'tinyimagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.tinyimagenet.mobilenet'),
+    ('mobilenet_v2_0_35', 'imagenet10', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet10.mobilenetv2'),
+    ('mobilenet_v3_large', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenet_v3_large', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('mobilenet_v3_large', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('mobilenet_v3_small', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenet_v3_small', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('mobilenet_v3_small', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('mobilenet_w1', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenet_w1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenet_w1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenet_w3d4', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenet_w3d4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenet_w3d4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenet_wd2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenet_wd2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenet_wd2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenet_wd4', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenet_wd4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenet_wd4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetb_w1', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenetb_w1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetb_w1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetb_w3d4', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenetb_w3d4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetb_w3d4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetb_wd2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenetb_wd2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetb_wd2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetb_wd4', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenetb_wd4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetb_wd4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv2_035', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenetv2_035', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mobilenetv2_035', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mobilenetv2_050', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenetv2_050', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mobilenetv2_050', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mobilenetv2_075', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenetv2_075', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mobilenetv2_075', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mobilenetv2_100', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenetv2_100', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mobilenetv2_100', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mobilenetv2_110d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenetv2_110d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mobilenetv2_110d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mobilenetv2_120d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenetv2_120d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mobilenetv2_120d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mobilenetv2_140', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenetv2_140', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mobilenetv2_140', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mobilenetv2_w035', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenetv2_w035', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.zoo_models'),
+    ('mobilenetv2_w1', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenetv2_w1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv2_w1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv2_w3d4', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenetv2_w3d4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv2_w3d4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv2_wd2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenetv2_wd2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv2_wd2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv2_wd4', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenetv2_wd4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv2_wd4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv2b_w1', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenetv2b_w1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv2b_w1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv2b_w3d4', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenetv2b_w3d4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv2b_w3d4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv2b_wd2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenetv2b_wd2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv2b_wd2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv2b_wd4', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenetv2b_wd4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv2b_wd4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv3_large', 'vww', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.vww.mobilenetv3'),
+    ('mobilenetv3_large_075', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenetv3_large_075', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mobilenetv3_large_075', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mobilenetv3_large_100', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenetv3_large_100', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mobilenetv3_large_100', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mobilenetv3_large_100_miil', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenetv3_large_100_miil', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mobilenetv3_large_100_miil', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mobilenetv3_large_100_miil_in21k', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenetv3_large_100_miil_in21k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mobilenetv3_large_100_miil_in21k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mobilenetv3_large_w1', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenetv3_large_w1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv3_large_w1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv3_large_w3d4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv3_large_w3d4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv3_large_w5d4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv3_large_w5d4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv3_large_w7d20', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv3_large_w7d20', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv3_large_wd2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv3_large_wd2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv3_rw', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenetv3_rw', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mobilenetv3_rw', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mobilenetv3_small', 'vww', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.vww.mobilenetv3'),
+    ('mobilenetv3_small_050', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenetv3_small_050', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mobilenetv3_small_050', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mobilenetv3_small_075', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenetv3_small_075', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mobilenetv3_small_075', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mobilenetv3_small_100', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('mobilenetv3_small_100', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mobilenetv3_small_100', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('mobilenetv3_small_w1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv3_small_w1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv3_small_w3d4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv3_small_w3d4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv3_small_w5d4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv3_small_w5d4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv3_small_w7d20', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv3_small_w7d20', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv3_small_wd2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobilenetv3_small_wd2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('mobileone_s0', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.mobileone'),
+    ('mobileone_s1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.mobileone'),
+    ('mobileone_s2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.mobileone'),
+    ('mobileone_s3', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.mobileone'),
+    ('mobileone_s4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.mobileone'),
+    ('msdnet22', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('msdnet22', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('nasnet_4a1056', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('nasnet_4a1056', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('nasnet_4a1056', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('nasnetalarge', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nasnetalarge', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nest_base', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nest_base', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nest_small', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nest_small', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nest_tiny', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('nest_tiny', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nest_tiny', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nf_ecaresnet101', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nf_ecaresnet101', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nf_ecaresnet26', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('nf_ecaresnet26', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nf_ecaresnet26', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nf_ecaresnet50', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('nf_ecaresnet50', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nf_ecaresnet50', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nf_regnet_b0', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('nf_regnet_b0', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nf_regnet_b0', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nf_regnet_b1', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('nf_regnet_b1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nf_regnet_b1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nf_regnet_b2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('nf_regnet_b2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nf_regnet_b2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nf_regnet_b3', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('nf_regnet_b3', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nf_regnet_b3', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nf_regnet_b4', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('nf_regnet_b4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nf_regnet_b4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nf_regnet_b5', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('nf_regnet_b5', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nf_regnet_b5', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nf_resnet101', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nf_resnet101', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nf_resnet26', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('nf_resnet26', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nf_resnet26', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nf_resnet50', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('nf_resnet50', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nf_resnet50', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nf_seresnet101', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nf_seresnet101', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nf_seresnet26', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('nf_seresnet26', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nf_seresnet26', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nf_seresnet50', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('nf_seresnet50', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nf_seresnet50', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nfnet_f0', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nfnet_f0', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nfnet_f0s', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nfnet_f0s', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nfnet_f1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nfnet_f1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nfnet_f1s', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nfnet_f1s', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nfnet_f2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nfnet_f2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nfnet_f2s', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nfnet_f2s', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nfnet_f3', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nfnet_f3', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nfnet_f3s', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nfnet_f3s', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nfnet_f4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nfnet_f4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nfnet_f4s', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nfnet_f4s', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nfnet_f5', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nfnet_f5', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nfnet_f5s', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nfnet_f5s', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nfnet_f6', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nfnet_f6', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nfnet_f6s', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nfnet_f6s', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nfnet_f7', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nfnet_f7', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nfnet_f7s', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nfnet_f7s', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nfnet_l0', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('nfnet_l0', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('nfnet_l0', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('octresnet10_ad2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('octresnet10_ad2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('octresnet50b_ad2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('octresnet50b_ad2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('peleenet', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('peleenet', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('peleenet', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('pit_b_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('pit_b_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('pit_b_distilled_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('pit_b_distilled_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('pit_s_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('pit_s_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('pit_s_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('pit_s_distilled_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('pit_s_distilled_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('pit_ti_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('pit_ti_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('pit_ti_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('pit_ti_distilled_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('pit_ti_distilled_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('pit_xs_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('pit_xs_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('pit_xs_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('pit_xs_distilled_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('pit_xs_distilled_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('pnasnet5large', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('pnasnet5large', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('pre_act_resnet18', 'cifar100', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.cifar100.preact_resnet'),
+    ('preresnet10', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('preresnet10', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet10', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet101', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('preresnet101', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet101', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet101b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('preresnet101b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet101b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet12', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('preresnet12', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet12', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet14', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('preresnet14', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet14', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet152', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet152', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet152b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet152b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet16', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('preresnet16', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet16', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet18', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('preresnet18', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet18', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet18_w3d4', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('preresnet18_w3d4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet18_w3d4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet18_wd2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('preresnet18_wd2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet18_wd2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet18_wd4', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('preresnet18_wd4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet18_wd4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet200', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet200', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet200b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet200b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet26', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('preresnet26', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet26', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet269b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet269b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet34', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('preresnet34', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet34', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet50', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('preresnet50', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet50', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet50b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('preresnet50b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnet50b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnetbc14b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('preresnetbc14b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnetbc14b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnetbc26b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('preresnetbc26b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnetbc26b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnetbc38b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('preresnetbc38b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('preresnetbc38b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('proxylessnas_cpu', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('proxylessnas_cpu', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('proxylessnas_cpu', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('proxylessnas_gpu', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('proxylessnas_gpu', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('proxylessnas_gpu', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('proxylessnas_mobile', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('proxylessnas_mobile', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('proxylessnas_mobile', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('proxylessnas_mobile14', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('proxylessnas_mobile14', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('proxylessnas_mobile14', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('pyramidnet101_a360', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('pyramidnet101_a360', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('q_googlenet', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models_quantized'),
+    ('q_inception_v3', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models_quantized'),
+    ('q_mobilenet_v2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models_quantized'),
+    ('q_mobilenet_v3_large', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models_quantized'),
+    ('q_resnet18', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models_quantized'),
+    ('q_resnet50', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models_quantized'),
+    ('q_resnext101_32x8d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models_quantized'),
+    ('q_shufflenet_v2_x0_5', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models_quantized'),
+    ('q_shufflenet_v2_x1_0', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models_quantized'),
+    ('q_shufflenet_v2_x1_5', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models_quantized'),
+    ('q_shufflenet_v2_x2_0', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models_quantized'),
+    ('regnetx002', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnetx002', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnetx002', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnetx004', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnetx004', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnetx004', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnetx006', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnetx006', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnetx006', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnetx008', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnetx008', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnetx008', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnetx016', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnetx016', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnetx016', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnetx032', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnetx032', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnetx032', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnetx040', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnetx040', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnetx040', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnetx064', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnetx064', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnetx064', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnetx080', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnetx080', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnetx120', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnetx120', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnetx160', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnetx160', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnetx320', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnetx320', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnetx_002', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnetx_002', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetx_002', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetx_004', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnetx_004', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetx_004', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetx_006', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnetx_006', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetx_006', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetx_008', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnetx_008', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetx_008', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetx_016', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnetx_016', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetx_016', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetx_032', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnetx_032', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetx_032', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetx_040', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnetx_040', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetx_040', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetx_064', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnetx_064', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetx_064', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetx_080', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetx_080', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetx_120', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetx_120', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetx_160', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetx_160', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetx_320', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetx_320', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnety002', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnety002', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnety002', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnety004', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnety004', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnety004', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnety006', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnety006', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnety006', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnety008', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnety008', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnety008', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnety016', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnety016', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnety016', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnety032', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnety032', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnety032', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnety040', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnety040', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnety040', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnety064', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnety064', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnety064', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnety080', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnety080', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnety120', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnety120', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnety160', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnety160', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnety320', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnety320', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('regnety_002', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnety_002', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnety_002', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnety_004', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnety_004', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnety_004', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnety_006', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnety_006', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnety_006', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnety_008', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnety_008', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnety_008', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnety_016', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnety_016', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnety_016', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnety_032', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnety_032', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnety_032', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnety_040', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnety_040', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnety_040', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnety_064', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnety_064', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnety_064', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnety_080', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnety_080', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnety_120', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnety_120', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnety_160', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnety_160', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnety_320', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnety_320', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetz_b16', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnetz_b16', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetz_b16', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetz_c16', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnetz_c16', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetz_c16', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetz_d32', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnetz_d32', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetz_d32', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetz_d8', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnetz_d8', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetz_d8', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetz_d8_evob', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnetz_d8_evob', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetz_d8_evob', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetz_d8_evos', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnetz_d8_evos', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetz_d8_evos', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetz_e8', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('regnetz_e8', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('regnetz_e8', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('repvgg_a2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('repvgg_a2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('repvgg_a2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('repvgg_b0', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('repvgg_b0', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('repvgg_b0', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('repvgg_b1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('repvgg_b1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('repvgg_b1g4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('repvgg_b1g4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('repvgg_b2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('repvgg_b2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('repvgg_b2g4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('repvgg_b2g4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('repvgg_b3', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('repvgg_b3', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('repvgg_b3g4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('repvgg_b3g4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('res2net101_26w_4s', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('res2net101_26w_4s', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('res2net50_14w_8s', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('res2net50_14w_8s', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('res2net50_14w_8s', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('res2net50_26w_4s', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('res2net50_26w_4s', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('res2net50_26w_4s', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('res2net50_26w_6s', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('res2net50_26w_6s', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('res2net50_26w_6s', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('res2net50_26w_8s', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('res2net50_26w_8s', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('res2net50_48w_2s', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('res2net50_48w_2s', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('res2net50_48w_2s', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('res2next50', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('res2next50', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('res2next50', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resattnet128', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resattnet128', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resattnet164', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resattnet164', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resattnet200', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resattnet200', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resattnet236', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resattnet236', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resattnet452', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resattnet452', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resattnet56', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resattnet56', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resattnet92', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resattnet92', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resmlp_12_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resmlp_12_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resmlp_12_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resmlp_12_224_dino', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resmlp_12_224_dino', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resmlp_12_224_dino', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resmlp_12_distilled_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resmlp_12_distilled_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resmlp_12_distilled_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resmlp_24_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resmlp_24_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resmlp_24_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resmlp_24_224_dino', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resmlp_24_224_dino', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resmlp_24_224_dino', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resmlp_24_distilled_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resmlp_24_distilled_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resmlp_24_distilled_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resmlp_36_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resmlp_36_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resmlp_36_distilled_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resmlp_36_distilled_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resmlp_big_24_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resmlp_big_24_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resmlp_big_24_224_in22ft1k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resmlp_big_24_224_in22ft1k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resmlp_big_24_distilled_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resmlp_big_24_distilled_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnest101e', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnest101e', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnest14d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnest14d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnest14d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnest200e', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnest200e', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnest269e', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnest269e', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnest26d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnest26d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnest26d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnest50d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnest50d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnest50d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnest50d_1s4x24d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnest50d_1s4x24d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnest50d_1s4x24d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnest50d_4s2x40d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnest50d_4s2x40d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnest50d_4s2x40d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnesta101', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnesta101', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnesta152', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnesta152', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnesta18', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnesta18', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnesta18', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnesta200', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnesta200', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnesta269', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnesta269', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnesta50', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnesta50', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnesta50', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnestabc14', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnestabc14', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnestabc14', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnestabc26', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnestabc26', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnestabc26', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet10', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnet10', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet10', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet101', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet101', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet101_pytorchcv', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnet101_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet101_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet101_torchvision', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('resnet101_torchvision', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('resnet101b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet101b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet101d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet101d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet12', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnet12', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet12', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet14', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnet14', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet14', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet152', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet152', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet152_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet152_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet152_torchvision', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('resnet152_torchvision', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('resnet152b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet152b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet152d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet152d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet16', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnet16', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet16', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet18', 'cifar100', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.cifar100.resnet'),
+    ('resnet18', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnet18', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet18', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet18', 'imagenet10', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet10.resnet'),
+    ('resnet18', 'imagenet16', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet16.resnet'),
+    ('resnet18', 'tinyimagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.tinyimagenet.resnet'),
+    ('resnet18', 'vww', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.vww.resnet'),
+    ('resnet18_pytorchcv', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnet18_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet18_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet18_ssd', 'voc', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.ssd'),
+    ('resnet18_torchvision', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnet18_torchvision', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('resnet18_torchvision', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('resnet18_w3d4', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnet18_w3d4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet18_w3d4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet18_wd2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnet18_wd2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet18_wd2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet18_wd4', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnet18_wd4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet18_wd4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet18d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnet18d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet18d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet200', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet200', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet200_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet200_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet200b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet200b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet200d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet200d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet26', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnet26', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet26', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet26_pytorchcv', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnet26_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet26_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet26d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnet26d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet26d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet26t', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnet26t', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet26t', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet32ts', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnet32ts', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet32ts', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet33ts', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnet33ts', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet33ts', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet34', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnet34', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet34', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet34', 'tinyimagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.tinyimagenet.resnet'),
+    ('resnet34_pytorchcv', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnet34_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet34_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet34_ssd', 'voc', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.ssd'),
+    ('resnet34_torchvision', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnet34_torchvision', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('resnet34_torchvision', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('resnet34d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnet34d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet34d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet50', 'cifar100', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.cifar100.resnet'),
+    ('resnet50', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnet50', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet50', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet50', 'imagenet16', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet16.resnet'),
+    ('resnet50', 'tinyimagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.tinyimagenet.resnet'),
+    ('resnet50', 'vww', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.vww.resnet'),
+    ('resnet50_gn', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnet50_gn', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet50_gn', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet50_pytorchcv', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnet50_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet50_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet50_ssd', 'voc', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.ssd'),
+    ('resnet50_torchvision', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnet50_torchvision', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('resnet50_torchvision', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('resnet50b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnet50b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet50b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnet50d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnet50d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet50d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet50t', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnet50t', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet50t', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet51q', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnet51q', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet51q', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet61q', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnet61q', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnet61q', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resneta10', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resneta10', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resneta10', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resneta101b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resneta101b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resneta152b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resneta152b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resneta18', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resneta18', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resneta18', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resneta50b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resneta50b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resneta50b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnetabc14b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnetabc14b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnetabc14b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnetbc14b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnetbc14b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnetbc14b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnetbc26b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnetbc26b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnetbc26b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnetbc38b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnetbc38b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnetbc38b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnetblur18', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetblur18', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetblur50', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetblur50', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetd101b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnetd101b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnetd152b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnetd152b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnetd50b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnetd50b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnetrs101', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetrs101', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetrs152', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetrs152', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetrs200', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetrs200', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetrs270', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetrs270', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetrs350', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetrs350', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetrs420', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetrs420', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetrs50', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnetrs50', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetrs50', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_101', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnetv2_101', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_101', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_101d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_101d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_101x1_bitm', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnetv2_101x1_bitm', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_101x1_bitm', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_101x1_bitm_in21k', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnetv2_101x1_bitm_in21k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_101x1_bitm_in21k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_101x3_bitm', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_101x3_bitm', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_101x3_bitm_in21k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_101x3_bitm_in21k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_152', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_152', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_152d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_152d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_152x2_bit_teacher', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_152x2_bit_teacher', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_152x2_bit_teacher_384', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_152x2_bit_teacher_384', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_152x2_bitm', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_152x2_bitm', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_152x2_bitm_in21k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_152x2_bitm_in21k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_152x4_bitm', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_152x4_bitm', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_152x4_bitm_in21k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_152x4_bitm_in21k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_50', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnetv2_50', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_50', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_50d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnetv2_50d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_50d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_50d_evob', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnetv2_50d_evob', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_50d_evob', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_50d_evos', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnetv2_50d_evos', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_50d_evos', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_50d_gn', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnetv2_50d_gn', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_50d_gn', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_50t', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnetv2_50t', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_50t', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_50x1_bit_distilled', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnetv2_50x1_bit_distilled', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_50x1_bit_distilled', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_50x1_bitm', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnetv2_50x1_bitm', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_50x1_bitm', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_50x1_bitm_in21k', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnetv2_50x1_bitm_in21k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_50x1_bitm_in21k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_50x3_bitm', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_50x3_bitm', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_50x3_bitm_in21k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnetv2_50x3_bitm_in21k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnext101_32x4d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnext101_32x4d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnext101_32x4d_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnext101_32x4d_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnext101_32x8d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnext101_32x8d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnext101_32x8d_torchvision', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('resnext101_32x8d_torchvision', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('resnext101_64x4d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnext101_64x4d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnext101_64x4d_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnext101_64x4d_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnext14_16x4d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnext14_16x4d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnext14_16x4d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnext14_32x2d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnext14_32x2d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnext14_32x2d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnext14_32x4d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnext14_32x4d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnext14_32x4d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnext26_16x4d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnext26_16x4d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnext26_32x2d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnext26_32x2d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnext26_32x2d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnext26_32x4d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnext26_32x4d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnext26_32x4d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnext26ts', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnext26ts', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnext26ts', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnext29_2x64d', 'cifar100', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.cifar100.resnext'),
+    ('resnext38_32x4d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnext38_32x4d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnext50_32x4d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnext50_32x4d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnext50_32x4d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnext50_32x4d_pytorchcv', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnext50_32x4d_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnext50_32x4d_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('resnext50_32x4d_torchvision', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnext50_32x4d_torchvision', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('resnext50_32x4d_torchvision', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('resnext50d_32x4d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('resnext50d_32x4d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('resnext50d_32x4d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('revnet110', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('revnet110', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('revnet164', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('revnet164', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('revnet38', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('revnet38', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('rexnet_100', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('rexnet_100', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('rexnet_100', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('rexnet_130', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('rexnet_130', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('rexnet_130', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('rexnet_150', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('rexnet_150', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('rexnet_150', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('rexnet_200', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('rexnet_200', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('rexnet_200', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('rexnetr_100', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('rexnetr_100', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('rexnetr_100', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('rexnetr_130', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('rexnetr_130', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('rexnetr_130', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('rexnetr_150', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('rexnetr_150', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('rexnetr_150', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('rexnetr_200', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('rexnetr_200', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('rexnetr_200', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('scnet101', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('scnet101', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('scnet101', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('scnet50', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('scnet50', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('scnet50', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('scneta101', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('scneta101', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('scneta50', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('scneta50', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('scneta50', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sebotnet33ts_256', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('sebotnet33ts_256', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('sehalonet33ts', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('sehalonet33ts', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('selecsls42', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('selecsls42', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('selecsls42', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('selecsls42_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('selecsls42_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('selecsls42b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('selecsls42b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('selecsls42b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('selecsls42b_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('selecsls42b_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('selecsls60', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('selecsls60', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('selecsls60', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('selecsls60_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('selecsls60_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('selecsls60b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('selecsls60b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('selecsls60b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('selecsls60b_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('selecsls60b_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('selecsls84', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('selecsls84', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('selecsls84', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('selecsls84_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('selecsls84_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('semnasnet_050', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('semnasnet_050', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('semnasnet_050', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('semnasnet_075', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('semnasnet_075', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('semnasnet_075', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('semnasnet_100', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('semnasnet_100', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('semnasnet_100', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('semnasnet_140', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('semnasnet_140', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('semnasnet_140', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('senet103', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('senet103', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('senet154', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('senet154', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('senet154_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('senet154_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('senet16', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('senet16', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('senet16', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('senet28', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('senet28', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('senet28', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('senet40', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('senet40', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('senet52', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('senet52', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sepreresnet10', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('sepreresnet10', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sepreresnet10', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sepreresnet101', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sepreresnet101', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sepreresnet101b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sepreresnet101b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sepreresnet12', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('sepreresnet12', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sepreresnet12', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sepreresnet14', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sepreresnet14', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sepreresnet152', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sepreresnet152', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sepreresnet152b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sepreresnet152b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sepreresnet16', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('sepreresnet16', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sepreresnet16', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sepreresnet18', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('sepreresnet18', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sepreresnet18', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sepreresnet200', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sepreresnet200', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sepreresnet200b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sepreresnet200b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sepreresnet26', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('sepreresnet26', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sepreresnet26', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sepreresnet34', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sepreresnet34', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sepreresnet50', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sepreresnet50', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sepreresnet50b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('sepreresnet50b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sepreresnet50b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sepreresnetbc26b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('sepreresnetbc26b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sepreresnetbc26b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sepreresnetbc38b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('sepreresnetbc38b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sepreresnetbc38b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnet10', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('seresnet10', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnet10', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnet101', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('seresnet101', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('seresnet101_pytorchcv', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('seresnet101_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnet101_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnet101b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnet101b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnet12', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('seresnet12', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnet12', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnet14', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('seresnet14', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnet14', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnet152', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('seresnet152', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('seresnet152_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnet152_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnet152b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnet152b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnet152d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('seresnet152d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('seresnet16', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('seresnet16', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnet16', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnet18', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('seresnet18', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('seresnet18', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('seresnet18_pytorchcv', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('seresnet18_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnet18_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnet200', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnet200', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnet200b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnet200b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnet200d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('seresnet200d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('seresnet26', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('seresnet26', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnet26', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnet269d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('seresnet269d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('seresnet33ts', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('seresnet33ts', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('seresnet33ts', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('seresnet34', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('seresnet34', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('seresnet34', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('seresnet34_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnet34_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnet50', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('seresnet50', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('seresnet50', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('seresnet50_pytorchcv', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('seresnet50_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnet50_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnet50b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('seresnet50b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnet50b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnet50t', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('seresnet50t', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('seresnet50t', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('seresnetbc26b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('seresnetbc26b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnetbc26b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnetbc38b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('seresnetbc38b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnetbc38b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnext101_32x4d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('seresnext101_32x4d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('seresnext101_32x4d_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnext101_32x4d_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnext101_32x8d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('seresnext101_32x8d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('seresnext101_64x4d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnext101_64x4d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnext26d_32x4d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('seresnext26d_32x4d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('seresnext26d_32x4d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('seresnext26t_32x4d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('seresnext26t_32x4d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('seresnext26t_32x4d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('seresnext26tn_32x4d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('seresnext26tn_32x4d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('seresnext26tn_32x4d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('seresnext26ts', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('seresnext26ts', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('seresnext26ts', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('seresnext50_32x4d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('seresnext50_32x4d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('seresnext50_32x4d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('seresnext50_32x4d_pytorchcv', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('seresnext50_32x4d_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('seresnext50_32x4d_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sharesnet101', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sharesnet101', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sharesnet101b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sharesnet101b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sharesnet152', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sharesnet152', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sharesnet152b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sharesnet152b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sharesnet18', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sharesnet18', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sharesnet34', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sharesnet34', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sharesnet50', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sharesnet50', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sharesnet50b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sharesnet50b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenet_g1_w1', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('shufflenet_g1_w1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenet_g1_w1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenet_g1_w3d4', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('shufflenet_g1_w3d4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenet_g1_w3d4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenet_g1_wd2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('shufflenet_g1_wd2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenet_g1_wd2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenet_g1_wd4', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('shufflenet_g1_wd4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenet_g1_wd4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenet_g2_w1', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('shufflenet_g2_w1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenet_g2_w1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenet_g3_w1', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('shufflenet_g3_w1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenet_g3_w1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenet_g3_w3d4', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('shufflenet_g3_w3d4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenet_g3_w3d4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenet_g3_wd2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('shufflenet_g3_wd2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenet_g3_wd2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenet_g3_wd4', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('shufflenet_g3_wd4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenet_g3_wd4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenet_g4_w1', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('shufflenet_g4_w1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenet_g4_w1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenet_g8_w1', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('shufflenet_g8_w1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenet_g8_w1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenet_v2_1_0', 'cifar100', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.cifar100.shufflenetv2'),
+    ('shufflenet_v2_x0_5', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('shufflenet_v2_x0_5', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('shufflenet_v2_x0_5', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('shufflenet_v2_x1_0', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('shufflenet_v2_x1_0', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('shufflenet_v2_x1_0', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('shufflenet_v2_x1_5', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('shufflenet_v2_x1_5', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('shufflenet_v2_x1_5', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('shufflenet_v2_x2_0', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('shufflenet_v2_x2_0', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('shufflenet_v2_x2_0', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('shufflenetv2_w1', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('shufflenetv2_w1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenetv2_w1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenetv2_w2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('shufflenetv2_w2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenetv2_w2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenetv2_w3d2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('shufflenetv2_w3d2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenetv2_w3d2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenetv2_wd2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('shufflenetv2_wd2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenetv2_wd2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenetv2b_w1', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('shufflenetv2b_w1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenetv2b_w1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenetv2b_w2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('shufflenetv2b_w2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenetv2b_w2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenetv2b_w3d2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('shufflenetv2b_w3d2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenetv2b_w3d2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenetv2b_wd2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('shufflenetv2b_wd2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('shufflenetv2b_wd2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sknet101', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sknet101', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sknet152', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sknet152', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sknet50', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sknet50', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('skresnet18', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('skresnet18', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('skresnet18', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('skresnet34', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('skresnet34', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('skresnet34', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('skresnet50', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('skresnet50', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('skresnet50', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('skresnet50d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('skresnet50d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('skresnet50d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('skresnext50_32x4d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('skresnext50_32x4d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('skresnext50_32x4d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('sparsenet121', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sparsenet121', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sparsenet161', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sparsenet161', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sparsenet169', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sparsenet169', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sparsenet201', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sparsenet201', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sparsenet264', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sparsenet264', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('spnasnet', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('spnasnet', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('spnasnet', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('spnasnet_100', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('spnasnet_100', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('spnasnet_100', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('sqnxt23_w1', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('sqnxt23_w1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sqnxt23_w1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sqnxt23_w2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('sqnxt23_w2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sqnxt23_w2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sqnxt23_w3d2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('sqnxt23_w3d2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sqnxt23_w3d2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sqnxt23v5_w1', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('sqnxt23v5_w1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sqnxt23v5_w1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sqnxt23v5_w2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('sqnxt23v5_w2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sqnxt23v5_w2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sqnxt23v5_w3d2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('sqnxt23v5_w3d2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('sqnxt23v5_w3d2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('squeezenet1_0', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('squeezenet1_0', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('squeezenet1_0', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('squeezenet1_1', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('squeezenet1_1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('squeezenet1_1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('squeezenet_v1_0', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('squeezenet_v1_0', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('squeezenet_v1_0', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('squeezenet_v1_1', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('squeezenet_v1_1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('squeezenet_v1_1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('squeezeresnet_v1_0', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('squeezeresnet_v1_0', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('squeezeresnet_v1_0', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('squeezeresnet_v1_1', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('squeezeresnet_v1_1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('squeezeresnet_v1_1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('ssl_resnet18', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('ssl_resnet18', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ssl_resnet18', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ssl_resnet50', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('ssl_resnet50', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ssl_resnet50', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ssl_resnext101_32x16d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ssl_resnext101_32x16d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ssl_resnext101_32x4d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ssl_resnext101_32x4d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ssl_resnext101_32x8d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ssl_resnext101_32x8d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ssl_resnext50_32x4d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('ssl_resnext50_32x4d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('ssl_resnext50_32x4d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('swin_base_patch4_window12_384', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('swin_base_patch4_window12_384', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('swin_base_patch4_window12_384_in22k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('swin_base_patch4_window12_384_in22k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('swin_base_patch4_window7_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('swin_base_patch4_window7_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('swin_base_patch4_window7_224_in22k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('swin_base_patch4_window7_224_in22k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('swin_large_patch4_window12_384', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('swin_large_patch4_window12_384', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('swin_large_patch4_window12_384_in22k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('swin_large_patch4_window12_384_in22k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('swin_large_patch4_window7_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('swin_large_patch4_window7_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('swin_large_patch4_window7_224_in22k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('swin_large_patch4_window7_224_in22k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('swin_small_patch4_window7_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('swin_small_patch4_window7_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('swin_tiny_patch4_window7_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('swin_tiny_patch4_window7_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('swin_tiny_patch4_window7_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('swsl_resnet18', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('swsl_resnet18', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('swsl_resnet18', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('swsl_resnet50', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('swsl_resnet50', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('swsl_resnet50', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('swsl_resnext101_32x16d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('swsl_resnext101_32x16d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('swsl_resnext101_32x4d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('swsl_resnext101_32x4d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('swsl_resnext101_32x8d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('swsl_resnext101_32x8d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('swsl_resnext50_32x4d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('swsl_resnext50_32x4d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('swsl_resnext50_32x4d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b0', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_b0', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b0', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b0_ap', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_b0_ap', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b0_ap', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b0_ns', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_b0_ns', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b0_ns', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b1', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_b1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b1_ap', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_b1_ap', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b1_ap', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b1_ns', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_b1_ns', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b1_ns', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_b2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b2_ap', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_b2_ap', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b2_ap', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b2_ns', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_b2_ns', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b2_ns', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b3', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_b3', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b3', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b3_ap', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_b3_ap', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b3_ap', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b3_ns', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_b3_ns', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b3_ns', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b4', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_b4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b4_ap', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_b4_ap', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b4_ap', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b4_ns', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_b4_ns', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b4_ns', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b5', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_b5', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b5', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b5_ap', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_b5_ap', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b5_ap', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b5_ns', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_b5_ns', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b5_ns', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b6', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_b6', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b6', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b6_ap', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_b6_ap', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b6_ap', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b6_ns', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_b6_ns', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b6_ns', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b7', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_b7', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b7', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b7_ap', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_b7_ap', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b7_ap', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b7_ns', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_b7_ns', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b7_ns', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b8', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_b8', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b8', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b8_ap', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_b8_ap', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_b8_ap', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_cc_b0_4e', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_cc_b0_4e', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_cc_b0_4e', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_cc_b0_8e', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_cc_b0_8e', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_cc_b0_8e', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_cc_b1_8e', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_cc_b1_8e', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_cc_b1_8e', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_el', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_el', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_el', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_em', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_em', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_em', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_es', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_es', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_es', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_l2_ns', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_l2_ns', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_l2_ns_475', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_l2_ns_475', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_lite0', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_lite0', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_lite0', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_lite1', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_lite1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_lite1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_lite2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_lite2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_lite2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_lite3', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_lite3', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_lite3', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_lite4', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnet_lite4', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnet_lite4', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnetv2_b0', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnetv2_b0', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnetv2_b0', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnetv2_b1', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnetv2_b1', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnetv2_b1', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnetv2_b2', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnetv2_b2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnetv2_b2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnetv2_b3', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnetv2_b3', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnetv2_b3', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnetv2_l', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnetv2_l', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnetv2_l_in21ft1k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnetv2_l_in21ft1k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnetv2_l_in21k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnetv2_l_in21k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnetv2_m', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnetv2_m', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnetv2_m', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnetv2_m_in21ft1k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnetv2_m_in21ft1k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnetv2_m_in21k', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnetv2_m_in21k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnetv2_m_in21k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnetv2_s', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnetv2_s', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnetv2_s', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnetv2_s_in21ft1k', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnetv2_s_in21ft1k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnetv2_s_in21ft1k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnetv2_s_in21k', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_efficientnetv2_s_in21k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnetv2_s_in21k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnetv2_xl_in21ft1k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnetv2_xl_in21ft1k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnetv2_xl_in21k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_efficientnetv2_xl_in21k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_inception_v3', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_inception_v3', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_inception_v3', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_mixnet_l', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_mixnet_l', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_mixnet_l', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_mixnet_m', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_mixnet_m', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_mixnet_m', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_mixnet_s', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_mixnet_s', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_mixnet_s', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_mobilenetv3_large_075', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_mobilenetv3_large_075', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_mobilenetv3_large_075', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_mobilenetv3_large_100', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_mobilenetv3_large_100', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_mobilenetv3_large_100', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_mobilenetv3_large_minimal_100', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_mobilenetv3_large_minimal_100', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_mobilenetv3_large_minimal_100', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_mobilenetv3_small_075', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_mobilenetv3_small_075', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_mobilenetv3_small_075', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_mobilenetv3_small_100', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_mobilenetv3_small_100', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_mobilenetv3_small_100', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_mobilenetv3_small_minimal_100', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tf_mobilenetv3_small_minimal_100', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tf_mobilenetv3_small_minimal_100', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tinynet_a', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tinynet_a', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tinynet_a', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tinynet_b', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tinynet_b', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tinynet_b', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tinynet_c', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tinynet_c', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tinynet_c', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tinynet_d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tinynet_d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tinynet_d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tinynet_e', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tinynet_e', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tinynet_e', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tnt_b_patch16_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tnt_b_patch16_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tnt_s_patch16_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tnt_s_patch16_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tnt_s_patch16_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tresnet_l', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tresnet_l', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tresnet_l_448', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tresnet_l_448', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tresnet_m', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tresnet_m', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tresnet_m_448', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tresnet_m_448', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tresnet_m_miil_in21k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tresnet_m_miil_in21k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tresnet_xl', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tresnet_xl', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tresnet_xl_448', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tresnet_xl_448', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tv_densenet121', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tv_densenet121', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tv_densenet121', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tv_resnet101', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tv_resnet101', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tv_resnet152', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tv_resnet152', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tv_resnet34', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tv_resnet34', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tv_resnet34', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tv_resnet50', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tv_resnet50', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tv_resnet50', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tv_resnext50_32x4d', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('tv_resnext50_32x4d', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('tv_resnext50_32x4d', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('twins_pcpvt_base', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('twins_pcpvt_base', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('twins_pcpvt_base', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('twins_pcpvt_large', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('twins_pcpvt_large', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('twins_pcpvt_small', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('twins_pcpvt_small', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('twins_pcpvt_small', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('twins_svt_base', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('twins_svt_base', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('twins_svt_large', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('twins_svt_large', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('twins_svt_small', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('twins_svt_small', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('twins_svt_small', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('unet', 'carvana', 'semantic_segmentation', True, 'deeplite_torch_zoo.wrappers.models.segmentation.unet'),
+    ('unet_scse_resnet18', 'carvana', 'semantic_segmentation', True, 'deeplite_torch_zoo.wrappers.models.segmentation.unet'),
+    ('unet_scse_resnet18', 'voc', 'semantic_segmentation', True, 'deeplite_torch_zoo.wrappers.models.segmentation.unet'),
+    ('vgg11', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('vgg11', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vgg11', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vgg11_bn', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('vgg11_bn', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vgg11_bn', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vgg11_bn_torchvision', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('vgg11_bn_torchvision', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('vgg11_pytorchcv', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('vgg11_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('vgg11_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('vgg11_torchvision', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('vgg11_torchvision', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('vgg13', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vgg13', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vgg13_bn', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vgg13_bn', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vgg13_bn_torchvision', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('vgg13_bn_torchvision', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('vgg13_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('vgg13_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('vgg13_torchvision', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('vgg13_torchvision', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('vgg16', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vgg16', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vgg16_bn', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vgg16_bn', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vgg16_bn_torchvision', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('vgg16_bn_torchvision', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('vgg16_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('vgg16_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('vgg16_ssd', 'voc', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.ssd'),
+    ('vgg16_ssd', 'wider_face', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.ssd'),
+    ('vgg16_torchvision', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('vgg16_torchvision', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('vgg19', 'cifar100', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.cifar100.vgg'),
+    ('vgg19', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vgg19', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vgg19', 'tinyimagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.tinyimagenet.vgg'),
+    ('vgg19_bn', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vgg19_bn', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vgg19_bn_torchvision', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('vgg19_bn_torchvision', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('vgg19_pytorchcv', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('vgg19_pytorchcv', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('vgg19_torchvision', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('vgg19_torchvision', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('visformer_small', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('visformer_small', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('visformer_small', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('visformer_tiny', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('visformer_tiny', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('visformer_tiny', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_patch16_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_patch16_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_patch16_224_in21k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_patch16_224_in21k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_patch16_224_miil', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_patch16_224_miil', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_patch16_224_miil_in21k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_patch16_224_miil_in21k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_patch16_384', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_patch16_384', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_patch16_sam_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_patch16_sam_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_patch32_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('vit_base_patch32_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_patch32_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_patch32_224_in21k', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('vit_base_patch32_224_in21k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_patch32_224_in21k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_patch32_384', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_patch32_384', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_patch32_sam_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('vit_base_patch32_sam_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_patch32_sam_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_patch8_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_patch8_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_patch8_224_in21k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_patch8_224_in21k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_r26_s32_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('vit_base_r26_s32_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_r26_s32_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_r50_s16_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_r50_s16_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_r50_s16_224_in21k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_r50_s16_224_in21k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_r50_s16_384', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_r50_s16_384', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_resnet26d_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('vit_base_resnet26d_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_resnet26d_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_resnet50_224_in21k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_resnet50_224_in21k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_resnet50_384', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_resnet50_384', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_resnet50d_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_base_resnet50d_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_giant_patch14_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_giant_patch14_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_gigantic_patch14_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_gigantic_patch14_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_huge_patch14_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_huge_patch14_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_huge_patch14_224_in21k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_huge_patch14_224_in21k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_large_patch16_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_large_patch16_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_large_patch16_224_in21k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_large_patch16_224_in21k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_large_patch16_384', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_large_patch16_384', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_large_patch32_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_large_patch32_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_large_patch32_224_in21k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_large_patch32_224_in21k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_large_patch32_384', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_large_patch32_384', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_large_r50_s32_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_large_r50_s32_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_large_r50_s32_224_in21k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_large_r50_s32_224_in21k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_large_r50_s32_384', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_large_r50_s32_384', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_small_patch16_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('vit_small_patch16_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_small_patch16_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_small_patch16_224_in21k', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('vit_small_patch16_224_in21k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_small_patch16_224_in21k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_small_patch16_384', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_small_patch16_384', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_small_patch32_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('vit_small_patch32_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_small_patch32_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_small_patch32_224_in21k', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('vit_small_patch32_224_in21k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_small_patch32_224_in21k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_small_patch32_384', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_small_patch32_384', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_small_r26_s32_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('vit_small_r26_s32_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_small_r26_s32_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_small_r26_s32_224_in21k', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('vit_small_r26_s32_224_in21k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_small_r26_s32_224_in21k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_small_r26_s32_384', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_small_r26_s32_384', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_small_resnet26d_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('vit_small_resnet26d_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_small_resnet26d_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_small_resnet50d_s16_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_small_resnet50d_s16_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_tiny_patch16_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('vit_tiny_patch16_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_tiny_patch16_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_tiny_patch16_224_in21k', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('vit_tiny_patch16_224_in21k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_tiny_patch16_224_in21k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_tiny_patch16_384', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_tiny_patch16_384', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_tiny_r_s16_p8_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('vit_tiny_r_s16_p8_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_tiny_r_s16_p8_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_tiny_r_s16_p8_224_in21k', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('vit_tiny_r_s16_p8_224_in21k', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_tiny_r_s16_p8_224_in21k', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_tiny_r_s16_p8_384', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vit_tiny_r_s16_p8_384', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vovnet27s', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('vovnet27s', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('vovnet27s', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('vovnet39', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('vovnet39', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('vovnet39', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('vovnet39a', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('vovnet39a', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vovnet39a', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vovnet57', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('vovnet57', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('vovnet57a', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('vovnet57a', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('wide_resnet101_2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('wide_resnet101_2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('wide_resnet101_2_torchvision', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('wide_resnet101_2_torchvision', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('wide_resnet50_2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('wide_resnet50_2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('wide_resnet50_2_torchvision', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('wide_resnet50_2_torchvision', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.torchvision_models'),
+    ('wrn50_2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('wrn50_2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('xception', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('xception', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xception', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xception41', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('xception41', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xception41', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xception65', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('xception65', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xception65', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xception71', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xception71', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_large_24_p16_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_large_24_p16_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_large_24_p16_224_dist', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_large_24_p16_224_dist', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_large_24_p16_384_dist', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_large_24_p16_384_dist', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_large_24_p8_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_large_24_p8_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_large_24_p8_224_dist', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_large_24_p8_224_dist', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_large_24_p8_384_dist', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_large_24_p8_384_dist', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_medium_24_p16_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_medium_24_p16_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_medium_24_p16_224_dist', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_medium_24_p16_224_dist', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_medium_24_p16_384_dist', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_medium_24_p16_384_dist', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_medium_24_p8_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_medium_24_p8_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_medium_24_p8_224_dist', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_medium_24_p8_224_dist', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_medium_24_p8_384_dist', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_medium_24_p8_384_dist', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_nano_12_p16_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('xcit_nano_12_p16_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_nano_12_p16_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_nano_12_p16_224_dist', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('xcit_nano_12_p16_224_dist', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_nano_12_p16_224_dist', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_nano_12_p16_384_dist', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('xcit_nano_12_p16_384_dist', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_nano_12_p16_384_dist', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_nano_12_p8_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('xcit_nano_12_p8_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_nano_12_p8_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_nano_12_p8_224_dist', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('xcit_nano_12_p8_224_dist', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_nano_12_p8_224_dist', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_nano_12_p8_384_dist', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('xcit_nano_12_p8_384_dist', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_nano_12_p8_384_dist', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_small_12_p16_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('xcit_small_12_p16_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_small_12_p16_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_small_12_p16_224_dist', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('xcit_small_12_p16_224_dist', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_small_12_p16_224_dist', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_small_12_p16_384_dist', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('xcit_small_12_p16_384_dist', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_small_12_p16_384_dist', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_small_12_p8_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_small_12_p8_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_small_12_p8_224_dist', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_small_12_p8_224_dist', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_small_12_p8_384_dist', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_small_12_p8_384_dist', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_small_24_p16_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_small_24_p16_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_small_24_p16_224_dist', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_small_24_p16_224_dist', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_small_24_p16_384_dist', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_small_24_p16_384_dist', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_small_24_p8_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_small_24_p8_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_small_24_p8_224_dist', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_small_24_p8_224_dist', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_small_24_p8_384_dist', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_small_24_p8_384_dist', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_tiny_12_p16_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('xcit_tiny_12_p16_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_tiny_12_p16_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_tiny_12_p16_224_dist', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('xcit_tiny_12_p16_224_dist', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_tiny_12_p16_224_dist', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_tiny_12_p16_384_dist', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('xcit_tiny_12_p16_384_dist', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_tiny_12_p16_384_dist', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_tiny_12_p8_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('xcit_tiny_12_p8_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_tiny_12_p8_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_tiny_12_p8_224_dist', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('xcit_tiny_12_p8_224_dist', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_tiny_12_p8_224_dist', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_tiny_12_p8_384_dist', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('xcit_tiny_12_p8_384_dist', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_tiny_12_p8_384_dist', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_tiny_24_p16_224', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('xcit_tiny_24_p16_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_tiny_24_p16_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_tiny_24_p16_224_dist', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('xcit_tiny_24_p16_224_dist', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_tiny_24_p16_224_dist', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_tiny_24_p16_384_dist', 'flowers102', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.flowers102.models'),
+    ('xcit_tiny_24_p16_384_dist', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_tiny_24_p16_384_dist', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_tiny_24_p8_224', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_tiny_24_p8_224', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_tiny_24_p8_224_dist', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_tiny_24_p8_224_dist', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_tiny_24_p8_384_dist', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xcit_tiny_24_p8_384_dist', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.timm_models'),
+    ('xdensenet121_2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('xdensenet121_2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('xdensenet161_2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('xdensenet161_2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('xdensenet169_2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('xdensenet169_2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('xdensenet201_2', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('xdensenet201_2', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('yolo3', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo3'),
+    ('yolo3', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo3'),
+    ('yolo3', 'voc', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo3'),
+    ('yolo3', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo3'),
+    ('yolo3_spp', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo3'),
+    ('yolo3_spp', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo3'),
+    ('yolo3_spp', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo3'),
+    ('yolo3_spp', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo3'),
+    ('yolo3_tiny', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo3'),
+    ('yolo3_tiny', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo3'),
+    ('yolo3_tiny', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo3'),
+    ('yolo3_tiny', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo3'),
+    ('yolo4l', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo4'),
+    ('yolo4l', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo4'),
+    ('yolo4l', 'voc', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo4'),
+    ('yolo4l', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo4'),
+    ('yolo4l_leaky', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo4'),
+    ('yolo4l_leaky', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo4'),
+    ('yolo4l_leaky', 'voc', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo4'),
+    ('yolo4l_leaky', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo4'),
+    ('yolo4m', 'coco', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo4'),
+    ('yolo4m', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo4'),
+    ('yolo4m', 'voc', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo4'),
+    ('yolo4m', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo4'),
+    ('yolo4s', 'coco', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo4'),
+    ('yolo4s', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo4'),
+    ('yolo4s', 'voc', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo4'),
+    ('yolo4s', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo4'),
+    ('yolo4x', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo4'),
+    ('yolo4x', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo4'),
+    ('yolo4x', 'voc', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo4'),
+    ('yolo4x', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo4'),
+    ('yolo5_6l', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6l', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6l', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6l', 'voc', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6l', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6l_hswish', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6l_hswish', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6l_hswish', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6l_hswish', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6l_hswish', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6l_relu', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6l_relu', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6l_relu', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6l_relu', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6l_relu', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6m', 'coco', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6m', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6m', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6m', 'voc', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6m', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6m_hswish', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6m_hswish', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6m_hswish', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6m_hswish', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6m_hswish', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6m_relu', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6m_relu', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6m_relu', 'person_detection', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6m_relu', 'voc', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6m_relu', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6ma', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6ma', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6ma', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6ma', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6ma', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6ma_hswish', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6ma_hswish', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6ma_hswish', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6ma_hswish', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6ma_hswish', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6ma_relu', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6ma_relu', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6ma_relu', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6ma_relu', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6ma_relu', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6n', 'coco', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6n', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6n', 'person_detection', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6n', 'voc', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6n', 'voc07', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6n_hswish', 'coco', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6n_hswish', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6n_hswish', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6n_hswish', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6n_hswish', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6n_relu', 'coco', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6n_relu', 'custom_person_detection', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6n_relu', 'person_detection', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6n_relu', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6n_relu', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6n_tiny', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6n_tiny', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6n_tiny', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6n_tiny', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6n_tiny', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6n_tiny_hswish', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6n_tiny_hswish', 'custom_person_detection', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6n_tiny_hswish', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6n_tiny_hswish', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6n_tiny_hswish', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6n_tiny_relu', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6n_tiny_relu', 'custom_person_detection', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6n_tiny_relu', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6n_tiny_relu', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6n_tiny_relu', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6s', 'coco', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6s', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6s', 'person_detection', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6s', 'voc', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6s', 'voc07', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6s_hswish', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6s_hswish', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6s_hswish', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6s_hswish', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6s_hswish', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6s_relu', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6s_relu', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6s_relu', 'person_detection', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6s_relu', 'voc', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6s_relu', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6sa', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6sa', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6sa', 'person_detection', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6sa', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6sa', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6sa_hswish', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6sa_hswish', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6sa_hswish', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6sa_hswish', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6sa_hswish', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6sa_relu', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6sa_relu', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6sa_relu', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6sa_relu', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6sa_relu', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6x', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6x', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6x', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6x', 'voc', 'object_detection', True, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6x', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6x_hswish', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6x_hswish', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6x_hswish', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6x_hswish', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6x_hswish', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6x_relu', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6x_relu', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6x_relu', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6x_relu', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5_6x_relu', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5l', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5l', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5l', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5l', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5l', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5m', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5m', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5m', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5m', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5m', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5ma', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5ma', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5ma', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5ma', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5ma', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5n', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5n', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5n', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5n', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5n', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5n_tiny', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5n_tiny', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5n_tiny', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5n_tiny', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5n_tiny', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5s', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5s', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5s', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5s', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5s', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5sa', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5sa', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5sa', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5sa', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5sa', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5x', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5x', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5x', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5x', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo5x', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo5'),
+    ('yolo7', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_hswish', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_hswish', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_hswish', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_hswish', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_hswish', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_relu', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_relu', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_relu', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_relu', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_relu', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_tinier', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_tinier', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_tinier', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_tinier', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_tinier', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_tinier_hswish', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_tinier_hswish', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_tinier_hswish', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_tinier_hswish', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_tinier_hswish', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_tinier_relu', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_tinier_relu', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_tinier_relu', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_tinier_relu', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_tinier_relu', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_tiny', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_tiny', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_tiny', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_tiny', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_tiny', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_tiny_hswish', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_tiny_hswish', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_tiny_hswish', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_tiny_hswish', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_tiny_hswish', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_tiny_relu', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_tiny_relu', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_tiny_relu', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_tiny_relu', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7_tiny_relu', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7x', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7x', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7x', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7x', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7x', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7x_hswish', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7x_hswish', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7x_hswish', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7x_hswish', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7x_hswish', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7x_relu', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7x_relu', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7x_relu', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7x_relu', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo7x_relu', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolo7'),
+    ('yolo_fdresnet18x0.25', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_fdresnet18x0.25', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_fdresnet18x0.25', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_fdresnet18x0.25', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_fdresnet18x0.25', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_fdresnet18x0.5', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_fdresnet18x0.5', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_fdresnet18x0.5', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_fdresnet18x0.5', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_fdresnet18x0.5', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_mobilenetv3', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_mobilenetv3', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_mobilenetv3', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_mobilenetv3', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_mobilenetv3', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet101', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet101', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet101', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet101', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet101', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet152', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet152', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet152', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet152', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet152', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet18', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet18', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet18', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet18', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet18', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet18x0.25', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet18x0.25', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet18x0.25', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet18x0.25', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet18x0.25', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet18x0.5', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet18x0.5', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet18x0.5', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet18x0.5', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet18x0.5', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet34', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet34', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet34', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet34', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet34', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet34x0.25', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet34x0.25', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet34x0.25', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet34x0.25', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet34x0.25', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet34x0.5', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet34x0.5', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet34x0.5', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet34x0.5', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet34x0.5', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet50', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet50', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet50', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet50', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_resnet50', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_shufflenetv2', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_shufflenetv2', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_shufflenetv2', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_shufflenetv2', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_shufflenetv2', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_vgg16bn', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_vgg16bn', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_vgg16bn', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_vgg16bn', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yolo_vgg16bn', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.flexible_yolo'),
+    ('yoloxl', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxl', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxl', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxl', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxl', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxl_hswish', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxl_hswish', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxl_hswish', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxl_hswish', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxl_hswish', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxl_relu', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxl_relu', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxl_relu', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxl_relu', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxl_relu', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxm', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxm', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxm', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxm', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxm', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxm_hswish', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxm_hswish', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxm_hswish', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxm_hswish', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxm_hswish', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxm_relu', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxm_relu', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxm_relu', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxm_relu', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxm_relu', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxn', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxn', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxn', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxn', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxn', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxn_hswish', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxn_hswish', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxn_hswish', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxn_hswish', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxn_hswish', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxn_relu', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxn_relu', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxn_relu', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxn_relu', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxn_relu', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxs', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxs', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxs', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxs', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxs', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxs_hswish', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxs_hswish', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxs_hswish', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxs_hswish', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxs_hswish', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxs_relu', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxs_relu', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxs_relu', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxs_relu', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxs_relu', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxt', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxt', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxt', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxt', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxt', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxt_hswish', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxt_hswish', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxt_hswish', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxt_hswish', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxt_hswish', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxt_relu', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxt_relu', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxt_relu', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxt_relu', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxt_relu', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxx', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxx', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxx', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxx', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxx', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxx_hswish', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxx_hswish', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxx_hswish', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxx_hswish', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxx_hswish', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxx_relu', 'coco', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxx_relu', 'custom_person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxx_relu', 'person_detection', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxx_relu', 'voc', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('yoloxx_relu', 'voc07', 'object_detection', False, 'deeplite_torch_zoo.wrappers.models.objectdetection.yolox'),
+    ('zfnet', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('zfnet', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('zfnetb', 'food101', 'classification', False, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+    ('zfnetb', 'imagenet', 'classification', True, 'deeplite_torch_zoo.wrappers.models.classification.imagenet.pytorchcv_models'),
+]
+
+DATA_WRAPPERS = [
+    ('car_detection', 'yolo', 'deeplite_torch_zoo.wrappers.datasets.objectdetection.yolo'),
+    ('carvana', 'unet', 'deeplite_torch_zoo.wrappers.datasets.segmentation.unet'),
+    ('cifar10', None, 'deeplite_torch_zoo.wrappers.datasets.classification.cifar'),
+    ('cifar100', None, 'deeplite_torch_zoo.wrappers.datasets.classification.cifar'),
+    ('coco', 'fasterrcnn_resnet50_fpn', 'deeplite_torch_zoo.wrappers.datasets.objectdetection.mask_rcnn'),
+    ('coco', 'mb2_ssd', 'deeplite_torch_zoo.wrappers.datasets.objectdetection.ssd'),
+    ('coco', 'ssd', 'deeplite_torch_zoo.wrappers.datasets.objectdetection.ssd'),
+    ('coco', 'yolo', 'deeplite_torch_zoo.wrappers.datasets.objectdetection.yolo'),
+    ('coco_gm', 'mb2_ssd', 'deeplite_torch_zoo.wrappers.datasets.objectdetection.ssd'),
+    ('corruptions', None, 'deeplite_torch_zoo.wrappers.datasets.classification.corruptions'),
+    ('custom_person_detection', 'yolo', 'deeplite_torch_zoo.wrappers.datasets.objectdetection.yolo'),
+    ('flowers102', None, 'deeplite_torch_zoo.wrappers.datasets.classification.flowers102'),
+    ('food101', None, 'deeplite_torch_zoo.wrappers.datasets.classification.food101'),
+    ('imagenet', None, 'deeplite_torch_zoo.wrappers.datasets.classification.imagenet'),
+    ('imagenet10', None, 'deeplite_torch_zoo.wrappers.datasets.classification.imagenet'),
+    ('imagenet16', None, 'deeplite_torch_zoo.wrappers.datasets.classification.imagenet'),
+    ('imagenette', None, 'deeplite_torch_zoo.wrappers.datasets.classification.imagenette'),
+    ('imagenette_160', None, 'deeplite_torch_zoo.wrappers.datasets.classification.imagenette'),
+    ('imagenette_320', None, 'deeplite_torch_zoo.wrappers.datasets.classification.imagenette'),
+    ('imagewoof', None, 'deeplite_torch_zoo.wrappers.datasets.classification.imagewoof'),
+    ('imagewoof_160', None, 'deeplite_torch_zoo.wrappers.datasets.classification.imagewoof'),
+    ('imagewoof_320', None, 'deeplite_torch_zoo.wrappers.datasets.classification.imagewoof'),
+    ('lisa', 'yolo', 'deeplite_torch_zoo.wrappers.datasets.objectdetection.yolo'),
+    ('mnist', None, 'deeplite_torch_zoo.wrappers.datasets.classification.mnist'),
+    ('person_detection', 'yolo', 'deeplite_torch_zoo.wrappers.datasets.objectdetection.yolo'),
+    ('tinyimagenet', None, 'deeplite_torch_zoo.wrappers.datasets.classification.tiny_imagenet'),
+    ('voc', 'deeplab', 'deeplite_torch_zoo.wrappers.datasets.segmentation.deeplab'),
+    ('voc', 'fcn', 'deeplite_torch_zoo.wrappers.datasets.segmentation.fcn'),
+    ('voc', 'mb1_ssd', 'deeplite_torch_zoo.wrappers.datasets.objectdetection.ssd'),
+    ('voc', 'mb2_ssd', 'deeplite_torch_zoo.wrappers.datasets.objectdetection.ssd'),
+    ('voc', 'mb2_ssd_lite', 'deeplite_torch_zoo.wrappers.datasets.objectdetection.ssd'),
+    ('voc', 'resnet18_ssd', 'deeplite_torch_zoo.wrappers.datasets.objectdetection.ssd'),
+    ('voc', 'resnet34_ssd', 'deeplite_torch_zoo.wrappers.datasets.objectdetection.ssd'),
+    ('voc', 'resnet50_ssd', 'deeplite_torch_zoo.wrappers.datasets.objectdetection.ssd'),
+    ('voc', 'ssd', 'deeplite_torch_zoo.wrappers.datasets.objectdetection.ssd'),
+    ('voc', 'unet', 'deeplite_torch_zoo.wrappers.datasets.segmentation.unet'),
+    ('voc', 'vgg16_ssd', 'deeplite_torch_zoo.wrappers.datasets.objectdetection.ssd'),
+    ('voc', 'yolo', 'deeplite_torch_zoo.wrappers.datasets.objectdetection.yolo'),
+    ('voc07', 'yolo', 'deeplite_torch_zoo.wrappers.datasets.objectdetection.yolo'),
+    ('voc_format_dataset', 'yolo', 'deeplite_torch_zoo.wrappers.datasets.objectdetection.yolo'),
+    ('vww', None, 'deeplite_torch_zoo.wrappers.datasets.classification.vww'),
+    ('wider_face', 'ssd', 'deeplite_torch_zoo.wrappers.datasets.objectdetection.ssd'),
+    ('wider_face', 'vgg16_ssd', 'deeplite_torch_zoo.wrappers.datasets.objectdetection.ssd'),
+    ('wider_face', 'yolo', 'deeplite_torch_zoo.wrappers.datasets.objectdetection.yolo'),
+]
+
+EVAL_WRAPPERS = [
+    ('classification', None, None, 'deeplite_torch_zoo.wrappers.eval.classification'),
+    ('semantic_segmentation', 'deeplab', None, 'deeplite_torch_zoo.src.segmentation.deeplab.eval'),
+    ('semantic_segmentation', 'fcn', None, 'deeplite_torch_zoo.src.segmentation.fcn.eval'),
+    ('semantic_segmentation', 'unet', None, 'deeplite_torch_zoo.src.segmentation.Unet.eval'),
+    ('semantic_segmentation', 'unet_scse', None, 'deeplite_torch_zoo.src.segmentation.Unet.eval'),
+    ('object_detection', 'mb2_ssd', 'coco', 'deeplite_torch_zoo.wrappers.eval.ssd'),
+    ('object_detection', 'rcnn', 'coco', 'deeplite_torch_zoo.wrappers.eval.rcnn'),
+    ('object_detection', 'yolo', 'coco', 'deeplite_torch_zoo.src.objectdetection.eval.yolov5_eval.wrappers'),
+    ('object_detection', 'yolo', 'lisa', 'deeplite_torch_zoo.src.objectdetection.eval.zoo_eval.extra_eval.lisa_eval'),
+    ('object_detection', 'mb1_ssd', 'voc', 'deeplite_torch_zoo.wrappers.eval.ssd'),
+    ('object_detection', 'mb2_ssd', 'voc', 'deeplite_torch_zoo.wrappers.eval.ssd'),
+    ('object_detection', 'mb2_ssd_lite', 'voc', 'deeplite_torch_zoo.wrappers.eval.ssd'),
+    ('object_detection', 'resnet18_ssd', 'voc', 'deeplite_torch_zoo.wrappers.eval.ssd'),
+    ('object_detection', 'resnet34_ssd', 'voc', 'deeplite_torch_zoo.wrappers.eval.ssd'),
+    ('object_detection', 'resnet50_ssd', 'voc', 'deeplite_torch_zoo.wrappers.eval.ssd'),
+    ('object_detection', 'ssd', 'voc', 'deeplite_torch_zoo.wrappers.eval.ssd'),
+    ('object_detection', 'vgg16_ssd', 'voc', 'deeplite_torch_zoo.wrappers.eval.ssd'),
+    ('object_detection', 'yolo', 'voc', 'deeplite_torch_zoo.src.objectdetection.eval.yolov5_eval.wrappers'),
+    ('object_detection', 'yolo', 'voc07', 'deeplite_torch_zoo.src.objectdetection.eval.yolov5_eval.wrappers'),
+    ('object_detection', 'ssd', 'wider_face', 'deeplite_torch_zoo.wrappers.eval.ssd'),
+    ('object_detection', 'vgg16_ssd', 'wider_face', 'deeplite_torch_zoo.wrappers.eval.ssd'),
+    ('object_detection', 'yolo', 'wider_face', 'deeplite_torch_zoo.src.objectdetection.eval.zoo_eval.extra_eval.wider_face_eval'),
+]
@@ -1,15 +1,15 @@
 import collections
 import fnmatch
+import math
+import warnings
 
 import texttable
 import torch
-from torchinfo import summary
-from torchprofile import profile_macs
 
-import deeplite_torch_zoo.wrappers.datasets  # pylint: disable=unused-import
-import deeplite_torch_zoo.wrappers.eval  # pylint: disable=unused-import
-import deeplite_torch_zoo.wrappers.models  # pylint: disable=unused-import
-from deeplite_torch_zoo.utils import switch_train_mode
+from deeplite_torch_zoo.utils import (count_macs, count_params,
+                                      get_latency_table, get_profile_cache,
+                                      predict_latency, switch_train_mode)
+from deeplite_torch_zoo.utils import measure_latency as measure_model_latency
 from deeplite_torch_zoo.wrappers.registries import (DATA_WRAPPER_REGISTRY,
                                                     EVAL_WRAPPER_REGISTRY,
                                                     MODEL_WRAPPER_REGISTRY)
@@ -21,7 +21,10 @@ __all__ = [
     "list_models",
     "create_model",
     "profile",
+    "get_profile_by_name",
+    "predict_latency_by_name",
     "get_models_by_dataset",
+    "prefetch_checkpoints",
 ]
 
 
@@ -117,38 +120,88 @@ def create_model(
     return model.half() if fp16 else model
 
 
-def profile(model, img_size=224, in_ch=3, verbose=False):
+def profile(model, img_size=224, in_ch=3, verbose=False, measure_latency=False, batch_size=1):
     """
     Do model profiling to calculate the MAC count, the number of parameters and weight size of the model.
-    The torchprofile package is used to calculate MACs, which is jit-based and
-    is more accurate than the hook based approach.
+    The parameters are counted without running the model, the MACs are counted during a single forward
+    pass on the model's device (see `deeplite_torch_zoo.utils.count_macs`).
 
     :param model: PyTorch nn.Module object
     :param img_size: Input image resolution, either an integer value or a tuple of integers of the form (3, 224, 224)
     :param in_ch: Number of input channels to use in case passed img_size is an integer
     :param verbose: if True, prints the model summary table from torchinfo
+    :param measure_latency: if True, also measures the latency and the throughput of the model on its device
+    :param batch_size: Batch size to measure the latency and the throughput with
 
-    returns a dictionary with the number of GMACs, number of parameters in millions and model size in megabytes
+    returns a dictionary with the number of GMACs, number of parameters in millions and model size in megabytes,
+    and the latency percentiles in milliseconds and the throughput in images per second if `measure_latency` is set
     """
+    if not isinstance(img_size, tuple):
+        img_size = (in_ch, img_size, img_size)
+
     device = next(model.parameters()).device
+    with switch_train_mode(model, is_training=False):
+        if verbose:
+            from torchinfo import summary  # pylint: disable=import-outside-toplevel
+            summary(model, input_size=(1, *img_size), verbose=verbose)
+
+        num_params, size_bytes = count_params(model)
+        macs = count_macs(model, torch.randn(1, *img_size, device=device))
+        results = {'GMACs': macs / 1e9, 'size_Mb': size_bytes / 1e6, 'Mparams': num_params / 1e6}
+        if measure_latency:
+            results.update(measure_model_latency(model, torch.randn(batch_size, *img_size, device=device)))
+    return results
+
 
+def get_profile_by_name(model_name, dataset_name, img_size=224, in_ch=3, measure_latency=False,
+    batch_size=1, use_cache=True, device='cpu'):
+    """
+    Profiles a zoo model created with random weights, see `profile`. The results are cached on disk per model,
+    dataset and input shape, and the latency measurements also per machine, device type, dtype and torch version
+    (see `deeplite_torch_zoo.utils.ProfileCache`). The model is only created if the results are not in the cache.
+    """
     if not isinstance(img_size, tuple):
         img_size = (in_ch, img_size, img_size)
+    cache = get_profile_cache()
+    key = cache.make_key(model_name, dataset_name, img_size)
+    latency_key = cache.make_key(model_name, dataset_name, (batch_size, *img_size), latency=True,
+        device=device, dtype=torch.float32)
+    results = cache.get(key) if use_cache else None
+    latency_results = cache.get(latency_key) if use_cache and measure_latency else None
+    if results is not None and (latency_results is not None or not measure_latency):
+        return {**results, **(latency_results or {})}
 
-    with switch_train_mode(model, is_training=False):
-        model_stats = summary(model, input_size=(1, *img_size), verbose=verbose)
-        model_size_mb = model_stats.to_megabytes(model_stats.total_param_bytes)
-        model_mparams = model_stats.total_params / 1e6
+    model = get_model_by_name(model_name, dataset_name, pretrained=False, device=device)
+    profile_results = profile(model, img_size=img_size, measure_latency=measure_latency, batch_size=batch_size)
+    if use_cache:
+        results = {name: profile_results[name] for name in ('GMACs', 'size_Mb', 'Mparams')}
+        cache.set(key, results)
+        if measure_latency:
+            cache.set(latency_key, {name: value for name, value in profile_results.items() if name not in results})
+    return profile_results
 
-        macs = profile_macs(model.to('cpu'), torch.randn(1, *img_size))
-        model_gmacs = macs / 1e9
 
-    model.to(device)
-    return {'GMACs': model_gmacs, 'size_Mb': model_size_mb, 'Mparams': model_mparams}
+def predict_latency_by_name(model_name, dataset_name, img_size=224, in_ch=3, batch_size=1, use_cache=True):
+    """
+    Predicts the CPU latency of a zoo model in milliseconds with the latency LUT of the local machine,
+    see `deeplite_torch_zoo.utils.predict_latency`. The predictions are kept in the LUT file, so the model
+    is only created the first time or after the LUT is updated.
+    """
+    if not isinstance(img_size, tuple):
+        img_size = (in_ch, img_size, img_size)
+    table = get_latency_table()
+    key = f'{model_name}/{dataset_name}/{"x".join(map(str, (batch_size, *img_size)))}'
+    latency_ms = table.get_model(key) if use_cache else None
+    if latency_ms is None:
+        model = get_model_by_name(model_name, dataset_name, pretrained=False, device='cpu')
+        latency_ms = predict_latency(model, img_size=img_size, batch_size=batch_size, table=table)
+        if use_cache:
+            table.set_model(key, latency_ms)
+    return latency_ms
 
 
 def list_models(filter='', print_table=True, return_list=False,
-    task_type_filter=None, include_no_checkpoint=False):
+    task_type_filter=None, include_no_checkpoint=False, sort_by=None, max_latency_ms=None, img_size=224):
     """
     A helper function to list all existing models or dataset calls
     It takes a `model_name` or a `dataset_name` as a filter and
@@ -158,7 +211,13 @@ def list_models(filter='', print_table=True, return_list=False,
     to use as a filter
     :param print_table: Whether to print a table with matched models to the console
     :param return_list: Whether to return a list with model names and corresponding datasets
+    :param sort_by: 'name' (default) or 'latency' to sort the models by their predicted CPU latency,
+    see `predict_latency_by_name`
+    :param max_latency_ms: Only keep the models whose predicted CPU latency is below this value
+    :param img_size: Input image resolution of the latency predictions
     """
+    if sort_by not in (None, 'name', 'latency'):
+        raise RuntimeError(f"Wrong sort_by value {sort_by}. Allowed values are 'name' and 'latency'")
     filter = '*' + filter + '*'
     if include_no_checkpoint:
         all_model_keys = MODEL_WRAPPER_REGISTRY.registry_dict.keys()
@@ -187,6 +246,30 @@ def list_models(filter='', print_table=True, return_list=False,
             models = set(models).union(include_models)
     found_model_keys = [all_models[model] for model in sorted(models)]
 
+    if sort_by == 'latency' or max_latency_ms is not None:
+        get_latency_table().require_entries()
+        latencies = {}
+        for model_key in found_model_keys:
+            try:
+                latencies[model_key] = predict_latency_by_name(model_key.model_name, model_key.dataset_name,
+                    img_size=img_size)
+            except Exception as e:  # pylint: disable=broad-except
+                warnings.warn(f'Could not predict the latency of {model_key.model_name}_{model_key.dataset_name}: '
+                    f'{e!r}')
+                latencies[model_key] = math.inf
+        if max_latency_ms is not None:
+            found_model_keys = [model_key for model_key in found_model_keys
+                if latencies[model_key] <= max_latency_ms]
+        if sort_by == 'latency':
+            found_model_keys = sorted(found_model_keys, key=latencies.get)
+        if print_table:
+            table = texttable.Texttable()
+            table.add_rows([['Model', 'Source dataset', 'Predicted latency, ms'],
+                *[[model_key.model_name, model_key.dataset_name, f'{latencies[model_key]:.2f}']
+                for model_key in found_model_keys]])
+            print(table.draw())
+        return found_model_keys if return_list else None
+
     if print_table:
         table = texttable.Texttable()
         rows = collections.defaultdict(list)
@@ -203,3 +286,25 @@ def list_models(filter='', print_table=True, return_list=False,
 def get_models_by_dataset(dataset_name):
     return [model_key.model_name for model_key in list_models(dataset_name, return_list=True, print_table=False)
             if model_key.dataset_name == dataset_name]
+
+
+def prefetch_checkpoints(filter='', task_type_filter=None, progress=True):
+    """
+    Warm the local checkpoint cache with the pretrained weights of all the models matching the filter,
+    so that they can be loaded later without network access (see `deeplite_torch_zoo.utils.CheckpointCache`)
+
+    :param filter: a string or list of strings to select the models, same as in `list_models`
+    :param task_type_filter: task type to select the models, same as in `list_models`
+    :param progress: Whether to enable the download progressbar
+
+    returns a dictionary of "model_name_dataset_name" -> None if the checkpoint is available, the raised exception otherwise
+    """
+    results = {}
+    for model_key in list_models(filter, print_table=False, return_list=True, task_type_filter=task_type_filter):
+        try:
+            get_model_by_name(model_key.model_name, model_key.dataset_name,
+                pretrained=True, progress=progress, device='cpu')
+            results[f'{model_key.model_name}_{model_key.dataset_name}'] = None
+        except Exception as e:  # pylint: disable=broad-except
+            results[f'{model_key.model_name}_{model_key.dataset_name}'] = e
+    return results
@@ -0,0 +1,112 @@
+import random
+
+import cv2
+import numpy as np
+import pytest
+import torch
+
+import deeplite_torch_zoo.src.objectdetection.yolov5.configs.hyps.hyp_config_voc as cfg
+from deeplite_torch_zoo.src.objectdetection.datasets.batch_augment import (
+    BatchAugmentation, batch_augment_hsv, batch_flip, batch_mosaic,
+    batch_random_perspective)
+from deeplite_torch_zoo.src.objectdetection.datasets.dataset import \
+    DLZooDataset
+
+
+def make_batch(batch_size=6, size=64, uint8=False):
+    """images with the boxes painted in the first channel, labels x1, y1, x2, y2, class"""
+    rng = np.random.RandomState(0)
+    images = torch.zeros((batch_size, 3, size, size))
+    labels = torch.zeros((batch_size, 3, 5))
+    lengths = torch.tensor([i % 3 + 1 for i in range(batch_size)])
+    for i in range(batch_size):
+        for j in range(lengths[i]):
+            # non-overlapping boxes in the columns of the image
+            x1, y1 = j * size // 3 + rng.randint(0, 4), rng.randint(0, size // 2)
+            x2, y2 = x1 + size // 3 - 6, y1 + rng.randint(12, size // 2)
+            images[i, 0, y1:y2, x1:x2] = 1
+            labels[i, j] = torch.tensor([x1, y1, x2, y2, j])
+    if uint8:
+        images = (images * 255).to(torch.uint8)
+    return images, labels, lengths
+
+
+def assert_boxes_on_painted_regions(images, labels, lengths):
+    painted = images[:, 0].float() / (255 if images.dtype == torch.uint8 else 1)
+    for i in range(len(images)):
+        assert not labels[i, lengths[i]:].any()
+        for x1, y1, x2, y2, _ in labels[i, :lengths[i]].tolist():
+            assert 0 <= x1 < x2 <= images.shape[3] and 0 <= y1 < y2 <= images.shape[2]
+            if min(x2 - x1, y2 - y1) < 2:
+                continue  # slivers left by clipping, interpolated with the background
+            assert painted[i, int((y1 + y2) / 2), int((x1 + x2) / 2)] > 0.5
+
+
+@pytest.mark.parametrize('uint8', [False, True])
+def test_batch_random_perspective(uint8):
+    images, labels, lengths = make_batch(uint8=uint8)
+    same = batch_random_perspective(images, labels, lengths, degrees=0, translate=0, scale=0, shear=0)
+    assert torch.allclose(same[0].float(), images.float(), atol=1e-5) and torch.equal(same[1], labels) and torch.equal(same[2], lengths)
+
+    torch.manual_seed(0)
+    for _ in range(5):
+        out_images, out_labels, out_lengths = batch_random_perspective(images, labels, lengths,
+            degrees=5, translate=0.1, scale=0.5, shear=2, perspective=0.0005)
+        assert out_images.dtype == images.dtype and out_images.shape == images.shape
+        assert (out_lengths <= lengths).all() and out_lengths.sum() > 0
+        assert_boxes_on_painted_regions(out_images, out_labels, out_lengths)
+
+
+def test_batch_flip():
+    images, labels, lengths = make_batch()
+    for vertical in (False, True):
+        out_images, out_labels, out_lengths = batch_flip(images, labels, lengths, p=1.0, vertical=vertical)
+        assert torch.equal(out_images, images.flip(2 if vertical else 3)) and torch.equal(out_lengths, lengths)
+        assert_boxes_on_painted_regions(out_images, out_labels, out_lengths)
+        assert torch.equal(batch_flip(out_images, out_labels, out_lengths, p=1.0, vertical=vertical)[1], labels)
+
+
+def test_batch_mosaic():
+    random.seed(0)
+    images, labels, lengths = make_batch()
+    out_images, out_labels, out_lengths = batch_mosaic(images, labels, lengths, p=1.0)
+    assert out_images.shape == images.shape and len(out_labels) == len(out_lengths) == len(images)
+    assert_boxes_on_painted_regions(out_images, out_labels, out_lengths)
+
+
+def test_batch_augment_hsv():
+    rng = np.random.RandomState(0)
+    images = torch.from_numpy(rng.randint(0, 256, size=(4, 3, 32, 32), dtype=np.uint8))
+    torch.manual_seed(0)
+    gains = torch.empty((4, 3)).uniform_(-1, 1) * torch.tensor([0.015, 0.7, 0.4]) + 1
+    torch.manual_seed(0)
+    augmented = batch_augment_hsv(images, hgain=0.015, sgain=0.7, vgain=0.4)
+
+    for image, out, r in zip(images, augmented, gains.tolist()):
+        # reference: the OpenCV HSV LUTs of AugmentHSV
+        hue, sat, val = cv2.split(cv2.cvtColor(image.permute(1, 2, 0).numpy(), cv2.COLOR_RGB2HSV))
+        x = np.arange(0, 256, dtype=np.float64)
+        lut_hue = ((x * r[0]) % 180).astype(np.uint8)
+        lut_sat = np.clip(x * r[1], 0, 255).astype(np.uint8)
+        lut_val = np.clip(x * r[2], 0, 255).astype(np.uint8)
+        hsv = cv2.merge((cv2.LUT(hue, lut_hue), cv2.LUT(sat, lut_sat), cv2.LUT(val, lut_val)))
+        expected = cv2.cvtColor(hsv, cv2.COLOR_HSV2RGB)
+        assert np.abs(out.permute(1, 2, 0).numpy().astype(np.int32) - expected).mean() < 3
+
+
+@pytest.mark.parametrize('uint8', [False, True])
+def test_batch_augmentation(uint8):
+    random.seed(0)
+    torch.manual_seed(0)
+    images, labels, lengths = make_batch(batch_size=8, uint8=uint8)
+    hyp_cfg = dict(cfg.TRAIN, mosaic=0.5, hsv_h=0, hsv_s=0, hsv_v=0, scale=0.3)
+    out_images, out_labels, out_lengths = BatchAugmentation(hyp_cfg)(images, labels, lengths)
+    assert out_images.dtype == images.dtype and out_images.shape == images.shape
+    assert_boxes_on_painted_regions(out_images, out_labels, out_lengths)
+
+
+def test_dataset_batch_augment():
+    # the workers only decode and resize, the augmentation is left to the training loop
+    dataset = DLZooDataset(cfg.TRAIN, 64, augment=True, batch_augment=True)
+    assert not dataset._do_augment and isinstance(dataset.batch_augmentation, BatchAugmentation)
+    assert DLZooDataset(cfg.TRAIN, 64, augment=False, batch_augment=True).batch_augmentation is None
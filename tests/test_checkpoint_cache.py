@@ -0,0 +1,71 @@
+import hashlib
+import os
+import shutil
+
+import pytest
+import torch
+
+from deeplite_torch_zoo.utils import checkpoints
+from deeplite_torch_zoo.utils.checkpoints import CheckpointCache
+
+
+@pytest.fixture
+def checkpoint_url(tmp_path):
+    src = tmp_path / 'remote' / 'model.pt'
+    src.parent.mkdir()
+    torch.save({'weight': torch.arange(10.)}, src)
+    digest = hashlib.sha256(src.read_bytes()).hexdigest()[:16]
+    dst = src.with_name(f'model-{digest}.pt')
+    src.rename(dst)
+    return dst.as_uri()
+
+
+@pytest.fixture
+def count_hashes(monkeypatch):
+    calls = []
+    file_sha256 = checkpoints._file_sha256
+
+    def counting_sha256(path):
+        calls.append(path)
+        return file_sha256(path)
+
+    monkeypatch.setattr(checkpoints, '_file_sha256', counting_sha256)
+    return calls
+
+
+def test_fetch_downloads_once(tmp_path, checkpoint_url, count_hashes):
+    cache = CheckpointCache(cache_dir=tmp_path / 'cache')
+    path = cache.fetch(checkpoint_url)
+    assert path == cache.cache_path(checkpoint_url)
+    assert torch.load(path)['weight'].sum() == 45
+
+    os.remove(checkpoint_url[len('file://'):])
+    # a new cache instance reads the manifest, the file is neither downloaded nor hashed again
+    assert CheckpointCache(cache_dir=tmp_path / 'cache').fetch(checkpoint_url) == path
+    assert not count_hashes
+
+
+def test_modified_file_is_verified(tmp_path, checkpoint_url, count_hashes):
+    cache = CheckpointCache(cache_dir=tmp_path / 'cache')
+    path = cache.fetch(checkpoint_url)
+    with open(path, 'ab') as f:
+        f.write(b'0')
+    # the corrupted file is rejected and downloaded again
+    assert cache.fetch(checkpoint_url) == path
+    assert count_hashes == [path]
+    assert cache.fetch(checkpoint_url) == path
+    assert count_hashes == [path]
+
+
+def test_offline_mirror(tmp_path, checkpoint_url, count_hashes):
+    mirror_dir = tmp_path / 'mirror'
+    mirror_dir.mkdir()
+    filename, _ = CheckpointCache.parse_url(checkpoint_url)
+    cache = CheckpointCache(cache_dir=tmp_path / 'cache', mirror_dir=mirror_dir, offline=True)
+    with pytest.raises(FileNotFoundError):
+        cache.fetch(checkpoint_url)
+
+    shutil.copy(checkpoint_url[len('file://'):], mirror_dir / filename)
+    assert cache.fetch(checkpoint_url) == str(mirror_dir / filename)
+    assert cache.fetch(checkpoint_url) == str(mirror_dir / filename)
+    assert len(count_hashes) == 1
@@ -0,0 +1,99 @@
+import json
+
+import numpy as np
+import pytest
+import torch
+from PIL import Image
+from pycocotools.coco import COCO
+
+from deeplite_torch_zoo.src.objectdetection.datasets.coco import (
+    CocoDetectionBoundingBox, SubsampledCOCO)
+from deeplite_torch_zoo.src.objectdetection.datasets.coco import \
+    coco_index
+from deeplite_torch_zoo.src.objectdetection.datasets.coco_config import \
+    COCO_MISSING_IDS
+from deeplite_torch_zoo.src.objectdetection.ssd.datasets.coco import \
+    CocoDetectionBoundingBox as SSDCocoDetectionBoundingBox
+
+CATEGORIES = [{'id': 1, 'name': 'person'}, {'id': 3, 'name': 'car'}, {'id': 13, 'name': 'stop sign'}]
+
+
+@pytest.fixture
+def coco_dataset(tmp_path, monkeypatch):
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    rng = np.random.RandomState(0)
+    img_root = tmp_path / 'images'
+    img_root.mkdir()
+    images, annotations = [], []
+    # image ids out of order, annotations of an image interleaved with others
+    for image_id in rng.permutation(np.arange(1, 9)).tolist():
+        file_name = f'{image_id:012d}.jpg'
+        Image.fromarray(rng.randint(0, 256, size=(60 + image_id, 80, 3), dtype=np.uint8)).save(img_root / file_name)
+        images.append({'id': image_id, 'file_name': file_name, 'height': 60 + image_id, 'width': 80})
+    for ann_id in range(20):
+        annotations.append({'id': ann_id, 'image_id': int(rng.randint(1, 8)), 'iscrowd': 0,
+            'category_id': CATEGORIES[ann_id % 3]['id'], 'bbox': (rng.rand(4) * 40).round(2).tolist()})
+    ann_file = tmp_path / 'instances.json'
+    ann_file.write_text(json.dumps({'images': images, 'annotations': annotations, 'categories': CATEGORIES}))
+    return str(img_root), str(ann_file)
+
+
+def reference_labels(coco, img_id, category_ids, dataset):
+    labels = [ann['bbox'] + [dataset._delete_coco_empty_category(ann['category_id'])]
+        for ann in coco.loadAnns(coco.getAnnIds(imgIds=img_id)) if ann['category_id'] in category_ids]
+    return torch.tensor(labels, dtype=torch.float32).reshape(-1, 5)
+
+
+@pytest.mark.parametrize('categories', ['all', ['car']])
+def test_coco_index_dataset(coco_dataset, categories):
+    img_root, ann_file = coco_dataset
+    if categories == 'all':
+        coco, category_ids = COCO(ann_file), [cat['id'] for cat in CATEGORIES]
+        kwargs = {'missing_ids': COCO_MISSING_IDS}
+    else:
+        coco, category_ids = SubsampledCOCO(ann_file, categories), [3]
+        kwargs = {'classes': categories, 'category': category_ids, 'missing_ids': [1, 2] + list(range(4, 92))}
+    # without a transform the dataset returns the image and its id
+    dataset = CocoDetectionBoundingBox(img_root, ann_file, **kwargs)
+    dataset_labels = CocoDetectionBoundingBox(img_root, ann_file, **kwargs,
+        transform=lambda img_size: lambda img, label: (torch.zeros(1), label.clone()))
+
+    assert dataset.ids == sorted(coco.imgs.keys())
+    for index, img_id in enumerate(dataset.ids):
+        img, *_, returned_id = dataset[index]
+        assert returned_id == img_id
+        assert img.shape == (coco.imgs[img_id]['height'], coco.imgs[img_id]['width'], 3)
+        _, labels, length, _, shape = dataset_labels[index]
+        expected = reference_labels(coco, img_id, category_ids, dataset)
+        expected[:, 2:4] += expected[:, 0:2]  # xywh -> xyxy
+        assert torch.equal(labels, expected) and length == len(expected)
+        assert shape == img.shape[:2]
+
+
+def test_coco_index_is_cached(coco_dataset, monkeypatch):
+    img_root, ann_file = coco_dataset
+    CocoDetectionBoundingBox(img_root, ann_file)
+    calls = []
+    from_annotation_file = coco_index.CocoIndex.from_annotation_file.__func__
+    monkeypatch.setattr(coco_index.CocoIndex, 'from_annotation_file',
+        classmethod(lambda cls, path: calls.append(path) or from_annotation_file(cls, path)))
+    dataset = CocoDetectionBoundingBox(img_root, ann_file)
+    assert not calls and isinstance(dataset._index.boxes, np.memmap)
+
+
+def test_ssd_coco_index_dataset(coco_dataset):
+    img_root, ann_file = coco_dataset
+    coco = COCO(ann_file)
+    dataset = SSDCocoDetectionBoundingBox(img_root, ann_file, missing_ids=COCO_MISSING_IDS)
+    for index, img_id in enumerate(dataset.ids):
+        image_id, (boxes, labels, _) = dataset.get_annotation(index)
+        anns = coco.loadAnns(coco.getAnnIds(imgIds=img_id))
+        assert image_id == str(img_id)
+        if anns:
+            assert labels.tolist() == [dataset._delete_coco_empty_category(ann['category_id']) + 1 for ann in anns]
+            expected = np.array([ann['bbox'] for ann in anns], dtype=np.float32)
+            expected[:, 2:4] += expected[:, 0:2]
+            assert np.array_equal(boxes, expected)
+        else:
+            assert labels.tolist() == [0]
+        assert dataset.get_image(index).shape == (coco.imgs[img_id]['height'], coco.imgs[img_id]['width'], 3)
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+import torch
+
+from deeplite_torch_zoo import get_data_splits_by_name
+from deeplite_torch_zoo.wrappers.datasets.classification.corruptions import (
+    CorruptionDataset, build_corruption_set)
+from tests.test_packed_dataset import make_image_folder
+
+
+def noise(x, severity=1):
+    return np.clip(x + np.random.randint(-20, 20, size=x.shape) * severity, 0, 255)
+
+
+def invert(x, severity=1):
+    return 255 - x
+
+
+def test_corruption_set(tmp_path):
+    folder_dataset = make_image_folder(tmp_path / 'folder')
+    folder_dataset.transform = None
+    metadata = build_corruption_set(folder_dataset, tmp_path / 'c', distortions={'noise': noise},
+        severities=(1, 3), img_size=12, num_workers=2)
+    assert metadata['variants'] == [('noise', 1), ('noise', 3)] and metadata['classes'] == folder_dataset.classes
+
+    # the images are rendered with the same seeds by a single process
+    build_corruption_set(folder_dataset, tmp_path / 'c0', distortions={'noise': noise}, severities=(3,),
+        img_size=12, num_workers=0)
+    dataset = CorruptionDataset(tmp_path / 'c', 'noise', severity=3)
+    reference = CorruptionDataset(tmp_path / 'c0', 'noise', severity=3)
+    assert len(dataset) == len(folder_dataset)
+    for i in range(len(dataset)):
+        image, label = dataset[i]
+        assert image.size == (12, 12) and label == folder_dataset.targets[i]
+        assert np.array_equal(np.asarray(image), np.asarray(reference[i][0]))
+
+    # only the new variants are rendered
+    images = np.load(tmp_path / 'c' / 'val-noise-1.npy')
+    metadata = build_corruption_set(folder_dataset, tmp_path / 'c', distortions={'invert': invert},
+        severities=(1,), img_size=12, num_workers=0)
+    assert len(metadata['variants']) == 3
+    assert np.array_equal(np.load(tmp_path / 'c' / 'val-noise-1.npy'), images)
+    with pytest.raises(ValueError):
+        CorruptionDataset(tmp_path / 'c', 'invert', severity=2)
+
+    dataloaders = get_data_splits_by_name(data_root=str(tmp_path / 'c'), dataset_name='corruptions',
+        model_name='resnet18', distortion_name='invert', batch_size=4, num_workers=0)
+    images, labels = next(iter(dataloaders['test']))
+    assert images.shape == (4, 3, 12, 12) and images.dtype == torch.float32 and labels.shape == (4,)
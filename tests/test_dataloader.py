@@ -0,0 +1,53 @@
+import numpy as np
+import torch
+from torch.utils.data import Dataset
+
+from deeplite_torch_zoo.wrappers.datasets.benchmark import (
+    benchmark_dataloader, main)
+from deeplite_torch_zoo.wrappers.datasets.utils import get_dataloader
+from tests.test_packed_dataset import make_image_folder
+
+
+class RandomDataset(Dataset):
+    def __len__(self):
+        return 8
+
+    def __getitem__(self, idx):
+        return torch.tensor([np.random.rand(), torch.get_num_threads()]), idx
+
+
+def load(seed, **kwargs):
+    dataloader = get_dataloader(RandomDataset(), batch_size=2, num_workers=2, shuffle=True, seed=seed,
+        device='cpu', **kwargs)
+    return [torch.cat(x) for x in zip(*dataloader)]
+
+
+def test_get_dataloader_seed():
+    values, indices = load(seed=0)
+    # the workers are seeded differently and the threads are capped
+    assert len(set(values[:, 0].tolist())) == len(values) and (values[:, 1] == 1).all()
+    assert torch.equal(values, load(seed=0)[0]) and torch.equal(indices, load(seed=0)[1])
+    assert not torch.equal(values, load(seed=1)[0])
+
+
+def test_get_dataloader_options():
+    dataloader = get_dataloader(RandomDataset(), batch_size=4, num_workers=2, fp16=True, device='cpu',
+        prefetch_factor=4)
+    assert dataloader.persistent_workers and dataloader.prefetch_factor == 4 and not dataloader.pin_memory
+    for _ in range(2):
+        values, _ = next(iter(dataloader))
+        assert values.dtype == torch.float16
+
+
+def test_benchmark_dataloader(tmp_path, capsys):
+    for split in ('train', 'val'):
+        make_image_folder(tmp_path / split)
+    results = benchmark_dataloader('tinyimagenet', data_root=str(tmp_path), batch_size=4, num_workers=2,
+        num_batches=3, num_samples=10, img_size=16)
+    assert results['samples_per_sec'] > 0 and results['first_batch'] > 0
+    assert results['decode'] > 0 and results['augment'] > 0 and results['collate'] > 0
+    assert abs(results['decode'] + results['augment'] - results['getitem']) < 1e-9
+
+    main(['--dataset', 'tinyimagenet', '--data-root', str(tmp_path), '--split', 'test', '--batch-size', '4',
+        '--num-workers', '0', '--num-batches', '2', '--img-size', '16'])
+    assert 'samples/s' in capsys.readouterr().out
@@ -0,0 +1,73 @@
+import torch
+
+from deeplite_torch_zoo.src.objectdetection.datasets.batch import \
+    DetectionBatch
+from deeplite_torch_zoo.src.objectdetection.yolov5.models.losses.loss_utils import \
+    get_yolov5_targets
+from deeplite_torch_zoo.src.objectdetection.yolov5.utils.general import \
+    xyxy2cxcywh
+
+
+def make_samples(num_labels=(3, 0, 5, 1), num_cols=5):
+    torch.manual_seed(0)
+    images = [torch.randint(0, 256, (3, 8, 8), dtype=torch.uint8) for _ in num_labels]
+    labels = []
+    for n in num_labels:
+        xy1 = torch.rand(n, 2) * 50
+        label = torch.cat((xy1, xy1 + 1 + torch.rand(n, 2) * 50, torch.randint(0, 20, (n, 1)).float(),
+            torch.rand(n, num_cols - 5)), dim=1)
+        labels.append(label)
+    return images, labels
+
+
+def pad_labels(labels):
+    # collate output before the DetectionBatch
+    max_num_obj = max(len(label) for label in labels)
+    padded = torch.zeros((len(labels), max_num_obj, labels[0].shape[1]))
+    for i, label in enumerate(labels):
+        padded[i, :len(label)] = label
+    return padded, torch.tensor([len(label) for label in labels])
+
+
+def reference_targets(labels, img_size):
+    targets = [torch.cat((torch.full((len(label), 1), float(i)), label[:, 4:5],
+        xyxy2cxcywh(label[:, :4]) / img_size), dim=1) for i, label in enumerate(labels)]
+    return torch.cat(targets)
+
+
+def test_collate():
+    images, labels = make_samples()
+    shapes = [(480, 640)] * len(images)
+    batch = DetectionBatch.collate(images, labels, shapes)
+    padded, lengths = pad_labels(labels)
+    assert len(batch) == 4 and batch.targets.shape == (9, 6)
+    assert torch.equal(batch.images, torch.stack(images)) and torch.equal(batch.lengths, lengths)
+    assert torch.equal(batch.padded, padded) and batch.shapes.shape == (4, 2)
+    for i, label in enumerate(labels):
+        assert torch.equal(batch.image_labels(i), label)
+
+    # unpacks as the former (images, padded labels, lengths, shapes) collate output
+    imgs, targets, labels_length, shapes = batch
+    assert torch.equal(targets, padded) and torch.equal(labels_length, lengths)
+
+    roundtrip = DetectionBatch.from_padded(imgs, targets, labels_length, shapes)
+    assert torch.equal(roundtrip.targets, batch.targets) and torch.equal(roundtrip.offsets, batch.offsets)
+
+
+def test_collate_no_labels():
+    images, labels = make_samples(num_labels=(0, 0))
+    batch = DetectionBatch.collate(images, labels)
+    assert batch.targets.shape == (0, 6) and batch.padded.shape == (2, 0, 5)
+    assert get_yolov5_targets(batch, batch.lengths, 8, 'cpu').shape == (0, 6)
+
+
+def test_get_yolov5_targets():
+    images, labels = make_samples(num_cols=7)
+    batch = DetectionBatch.collate(images, labels).half().to('cpu')
+    assert batch.images.dtype == torch.uint8 and batch.targets.dtype == torch.float16
+    batch = DetectionBatch.collate(images, labels)
+    expected = reference_targets(labels, 64)
+    assert torch.allclose(get_yolov5_targets(batch, batch.lengths, 64, 'cpu'), expected)
+    padded, lengths = pad_labels(labels)
+    assert torch.allclose(get_yolov5_targets(padded, lengths, 64, 'cpu'), expected)
+    assert torch.allclose(get_yolov5_targets(padded, lengths.tolist(), 64, 'cpu'), expected)
@@ -0,0 +1,105 @@
+import os
+import random
+import time
+
+import numpy as np
+import pytest
+import torch
+
+from deeplite_torch_zoo.src.objectdetection.datasets.voc import VocDataset
+from deeplite_torch_zoo.wrappers.datasets.objectdetection.yolo import \
+    create_voc_datasets
+from deeplite_torch_zoo.wrappers.datasets.utils import get_dataloader
+from tests.test_detection_uint8 import make_voc_annotations
+
+SLOT_BYTES = 320 * 320 * 3
+
+
+def test_image_cache_matches_uncached(tmp_path):
+    annotation_path = make_voc_annotations(tmp_path)
+    dataset = VocDataset(str(annotation_path), 'test', img_size=320, uint8=True)
+    cached_dataset = VocDataset(str(annotation_path), 'test', img_size=320, uint8=True,
+        cache_size=4 * SLOT_BYTES)
+
+    for _ in range(2):
+        for i in range(len(dataset)):
+            img, bboxes, _, img_id, shape = cached_dataset[i]
+            ref_img, ref_bboxes, _, ref_img_id, ref_shape = dataset[i]
+            assert torch.equal(img, ref_img)
+            assert torch.allclose(bboxes, ref_bboxes)
+            assert (img_id, shape) == (ref_img_id, ref_shape)
+    assert cached_dataset.image_cache.stats() == {
+        'hits': 4, 'misses': 4, 'disk_hits': 0, 'evictions': 0, 'cached': 4, 'capacity': 4}
+
+
+def test_image_cache_lru_eviction(tmp_path):
+    annotation_path = make_voc_annotations(tmp_path)
+    dataset = VocDataset(str(annotation_path), 'test', img_size=320, cache_size=2 * SLOT_BYTES)
+    for i in (0, 1, 0, 2, 0, 1):
+        dataset[i]  # pylint: disable=pointless-statement
+    # 2 evicts 1 (least recently used), then 1 evicts 2
+    assert dataset.image_cache.stats() == {
+        'hits': 2, 'misses': 4, 'disk_hits': 0, 'evictions': 2, 'cached': 2, 'capacity': 2}
+
+
+def test_image_cache_disk(tmp_path):
+    annotation_path = make_voc_annotations(tmp_path)
+    cache_dir = tmp_path / 'cache'
+    for expected_disk_hits in (0, 4):
+        dataset = VocDataset(str(annotation_path), 'test', img_size=320, cache_dir=str(cache_dir))
+        samples = [dataset[i] for i in range(len(dataset))]
+        assert dataset.image_cache.stats()['disk_hits'] == expected_disk_hits
+    assert len(os.listdir(cache_dir)) == 4
+
+    # a modified image gets a new cache entry
+    img_path = tmp_path / '000000.jpg'
+    stat = img_path.stat()
+    os.utime(img_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    dataset = VocDataset(str(annotation_path), 'test', img_size=320, cache_dir=str(cache_dir))
+    assert torch.equal(dataset[0][0], samples[0][0])
+    assert dataset.image_cache.stats()['disk_hits'] == 0
+    assert len(os.listdir(cache_dir)) == 5
+
+
+def test_image_cache_shared_by_workers(tmp_path):
+    annotation_path = make_voc_annotations(tmp_path, num_images=8)
+    dataset = VocDataset(str(annotation_path), 'train', img_size=320, augment=True, uint8=True,
+        cache_size=8 * SLOT_BYTES)
+    loader = get_dataloader(dataset, batch_size=4, num_workers=2, collate_fn=dataset.collate_img_label_fn)
+    random.seed(0)
+    np.random.seed(0)
+    for _ in range(2):
+        for images, *_ in loader:
+            assert images.shape == (4, 3, 320, 320)
+    stats = dataset.image_cache.stats()
+    # mosaic loads up to 4 images per sample, each image is decoded once across the workers
+    assert stats['misses'] == stats['cached'] == 8
+    assert stats['hits'] >= 8
+
+
+def test_image_cache_budget_of_train_set(tmp_path, monkeypatch):
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'xdg'))
+    (tmp_path / 'yolo_data').mkdir()
+    make_voc_annotations(tmp_path / 'yolo_data')
+    train_dataset, test_dataset = create_voc_datasets(str(tmp_path), None, 320, standard_voc_format=False,
+        cache_size=4 * SLOT_BYTES, cache_dir=str(tmp_path / 'cache'))
+    # the RAM cache is allocated for the train set only, the test set only uses the disk cache
+    assert train_dataset.image_cache.num_slots == 4
+    assert test_dataset.image_cache.num_slots == 0 and test_dataset.image_cache.cache_dir is not None
+
+
+@pytest.mark.slow
+def test_image_cache_mosaic_throughput(tmp_path):
+    annotation_path = make_voc_annotations(tmp_path, num_images=32, img_shape=(480, 640))
+    timings = {}
+    for cached, cache_size in ((False, 0), (True, 32 * 640 * 640 * 3)):
+        dataset = VocDataset(str(annotation_path), 'train', img_size=640, augment=True, uint8=True,
+            cache_size=cache_size)
+        for i in range(len(dataset)):  # warm up the cache
+            dataset[i]  # pylint: disable=pointless-statement
+        start = time.perf_counter()
+        for i in range(len(dataset)):
+            dataset[i]  # pylint: disable=pointless-statement
+        timings[cached] = time.perf_counter() - start
+    print(f'Mosaic epoch time, no cache: {timings[False]:.2f}s, cached: {timings[True]:.2f}s')
+    assert timings[True] < timings[False]
@@ -0,0 +1,69 @@
+import random
+import time
+
+import cv2
+import numpy as np
+import pytest
+import torch
+
+from deeplite_torch_zoo.src.objectdetection.datasets.dataset import \
+    images_to_float
+from deeplite_torch_zoo.src.objectdetection.datasets.voc import VocDataset
+from deeplite_torch_zoo.wrappers.datasets.utils import get_dataloader
+
+CLASS_NAMES = ['cat', 'dog']
+
+
+def make_voc_annotations(root, num_images=4, img_shape=(375, 500)):
+    rng = np.random.RandomState(0)
+    lines = []
+    for i in range(num_images):
+        img_path = root / f'{i:06d}.jpg'
+        cv2.imwrite(str(img_path), rng.randint(0, 256, size=(*img_shape, 3), dtype=np.uint8))
+        boxes = ' '.join(f'{x},{y},{x + 100},{y + 80},{CLASS_NAMES[j % 2]}'
+            for j, (x, y) in enumerate(rng.randint(0, 250, size=(3, 2))))
+        lines.append(f'{img_path} {boxes}\n')
+    (root / 'class_names.txt').write_text(' '.join(CLASS_NAMES))
+    (root / 'train_annotation.txt').write_text(''.join(lines))
+    (root / 'test_annotation.txt').write_text(''.join(lines))
+    return root
+
+
+def test_voc_uint8_matches_float(tmp_path):
+    annotation_path = make_voc_annotations(tmp_path)
+    float_dataset = VocDataset(str(annotation_path), 'test', img_size=320)
+    uint8_dataset = VocDataset(str(annotation_path), 'test', img_size=320, uint8=True)
+
+    images, labels, *_ = uint8_dataset.collate_img_label_fn([uint8_dataset[i] for i in range(4)])
+    ref_images, ref_labels, *_ = float_dataset.collate_img_label_fn([float_dataset[i] for i in range(4)])
+    assert images.dtype == torch.uint8
+    assert torch.equal(labels, ref_labels)
+    # images are resized in uint8 instead of float32, pixels can differ by one step of rounding
+    assert (images_to_float(images) - ref_images).abs().max() <= 1 / 255 + 1e-6
+
+
+def test_voc_uint8_augmentation(tmp_path):
+    annotation_path = make_voc_annotations(tmp_path)
+    dataset = VocDataset(str(annotation_path), 'train', img_size=320, augment=True, uint8=True)
+    random.seed(0)
+    np.random.seed(0)
+    for i in range(len(dataset)):
+        img, bboxes, *_ = dataset[i]
+        assert img.dtype == torch.uint8 and img.shape == (3, 320, 320)
+        assert bboxes.dtype == torch.float32
+
+
+@pytest.mark.slow
+def test_voc_uint8_loader_throughput(tmp_path):
+    annotation_path = make_voc_annotations(tmp_path, num_images=64, img_shape=(480, 640))
+    timings, batch_bytes = {}, {}
+    for uint8 in (False, True):
+        dataset = VocDataset(str(annotation_path), 'test', img_size=640, uint8=uint8)
+        loader = get_dataloader(dataset, batch_size=16, num_workers=2, collate_fn=dataset.collate_img_label_fn)
+        start = time.perf_counter()
+        for images, *_ in loader:
+            batch_bytes[uint8] = images.element_size() * images.nelement()
+        timings[uint8] = time.perf_counter() - start
+    print(f'Loader time, float: {timings[False]:.2f}s, uint8: {timings[True]:.2f}s')
+    assert batch_bytes[False] == 4 * batch_bytes[True]
+    assert timings[True] < timings[False]
@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+
+try:
+    from deeplite_torch_zoo.src.classification.augmentations.distortions.distortions import \
+        shuffle_pixels
+except ImportError:  # Wand without the ImageMagick library
+    pytest.skip('distortions need Wand and ImageMagick', allow_module_level=True)
+
+
+def reference_shuffle_pixels(x, max_delta):
+    # loop of the original glass_blur
+    h_image, w_image = x.shape[0], x.shape[1]
+    for h in range(h_image - max_delta, max_delta, -1):
+        for w in range(w_image - max_delta, max_delta, -1):
+            dx, dy = np.random.randint(-max_delta, max_delta, size=(2,))
+            h_prime, w_prime = h + dy, w + dx
+            x[h, w], x[h_prime, w_prime] = x[h_prime, w_prime], x[h, w]
+    return x
+
+
+@pytest.mark.parametrize('shape', [(37, 53, 3), (64, 64, 3), (6, 5, 3)])
+@pytest.mark.parametrize('max_delta', [1, 2, 4])
+def test_shuffle_pixels(shape, max_delta):
+    x = np.random.RandomState(0).randint(0, 256, size=shape, dtype=np.uint8)
+    np.random.seed(max_delta)
+    expected = reference_shuffle_pixels(x.copy(), max_delta)
+    np.random.seed(max_delta)
+    assert np.array_equal(shuffle_pixels(x.copy(), max_delta), expected)
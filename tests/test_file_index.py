@@ -0,0 +1,49 @@
+import numpy as np
+from PIL import Image
+from torchvision import datasets
+
+from deeplite_torch_zoo.wrappers.datasets import file_index
+from deeplite_torch_zoo.wrappers.datasets.file_index import (
+    CachedImageFolder, get_file_index)
+
+
+def make_image_folder(root, num_classes=4, images_per_class=5):
+    rng = np.random.RandomState(0)
+    for class_index in range(num_classes):
+        class_dir = root / f'class{class_index}'
+        (class_dir / 'nested').mkdir(parents=True)
+        for i in range(images_per_class):
+            img = Image.fromarray(rng.randint(0, 256, size=(8, 8, 3), dtype=np.uint8))
+            img.save(class_dir / ('nested' if i % 2 else '') / f'{i}.PNG')
+        (class_dir / 'notes.txt').write_text('not an image')
+
+
+def test_cached_image_folder(tmp_path, monkeypatch):
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    make_image_folder(tmp_path / 'folder')
+    reference = datasets.ImageFolder(str(tmp_path / 'folder'))
+    for num_threads in (0, 4):
+        dataset = CachedImageFolder(str(tmp_path / 'folder'), num_threads=num_threads)
+        assert dataset.samples == reference.samples and dataset.classes == reference.classes
+        assert dataset.targets == reference.targets
+
+    # the cached index is used without walking the directories
+    walks = []
+    walk_class_dir = file_index._walk_class_dir
+    monkeypatch.setattr(file_index, '_walk_class_dir', lambda *args: walks.append(args) or walk_class_dir(*args))
+    assert CachedImageFolder(str(tmp_path / 'folder')).samples == reference.samples and not walks
+
+    # a new file in a nested directory invalidates the index
+    Image.fromarray(np.zeros((8, 8, 3), dtype=np.uint8)).save(tmp_path / 'folder' / 'class2' / 'nested' / 'new.png')
+    assert CachedImageFolder(str(tmp_path / 'folder')).samples == datasets.ImageFolder(str(tmp_path / 'folder')).samples
+    assert walks
+
+
+def test_file_index_all_files(tmp_path):
+    make_image_folder(tmp_path / 'folder')
+    classes, paths, labels = get_file_index(tmp_path / 'folder', extensions=None, classes=['class1', 'class3'],
+        cache_dir=tmp_path / 'cache')
+    assert classes == ['class1', 'class3'] and len(paths) == len(labels) == 12
+    assert sum(path.endswith('notes.txt') for path in paths) == 2 and sorted(set(labels)) == [0, 1]
+    assert (classes, paths, labels) == get_file_index(tmp_path / 'folder', extensions=None,
+        classes=['class1', 'class3'], cache_dir=tmp_path / 'cache')
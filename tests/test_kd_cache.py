@@ -0,0 +1,91 @@
+import random
+
+import numpy as np
+import torch
+import torch.nn.functional as F
+from torch.utils.data import DataLoader, Dataset
+
+from deeplite_torch_zoo.utils import (CachedTeacher, TeacherLogitCache,
+                                      sparse_kd_loss, with_augmentation_seeds)
+
+NUM_CLASSES = 20
+
+
+class RandomCropDataset(Dataset):
+    # the random augmentation depends on the torch random generator
+    classes = list(range(NUM_CLASSES))
+
+    def __len__(self):
+        return 10
+
+    def __getitem__(self, index):
+        return torch.full((4,), float(index)) + torch.rand(4), index % NUM_CLASSES
+
+
+class Teacher:
+    def __init__(self):
+        self.weight = torch.randn(4, NUM_CLASSES)
+        self.num_samples = 0
+
+    def __call__(self, inputs):
+        self.num_samples += len(inputs)
+        return inputs @ self.weight
+
+
+def test_sparse_kd_loss():
+    student, teacher = torch.randn(8, NUM_CLASSES), torch.randn(8, NUM_CLASSES)
+    expected = F.kl_div(F.log_softmax(student, -1), F.softmax(teacher, -1), reduction='batchmean')
+    values, indices = teacher.topk(NUM_CLASSES, dim=-1)
+    assert torch.allclose(sparse_kd_loss(student, values, indices), expected, atol=1e-6)
+    values, indices = teacher.topk(5, dim=-1)
+    assert sparse_kd_loss(student, values, indices) > 0
+
+
+def test_augmentation_seeds():
+    loader = with_augmentation_seeds(DataLoader(RandomCropDataset(), batch_size=4, shuffle=True), num_seeds=2)
+    assert loader.dataset.classes == RandomCropDataset.classes
+    random_state, numpy_state = random.getstate(), np.random.get_state()
+    epochs = [list(loader) for _ in range(3)]
+    samples = [{int(index): image for images, _, indices, _ in epoch for image, index in zip(images, indices)}
+        for epoch in epochs]
+    # the augmentations only depend on the index and the seed of the epoch, which repeats every 2 epochs
+    assert all(torch.equal(samples[0][index], samples[2][index]) for index in range(10))
+    assert not any(torch.equal(samples[0][index], samples[1][index]) for index in range(10))
+    assert [set(seeds.tolist()) for epoch in epochs for *_, seeds in epoch[:1]] == [{0}, {1}, {0}]
+    # the random states of the training process are restored after the augmentations
+    assert random.getstate() == random_state and np.array_equal(np.random.get_state()[1], numpy_state[1])
+
+
+def test_cached_teacher(tmp_path):
+    torch.manual_seed(0)
+    loader = with_augmentation_seeds(DataLoader(RandomCropDataset(), batch_size=4, shuffle=True), num_seeds=2)
+    teacher = Teacher()
+    cache = TeacherLogitCache(str(tmp_path), len(loader.dataset), NUM_CLASSES, num_seeds=2, top_k=5)
+    cached_teacher = CachedTeacher(teacher, cache)
+
+    for epoch in range(4):
+        loader.sampler.set_epoch(epoch)
+        cached_teacher.set_epoch(epoch)
+        for images, _, indices, seeds in loader:
+            values, classes = cached_teacher(images, indices, seeds)
+            expected_values, expected_classes = (images @ teacher.weight).topk(5, dim=-1)
+            assert torch.equal(classes, expected_classes)
+            assert torch.allclose(values.float(), expected_values, rtol=1e-3, atol=1e-3)
+        # the teacher only runs in the first epoch of each seed
+        assert teacher.num_samples == 10 * min(epoch + 1, 2)
+    cache.flush()
+
+    # the cache is reopened with the same settings, refreshed entries are recomputed
+    cached_teacher = CachedTeacher(teacher, TeacherLogitCache(str(tmp_path), 10, NUM_CLASSES, num_seeds=2, top_k=5),
+        refresh=0.5)
+    num_samples = teacher.num_samples
+    for images, _, indices, seeds in loader:
+        cached_teacher(images, indices, seeds)
+    assert 0 < teacher.num_samples - num_samples < 10
+
+    # another number of seeds creates a new cache, which is filled offline
+    cache = TeacherLogitCache(str(tmp_path), 10, NUM_CLASSES, num_seeds=3, top_k=5)
+    assert not cache.filled.any()
+    loader = with_augmentation_seeds(DataLoader(RandomCropDataset(), batch_size=4), num_seeds=3)
+    CachedTeacher(teacher, cache).fill(loader)
+    assert cache.filled.all()
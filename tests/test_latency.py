@@ -0,0 +1,95 @@
+import json
+
+import pytest
+import torch
+import torch.nn as nn
+
+import deeplite_torch_zoo.wrappers.wrapper as wrapper
+from deeplite_torch_zoo import list_models, predict_latency_by_name
+from deeplite_torch_zoo.src.dnn_blocks.common import ConvBnAct
+from deeplite_torch_zoo.utils import (LatencyTable, build_latency_table,
+                                      get_latency_table, predict_latency,
+                                      set_latency_table)
+from deeplite_torch_zoo.utils.latency import get_key
+from deeplite_torch_zoo.wrappers.latency import main
+
+TINY_GRID = {'channels': (16,), 'resolutions': (8,), 'stem_channels': (16,), 'stem_resolutions': (16,)}
+
+
+@pytest.fixture(name='table')
+def fixture_table(tmp_path):
+    previous = get_latency_table()
+    table = LatencyTable(tmp_path / 'latency_lut.json')
+    build_latency_table(table, grid=TINY_GRID, warmup=1, repeat=3)
+    set_latency_table(table)
+    yield table
+    set_latency_table(previous)
+
+
+def test_latency_table(table):
+    groups = {entry['group'] for entry in table.entries.values()}
+    assert {'Conv2d', 'Conv2d/grouped', 'ConvBnAct', 'MBConv', 'MobileOneBlock/grouped', 'ShuffleUnit'} <= groups
+    # the configurations in the LUT are not measured again, a new instance reads the LUT from disk
+    assert build_latency_table(table, grid=TINY_GRID, blocks=['ConvBnAct']) == 0
+    assert len(LatencyTable(table.path)) == len(table) > 0
+    with pytest.raises(ValueError):
+        build_latency_table(table, blocks=['UnknownBlock'])
+
+    # the LUT is stored per machine and the files of other versions of the format are ignored
+    with open(table.path) as f:
+        contents = json.load(f)
+    assert list(contents['tables']) == [LatencyTable.device_key()]
+    contents['version'] = 0
+    with open(table.path, 'w') as f:
+        json.dump(contents, f)
+    assert len(LatencyTable(table.path)) == 0
+
+
+def test_predict_latency(table):
+    block = ConvBnAct(16, 32, 3, s=2).eval()
+    inputs = torch.randn(1, 16, 8, 8)
+    entry = table.get(get_key(block, inputs.shape))
+    # the benchmarked blocks are looked up, the other modules are decomposed into their child modules
+    assert predict_latency(block, inputs, table=table) == entry['latency_ms']
+    model = nn.Sequential(ConvBnAct(16, 32, 3, s=2), ConvBnAct(16, 32, 3, s=2)).eval()
+    model[1] = nn.Sequential(ConvBnAct(32, 32, 1), nn.GELU(), nn.Conv2d(32, 8, 1))
+    latency_ms = predict_latency(model, inputs, table=table)
+    assert latency_ms > entry['latency_ms']
+    # the same configuration at a higher resolution is estimated from the entries of its block type
+    assert predict_latency(block, img_size=(16, 32, 32), table=table) > entry['latency_ms']
+    # the model is traced in eval mode and its mode is restored
+    assert predict_latency(model.train(), inputs, table=table) == latency_ms and model.training
+
+    with pytest.raises(RuntimeError):
+        predict_latency(block, inputs, table=LatencyTable(table.path + '.empty'))
+
+
+def test_list_models_by_latency(table, monkeypatch):
+    model_keys = list_models('resnet*cifar100', print_table=False, return_list=True, sort_by='latency', img_size=32)
+    latencies = [predict_latency_by_name(key.model_name, key.dataset_name, img_size=32) for key in model_keys]
+    assert len(model_keys) == 3 and latencies == sorted(latencies)
+    assert [key.model_name for key in model_keys].index('resnet18') < \
+        [key.model_name for key in model_keys].index('resnet50')
+
+    # the predictions are cached, the models are not created again
+    monkeypatch.setattr(wrapper, 'get_model_by_name', None)
+    model_keys = list_models('resnet*cifar100', print_table=False, return_list=True, max_latency_ms=latencies[1],
+        img_size=32)
+    assert len(model_keys) == 2 and 'resnet50' not in [key.model_name for key in model_keys]
+
+    with pytest.raises(RuntimeError):
+        list_models('resnet', sort_by='macs')
+    set_latency_table(LatencyTable(table.path + '.empty'))
+    with pytest.raises(RuntimeError):
+        list_models('resnet', sort_by='latency')
+
+
+def test_latency_cli(tmp_path, capsys):
+    previous = get_latency_table()
+    try:
+        main(['--lut', str(tmp_path / 'lut.json'), '--channels', '16', '--resolutions', '8', '--blocks',
+            'Conv2d_k3', 'Conv2d_k1', 'BatchNorm2d', 'ReLU', '--filter', 'resnet18_cifar100', '--img-size', '32'])
+    finally:
+        set_latency_table(previous)
+    output = capsys.readouterr().out
+    assert 'Predicted latency, ms' in output and 'resnet18' in output
@@ -0,0 +1,83 @@
+import os
+import subprocess
+import sys
+
+import pytest
+import torch
+from torch import nn
+
+from deeplite_torch_zoo.utils import load_checkpoint, load_state_dict_partial
+
+PEAK_MEMORY_BENCHMARK = '''
+import threading, time, torch
+from torch import nn
+from deeplite_torch_zoo.utils import load_checkpoint, load_state_dict_partial
+
+def rss_anon_mb():
+    with open('/proc/self/status') as f:
+        return next(int(line.split()[1]) for line in f if line.startswith('RssAnon')) / 1024
+
+def load_state_dict_partial_eager(model, checkpoint_path):
+    pretrained_dict = torch.load(checkpoint_path, map_location='cpu')
+    model_dict = model.state_dict()
+    pretrained_dict = {{k: v for k, v in pretrained_dict.items()
+        if k in model_dict and v.size() == model_dict[k].size()}}
+    model_dict.update(pretrained_dict)
+    model.load_state_dict(model_dict)
+
+model = nn.Sequential(*[nn.Linear(1024, 1024) for _ in range({num_layers})])
+peak, done = [rss_anon_mb()], threading.Event()
+def sample():
+    while not done.is_set():
+        peak.append(rss_anon_mb())
+        time.sleep(0.001)
+sampler = threading.Thread(target=sample)
+sampler.start()
+baseline = rss_anon_mb()
+if '{impl}' == 'eager':
+    load_state_dict_partial_eager(model, '{checkpoint_path}')
+else:
+    load_state_dict_partial(model, load_checkpoint('{checkpoint_path}'))
+done.set()
+sampler.join()
+print(max(peak) - baseline)
+'''
+
+
+def test_load_state_dict_partial_skips_mismatched():
+    model = nn.Sequential(nn.Conv2d(3, 8, 3), nn.BatchNorm2d(8), nn.Linear(8, 10))
+    pretrained = nn.Sequential(nn.Conv2d(3, 8, 3), nn.BatchNorm2d(8), nn.Linear(8, 5))
+    head_weight = model[2].weight.clone()
+
+    mismatched = load_state_dict_partial(model, pretrained.state_dict())
+    assert mismatched == ['2.weight', '2.bias']
+    assert torch.equal(model[0].weight, pretrained[0].weight)
+    assert torch.equal(model[1].running_var, pretrained[1].running_var)
+    assert torch.equal(model[2].weight, head_weight)
+
+
+def test_load_checkpoint_mmap(tmp_path):
+    model = nn.Linear(16, 4)
+    torch.save(model.state_dict(), tmp_path / 'model.pt')
+    torch.save(model.state_dict(), tmp_path / 'legacy.pt', _use_new_zipfile_serialization=False)
+
+    for filename in ('model.pt', 'legacy.pt'):
+        restored = nn.Linear(16, 4)
+        assert load_state_dict_partial(restored, load_checkpoint(tmp_path / filename)) == []
+        assert torch.equal(restored.weight, model.weight)
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(not os.path.exists('/proc/self/status'), reason='needs procfs')
+def test_load_state_dict_partial_peak_memory(tmp_path):
+    num_layers = 64  # 256 Mb of weights
+    checkpoint_path = tmp_path / 'model.pt'
+    torch.save(nn.Sequential(*[nn.Linear(1024, 1024) for _ in range(num_layers)]).state_dict(), checkpoint_path)
+
+    peak_mb = {}
+    for impl in ('eager', 'mmap'):
+        code = PEAK_MEMORY_BENCHMARK.format(num_layers=num_layers, impl=impl, checkpoint_path=checkpoint_path)
+        output = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True).stdout
+        peak_mb[impl] = float(output.split()[-1])
+    print(f'Peak memory increase while loading, Mb: {peak_mb}')
+    assert peak_mb['mmap'] * 4 < peak_mb['eager']
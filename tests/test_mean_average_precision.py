@@ -0,0 +1,133 @@
+import time
+
+import numpy as np
+import pytest
+import torch
+
+from deeplite_torch_zoo.src.objectdetection.eval.mean_average_precision import \
+    MetricBuilder
+from deeplite_torch_zoo.src.objectdetection.eval.yolov5_eval.yolov5_eval import (
+    process_batch, process_batch_dense)
+
+
+def make_detection_samples(num_images, num_classes, num_preds, num_gt, seed=42):
+    rng = np.random.RandomState(seed)
+    samples = []
+    for _ in range(num_images):
+        n_gt = rng.randint(0, num_gt + 1)
+        xy = rng.uniform(0, 400, size=(n_gt, 2))
+        wh = rng.uniform(10, 100, size=(n_gt, 2))
+        gt = np.zeros((n_gt, 7))
+        gt[:, :2], gt[:, 2:4] = xy, xy + wh
+        gt[:, 4] = rng.randint(0, num_classes, size=n_gt)
+        gt[:, 5] = rng.uniform(size=n_gt) < 0.1
+        gt[:, 6] = rng.uniform(size=n_gt) < 0.1
+
+        n_preds = rng.randint(0, num_preds + 1)
+        preds = np.zeros((n_preds, 6))
+        if n_gt:
+            # jittered copies of gt boxes, several predictions per gt
+            src = gt[rng.randint(0, n_gt, size=n_preds)]
+            preds[:, :4] = src[:, :4] + rng.normal(0, 8, size=(n_preds, 4))
+            preds[:, 4] = np.where(rng.uniform(size=n_preds) < 0.9, src[:, 4],
+                                   rng.randint(0, num_classes, size=n_preds))
+        else:
+            preds[:, :2] = rng.uniform(0, 400, size=(n_preds, 2))
+            preds[:, 2:4] = preds[:, :2] + rng.uniform(10, 100, size=(n_preds, 2))
+            preds[:, 4] = rng.randint(0, num_classes, size=n_preds)
+        preds[:, 5] = rng.uniform(size=n_preds)
+        samples.append((preds, gt))
+    return samples
+
+
+def compute_metrics(metric_type, samples, num_classes, **value_kwargs):
+    metric_fn = MetricBuilder.build_evaluation_metric(metric_type, num_classes=num_classes)
+    for preds, gt in samples:
+        metric_fn.add(preds, gt)
+    return metric_fn.value(**value_kwargs)
+
+
+@pytest.mark.parametrize(
+    ('iou_thresholds', 'recall_thresholds', 'mpolicy'),
+    [
+        (0.5, None, 'greedy'),
+        (0.5, None, 'soft'),
+        (np.arange(0.5, 1.0, 0.05), np.arange(0., 1.01, 0.01), 'soft'),
+        (np.arange(0.5, 1.0, 0.05), np.arange(0., 1.01, 0.01), 'greedy'),
+    ]
+)
+def test_map_2d_numpy_matches_pandas(iou_thresholds, recall_thresholds, mpolicy):
+    num_classes = 5
+    samples = make_detection_samples(num_images=50, num_classes=num_classes, num_preds=30, num_gt=10)
+    value_kwargs = dict(iou_thresholds=iou_thresholds, recall_thresholds=recall_thresholds, mpolicy=mpolicy)
+    ref = compute_metrics('map_2d_pandas', samples, num_classes, **value_kwargs)
+    res = compute_metrics('map_2d', samples, num_classes, **value_kwargs)
+
+    assert np.isclose(res['mAP'], ref['mAP'])
+    for t in np.atleast_1d(iou_thresholds):
+        for class_id in range(num_classes):
+            assert np.isclose(res[t][class_id]['ap'], ref[t][class_id]['ap'])
+            assert np.allclose(res[t][class_id]['precision'], ref[t][class_id]['precision'])
+            assert np.allclose(res[t][class_id]['recall'], ref[t][class_id]['recall'])
+
+
+@pytest.mark.slow
+def test_map_2d_numpy_speedup():
+    num_classes = 20
+    samples = make_detection_samples(num_images=300, num_classes=num_classes, num_preds=100, num_gt=20)
+    value_kwargs = dict(
+        iou_thresholds=np.arange(0.5, 1.0, 0.05),
+        recall_thresholds=np.arange(0., 1.01, 0.01),
+        mpolicy='soft',
+    )
+    timings = {}
+    for metric_type in ('map_2d_pandas', 'map_2d'):
+        start = time.perf_counter()
+        compute_metrics(metric_type, samples, num_classes, **value_kwargs)
+        timings[metric_type] = time.perf_counter() - start
+    print(f'mAP computation time: {timings}')
+    assert timings['map_2d'] * 10 < timings['map_2d_pandas']
+
+
+def test_process_batch_dense_matches_process_batch():
+    samples = make_detection_samples(num_images=8, num_classes=3, num_preds=40, num_gt=8, seed=0)
+    iouv = torch.linspace(0.5, 0.95, 10)
+    num_preds = max(preds.shape[0] for preds, _ in samples)
+    num_gt = max(gt.shape[0] for _, gt in samples)
+    detections = torch.zeros(len(samples), num_preds, 6)
+    labels = torch.zeros(len(samples), num_gt, 5)
+    for i, (preds, gt) in enumerate(samples):
+        preds = preds[np.argsort(-preds[:, 5])]
+        detections[i, :preds.shape[0]] = torch.from_numpy(preds[:, [0, 1, 2, 3, 5, 4]])
+        labels[i, :gt.shape[0]] = torch.from_numpy(gt[:, :5])
+    detections_valid = detections[..., 4] > 0
+    labels_valid = labels.ne(0).any(-1)
+
+    correct = process_batch_dense(detections, detections_valid, labels, labels_valid, iouv)
+    for i, (preds, gt) in enumerate(samples):
+        ref = process_batch(
+            detections[i, :preds.shape[0]],
+            labels[i, :gt.shape[0]][:, [4, 0, 1, 2, 3]],
+            iouv,
+        )
+        assert torch.equal(correct[i, :preds.shape[0]], ref)
+        assert not correct[i, preds.shape[0]:].any()
+
+
+@pytest.mark.parametrize('async_mode', ['thread', 'process'])
+def test_map_2d_async(async_mode):
+    num_classes = 5
+    samples = make_detection_samples(num_images=20, num_classes=num_classes, num_preds=30, num_gt=10)
+    ref = compute_metrics('map_2d', samples, num_classes, iou_thresholds=0.5)
+    metric_fn = MetricBuilder.build_evaluation_metric('map_2d', async_mode=async_mode, num_classes=num_classes)
+    for preds, gt in samples:
+        metric_fn.add(preds, gt)
+    assert metric_fn.value(iou_thresholds=0.5)['mAP'] == ref['mAP']
+
+    metric_fn.reset()
+    metric_fn.add(np.zeros((3, 5)), np.zeros((0, 7)))
+    with pytest.raises(RuntimeError):
+        for preds, gt in samples:
+            metric_fn.add(preds, gt)
+        metric_fn.value(iou_thresholds=0.5)
+    metric_fn.reset()
@@ -0,0 +1,116 @@
+import pytest
+import torch
+import torch.nn as nn
+
+from deeplite_torch_zoo import get_model_by_name
+from deeplite_torch_zoo.src.dnn_blocks.common import ConvBnAct
+from deeplite_torch_zoo.src.dnn_blocks.mobileone.mobileone_blocks import \
+    MobileOneBlock
+from deeplite_torch_zoo.src.dnn_blocks.replk.large_kernel_blocks import (
+    LargeKernelReparam, RepLKBlock)
+from deeplite_torch_zoo.src.dnn_blocks.yolov7.repvgg_blocks import RepConv
+from deeplite_torch_zoo.src.objectdetection.flexible_yolo.backbone.repvgg import \
+    RepVGGBlock
+from deeplite_torch_zoo.utils import fuse_conv_bn, optimize_for_inference
+from deeplite_torch_zoo.wrappers.optimize import benchmark_optimization, main
+
+
+def randomize_batch_norms(model):
+    torch.manual_seed(0)
+    for module in model.modules():
+        if isinstance(module, nn.BatchNorm2d):
+            module.running_mean.uniform_(-1, 1)
+            module.running_var.uniform_(0.5, 2)
+            module.weight.data.uniform_(0.5, 1.5)
+            module.bias.data.uniform_(-0.5, 0.5)
+    return model
+
+
+def count_batch_norms(model):
+    return sum(isinstance(module, nn.BatchNorm2d) for module in model.modules())
+
+
+class Branches(nn.Module):
+    # the output of conv is used twice and can not be fused, the Sequential can not be traced
+    def __init__(self):
+        super().__init__()
+        self.conv = nn.Conv2d(8, 8, 3, padding=1)
+        self.bn = nn.BatchNorm2d(8)
+        self.seq = nn.Sequential(nn.Conv2d(8, 8, 3, groups=4, dilation=2, padding=2, bias=False),
+            nn.BatchNorm2d(8), nn.Dropout(0.5), nn.ReLU())
+
+    def forward(self, x):
+        y = self.conv(x)
+        return self.bn(y) + y + self.seq(x)
+
+
+@pytest.mark.parametrize(
+    ('block', 'make_block', 'num_batch_norms'),
+    [
+        (ConvBnAct, lambda: ConvBnAct(8, 8, 3), 0),
+        (ConvBnAct, lambda: ConvBnAct(8, 16, 3, g=4, residual=True), 0),
+        (MobileOneBlock, lambda: MobileOneBlock(8, 8), 0),
+        (RepConv, lambda: RepConv(8, 8, g=4), 0),
+        (RepVGGBlock, lambda: RepVGGBlock(8, 8, 3, padding=1), 0),
+        (LargeKernelReparam, lambda: LargeKernelReparam(8, 7, small_kernel=3), 0),
+        # the pre_bn and premlp_bn batch norms do not follow a convolution
+        (RepLKBlock, lambda: RepLKBlock(8, 8, k=7, small_kernel=3), 2),
+        (Branches, Branches, 1),
+    ]
+)
+def test_optimize_block(block, make_block, num_batch_norms):
+    model = make_block()
+    randomize_batch_norms(model).eval()
+    x = torch.randn(2, 8, 16, 16)
+    optimized = optimize_for_inference(model, inputs=x)
+    assert count_batch_norms(model) > 0 and count_batch_norms(optimized) == num_batch_norms
+    assert not any(isinstance(module, nn.Dropout) for module in optimized.modules())
+    assert torch.allclose(model(x), optimized(x), atol=1e-4)
+    if block is ConvBnAct:
+        assert optimized.forward == optimized.forward_fuse and not hasattr(optimized, 'bn')
+
+
+def test_fuse_conv_bn():
+    conv = nn.Conv2d(4, 6, 3, stride=2, groups=2, padding=1, padding_mode='reflect').double()
+    bn = randomize_batch_norms(nn.BatchNorm2d(6).double()).eval()
+    fused = fuse_conv_bn(conv, bn)
+    x = torch.randn(1, 4, 9, 9, dtype=torch.float64)
+    assert fused.padding_mode == 'reflect' and fused.weight.dtype == torch.float64
+    assert torch.allclose(fused(x), bn(conv(x)))
+
+
+def test_optimize_validation():
+    class Noise(nn.Module):
+        def forward(self, x):
+            return x + torch.rand_like(x)
+
+    model = nn.Sequential(nn.Conv2d(3, 4, 3), nn.BatchNorm2d(4), Noise())
+    with pytest.raises(ValueError):
+        optimize_for_inference(model, img_size=8)
+    # the original model is not modified
+    assert isinstance(model[1], nn.BatchNorm2d)
+    optimized = optimize_for_inference(model, img_size=8, validate=False)
+    assert len(optimized) == 2
+
+
+@pytest.mark.parametrize(
+    ('model_name', 'dataset_name', 'img_size'),
+    [
+        ('resnet18', 'cifar100', 32),
+        ('yolo5_6n', 'voc', 128),
+        # the SSD base network is sliced by index, its identities are kept
+        ('mb2_ssd', 'voc', 300),
+    ]
+)
+def test_optimize_zoo_model(model_name, dataset_name, img_size):
+    model = get_model_by_name(model_name, dataset_name, pretrained=False, device='cpu')
+    optimized = optimize_for_inference(randomize_batch_norms(model), img_size=img_size)
+    assert type(optimized) is type(model) and not optimized.training
+    assert count_batch_norms(optimized) == 0
+
+
+def test_benchmark_optimization(capsys):
+    results = benchmark_optimization('resnet18', 'cifar100', img_size=32, warmup=1, repeat=2)
+    assert results['latency_ms'] > 0 and results['optimized_latency_ms'] > 0
+    main(['--models', 'resnet18:cifar100:32', '--warmup', '1', '--repeat', '2'])
+    assert 'resnet18' in capsys.readouterr().out
@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+import torch
+from PIL import Image
+from torch.utils.data import DataLoader
+from torchvision import datasets, transforms
+
+from deeplite_torch_zoo import get_data_splits_by_name
+from deeplite_torch_zoo.wrappers.datasets.packed import (
+    PackedDataset, PackedIterableDataset, get_samples, main,
+    write_packed_dataset)
+from deeplite_torch_zoo.wrappers.datasets.utils import set_dataloader_epoch
+
+
+def make_image_folder(root, num_classes=3, images_per_class=7):
+    rng = np.random.RandomState(0)
+    for class_index in range(num_classes):
+        (root / f'class{class_index}').mkdir(parents=True)
+        for i in range(images_per_class):
+            img = rng.randint(0, 256, size=(16, 16, 3), dtype=np.uint8)
+            Image.fromarray(img).save(root / f'class{class_index}' / f'{i}.png')
+    return datasets.ImageFolder(str(root), transform=transforms.PILToTensor())
+
+
+@pytest.fixture
+def packed_dataset(tmp_path):
+    folder_dataset = make_image_folder(tmp_path / 'folder')
+    # about 2 images per shard
+    metadata = write_packed_dataset(get_samples(folder_dataset), tmp_path / 'packed', 'train',
+        classes=folder_dataset.classes, shard_size=1500)
+    assert len(metadata['shards']) > 5
+    return folder_dataset, tmp_path / 'packed'
+
+
+def test_packed_dataset(packed_dataset):
+    folder_dataset, packed_root = packed_dataset
+    dataset = PackedDataset(packed_root, 'train', transform=transforms.PILToTensor())
+    assert len(dataset) == len(folder_dataset) and dataset.classes == folder_dataset.classes
+    for i in range(len(dataset)):
+        img, label = dataset[i]
+        ref_img, ref_label = folder_dataset[i]
+        assert torch.equal(img, ref_img) and label == ref_label
+
+
+def iterate_labels(packed_root, epoch, rank=0, world_size=1, num_workers=0):
+    dataset = PackedIterableDataset(packed_root, 'train', transform=transforms.PILToTensor(),
+        rank=rank, world_size=world_size)
+    dataset.set_epoch(epoch)
+    samples = list(DataLoader(dataset, batch_size=None, num_workers=num_workers))
+    assert len(samples) == len(dataset)
+    return [(int(label), img.sum().item()) for img, label in samples]
+
+
+def test_packed_iterable_dataset_ddp(packed_dataset):
+    folder_dataset, packed_root = packed_dataset
+    expected = sorted((label, folder_dataset[i][0].sum().item()) for i, (_, label) in
+        enumerate(folder_dataset.samples))
+    epoch0 = iterate_labels(packed_root, epoch=0)
+    assert sorted(epoch0) == expected
+    assert epoch0 != iterate_labels(packed_root, epoch=1)
+
+    # 2 ranks with 2 workers each read disjoint equal parts of the same shuffled sequence
+    ranks = [iterate_labels(packed_root, epoch=0, rank=rank, world_size=2, num_workers=2) for rank in range(2)]
+    assert len(ranks[0]) == len(ranks[1]) == len(folder_dataset) // 2
+    combined = ranks[0] + ranks[1]
+    assert len(set(combined)) == len(combined) and set(combined) <= set(epoch0)
+    assert ranks == [iterate_labels(packed_root, epoch=0, rank=rank, world_size=2, num_workers=2) for rank in range(2)]
+
+
+def test_packed_wrapper(tmp_path):
+    for split in ('train', 'val'):
+        make_image_folder(tmp_path / 'folder' / split)
+        main(['--src', str(tmp_path / 'folder' / split), '--dst', str(tmp_path / 'packed'), '--split', split])
+    dataloaders = get_data_splits_by_name(data_root=str(tmp_path / 'packed'), dataset_name='tinyimagenet',
+        model_name='resnet18', batch_size=4, num_workers=0, img_size=16, format='packed')
+    images, labels = next(iter(dataloaders['train']))
+    assert images.shape == (4, 3, 16, 16) and labels.shape == (4,)
+    assert sum(len(labels) for _, labels in dataloaders['test']) == 21
+
+
+def test_packed_wrapper_epochs(tmp_path):
+    for split in ('train', 'val'):
+        make_image_folder(tmp_path / 'folder' / split)
+        main(['--src', str(tmp_path / 'folder' / split), '--dst', str(tmp_path / 'packed'), '--split', split])
+    train_loader = get_data_splits_by_name(data_root=str(tmp_path / 'packed'), dataset_name='tinyimagenet',
+        model_name='resnet18', batch_size=4, num_workers=2, img_size=16, format='packed')['train']
+    # the epoch loop of the training scripts, the epoch reaches the dataset copies of the workers,
+    # the images are randomly augmented so the orders are compared by label
+    orders = []
+    for epoch in range(2):
+        set_dataloader_epoch(train_loader, epoch)
+        orders.append([label.item() for _, labels in train_loader for label in labels])
+    assert orders[0] != orders[1] and sorted(orders[0]) == sorted(orders[1])
+    assert len(orders[0]) == 21
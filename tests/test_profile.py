@@ -1,6 +1,10 @@
 import pytest
+import torch
 
-from deeplite_torch_zoo import get_model_by_name, profile
+import deeplite_torch_zoo.wrappers.wrapper as wrapper
+from deeplite_torch_zoo import get_model_by_name, get_profile_by_name, profile
+from deeplite_torch_zoo.utils import (ProfileCache, count_macs,
+                                      set_profile_cache)
 
 
 @pytest.mark.parametrize(
@@ -25,3 +29,47 @@ def test_profile(
 
     assert metrics_dict['GMACs'] == ref_gmacs
     assert metrics_dict['size_Mb'] == ref_model_size_mb
+
+
+@pytest.mark.parametrize(
+    ('model_name', 'dataset_name', 'img_size'),
+    [
+        ('mobilenet_v3_small', 'imagenet', 224),
+        ('efficientnet_b0', 'imagenet', 224),
+        ('vit_tiny_patch16_224', 'imagenet', 224),
+        ('resnet18', 'cifar100', 32),
+    ]
+)
+def test_count_macs_matches_torchprofile(model_name, dataset_name, img_size):
+    from torchprofile import profile_macs
+
+    model = get_model_by_name(model_name=model_name, dataset_name=dataset_name, pretrained=False, device='cpu')
+    model.eval()
+    inputs = torch.randn(1, 3, img_size, img_size)
+    assert count_macs(model, inputs) == profile_macs(model, inputs)
+
+
+def test_profile_cache(tmp_path, monkeypatch):
+    set_profile_cache(ProfileCache(tmp_path / 'profile.json'))
+    try:
+        metrics_dict = get_profile_by_name('resnet18', 'cifar100', img_size=32, measure_latency=True, batch_size=2)
+        assert {'GMACs', 'size_Mb', 'Mparams', 'latency_ms', 'latency_ms_p50', 'throughput'} <= set(metrics_dict)
+
+        # a fresh cache instance reads the results from disk, the model is not created again
+        set_profile_cache(ProfileCache(tmp_path / 'profile.json'))
+        monkeypatch.setattr(wrapper, 'get_model_by_name', None)
+        assert get_profile_by_name('resnet18', 'cifar100', img_size=32, measure_latency=True,
+            batch_size=2) == metrics_dict
+        assert get_profile_by_name('resnet18', 'cifar100', img_size=32) == \
+            {name: metrics_dict[name] for name in ('GMACs', 'size_Mb', 'Mparams')}
+        # latency measurements are not shared across devices, dtypes and torch versions
+        key = ProfileCache.make_key('resnet18', 'cifar100', (2, 3, 32, 32), latency=True)
+        assert ProfileCache.make_key('resnet18', 'cifar100', (2, 3, 32, 32), latency=True, device='cuda:0') != key
+        assert ProfileCache.make_key('resnet18', 'cifar100', (2, 3, 32, 32), latency=True,
+            dtype=torch.float16) != key
+        assert torch.__version__ in key
+
+        # models passed to profile are never looked up in the cache
+        assert profile(torch.nn.Conv2d(3, 8, 3), img_size=32)['GMACs'] != metrics_dict['GMACs']
+    finally:
+        set_profile_cache(None)
@@ -0,0 +1,116 @@
+import math
+
+import pytest
+import torch
+import torch.nn as nn
+
+from deeplite_torch_zoo import get_model_by_name
+from deeplite_torch_zoo.src.dnn_blocks.common import ConvBnAct, DWConv
+from deeplite_torch_zoo.src.objectdetection.yolov5.models.experimental import \
+    C3
+from deeplite_torch_zoo.utils import ChannelDependencyGraph, prune_channels
+from deeplite_torch_zoo.wrappers.prune import main, prune_model
+from deeplite_torch_zoo.wrappers.wrapper import profile
+from tests.test_optimize import randomize_batch_norms
+
+MOCK_VOC_PATH = 'tests/fixture/datasets/VOCdevkit'
+
+
+class Net(nn.Module):
+    # residual additions, depthwise convolutions, a CSP block with a concatenation, squeeze-and-excitation
+    def __init__(self):
+        super().__init__()
+        self.stem = ConvBnAct(3, 16, 3, s=2)
+        self.res = ConvBnAct(16, 16, 3, residual=True)
+        self.down = ConvBnAct(16, 24, 3, s=2, residual=True)
+        self.dw = DWConv(24, 24, 3)
+        self.csp = C3(24, 32, n=2)
+        self.se = nn.Sequential(nn.AdaptiveAvgPool2d(1), nn.Conv2d(32, 8, 1), nn.ReLU(), nn.Conv2d(8, 32, 1),
+            nn.Sigmoid())
+        self.pool = nn.AdaptiveAvgPool2d(1)
+        self.fc = nn.Linear(32, 10)
+
+    def forward(self, x):
+        x = self.csp(self.dw(self.down(self.res(self.stem(x)))))
+        x = x * self.se(x)
+        return self.fc(torch.flatten(self.pool(x), 1))
+
+
+def zero_pruned_channels(graph):
+    # zeroes the channels which are removed by pruning half of every group, so that they do not change the outputs
+    find = graph.spaces.find
+    modules = dict(graph.model.named_modules())
+    for space, group in graph.get_groups().items():
+        keep = math.ceil(group['size'] / 2)
+        for name in group['producers']:
+            modules[name].weight.data[keep:] = 0
+            if modules[name].bias is not None:
+                modules[name].bias.data[keep:] = 0
+        for name, layout in graph.members:
+            offset = 0
+            for segment, size in layout:
+                if find(segment) == space and isinstance(modules[name], nn.BatchNorm2d):
+                    for tensor in (modules[name].weight, modules[name].bias, modules[name].running_mean):
+                        tensor.data[offset + keep:offset + size] = 0
+                offset += size
+
+
+def test_channel_groups():
+    model = Net().eval()
+    groups = ChannelDependencyGraph(model, torch.randn(1, 3, 32, 32)).get_groups().values()
+    producers = [sorted(group['producers']) for group in groups]
+    # the residual additions and the squeeze-and-excitation product tie the channels of several layers
+    assert ['res.conv', 'stem.conv'] in producers
+    assert ['down.conv', 'down.identity_conv.conv'] in producers
+    assert ['csp.cv3.conv', 'se.3'] in producers
+    group = next(group for group in groups if 'down.conv' in group['producers'])
+    assert 'dw.conv' in group['members'] and {'csp.cv1.conv', 'csp.cv2.conv'} <= set(group['consumers'])
+    # the concatenation of the CSP block joins the channels of two groups
+    assert sum('csp.cv3.conv' in group['consumers'] for group in groups) == 2
+    # the output channels of the classifier are kept
+    assert not any('fc' in group['producers'] for group in groups)
+
+
+@pytest.mark.parametrize('criterion', ['bn', 'l1'])
+def test_prune_channels(criterion):
+    model = randomize_batch_norms(Net()).eval()
+    x = torch.randn(2, 3, 32, 32)
+    zero_pruned_channels(ChannelDependencyGraph(model, x))
+    pruned = prune_channels(model, ratio=0.5, criterion=criterion, round_to=1, inputs=x)
+
+    assert type(pruned) is Net and not pruned.training
+    assert pruned.stem.conv.out_channels == pruned.stem.out_channels == 8
+    assert pruned.dw.conv.groups == pruned.dw.bn.num_features == 12 and pruned.fc.in_features == 16
+    assert torch.allclose(pruned(x), model(x), atol=1e-5)
+    # the original model is not modified
+    assert model.stem.conv.out_channels == 16
+
+    with pytest.raises(ValueError):
+        prune_channels(model, ratio=1, img_size=32)
+
+
+@pytest.mark.parametrize(
+    ('model_name', 'dataset_name', 'img_size'),
+    [
+        ('resnet18', 'cifar100', 32),
+        ('mobilenet_v2', 'imagenet', 64),
+        ('mb2_ssd', 'voc', 300),
+    ]
+)
+def test_prune_zoo_model(model_name, dataset_name, img_size):
+    model = get_model_by_name(model_name, dataset_name, pretrained=False, device='cpu')
+    pruned = prune_channels(model, ratio=0.5, img_size=img_size)
+    assert type(pruned) is type(model)
+    assert profile(pruned, img_size)['GMACs'] < profile(model, img_size)['GMACs'] / 2
+
+
+def test_prune_yolo(capsys):
+    pruned, report = prune_model('yolo5_6n', 'voc', ratio=0.25, img_size=128, pretrained=False,
+        data_root=MOCK_VOC_PATH, batch_size=2, num_workers=0)
+    # the inputs of the Detect head are not pruned and the evaluation function runs on the pruned model
+    assert [module.in_channels for module in pruned.model[-1].m] == [64, 128, 256]
+    assert len(pruned.names) == 20 and 'mAP' in report and report['GMACs'] > 0
+
+    main(['--model', 'yolo5_6n', '--dataset', 'voc', '--img-size', '128', '--ratios', '0', '0.5',
+        '--no-pretrained'])
+    assert 'GMACs' in capsys.readouterr().out
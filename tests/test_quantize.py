@@ -0,0 +1,53 @@
+import torch
+import torch.nn as nn
+
+from deeplite_torch_zoo.utils import quantize_static
+from deeplite_torch_zoo.wrappers.quantize import main, quantize_model
+from tests.test_packed_dataset import make_image_folder
+
+MOCK_VOC_PATH = 'tests/fixture/datasets/VOCdevkit'
+
+
+class Head(nn.Module):
+    def forward(self, x):
+        # data-dependent control flow can not be traced
+        return x if x.sum() > 0 else -x
+
+
+def make_model():
+    return nn.Sequential(nn.Conv2d(3, 8, 3), nn.BatchNorm2d(8), nn.ReLU(), nn.Conv2d(8, 8, 3), Head())
+
+
+def test_quantize_static():
+    torch.manual_seed(0)
+    model = make_model().eval()
+    calibration_data = [torch.rand(2, 3, 16, 16) for _ in range(4)]
+    quantized = quantize_static(model, calibration_data, skip_modules=[Head])
+    convs = [module for module in quantized.modules() if type(module).__name__ == 'ConvReLU2d']
+    assert len(convs) == 1 and convs[0].weight().qscheme() == torch.per_channel_affine
+    x = torch.rand(1, 3, 16, 16)
+    assert (quantized(x) - model(x)).abs().max() < 0.05 * model(x).abs().max()
+
+    quantized = quantize_static(model, calibration_data, skip_modules=['3', Head], per_channel=False)
+    assert type(quantized.get_submodule('model.3')) is nn.Conv2d
+
+
+def test_quantize_model(tmp_path, capsys):
+    for split in ('train', 'val'):
+        make_image_folder(tmp_path / split)
+    quantized, report = quantize_model('resnet18', 'tinyimagenet', data_root=str(tmp_path), calib_batches=2,
+        pretrained=False, batch_size=4, num_workers=0, img_size=32)
+    assert set(report['fp32']) == set(report['int8']) == {'acc', 'acc_top5', 'latency_ms', 'size_Mb'}
+    assert report['int8']['size_Mb'] < report['fp32']['size_Mb'] / 3
+
+    main(['--model', 'resnet18', '--dataset', 'tinyimagenet', '--data-root', str(tmp_path), '--calib-batches',
+        '1', '--batch-size', '4', '--num-workers', '0', '--img-size', '32', '--no-pretrained', '--no-eval'])
+    assert 'latency_ms' in capsys.readouterr().out
+
+
+def test_quantize_yolo():
+    quantized, report = quantize_model('yolo5_6n', 'voc', data_root=MOCK_VOC_PATH, calib_batches=1,
+        pretrained=False, batch_size=2, num_workers=0, img_size=128, measure_latency_batch_size=None)
+    # the Detect head is kept in fp32 and the attributes used by the evaluation are kept
+    assert [type(module).__name__ for module in quantized.modules()].count('Detect') == 1
+    assert len(quantized.names) == 20 and 'mAP' in report['int8']
@@ -0,0 +1,51 @@
+import subprocess
+import sys
+import time
+
+import pytest
+
+HEAVY_MODULES = ['timm', 'pytorchcv', 'pycocotools', 'albumentations', 'torchvision.models.detection']
+
+
+def run_python(code):
+    start = time.perf_counter()
+    output = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True).stdout
+    return output.strip(), time.perf_counter() - start
+
+
+def test_list_models_does_not_import_wrappers():
+    imported, _ = run_python(
+        'import sys; import deeplite_torch_zoo; '
+        'deeplite_torch_zoo.list_models(print_table=False); '
+        f'print([name for name in {HEAVY_MODULES} if name in sys.modules])'
+    )
+    assert imported == '[]'
+
+
+def test_lookup_imports_defining_module():
+    imported, _ = run_python(
+        'import sys; from deeplite_torch_zoo.wrappers.registries import MODEL_WRAPPER_REGISTRY; '
+        'fn = MODEL_WRAPPER_REGISTRY.get(model_name="resnet18", dataset_name="cifar100"); '
+        'print(fn.__name__, "deeplite_torch_zoo.wrappers.models.classification.cifar100.resnet" in sys.modules)'
+    )
+    assert imported == 'resnet18_cifar100 True'
+
+
+def test_registry_manifest_is_up_to_date():
+    from deeplite_torch_zoo.wrappers import registry_manifest
+    from deeplite_torch_zoo.wrappers.generate_manifest import get_manifest
+
+    for name, entries in get_manifest().items():
+        assert entries == getattr(registry_manifest, name), \
+            'run python -m deeplite_torch_zoo.wrappers.generate_manifest'
+
+
+@pytest.mark.slow
+def test_lazy_import_time():
+    _, lazy_time = run_python('import deeplite_torch_zoo')
+    _, eager_time = run_python(
+        'import deeplite_torch_zoo; import deeplite_torch_zoo.wrappers.models; '
+        'import deeplite_torch_zoo.wrappers.datasets; import deeplite_torch_zoo.wrappers.eval'
+    )
+    print(f'import time: lazy {lazy_time:.2f}s, eager {eager_time:.2f}s')
+    assert lazy_time * 2 < eager_time
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+import torch
+import torch.nn as nn
+
+from deeplite_torch_zoo.src.objectdetection.ssd.eval import ssd_eval
+from deeplite_torch_zoo.src.objectdetection.ssd.models.predictor import Predictor
+from deeplite_torch_zoo.src.objectdetection.ssd.repo.vision.ssd.predictor import \
+    Predictor as RepoPredictor
+
+
+class RandomSSD(nn.Module):
+    """Stub SSD head returning random (scores, boxes) seeded by the content of every image."""
+    def __init__(self, num_priors=300, num_classes=4):
+        super().__init__()
+        self.num_priors = num_priors
+        self.num_classes = num_classes
+
+    def forward(self, x):
+        scores, boxes = [], []
+        for image in x:
+            generator = torch.Generator().manual_seed(int(image.abs().sum()))
+            centers = torch.rand(self.num_priors, 2, generator=generator)
+            sizes = torch.rand(self.num_priors, 2, generator=generator) * 0.3
+            boxes.append(torch.cat([centers - sizes / 2, centers + sizes / 2], dim=-1))
+            scores.append(torch.rand(self.num_priors, self.num_classes, generator=generator).softmax(-1))
+        return torch.stack(scores), torch.stack(boxes)
+
+
+@pytest.mark.parametrize('predictor_cls', [Predictor, RepoPredictor])
+@pytest.mark.parametrize('nms_method', ['hard', 'soft'])
+@pytest.mark.parametrize('top_k', [-1, 5])
+def test_predict_batch_matches_predict(predictor_cls, nms_method, top_k):
+    predictor = predictor_cls(RandomSSD(), 32, nms_method=nms_method, filter_threshold=0.3, device='cpu')
+    rng = np.random.RandomState(0)
+    images = [rng.randint(0, 255, size=(h, w, 3)).astype(np.uint8)
+              for h, w in [(40, 60), (50, 50), (64, 32)]]
+
+    results = predictor.predict_batch(images, top_k=top_k)
+    assert len(results) == len(images)
+    for image, (boxes, labels, probs) in zip(images, results):
+        ref_boxes, ref_labels, ref_probs = predictor.predict(image, top_k=top_k)
+        assert torch.allclose(boxes, ref_boxes, atol=1e-4)
+        assert torch.equal(labels, ref_labels)
+        assert torch.allclose(probs, ref_probs, atol=1e-5)
+
+
+class DetectionDataset:
+    """VOC-like dataset with the given annotations per image."""
+    classes = ['BACKGROUND', 'a', 'b', 'c']
+
+    def __init__(self, images, annotations):
+        self.images = images
+        self.annotations = annotations
+
+    def __getitem__(self, index):
+        boxes, labels, _ = self.annotations[index]
+        return self.images[index], boxes, labels
+
+    def __len__(self):
+        return len(self.images)
+
+    def get_image(self, index):
+        return self.images[index]
+
+    def get_annotation(self, index):
+        return str(index), self.annotations[index]
+
+
+@pytest.mark.parametrize('use_2007_metric', [True, False])
+def test_ssd_eval_perfect_detections(use_2007_metric):
+    predictor = Predictor(RandomSSD(), 32, nms_method='hard', filter_threshold=0.3, device='cpu')
+    rng = np.random.RandomState(0)
+    images = [rng.randint(0, 255, size=(rng.randint(40, 80), rng.randint(40, 80), 3)).astype(np.uint8)
+              for _ in range(12)]
+    predictions = [predictor.predict(image) for image in images]
+    threshold = np.median(torch.cat([probs for _, _, probs in predictions]).numpy())
+    annotations = []
+    for boxes, labels, probs in predictions:
+        # the most confident detections are the ground truth, the rest are false positives
+        keep = probs > threshold
+        annotations.append((boxes[keep].numpy(), labels[keep].numpy(), np.zeros(int(keep.sum()), dtype=np.uint8)))
+    dataset = DetectionDataset(images, annotations)
+    dataloader = torch.utils.data.DataLoader(dataset, batch_size=4)
+
+    stat = ssd_eval(predictor, dataloader, dataset.classes, use_2007_metric=use_2007_metric)
+    assert np.isclose(stat['mAP'], 1.0)
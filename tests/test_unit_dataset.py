@@ -100,7 +100,7 @@ def test_unit_food101(*args):
     assert label == 0
 
 
-@mock.patch("deeplite_torch_zoo.wrappers.datasets.classification.imagenet.datasets")
+@mock.patch("deeplite_torch_zoo.wrappers.datasets.classification.imagenet.CachedImageFolder")
 @mock.patch("deeplite_torch_zoo.wrappers.datasets.classification.imagenet.get_dataloader", get_dataloader)
 def test_unit_imagenet(*args):
     get_imagenet('', x=3)
@@ -112,6 +112,8 @@ def test_unit_imagenet(*args):
 @mock.patch("deeplite_torch_zoo.wrappers.datasets.classification.imagenette.verify_str_arg")
 @mock.patch("deeplite_torch_zoo.wrappers.datasets.classification.imagenette.get_dataloader", get_dataloader)
 @mock.patch("deeplite_torch_zoo.wrappers.datasets.classification.imagenette.os.scandir")
+@mock.patch("deeplite_torch_zoo.wrappers.datasets.classification.imagenette.get_file_index",
+    return_value=([], [], []))
 def test_unit_imagenette(*args):
     MockedPath.rval = True
     get_imagenette_160('', x=3)
@@ -143,7 +145,7 @@ def test_unit_mnist(*args):
     get_mnist('', x=1, y=2)
 
 
-@mock.patch("deeplite_torch_zoo.wrappers.datasets.classification.tiny_imagenet.datasets")
+@mock.patch("deeplite_torch_zoo.wrappers.datasets.classification.tiny_imagenet.CachedImageFolder")
 @mock.patch("deeplite_torch_zoo.wrappers.datasets.classification.tiny_imagenet.get_dataloader", get_dataloader)
 def test_unit_tinyimagenet(*args):
     get_tinyimagenet('', x=1, y=2)
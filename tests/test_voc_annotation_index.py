@@ -0,0 +1,86 @@
+import os
+
+import cv2
+import numpy as np
+import torch
+
+from deeplite_torch_zoo.src.objectdetection.datasets.voc import VocDataset
+from deeplite_torch_zoo.src.objectdetection.datasets.voc_utils import (
+    get_annotation_index, get_annotation_index_dir, prepare_yolo_voc_data)
+
+OBJECT_XML = '''<object><name>{name}</name><difficult>0</difficult>
+<bndbox><xmin>{box[0]}</xmin><ymin>{box[1]}</ymin><xmax>{box[2]}</xmax><ymax>{box[3]}</ymax></bndbox></object>'''
+
+
+def make_voc_dataset(root, num_images=6):
+    rng = np.random.RandomState(0)
+    for subdir in ('JPEGImages', 'Annotations', 'ImageSets/Main'):
+        (root / subdir).mkdir(parents=True)
+    image_ids = [f'2008_{i:06d}' for i in range(num_images)]
+    text_annotations = {'train': [], 'test': []}
+    for i, image_id in enumerate(image_ids):
+        img_path = root / 'JPEGImages' / f'{image_id}.jpg'
+        cv2.imwrite(str(img_path), rng.randint(0, 256, size=(120, 160, 3), dtype=np.uint8))
+        # the last image has no objects
+        objects = [(['Cat', 'dog'][j % 2], rng.randint(0, 60, size=2).tolist()) for j in range(i % 3 + 1)] \
+            if i < num_images - 1 else []
+        objects_xml = ''.join(OBJECT_XML.format(name=name, box=(x, y, x + 50, y + 40)) for name, (x, y) in objects)
+        (root / 'Annotations' / f'{image_id}.xml').write_text(f'<annotation>{objects_xml}</annotation>')
+        line = str(img_path) + ''.join(f' {x},{y},{x + 50},{y + 40},{name.lower()}' for name, (x, y) in objects)
+        text_annotations['train'].append(line)
+        if i % 2:
+            text_annotations['test'].append(line)
+    (root / 'ImageSets/Main/trainval.txt').write_text('\n'.join(image_ids))
+    (root / 'ImageSets/Main/test.txt').write_text('\n'.join(image_ids[1::2]))
+    return text_annotations
+
+
+def test_voc_annotation_index(tmp_path, monkeypatch):
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    data_root = tmp_path / 'voc'
+    text_annotations = make_voc_dataset(data_root)
+    text_path = tmp_path / 'text'
+    text_path.mkdir()
+    (text_path / 'class_names.txt').write_text('cat dog')
+    for anno_type, lines in text_annotations.items():
+        (text_path / f'{anno_type}_annotation.txt').write_text('\n'.join(lines) + '\n')
+
+    annotation_path = tmp_path / 'annotations'
+    prepare_yolo_voc_data(str(data_root), str(annotation_path), standard_voc_format=False)
+    assert (annotation_path / 'class_names.txt').read_text() == 'cat dog'
+    paths, offsets, boxes = get_annotation_index(str(annotation_path / 'train_annotation.txt'), ['cat', 'dog'])
+    assert isinstance(boxes, np.memmap) and len(paths) == 6 and offsets[-1] == len(boxes) == 9
+    # the index is cached outside of the dataset directory
+    assert sorted(os.listdir(annotation_path)) == ['class_names.txt', 'test_annotation.txt', 'train_annotation.txt']
+
+    for anno_type in ('train', 'test'):
+        dataset = VocDataset(str(annotation_path), anno_type, img_size=160)
+        text_dataset = VocDataset(str(text_path), anno_type, img_size=160)
+        # images without boxes are skipped in the train set
+        assert len(dataset) == len(text_dataset) == {'train': 5, 'test': 3}[anno_type]
+        for i in range(len(dataset)):
+            img, bboxes, length, img_id, shape = dataset[i]
+            ref_img, ref_bboxes, ref_length, ref_img_id, ref_shape = text_dataset[i]
+            assert torch.equal(img, ref_img) and torch.equal(bboxes, ref_bboxes)
+            assert (length, img_id, shape) == (ref_length, ref_img_id, ref_shape)
+
+
+def test_voc_annotation_index_is_rebuilt(tmp_path):
+    data_root = tmp_path / 'voc'
+    make_voc_dataset(data_root)
+    annotation_path = tmp_path / 'annotations'
+    prepare_yolo_voc_data(str(data_root), str(annotation_path), standard_voc_format=False)
+    anno_path = str(annotation_path / 'test_annotation.txt')
+    cache_dir = str(tmp_path / 'cache')
+    index_dir = get_annotation_index_dir(anno_path, ['cat', 'dog'], cache_dir)
+    paths, offsets, boxes = get_annotation_index(anno_path, ['cat', 'dog'], cache_dir)
+    assert os.path.exists(index_dir) and len(paths) == 3
+
+    # editing the text annotations or the class names creates a new index
+    lines = (annotation_path / 'test_annotation.txt').read_text().splitlines()
+    (annotation_path / 'test_annotation.txt').write_text('\n'.join(lines[:2]) + '\n')
+    assert get_annotation_index_dir(anno_path, ['cat', 'dog'], cache_dir) != index_dir
+    assert len(get_annotation_index(anno_path, ['cat', 'dog'], cache_dir)[0]) == 2
+    new_paths, new_offsets, new_boxes = get_annotation_index(anno_path, ['dog', 'cat'], cache_dir)
+    assert np.array_equal(new_boxes['class_id'], 1 - boxes['class_id'][:new_offsets[-1]])
+    assert len(os.listdir(cache_dir)) == 3
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+import torch
+import torch.nn as nn
+
+from deeplite_torch_zoo.src.objectdetection.eval.zoo_eval.evaluator import \
+    Evaluator
+from deeplite_torch_zoo.src.objectdetection.yolov5.utils.general import nms
+
+
+class RandomYOLO(nn.Module):
+    """Stub YOLO head returning random (cx, cy, w, h, obj, cls...) predictions per image."""
+    def __init__(self, num_anchors=200, num_classes=3):
+        super().__init__()
+        self.num_anchors = num_anchors
+        self.num_classes = num_classes
+        self.weight = nn.Parameter(torch.zeros(1))
+
+    def forward(self, x):
+        preds = []
+        for image in x:
+            generator = torch.Generator().manual_seed(int(image.abs().sum() * 1000) % 2 ** 31)
+            xy = torch.rand(self.num_anchors, 2, generator=generator) * x.size(-1)
+            wh = torch.rand(self.num_anchors, 2, generator=generator) * x.size(-1) / 4
+            scores = torch.rand(self.num_anchors, 1 + self.num_classes, generator=generator)
+            preds.append(torch.cat([xy, wh, scores], dim=1))
+        return torch.stack(preds), None
+
+
+@pytest.mark.parametrize(('multi_test', 'flip_test'), [(False, False), (True, False), (True, True)])
+def test_get_bboxes_matches_get_bbox(multi_test, flip_test):
+    evaluator = Evaluator(RandomYOLO(), img_size=64, batch_size=3)
+    rng = np.random.RandomState(0)
+    images = [rng.randint(0, 255, size=(h, w, 3)).astype(np.uint8)
+              for h, w in [(40, 60), (50, 50), (64, 32), (30, 70)]]
+
+    results = evaluator.get_bboxes(images, multi_test=multi_test, flip_test=flip_test)
+    assert len(results) == len(images)
+    for image, bboxes in zip(images, results):
+        ref = evaluator.get_bbox(image, multi_test=multi_test, flip_test=flip_test)
+        assert bboxes.shape[1] == 6
+        assert np.allclose(bboxes, ref)
+
+
+@pytest.mark.parametrize('method', ['nms', 'soft-nms'])
+def test_nms_per_class(method):
+    rng = np.random.RandomState(0)
+    # well separated boxes, every one with a lower scored near duplicate
+    xy = np.stack(np.meshgrid(np.arange(5) * 40.0, np.arange(4) * 40.0), axis=-1).reshape(-1, 2)
+    boxes = np.concatenate([xy, xy + 20], axis=1)
+    scores = rng.uniform(0.5, 1, size=len(boxes))
+    bboxes = np.concatenate([
+        np.c_[boxes + 1, scores / 2, np.ones(len(boxes))],
+        np.c_[boxes, scores, np.ones(len(boxes))],
+        np.c_[boxes, scores, np.zeros(len(boxes))],
+    ])
+    picked = nms(bboxes, 0.01, 0.5, method=method)
+
+    assert np.all(np.diff(picked[:, 5]) >= 0)
+    for class_id in (0, 1):
+        picked_class = picked[picked[:, 5] == class_id]
+        # every class is picked in the order of decreasing score
+        assert np.all(np.diff(picked_class[:len(boxes), 4]) <= 0)
+        assert np.allclose(np.sort(picked_class[:len(boxes), 4]), np.sort(scores))
+    if method == 'nms':
+        assert len(picked) == 2 * len(boxes)
@@ -27,6 +27,10 @@ import torch.nn.functional as F
 import torchvision.utils
 import yaml
 from deeplite_torch_zoo import create_model, get_data_splits_by_name
+from deeplite_torch_zoo.utils.kd import (CachedTeacher, TeacherLogitCache,
+                                         sparse_kd_loss,
+                                         with_augmentation_seeds)
+from deeplite_torch_zoo.wrappers.datasets.utils import set_dataloader_epoch
 from timm import utils
 from timm.data import FastCollateMixup, Mixup, resolve_data_config
 from timm.models import (convert_splitbn_model, convert_sync_batchnorm,
@@ -86,6 +90,8 @@ group.add_argument('--train-split', metavar='NAME', default='imagenet_training',
                     help='dataset train split (default: train)')
 group.add_argument('--val-split', metavar='NAME', default='imagenet_val',
                     help='dataset validation split (default: validation)')
+group.add_argument('--data-format', default='folder', choices=['folder', 'packed'],
+                    help='image folders or the sharded packed format of the dataset (default: folder)')
 group.add_argument('--dataset-download', action='store_true', default=False,
                     help='Allow download of dataset for torch/ and tfds/ datasets that support it.')
 group.add_argument('--class-map', default='', type=str, metavar='FILENAME',
@@ -331,6 +337,16 @@ group.add_argument('--kd_model_name', default=None, type=str)
 group.add_argument('--kd_model_checkpoint', default=None, type=str)
 group.add_argument('--alpha_kd', default=5, type=float)
 group.add_argument('--use_kd_only_loss', action='store_true', default=False)
+group.add_argument('--kd_cache_dir', default=None, type=str,
+                   help='directory of the memory-mapped cache of the top-k teacher logits, '
+                        'the teacher runs on every step if not set')
+group.add_argument('--kd_cache_topk', default=10, type=int, help='number of cached teacher logits per sample')
+group.add_argument('--kd_cache_seeds', default=1, type=int,
+                   help='number of augmentation seeds, the augmentations of a sample repeat every N epochs')
+group.add_argument('--kd_cache_refresh', default=0., type=float,
+                   help='fraction of the cached teacher outputs recomputed every epoch')
+group.add_argument('--kd_cache_build', action='store_true', default=False,
+                   help='fill the teacher cache for all the augmentation seeds before training')
 
 
 def _parse_args():
@@ -409,6 +425,8 @@ def main():
     datasplit_kwargs = {}
     if args.img_size is not None:
         datasplit_kwargs = {'img_size': args.img_size}
+    if args.data_format != 'folder':
+        datasplit_kwargs['format'] = args.data_format
 
     data_splits = get_data_splits_by_name(
         dataset_name=args.dataset,
@@ -561,6 +579,25 @@ def main():
         else:
             mixup_fn = Mixup(**mixup_args)
 
+    # the teacher outputs are read from the cache instead of running the teacher on every step
+    teacher_cache = None
+    if model_kd is not None and args.kd_cache_dir is not None:
+        assert mixup_fn is None, 'The teacher cache needs the same augmentations per sample, disable mixup/cutmix'
+        loader_train = with_augmentation_seeds(loader_train, num_seeds=args.kd_cache_seeds, base_seed=args.seed)
+        # the cache is shared by the processes and created by the first one
+        if args.distributed and args.rank != 0:
+            torch.distributed.barrier()
+        cache = TeacherLogitCache(args.kd_cache_dir, len(loader_train.dataset), args.num_classes,
+                                  num_seeds=args.kd_cache_seeds, top_k=args.kd_cache_topk)
+        if args.distributed and args.rank == 0:
+            torch.distributed.barrier()
+        teacher_cache = CachedTeacher(lambda input: model_kd(input, model), cache,
+                                      refresh=args.kd_cache_refresh, seed=args.seed)
+        if args.kd_cache_build:
+            teacher_cache.fill(loader_train, device=args.device)
+            if args.distributed:
+                torch.distributed.barrier()
+
     # create data loaders w/ augmentation pipeiine
     train_interpolation = args.train_interpolation
     if args.no_aug or not train_interpolation:
@@ -596,14 +633,16 @@ def main():
         writer = SummaryWriter(log_dir=output_dir)
     try:
         for epoch in range(start_epoch, num_epochs):
-            if args.distributed and hasattr(loader_train.sampler, 'set_epoch'):
-                loader_train.sampler.set_epoch(epoch)
+            # reshuffles the DistributedSampler or the shards of a packed dataset
+            set_dataloader_epoch(loader_train, epoch)
+            if teacher_cache is not None:
+                teacher_cache.set_epoch(epoch)
 
             train_metrics = train_one_epoch(
                 epoch, model, loader_train, optimizer, train_loss_fn, args,
                 lr_scheduler=lr_scheduler, saver=saver, output_dir=output_dir,
                 amp_autocast=amp_autocast, loss_scaler=loss_scaler, model_ema=model_ema, mixup_fn=mixup_fn,
-                model_kd=model_kd,
+                model_kd=model_kd, teacher_cache=teacher_cache,
             )
 
             if args.distributed and args.dist_bn in ('broadcast', 'reduce'):
@@ -648,7 +687,7 @@ def main():
 def train_one_epoch(
         epoch, model, loader, optimizer, loss_fn, args,
         lr_scheduler=None, saver=None, output_dir=None, amp_autocast=suppress,
-        loss_scaler=None, model_ema=None, mixup_fn=None, model_kd=None):
+        loss_scaler=None, model_ema=None, mixup_fn=None, model_kd=None, teacher_cache=None):
 
     if args.mixup_off_epoch and epoch >= args.mixup_off_epoch:
         if args.prefetcher and loader.mixup_enabled:
@@ -666,7 +705,7 @@ def train_one_epoch(
     end = time.time()
     last_idx = len(loader) - 1
     num_updates = epoch * len(loader)
-    for batch_idx, (input, target) in enumerate(loader):
+    for batch_idx, (input, target, *sample_keys) in enumerate(loader):
         input, target = input.cuda(), target.cuda()
         last_batch = batch_idx == last_idx
         data_time_m.update(time.time() - end)
@@ -683,20 +722,25 @@ def train_one_epoch(
 
             # KD logic
             if model_kd is not None:
-                # student probability calculation
-                prob_s = F.log_softmax(output, dim=-1)
-
-                # teacher probability calculation
-                with torch.no_grad():
-                    input_kd = model_kd.normalize_input(input, model)
-                    out_t = model_kd.model(input_kd.detach())
-                    prob_t = F.softmax(out_t, dim=-1)
+                if teacher_cache is not None:
+                    # sparse top-k teacher logits of the sample indices and augmentation seeds
+                    values_t, classes_t = teacher_cache(input, *sample_keys)
+                    loss_kd = sparse_kd_loss(output, values_t, classes_t)
+                else:
+                    # student probability calculation
+                    prob_s = F.log_softmax(output, dim=-1)
+
+                    # teacher probability calculation
+                    with torch.no_grad():
+                        out_t = model_kd(input.detach(), model)
+                        prob_t = F.softmax(out_t, dim=-1)
+                    loss_kd = F.kl_div(prob_s, prob_t, reduction='batchmean')
 
                 # adding KL loss
                 if not args.use_kd_only_loss:
-                    loss += args.alpha_kd * F.kl_div(prob_s, prob_t, reduction='batchmean')
+                    loss += args.alpha_kd * loss_kd
                 else: # only kid
-                    loss = args.alpha_kd * F.kl_div(prob_s, prob_t, reduction='batchmean')
+                    loss = args.alpha_kd * loss_kd
 
         if not args.distributed:
             losses_m.update(loss.item(), input.size(0))
@@ -767,6 +811,8 @@ def train_one_epoch(
 
     if hasattr(optimizer, 'sync_lookahead'):
         optimizer.sync_lookahead()
+    if teacher_cache is not None:
+        teacher_cache.cache.flush()
 
     return OrderedDict([('loss', losses_m.avg)])
 
@@ -2,7 +2,6 @@
 
 import torch
 import torch.nn as nn
-import torchvision.transforms as T
 
 from deeplite_torch_zoo import create_model
 
@@ -34,6 +33,7 @@ class KDTeacher(nn.Module):
         if hasattr(model_kd, 'default_cfg'):
             self.mean_model_kd = model_kd.default_cfg['mean']
             self.std_model_kd = model_kd.default_cfg['std']
+        self.input_transforms = {}
 
     # handling different normalization of teacher and student
     def normalize_input(self, input, student_model):
@@ -42,24 +42,27 @@ class KDTeacher(nn.Module):
         else:
             model_s = student_model
 
-        input_kd = input
-
-        if hasattr(model_s, 'default_cfg'):
-            mean_student = model_s.default_cfg['mean']
-            std_student = model_s.default_cfg['std']
-
-            if mean_student != self.mean_model_kd or std_student != self.std_model_kd:
-                std = (self.std_model_kd[0] / std_student[0], self.std_model_kd[1] / std_student[1],
-                    self.std_model_kd[2] / std_student[2])
-                transform_std = T.Normalize(mean=(0, 0, 0), std=std)
-
-                mean = (self.mean_model_kd[0] - mean_student[0], self.mean_model_kd[1] - mean_student[1],
-                        self.mean_model_kd[2] - mean_student[2])
-                transform_mean = T.Normalize(mean=mean, std=(1, 1, 1))
-
-                input_kd = transform_mean(transform_std(input))
-
-        return input_kd
+        if not hasattr(model_s, 'default_cfg') or self.mean_model_kd is None:
+            return input
+        mean_student = model_s.default_cfg['mean']
+        std_student = model_s.default_cfg['std']
+        if mean_student == self.mean_model_kd and std_student == self.std_model_kd:
+            return input
+
+        # (input * std_s + mean_s - mean_kd) / std_kd in a single multiply-add, the factors are cached per device
+        key = (tuple(mean_student), tuple(std_student), input.device, input.dtype)
+        if key not in self.input_transforms:
+            std_s, mean_s = torch.tensor(std_student), torch.tensor(mean_student)
+            std_kd, mean_kd = torch.tensor(self.std_model_kd), torch.tensor(self.mean_model_kd)
+            self.input_transforms[key] = (
+                (std_s / std_kd).view(1, -1, 1, 1).to(input.device, input.dtype),
+                ((mean_s - mean_kd) / std_kd).view(1, -1, 1, 1).to(input.device, input.dtype),
+            )
+        scale, shift = self.input_transforms[key]
+        return torch.addcmul(shift, input, scale)
+
+    def forward(self, input, student_model):
+        return self.model(self.normalize_input(input, student_model))
 
 
 def extract_layer(model, layer):
@@ -23,6 +23,10 @@ from utils.torch_utils import (GenericLogger, ModelEMA, select_device,
 
 from deeplite_torch_zoo import (create_model, get_data_splits_by_name,
                                 get_eval_function)
+from deeplite_torch_zoo.utils.kd import (CachedTeacher, TeacherLogitCache,
+                                         sparse_kd_loss,
+                                         with_augmentation_seeds)
+from deeplite_torch_zoo.wrappers.datasets.utils import set_dataloader_epoch
 
 ROOT = Path.cwd()
 
@@ -49,6 +53,7 @@ def train(opt, device):
     logger = GenericLogger(opt=opt, console_logger=LOGGER) if RANK in {-1, 0} else None
 
     # Dataloaders
+    datasplit_kwargs = {'format': opt.data_format} if opt.data_format != 'folder' else {}
     dataloaders = get_data_splits_by_name(
         data_root=opt.data_root,
         dataset_name=opt.dataset,
@@ -57,6 +62,7 @@ def train(opt, device):
         test_batch_size=opt.test_batch_size,
         img_size=imgsz,
         num_workers=nw,
+        **datasplit_kwargs,
     )
     trainloader, testloader = dataloaders['train'], dataloaders['test']
 
@@ -108,6 +114,23 @@ def train(opt, device):
     if cuda and RANK != -1:
         model = smart_DDP(model)
 
+    # Teacher outputs read from the cache instead of running the teacher on every step
+    teacher_cache = None
+    if model_kd is not None and opt.kd_cache_dir is not None:
+        trainloader = with_augmentation_seeds(trainloader, num_seeds=opt.kd_cache_seeds, base_seed=opt.seed)
+        if RANK not in {-1, 0}:
+            dist.barrier()  # the cache is created by the first process
+        cache = TeacherLogitCache(opt.kd_cache_dir, len(trainloader.dataset), opt.num_classes,
+                                  num_seeds=opt.kd_cache_seeds, top_k=opt.kd_cache_topk)
+        if RANK == 0:
+            dist.barrier()
+        teacher_cache = CachedTeacher(lambda x: model_kd(x, model), cache, refresh=opt.kd_cache_refresh,
+                                      seed=opt.seed)
+        if opt.kd_cache_build:
+            teacher_cache.fill(trainloader, device=device)
+            if RANK != -1:
+                dist.barrier()
+
     # Train
     t0 = time.time()
     criterion = smartCrossEntropyLoss(label_smoothing=opt.label_smoothing)  # loss function
@@ -121,10 +144,14 @@ def train(opt, device):
     for epoch in range(epochs):  # loop over the dataset multiple times
         tloss, vloss, fitness = 0.0, 0.0, 0.0  # train loss, val loss, fitness
         model.train()
+        # reshuffles the DistributedSampler or the shards of a packed dataset
+        set_dataloader_epoch(trainloader, epoch)
+        if teacher_cache is not None:
+            teacher_cache.set_epoch(epoch)
         pbar = enumerate(trainloader)
         if RANK in {-1, 0}:
             pbar = tqdm(enumerate(trainloader), total=len(trainloader), bar_format='{l_bar}{bar:10}{r_bar}{bar:-10b}')
-        for i, (images, labels) in pbar:  # progress bar
+        for i, (images, labels, *sample_keys) in pbar:  # progress bar
             images, labels = images.to(device, non_blocking=True), labels.to(device)
 
             # Forward
@@ -133,20 +160,25 @@ def train(opt, device):
                 loss = criterion(output, labels)
 
                 if model_kd is not None:
-                    # student probability calculation
-                    prob_s = F.log_softmax(output, dim=-1)
-
-                    # teacher probability calculation
-                    with torch.no_grad():
-                        input_kd = model_kd.normalize_input(images, model)
-                        out_t = model_kd.model(input_kd.detach())
-                        prob_t = F.softmax(out_t, dim=-1)
+                    if teacher_cache is not None:
+                        # sparse top-k teacher logits of the sample indices and augmentation seeds
+                        values_t, classes_t = teacher_cache(images, *sample_keys)
+                        loss_kd = sparse_kd_loss(output, values_t, classes_t)
+                    else:
+                        # student probability calculation
+                        prob_s = F.log_softmax(output, dim=-1)
+
+                        # teacher probability calculation
+                        with torch.no_grad():
+                            out_t = model_kd(images.detach(), model)
+                            prob_t = F.softmax(out_t, dim=-1)
+                        loss_kd = F.kl_div(prob_s, prob_t, reduction='batchmean')
 
                     # adding KL loss
                     if not opt.use_kd_only_loss:
-                        loss += opt.alpha_kd * F.kl_div(prob_s, prob_t, reduction='batchmean')
+                        loss += opt.alpha_kd * loss_kd
                     else: # only kid
-                        loss = opt.alpha_kd * F.kl_div(prob_s, prob_t, reduction='batchmean')
+                        loss = opt.alpha_kd * loss_kd
 
             # Backward
             scaler.scale(loss).backward()
@@ -175,6 +207,8 @@ def train(opt, device):
 
         # Scheduler
         scheduler.step()
+        if teacher_cache is not None:
+            teacher_cache.cache.flush()
 
         # Log metrics
         if RANK in {-1, 0}:
@@ -225,6 +259,8 @@ def parse_opt(known=False):
     parser.add_argument('--data-root', type=str, default='./')
     parser.add_argument('--model', type=str, default='resnet18')
     parser.add_argument('--dataset', type=str, default='flowers102', help='cifar10, cifar100, flowers102, food101, ...')
+    parser.add_argument('--data-format', default='folder', choices=['folder', 'packed'],
+                        help='image folders or the sharded packed format of the dataset')
     parser.add_argument('--pretraining-dataset', type=str, default='imagenet')
     parser.add_argument('--epochs', type=int, default=200, help='total training epochs')
     parser.add_argument('--batch-size', type=int, default=64, help='total batch size for all GPUs')
@@ -249,6 +285,15 @@ def parse_opt(known=False):
     parser.add_argument('--kd_model_checkpoint', default=None, type=str)
     parser.add_argument('--alpha_kd', default=5, type=float)
     parser.add_argument('--use_kd_only_loss', action='store_true', default=False)
+    parser.add_argument('--kd_cache_dir', default=None, type=str,
+                        help='directory of the memory-mapped teacher logit cache, the teacher runs every step if not set')
+    parser.add_argument('--kd_cache_topk', default=10, type=int, help='number of cached teacher logits per sample')
+    parser.add_argument('--kd_cache_seeds', default=1, type=int,
+                        help='number of augmentation seeds, the augmentations of a sample repeat every N epochs')
+    parser.add_argument('--kd_cache_refresh', default=0., type=float,
+                        help='fraction of the cached teacher outputs recomputed every epoch')
+    parser.add_argument('--kd_cache_build', action='store_true',
+                        help='fill the teacher cache for all the augmentation seeds before training')
 
     return parser.parse_known_args()[0] if known else parser.parse_args()
 
@@ -39,6 +39,8 @@ import deeplite_torch_zoo.src.objectdetection.yolov5.configs.hyps.hyp_config_fin
 import deeplite_torch_zoo.src.objectdetection.yolov5.configs.hyps.hyp_config_lisa as hyp_cfg_lisa
 from deeplite_torch_zoo import (create_model, get_data_splits_by_name,
                                 get_eval_function)
+from deeplite_torch_zoo.src.objectdetection.datasets.batch import \
+    DetectionBatch
 from deeplite_torch_zoo.src.objectdetection.yolov5.models.losses.yolov5_loss import \
     YoloV5Loss
 from deeplite_torch_zoo.src.objectdetection.yolov5.models.losses.yolox.yolox_loss import \
@@ -111,6 +113,8 @@ def train(opt, device):
     dataset_kwargs = {}
     if opt.img_size:
         dataset_kwargs = {'img_size': opt.img_size}
+    if opt.batch_augment:
+        dataset_kwargs['batch_augment'] = True
     dataset_splits = get_data_splits_by_name(
         data_root=opt.img_dir,
         dataset_name=opt.dataset_name,
@@ -128,6 +132,7 @@ def train(opt, device):
 
     dataset = train_loader.dataset
     nc = dataset.num_classes
+    batch_augmentation = getattr(dataset, 'batch_augmentation', None)  # set by the batch_augment datasets
     print("Number of classes = ", nc)
 
     nb = len(train_loader)  # number of batches
@@ -278,9 +283,12 @@ def train(opt, device):
         if RANK in [-1, 0]:
             pbar = tqdm(pbar, total=nb)  # progress bar
         optimizer.zero_grad()
-        for i, (imgs, targets, labels_length, _) in pbar:  # batch
+        for i, batch in pbar:  # batch
             ni = i + nb * epoch  # number integrated batches (since train start)
-            imgs = imgs.to(device, non_blocking=True).float()
+            imgs = batch.images.to(device, non_blocking=True).float()
+            if batch_augmentation is not None:
+                imgs, targets, labels_length = batch_augmentation(imgs, batch.padded, batch.lengths)
+                batch = DetectionBatch.from_padded(imgs, targets, labels_length)
 
             # Warmup
             if ni <= nw:
@@ -305,7 +313,7 @@ def train(opt, device):
                 pred = model(imgs)  # forward
 
                 loss, loss_items = criterion(
-                    pred, targets, labels_length, imgs.shape[-1]
+                    pred, batch, batch.lengths, imgs.shape[-1]
                 )
 
                 if RANK in (-1, 0):
@@ -334,7 +342,7 @@ def train(opt, device):
                 mloss = (mloss * i + loss_items) / (i + 1)  # update mean losses
                 mem = f'{torch.cuda.memory_reserved() / 1E9 if torch.cuda.is_available() else 0:.3g}G'  # (GB)
                 pbar.set_description(('%10s' * 2 + '%10.4g' * 5) % (
-                    f'{epoch}/{epochs - 1}', mem, *mloss[:3], targets.shape[0], imgs.shape[-1]))
+                    f'{epoch}/{epochs - 1}', mem, *mloss[:3], batch.targets.shape[0], imgs.shape[-1]))
             # end batch
 
         # Scheduler
@@ -467,6 +475,8 @@ def parse_opt(known=False):
     parser.add_argument('--noval', action='store_true', help='only validate final epoch')
     parser.add_argument('--device', default='', help='cuda device, i.e. 0 or 0,1,2,3 or cpu')
     parser.add_argument('--multi-scale', action='store_true', help='vary img-size +/- 50%%')
+    parser.add_argument('--batch-augment', action='store_true',
+        help='augment the collated batches on the device instead of single images in the dataloader workers')
     parser.add_argument('--adam', action='store_true', help='use torch.optim.Adam() optimizer')
     parser.add_argument('--sync-bn', action='store_true', help='use SyncBatchNorm, only available in DDP mode')
     parser.add_argument('--workers', type=int, default=8, help='maximum number of dataloader workers')